@@ -5,18 +5,26 @@ ServiceRegistry 클래스가 모든 서비스 인스턴스를 관리합니다.
 """
 
 import logging
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from app.core.config import WORKSPACES_ROOT, Settings
 from app.core.database import Database
+from app.core.tracing import tracer
 from app.services.analytics_service import AnalyticsService
 from app.services.claude_runner import ClaudeRunner
 from app.services.claude_memory_service import ClaudeMemoryService
 from app.services.context_builder_service import ContextBuilderService
 from app.services.filesystem_service import FilesystemService
+from app.services.diff_cache import DiffCache
+from app.services.disk_usage import DiskUsageScanner
+from app.services.git_ref_sync import RefSyncScheduler
+from app.services.pr_review_service import PRReviewService
 from app.services.git_service import GitService
+from app.services.git_watcher import GitChangeWatcher
+from app.services.subprocess_runner import SubprocessRunner
 from app.services.insight_service import InsightService
 from app.services.session_analysis_service import SessionAnalysisService
 from app.services.github_service import GitHubService
@@ -28,6 +36,7 @@ from app.services.search_service import SearchService
 from app.services.session_manager import SessionManager
 from app.services.settings_service import SettingsService
 from app.services.skills_service import SkillsService
+from app.services.spill_journal import SpillJournal
 from app.services.tag_service import TagService
 from app.services.usage_service import UsageService
 from app.services.websocket_manager import WebSocketManager
@@ -56,7 +65,10 @@ class ServiceRegistry:
         self.claude_runner: ClaudeRunner | None = None
         self.filesystem_service: FilesystemService | None = None
         self.git_service: GitService | None = None
+        self.git_watcher: GitChangeWatcher | None = None
+        self.git_ref_sync: RefSyncScheduler | None = None
         self.github_service: GitHubService | None = None
+        self.pr_review_service: PRReviewService | None = None
         self.skills_service: SkillsService | None = None
         self.local_scanner: LocalSessionScanner | None = None
         self.usage_service: UsageService | None = None
@@ -89,8 +101,32 @@ class ServiceRegistry:
         """앱 시작 시 모든 서비스 초기화."""
         settings = get_settings()
         self.filesystem_service = FilesystemService(root_dir=WORKSPACES_ROOT)
-        self.git_service = GitService(root_dir=WORKSPACES_ROOT)
-        self.github_service = GitHubService(git_service=self.git_service)
+        diff_cache = DiffCache(
+            settings.resolved_diff_cache_dir,
+            memory_max_bytes=settings.diff_cache_memory_bytes,
+            disk_max_bytes=settings.diff_cache_disk_bytes,
+        )
+        await diff_cache.open()
+        git_runner = SubprocessRunner(
+            "git",
+            max_concurrency=settings.git_max_concurrency,
+            per_key_concurrency=settings.git_repo_max_concurrency,
+        )
+        self.git_service = GitService(
+            root_dir=WORKSPACES_ROOT, diff_cache=diff_cache, runner=git_runner
+        )
+        self.github_service = GitHubService(
+            git_service=self.git_service,
+            diff_cache=diff_cache,
+            pr_fresh_ttl=settings.github_pr_cache_fresh_seconds,
+            pr_stale_ttl=settings.github_pr_cache_stale_seconds,
+        )
+        if settings.git_ref_sync_interval_seconds > 0:
+            self.git_ref_sync = RefSyncScheduler(
+                self.git_service,
+                interval=settings.git_ref_sync_interval_seconds,
+                max_concurrency=settings.git_ref_sync_concurrency,
+            )
         self.skills_service = SkillsService()
 
         # 업로드 디렉토리 보장
@@ -98,12 +134,28 @@ class ServiceRegistry:
         upload_path.mkdir(parents=True, exist_ok=True)
         logger.info("업로드 디렉토리: %s", upload_path)
 
+        # Spill 저널: 이전 프로세스가 남긴 미전달 배치도 복원하여 DB 복구 시 replay
+        spill_root = Path(settings.resolved_spill_dir)
+        event_journal = SpillJournal(
+            spill_root / "events",
+            max_bytes=settings.spill_max_bytes,
+            segment_max_bytes=settings.spill_segment_bytes,
+        )
+        message_journal = SpillJournal(
+            spill_root / "messages",
+            max_bytes=settings.spill_max_bytes,
+            segment_max_bytes=settings.spill_segment_bytes,
+        )
+        await event_journal.open()
+        await message_journal.open()
+
         # WebSocketManager를 DB 초기화 전에 인스턴스 생성
         self.ws_manager = WebSocketManager(
             event_queue_maxsize=settings.event_queue_maxsize,
             event_flush_interval=settings.event_flush_interval,
             event_batch_max_size=settings.event_batch_max_size,
             heartbeat_interval=settings.ws_heartbeat_interval,
+            spill_journal=event_journal,
         )
         self.database = Database(
             settings.database_url,
@@ -111,16 +163,34 @@ class ServiceRegistry:
             max_overflow=settings.db_max_overflow,
             pool_timeout=settings.db_pool_timeout,
             pool_recycle=settings.db_pool_recycle,
+            statement_cache_size=settings.db_statement_cache_size,
+            query_cache_size=settings.db_query_cache_size,
         )
         await self.database.initialize()
         self.ws_manager.set_database(self.database)
 
+        # Git 상태 캐시 변경 감시 (미사용/불가 시 TTL 캐시)
+        if settings.git_cache_mode == "watch":
+            if GitChangeWatcher.is_available():
+                self.git_watcher = GitChangeWatcher(
+                    self.git_service,
+                    self.ws_manager,
+                    max_repos=settings.git_watch_max_repos,
+                    debounce_ms=settings.git_watch_debounce_ms,
+                )
+            else:
+                logger.warning("watchfiles 미설치: Git 상태 캐시를 TTL 모드로 사용합니다")
+
         from app.services.pending_questions import init as init_pending_questions
 
         init_pending_questions(self.database)
 
         self.session_manager = SessionManager(
-            self.database, upload_dir=settings.resolved_upload_dir
+            self.database,
+            upload_dir=settings.resolved_upload_dir,
+            spill_journal=message_journal,
+            cache_ttl=settings.session_cache_ttl_seconds,
+            cache_max_entries=settings.session_cache_max_entries,
         )
         self.session_manager.start_message_batch_writer(
             maxsize=settings.message_queue_maxsize,
@@ -129,7 +199,31 @@ class ServiceRegistry:
         self.local_scanner = LocalSessionScanner(self.database)
         self.usage_service = UsageService()
         self.claude_runner = ClaudeRunner(settings)
-        self.settings_service = SettingsService(self.database)
+        self.settings_service = SettingsService(
+            self.database, cache_ttl=settings.hot_cache_ttl_seconds
+        )
+
+        # 턴 트레이싱 설정 + export 워커 시작
+        tracer.configure(
+            enabled=settings.tracing_enabled,
+            max_spans=settings.tracing_max_spans_per_turn,
+            retained_turns=settings.tracing_retained_turns,
+            export_path=settings.tracing_export_path,
+            otlp_endpoint=settings.tracing_otlp_endpoint,
+        )
+        tracer.start()
+
+        # Permission 신뢰 규칙 엔진 연결 + 재시작 전 대기 요청 복원
+        from app.api.v1.endpoints.permissions import init as init_permissions
+
+        session_manager = self.session_manager
+
+        async def _session_workspace(session_id: str) -> str | None:
+            return (await session_manager.get(session_id)).get("workspace_id")
+
+        await init_permissions(
+            self.database, self.settings_service, _session_workspace
+        )
         self.mcp_service = McpService(self.database)
         self.memo_service = MemoService(self.database)
         self.tag_service = TagService(self.database)
@@ -141,7 +235,24 @@ class ServiceRegistry:
             self.database, self.workflow_definition_service
         )
         self.workspace_service = WorkspaceService(
-            self.database, self.git_service, workspaces_root=WORKSPACES_ROOT
+            self.database,
+            self.git_service,
+            workspaces_root=WORKSPACES_ROOT,
+            disk_usage=DiskUsageScanner(
+                parallelism=settings.workspace_disk_usage_parallelism
+            ),
+        )
+        self.pr_review_service = PRReviewService(
+            self.database,
+            self.github_service,
+            self.ws_manager,
+            workers=settings.pr_review_workers,
+            queue_size=settings.pr_review_queue_size,
+            claude_concurrency=settings.pr_review_claude_concurrency,
+            chunk_chars=settings.pr_review_chunk_chars,
+            max_chunks=settings.pr_review_max_chunks,
+            timeout=settings.pr_review_timeout_seconds,
+            scheduler=self.claude_runner.scheduler,
         )
         self.validation_service = ValidationService(self.database)
         self.insight_service = InsightService(self.database)
@@ -174,6 +285,16 @@ class ServiceRegistry:
         # stale 워크스페이스 복구 (cloning/deleting 상태)
         if self.workspace_service:
             await self.workspace_service.cleanup_stale()
+            # 워크스페이스 저장소는 조회 여부와 무관하게 원격 ref 동기화
+            if self.git_ref_sync:
+                for path in await self.workspace_service.list_ready_paths():
+                    if os.path.isdir(path):
+                        self.git_ref_sync.register(
+                            os.path.realpath(path), pinned=True
+                        )
+
+        # PR 리뷰 워커 시작 (미완료 작업 재등록)
+        await self.pr_review_service.start()
 
         # Materialized View 생성/확인 (분석 쿼리 최적화)
         from app.repositories.analytics_repo import AnalyticsRepository
@@ -202,12 +323,42 @@ class ServiceRegistry:
                 self.jsonl_watcher.stop_all()
             except Exception as e:
                 logger.error("JsonlWatcher 종료 실패: %s", e)
+        # 2-1. Git 변경 감시 + cat-file 워커 종료
+        if self.git_watcher:
+            try:
+                await self.git_watcher.stop_all()
+            except Exception as e:
+                logger.error("GitChangeWatcher 종료 실패: %s", e)
+        if self.git_service:
+            try:
+                await self.git_service.close()
+            except Exception as e:
+                logger.error("GitService 워커 종료 실패: %s", e)
+        if self.claude_runner:
+            try:
+                await self.claude_runner.close()
+            except Exception as e:
+                logger.error("warm 프로세스 정리 실패: %s", e)
+        if self.pr_review_service:
+            try:
+                await self.pr_review_service.stop()
+            except Exception as e:
+                logger.error("PR 리뷰 워커 종료 실패: %s", e)
+        if self.github_service:
+            try:
+                await self.github_service.close()
+            except Exception as e:
+                logger.error("GitHubService 캐시 작업 종료 실패: %s", e)
         # 3. Usage HTTP 클라이언트 정리
         if self.usage_service and hasattr(self.usage_service, "close"):
             try:
                 await self.usage_service.close()
             except Exception as e:
                 logger.error("UsageService 종료 실패: %s", e)
+        try:
+            await tracer.close()
+        except Exception as e:
+            logger.error("트레이스 export 종료 실패: %s", e)
         # 4. DB 연결 종료
         if self.database:
             await self.database.close()
@@ -253,10 +404,24 @@ def get_git_service() -> GitService:
     return _registry._require("git_service")
 
 
+def get_git_watcher() -> GitChangeWatcher | None:
+    """Git 변경 감시기 (TTL 모드이면 None)."""
+    return _registry.git_watcher
+
+
+def get_git_ref_sync() -> RefSyncScheduler | None:
+    """백그라운드 원격 ref 동기화 (비활성화 시 None)."""
+    return _registry.git_ref_sync
+
+
 def get_github_service() -> GitHubService:
     return _registry._require("github_service")
 
 
+def get_pr_review_service() -> PRReviewService:
+    return _registry._require("pr_review_service")
+
+
 def get_skills_service() -> SkillsService:
     return _registry._require("skills_service")
 
@@ -1,15 +1,15 @@
 """파일 내용 조회 엔드포인트."""
 
 import asyncio
-import subprocess
 import uuid
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from fastapi.responses import PlainTextResponse
 
-from app.api.dependencies import get_session_manager, get_settings
+from app.api.dependencies import get_git_service, get_session_manager, get_settings
 from app.core.config import Settings
+from app.services.git_service import GitService
 from app.services.session_manager import SessionManager
 
 router = APIRouter(prefix="/sessions", tags=["files"])
@@ -85,6 +85,7 @@ async def get_file_diff(
     session_id: str,
     file_path: str,
     manager: SessionManager = Depends(get_session_manager),
+    git: GitService = Depends(get_git_service),
 ):
     """파일의 git diff를 조회합니다."""
     session = await manager.get(session_id)
@@ -94,72 +95,8 @@ async def get_file_diff(
     resolved_work_dir = work_dir.resolve()
     rel_path = str(target.relative_to(resolved_work_dir))
 
-    async def run_git_diff() -> str:
-        def _run() -> str:
-            # 먼저 HEAD 대비 변경사항 확인 (staged + unstaged)
-            try:
-                result = subprocess.run(
-                    ["git", "diff", "HEAD", "--", rel_path],
-                    cwd=str(work_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=10.0,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # HEAD diff가 없으면 unstaged 변경사항 확인
-            try:
-                result = subprocess.run(
-                    ["git", "diff", "--", rel_path],
-                    cwd=str(work_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=10.0,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # staged 변경사항 확인
-            try:
-                result = subprocess.run(
-                    ["git", "diff", "--cached", "--", rel_path],
-                    cwd=str(work_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=10.0,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # 새로 생성된 파일(untracked): /dev/null과 비교하여 diff 생성
-            abs_path = (Path(work_dir) / rel_path).resolve()
-            if abs_path.is_file():
-                try:
-                    result = subprocess.run(
-                        ["git", "diff", "--no-index", "--", "/dev/null", rel_path],
-                        cwd=str(work_dir),
-                        capture_output=True,
-                        text=True,
-                        timeout=10.0,
-                    )
-                    # --no-index는 차이가 있으면 returncode=1을 반환
-                    if result.stdout.strip():
-                        return result.stdout
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    pass
-
-            return ""
-
-        return await asyncio.to_thread(_run)
-
-    diff_text = await run_git_diff()
+    # HEAD/index blob은 장기 실행 cat-file 워커에서 읽고 diff는 프로세스 내 계산
+    diff_text = await git.diff_worktree_file(str(resolved_work_dir), rel_path)
 
     if not diff_text:
         return PlainTextResponse("", status_code=204)
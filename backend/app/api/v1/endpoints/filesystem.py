@@ -1,7 +1,7 @@
 """파일시스템 탐색 API 엔드포인트."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from app.core.exceptions import ValidationError
 from app.schemas.common import StatusResponse
@@ -9,6 +9,7 @@ from app.api.dependencies import (
     get_filesystem_service,
     get_git_service,
     get_github_service,
+    get_pr_review_service,
     get_skills_service,
 )
 from app.schemas.filesystem import (
@@ -42,6 +43,7 @@ from app.schemas.filesystem import (
 from app.services.filesystem_service import FilesystemService
 from app.services.git_service import GitService
 from app.services.github_service import GitHubService
+from app.services.pr_review_service import PRReviewService
 from app.services.skills_service import SkillsService
 
 router = APIRouter(prefix="/fs", tags=["filesystem"])
@@ -141,11 +143,12 @@ async def get_git_log(
 @router.get("/git-commit-diff", response_class=PlainTextResponse)
 async def get_commit_diff(
     path: str = Query(..., description="Git 저장소 경로"),
-    commit: str = Query(..., min_length=7, max_length=40, description="커밋 해시"),
+    commit: str = Query(..., min_length=7, max_length=64, description="커밋 해시"),
     git: GitService = Depends(get_git_service),
 ):
-    result = await git.get_commit_diff(path, commit)
-    return PlainTextResponse(result or "")
+    # 대용량 커밋도 버퍼링 없이 청크 단위로 전달 (커밋 OID 키로 캐시)
+    chunks = await git.stream_commit_diff(path, commit)
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
 
 
 @router.get("/gh-status", response_model=GitHubCLIStatus)
@@ -200,11 +203,11 @@ async def get_github_pr_diff(
 @router.post("/gh-pr-review", response_model=PRReviewJobResponse)
 async def generate_pr_review(
     req: PRReviewRequest,
-    gh: GitHubService = Depends(get_github_service),
+    reviews: PRReviewService = Depends(get_pr_review_service),
 ):
-    """PR 리뷰 비동기 작업 생성."""
+    """PR 리뷰 작업 생성 (대기열 등록). 진행 상황은 /ws/pr-reviews/{job_id}."""
     try:
-        return await gh.request_pr_review(req.path, req.pr_number)
+        return await reviews.submit(req.path, req.pr_number)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -212,13 +215,10 @@ async def generate_pr_review(
 @router.get("/gh-pr-review-status/{job_id}", response_model=PRReviewStatusResponse)
 async def get_pr_review_status(
     job_id: str,
-    gh: GitHubService = Depends(get_github_service),
+    reviews: PRReviewService = Depends(get_pr_review_service),
 ):
-    """PR 리뷰 작업 상태 조회."""
-    try:
-        return gh.get_pr_review_status(job_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    """PR 리뷰 작업 상태 조회 (진행 중이면 생성 중인 텍스트 포함)."""
+    return await reviews.get_status(job_id)
 
 
 @router.post("/gh-pr-review-submit", response_model=PRReviewSubmitResponse)
@@ -247,9 +247,10 @@ async def list_skills(
 @router.get("/git-branches", response_model=GitBranchListResponse)
 async def list_git_branches(
     path: str = Query(..., description="Git 저장소 경로"),
+    fetch: bool = Query(False, description="조회 전 git fetch 실행 (수동 새로고침)"),
     git: GitService = Depends(get_git_service),
 ):
-    branches, current, default_branch = await git.list_branches(path)
+    branches, current, default_branch = await git.list_branches(path, fetch=fetch)
     return GitBranchListResponse(
         branches=branches,
         current_branch=current,
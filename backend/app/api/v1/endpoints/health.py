@@ -18,12 +18,20 @@ async def health():
 
 @router.get("/health/detailed")
 async def health_detailed():
-    """상세 모니터링 엔드포인트: DB 풀, WebSocket, 프로세스, 메시지 큐 상태."""
+    """상세 모니터링 엔드포인트: DB 풀, WebSocket, 프로세스, 메시지 큐, 세션/Git 캐시, 실행기 상태."""
     from app.api.dependencies import (
+        get_claude_runner,
         get_database,
+        get_git_service,
+        get_git_ref_sync,
+        get_git_watcher,
+        get_pr_review_service,
+        get_github_service,
         get_session_manager,
+        get_workspace_service,
         get_ws_manager,
     )
+    from app.core.executors import get_executor_metrics
 
     result: dict = {"status": "ok", "timestamp": utc_now_iso()}
 
@@ -57,15 +65,102 @@ async def health_detailed():
     except Exception as e:
         result["processes"] = {"error": str(e)}
 
-    # 메시지 배치 큐 상태
+    # 메시지 배치 큐 + spill 저널 상태
     try:
         session_manager = get_session_manager()
-        msg_queue = session_manager._message_queue
-        result["message_queue"] = {
-            "size": msg_queue.qsize() if msg_queue else 0,
-            "maxsize": msg_queue.maxsize if msg_queue else 0,
-        }
+        result["message_queue"] = session_manager.get_batch_metrics()
     except Exception as e:
         result["message_queue"] = {"error": str(e)}
 
+    # 세션 상태 캐시 hit/miss
+    try:
+        session_manager = get_session_manager()
+        result["session_cache"] = session_manager.get_cache_metrics()
+    except Exception as e:
+        result["session_cache"] = {"error": str(e)}
+
+    # Git 스냅샷 캐시 + 변경 감시
+    try:
+        git_cache = get_git_service().get_metrics()
+        git_watcher = get_git_watcher()
+        if git_watcher:
+            git_cache["watcher"] = git_watcher.get_metrics()
+        git_ref_sync = get_git_ref_sync()
+        if git_ref_sync:
+            git_cache["ref_sync"] = git_ref_sync.get_metrics()
+        result["git_cache"] = git_cache
+    except Exception as e:
+        result["git_cache"] = {"error": str(e)}
+
+    # 턴 스케줄러 (우선순위별 대기/스케줄링 지연, admission 보류)
+    try:
+        result["turn_scheduler"] = get_claude_runner().scheduler.get_metrics()
+    except Exception as e:
+        result["turn_scheduler"] = {"error": str(e)}
+
+    # 세션별 claude 프로세스 트리 RSS/CPU + 메모리 압박
+    try:
+        result["process_resources"] = get_claude_runner().process_monitor.get_metrics()
+    except Exception as e:
+        result["process_resources"] = {"error": str(e)}
+
+    # 다음 턴 claude 프로세스 사전 기동 풀
+    try:
+        result["warm_pool"] = get_claude_runner().process_pool.get_metrics()
+    except Exception as e:
+        result["warm_pool"] = {"error": str(e)}
+
+    # 세션 상주 claude 프로세스 (재사용/재활용 사유)
+    try:
+        runner = get_claude_runner()
+        result["resident_processes"] = runner.resident_processes.get_metrics()
+    except Exception as e:
+        result["resident_processes"] = {"error": str(e)}
+
+    # --mcp-config 파일 재사용
+    try:
+        result["mcp_configs"] = get_claude_runner().mcp_configs.get_metrics()
+    except Exception as e:
+        result["mcp_configs"] = {"error": str(e)}
+
+    # Permission 판정 (출처별 지연, 컴파일된 신뢰 규칙)
+    try:
+        from app.api.v1.endpoints.permissions import engine, get_pending
+
+        result["permissions"] = {
+            **engine.get_metrics(),
+            "pending": len(get_pending()),
+        }
+    except Exception as e:
+        result["permissions"] = {"error": str(e)}
+
+    # 턴 트레이싱 (보관 턴 수, span 드롭, export 실패)
+    try:
+        from app.core.tracing import tracer
+
+        result["tracing"] = tracer.get_metrics()
+    except Exception as e:
+        result["tracing"] = {"error": str(e)}
+
+    # 워크스페이스 디스크 사용량 증분 계산
+    try:
+        result["disk_usage"] = get_workspace_service().get_disk_usage_metrics()
+    except Exception as e:
+        result["disk_usage"] = {"error": str(e)}
+
+    # gh/claude 실행기
+    try:
+        result["github"] = get_github_service().get_metrics()
+    except Exception as e:
+        result["github"] = {"error": str(e)}
+
+    # PR 리뷰 작업 큐
+    try:
+        result["pr_reviews"] = get_pr_review_service().get_metrics()
+    except Exception as e:
+        result["pr_reviews"] = {"error": str(e)}
+
+    # 스레드 풀 실행기 포화 (대기열 깊이/대기 시간)
+    result["executors"] = get_executor_metrics()
+
     return result
@@ -1,15 +1,35 @@
-"""Permission 요청/응답 API - MCP 서버와 프론트엔드 간 중계."""
+"""Permission 요청/응답 API - MCP 서버와 프론트엔드 간 중계.
+
+/{session_id}/mcp는 Claude CLI가 직접 연결하는 Streamable HTTP MCP 서버입니다.
+모든 세션이 백엔드 프로세스 하나를 공유하므로 턴마다 Python 인터프리터를
+실행하지 않고, CLI의 HTTP keep-alive 연결로 권한 요청을 주고받습니다.
+
+신뢰 규칙 판정은 PermissionEngine이 메모리에서 처리하며(DB 조회 없음), 사용자
+응답을 기다리는 요청만 DB에 기록되어 서버 재시작 후 복원됩니다.
+"""
 
 import asyncio
 import logging
+import time
 import uuid
 from collections import OrderedDict
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
-from app.api.dependencies import get_settings_service, get_ws_manager
+from app.api.dependencies import get_ws_manager
 from app.models.event_types import WsEventType
+from app.services.permission_engine import (
+    PermissionEngine,
+    TrustRule,
+    request_fingerprint,
+)
+from app.services.permission_mcp_server import (
+    HANDLE_REQUEST_TOOL,
+    SERVER_INFO,
+    tool_result,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +38,18 @@ router = APIRouter(prefix="/permissions", tags=["permissions"])
 # 인메모리 pending 요청 저장소
 MAX_PENDING = 100
 _pending: dict[str, dict] = {}
+# 사용자 응답 대기 시간 (초)
+PERMISSION_TIMEOUT = 120
+
+# 세션/워크스페이스/글로벌 신뢰 규칙 (앱 시작 시 init()으로 DB/설정 연결)
+engine = PermissionEngine()
+
+# 재시작 전 요청에 대해 재시작 후 받은 응답 (같은 요청이 다시 오면 적용)
+_MAX_RECOVERED_ANSWERS = 100
+_recovered_answers: OrderedDict[str, str] = OrderedDict()
 
-# 세션별 신뢰 도구 저장소 (인메모리, 서버 재시작 시 초기화)
-_MAX_TRUSTED_SESSIONS = 200
-_session_trusted_tools: OrderedDict[str, set[str]] = OrderedDict()
+# HTTP MCP 협상 가능한 프로토콜 버전 (첫 항목이 기본값)
+_MCP_PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
 
 
 class PermissionRequest(BaseModel):
@@ -39,87 +67,175 @@ def get_pending() -> dict[str, dict]:
 
 
 def clear_pending():
-    """서버 종료 시 모든 pending 요청 정리."""
+    """서버 종료 시 모든 pending 요청 정리.
+
+    DB 기록은 pending으로 남겨 두어 재시작 후 복원합니다.
+    """
     for entry in _pending.values():
         entry["response"] = {"behavior": "deny"}
         entry["event"].set()
+        expiry = entry.get("expiry")
+        if expiry is not None:
+            expiry.cancel()
     _pending.clear()
 
 
 def clear_session_trusted(session_id: str):
-    """세션 삭제 시 해당 세션의 신뢰 도구 정리."""
-    _session_trusted_tools.pop(session_id, None)
+    """세션 삭제 시 해당 세션의 신뢰 규칙 정리."""
+    engine.clear_session(session_id)
+
+
+async def init(db, settings_service, workspace_of=None) -> None:
+    """앱 시작 시 규칙 엔진 연결 + 재시작 전 대기 요청 복원.
+
+    복원된 요청은 응답을 기다리는 CLI가 없으므로(orphan) 프론트엔드 프롬프트
+    복원용이며, 받은 응답은 같은 요청이 다시 오면 적용됩니다. 원래 대기
+    시간이 지나면 만료 처리합니다.
+    """
+    engine.attach(db, settings_service, workspace_of)
+    try:
+        rows = await engine.recover(timeout=PERMISSION_TIMEOUT)
+    except Exception:
+        logger.warning("Permission 대기 요청 복원 실패", exc_info=True)
+        return
+    now = time.time()
+    for row in rows:
+        permission_id = row["permission_id"]
+        remaining = PERMISSION_TIMEOUT - (now - row["created_at"].timestamp())
+        _pending[permission_id] = {
+            "event": asyncio.Event(),
+            "permission_id": permission_id,
+            "session_id": row["session_id"],
+            "tool_name": row["tool_name"],
+            "tool_input": row["tool_input"],
+            "response": None,
+            "orphan": True,
+            "fingerprint": request_fingerprint(
+                row["session_id"], row["tool_name"], row["tool_input"]
+            ),
+            "started": time.perf_counter(),
+            "expiry": asyncio.create_task(
+                _expire_orphan(permission_id, max(remaining, 0.0))
+            ),
+        }
+
+
+async def _expire_orphan(permission_id: str, delay: float) -> None:
+    await asyncio.sleep(delay)
+    entry = _pending.get(permission_id)
+    if entry is None or not entry.get("orphan"):
+        return
+    del _pending[permission_id]
+    engine.record("timeout", entry["started"])
+    await engine.persist_decision(permission_id, "expired")
+    try:
+        await get_ws_manager().broadcast_event(
+            entry["session_id"],
+            {
+                "type": WsEventType.PERMISSION_RESPONSE,
+                "permission_id": permission_id,
+                "behavior": "deny",
+                "reason": "timeout",
+            },
+        )
+    except Exception:
+        logger.debug("만료 알림 실패: %s", permission_id, exc_info=True)
+
+
+def _adopt_orphan(fingerprint: str) -> dict | None:
+    """재시작 전에 기록된 같은 요청의 대기 항목 인계 (프롬프트 재사용)."""
+    for entry in _pending.values():
+        if entry.get("orphan") and entry.get("fingerprint") == fingerprint:
+            entry["orphan"] = False
+            entry["expiry"].cancel()
+            entry["expiry"] = None
+            return entry
+    return None
 
 
 @router.post("/{session_id}/request")
 async def request_permission(session_id: str, body: PermissionRequest):
     """MCP 서버가 호출 - 사용자에게 권한 요청을 전달하고 응답 대기."""
+    started = time.perf_counter()
 
-    # 1. 세션 레벨 신뢰 확인
-    session_trusted = _session_trusted_tools.get(session_id, set())
-    if session_trusted:
-        _session_trusted_tools.move_to_end(session_id)
-    if body.tool_name in session_trusted:
+    # 1. 세션 → 워크스페이스 → 글로벌 신뢰 규칙 (메모리 판정)
+    decision = await engine.evaluate(session_id, body.tool_name, body.tool_input)
+    if decision is not None:
+        source, rule = decision
+        engine.record(source, started)
         logger.info(
-            "Permission 자동 승인 (세션 신뢰): tool=%s, session=%s",
+            "Permission 자동 승인 (%s 신뢰 %s): tool=%s, session=%s",
+            source,
+            rule,
             body.tool_name,
             session_id,
         )
         return {"behavior": "allow"}
 
-    # 2. 글로벌 레벨 신뢰 확인
-    try:
-        settings_service = get_settings_service()
-        global_settings = await settings_service.get()
-        globally_trusted = global_settings.get("globally_trusted_tools") or []
-        if body.tool_name in globally_trusted:
-            logger.info("Permission 자동 승인 (글로벌 신뢰): tool=%s", body.tool_name)
-            return {"behavior": "allow"}
-    except Exception:
-        logger.warning("글로벌 신뢰 도구 확인 실패, 수동 승인으로 진행", exc_info=True)
-
-    # 3. 기존 흐름: 프론트엔드에 요청 전송 후 응답 대기
-    if len(_pending) >= MAX_PENDING:
-        logger.warning("Pending 요청 수 초과 (%d), 가장 오래된 요청 정리", MAX_PENDING)
-        oldest_id = next(iter(_pending))
-        oldest = _pending.pop(oldest_id)
-        oldest["response"] = {"behavior": "deny"}
-        oldest["event"].set()
-
-    permission_id = str(uuid.uuid4())[:12]
-    event = asyncio.Event()
-
-    pending_entry = {
-        "event": event,
-        "permission_id": permission_id,
-        "session_id": session_id,
-        "tool_name": body.tool_name,
-        "tool_input": body.tool_input,
-        "response": None,
-    }
-    _pending[permission_id] = pending_entry
+    # 2. 재시작 전 같은 요청에 대한 응답/대기 항목
+    fingerprint = request_fingerprint(session_id, body.tool_name, body.tool_input)
+    answered = _recovered_answers.pop(fingerprint, None)
+    if answered is not None:
+        engine.record("recovered", started)
+        return {"behavior": answered}
+    pending_entry = _adopt_orphan(fingerprint)
 
-    # WebSocket으로 프론트엔드에 permission 요청 브로드캐스트
+    # 3. 프론트엔드에 요청 전송 후 응답 대기
     ws_manager = get_ws_manager()
-    await ws_manager.broadcast_event(
-        session_id,
-        {
-            "type": WsEventType.PERMISSION_REQUEST,
+    if pending_entry is None:
+        if len(_pending) >= MAX_PENDING:
+            logger.warning(
+                "Pending 요청 수 초과 (%d), 가장 오래된 요청 정리", MAX_PENDING
+            )
+            oldest_id = next(iter(_pending))
+            oldest = _pending.pop(oldest_id)
+            oldest["response"] = {"behavior": "deny"}
+            oldest["event"].set()
+            if oldest.get("expiry") is not None:
+                oldest["expiry"].cancel()
+            engine.record("evicted", oldest.get("started", started))
+            await engine.persist_decision(oldest_id, "deny")
+
+        permission_id = str(uuid.uuid4())[:12]
+        pending_entry = {
+            "event": asyncio.Event(),
             "permission_id": permission_id,
+            "session_id": session_id,
             "tool_name": body.tool_name,
             "tool_input": body.tool_input,
-        },
-    )
+            "response": None,
+            "fingerprint": fingerprint,
+            "started": started,
+        }
+        _pending[permission_id] = pending_entry
+        await engine.persist_pending(
+            permission_id, session_id, body.tool_name, body.tool_input
+        )
+
+        # WebSocket으로 프론트엔드에 permission 요청 브로드캐스트
+        await ws_manager.broadcast_event(
+            session_id,
+            {
+                "type": WsEventType.PERMISSION_REQUEST,
+                "permission_id": permission_id,
+                "tool_name": body.tool_name,
+                "tool_input": body.tool_input,
+            },
+        )
+    permission_id = pending_entry["permission_id"]
+    event = pending_entry["event"]
 
     try:
         # 프론트엔드 응답 대기 (최대 120초)
-        await asyncio.wait_for(event.wait(), timeout=120)
+        await asyncio.wait_for(event.wait(), timeout=PERMISSION_TIMEOUT)
         response = pending_entry.get("response", {"behavior": "deny"})
         return response
     except asyncio.TimeoutError:
         logger.warning(
             "Permission 요청 타임아웃: %s (세션: %s)", permission_id, session_id
         )
+        engine.record("timeout", pending_entry["started"])
+        await engine.persist_decision(permission_id, "expired")
         # 타임아웃 시 프론트엔드에 알림
         await ws_manager.broadcast_event(
             session_id,
@@ -135,15 +251,138 @@ async def request_permission(session_id: str, body: PermissionRequest):
         _pending.pop(permission_id, None)
 
 
+def _rpc_error(msg_id, code: int, message: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+async def _handle_mcp_message(session_id: str, msg) -> dict | None:
+    """JSON-RPC 메시지 1개 처리. 알림/클라이언트 응답이면 None."""
+    if not isinstance(msg, dict):
+        return _rpc_error(None, -32600, "Invalid Request")
+    if "id" not in msg or "method" not in msg:
+        return None
+    msg_id = msg["id"]
+    method = msg["method"]
+    params = msg.get("params") or {}
+
+    if method == "initialize":
+        requested = params.get("protocolVersion")
+        version = (
+            requested
+            if requested in _MCP_PROTOCOL_VERSIONS
+            else _MCP_PROTOCOL_VERSIONS[0]
+        )
+        return {
+            "jsonrpc": "2.0",
+            "id": msg_id,
+            "result": {
+                "protocolVersion": version,
+                "capabilities": {"tools": {}},
+                "serverInfo": SERVER_INFO,
+            },
+        }
+    if method == "ping":
+        return {"jsonrpc": "2.0", "id": msg_id, "result": {}}
+    if method == "tools/list":
+        return {
+            "jsonrpc": "2.0",
+            "id": msg_id,
+            "result": {"tools": [HANDLE_REQUEST_TOOL]},
+        }
+    if method == "tools/call":
+        if params.get("name") != "handle_request":
+            return _rpc_error(msg_id, -32601, f"Unknown tool: {params.get('name')}")
+        arguments = params.get("arguments") or {}
+        decision = await request_permission(
+            session_id,
+            PermissionRequest(
+                tool_name=arguments.get("tool_name", "unknown"),
+                tool_input=arguments.get("input") or {},
+            ),
+        )
+        return tool_result(msg_id, decision.get("behavior", "deny"))
+    return _rpc_error(msg_id, -32601, f"Method not found: {method}")
+
+
+@router.post("/{session_id}/mcp")
+async def permission_mcp(session_id: str, request: Request):
+    """Streamable HTTP MCP 엔드포인트 (--permission-prompt-tool 용, 세션 공유)."""
+    try:
+        payload = await request.json()
+    except ValueError:
+        return JSONResponse(_rpc_error(None, -32700, "Parse error"), status_code=400)
+
+    if isinstance(payload, list):
+        results = await asyncio.gather(
+            *(_handle_mcp_message(session_id, msg) for msg in payload)
+        )
+        responses = [r for r in results if r is not None]
+    else:
+        response = await _handle_mcp_message(session_id, payload)
+        responses = response if response is not None else []
+    if not responses:
+        return Response(status_code=202)
+    return JSONResponse(responses)
+
+
+@router.api_route("/{session_id}/mcp", methods=["GET", "DELETE"])
+async def permission_mcp_unsupported(session_id: str):
+    """서버 → 클라이언트 SSE 스트림/세션 종료 미지원 (상태 없는 서버)."""
+    return Response(status_code=405, headers={"Allow": "POST"})
+
+
+async def _register_trust(entry: dict, trust_level: str, rule: str | None) -> None:
+    tool_name = entry.get("tool_name", "")
+    session_id = entry.get("session_id", "")
+    if not tool_name:
+        return
+    spec = tool_name
+    if rule:
+        try:
+            if TrustRule.parse(rule).matches(tool_name, entry.get("tool_input") or {}):
+                spec = rule
+            else:
+                logger.warning("요청과 일치하지 않는 신뢰 규칙 무시: %s", rule)
+        except ValueError:
+            logger.warning("잘못된 신뢰 규칙 무시: %s", rule)
+
+    # 세션 신뢰에는 항상 즉시 등록
+    if session_id:
+        engine.trust_session(session_id, spec)
+        logger.info("도구 세션 신뢰 등록: %s (세션: %s)", spec, session_id)
+
+    try:
+        if trust_level == "workspace":
+            workspace_id = await engine.workspace_of(session_id)
+            if workspace_id and await engine.trust_workspace(workspace_id, spec):
+                logger.info("도구 워크스페이스 신뢰 등록: %s (%s)", spec, workspace_id)
+        elif trust_level == "always":
+            if await engine.trust_global(spec):
+                logger.info("도구 글로벌 신뢰 등록: %s", spec)
+    except Exception:
+        logger.warning("신뢰 규칙 저장 실패: %s", spec, exc_info=True)
+
+
 async def respond_permission(
-    permission_id: str, behavior: str, trust_level: str = "once"
+    permission_id: str,
+    behavior: str,
+    trust_level: str = "once",
+    rule: str | None = None,
 ) -> bool:
     """permission 응답 처리 (ws.py에서 호출).
 
     trust_level:
     - "once": 이번만 허용 (기본값)
-    - "session": 세션 동안 같은 도구 자동 승인
-    - "always": 모든 세션에서 해당 도구 자동 승인 (DB 저장)
+    - "session": 세션 동안 같은 규칙 자동 승인
+    - "workspace": 세션의 워크스페이스에서 자동 승인 (DB 저장)
+    - "always": 모든 세션에서 자동 승인 (DB 저장)
+
+    rule은 등록할 신뢰 규칙(예: "Bash(npm test*)")이며, 없거나 형식이
+    잘못되었으면 도구 이름 전체를 신뢰합니다.
     """
     entry = _pending.get(permission_id)
     if not entry:
@@ -151,36 +390,19 @@ async def respond_permission(
 
     entry["response"] = {"behavior": behavior}
     entry["event"].set()
+    if entry.get("orphan"):
+        # 기다리는 CLI 없음 → 같은 요청이 다시 오면 이 응답 적용
+        _pending.pop(permission_id, None)
+        entry["expiry"].cancel()
+        _recovered_answers[entry["fingerprint"]] = behavior
+        while len(_recovered_answers) > _MAX_RECOVERED_ANSWERS:
+            _recovered_answers.popitem(last=False)
+    engine.record("user", entry.get("started", time.perf_counter()))
+    await engine.persist_decision(permission_id, behavior)
 
     # Trust level 처리: allow인 경우에만 신뢰 등록
     if behavior == "allow" and trust_level != "once":
-        tool_name = entry.get("tool_name", "")
-        session_id = entry.get("session_id", "")
-
-        if trust_level == "session" and tool_name and session_id:
-            _session_trusted_tools.setdefault(session_id, set()).add(tool_name)
-            _session_trusted_tools.move_to_end(session_id)
-            while len(_session_trusted_tools) > _MAX_TRUSTED_SESSIONS:
-                _session_trusted_tools.popitem(last=False)
-            logger.info("도구 세션 신뢰 등록: %s (세션: %s)", tool_name, session_id)
-
-        elif trust_level == "always" and tool_name:
-            # 세션 신뢰에도 즉시 등록
-            if session_id:
-                _session_trusted_tools.setdefault(session_id, set()).add(tool_name)
-                _session_trusted_tools.move_to_end(session_id)
-                while len(_session_trusted_tools) > _MAX_TRUSTED_SESSIONS:
-                    _session_trusted_tools.popitem(last=False)
-            # DB에 글로벌 신뢰 저장
-            try:
-                settings_service = get_settings_service()
-                current = await settings_service.get()
-                existing = current.get("globally_trusted_tools") or []
-                trusted = list(set(existing + [tool_name]))
-                await settings_service.update(globally_trusted_tools=trusted)
-                logger.info("도구 글로벌 신뢰 등록: %s", tool_name)
-            except Exception:
-                logger.warning("글로벌 신뢰 저장 실패: %s", tool_name, exc_info=True)
+        await _register_trust(entry, trust_level, rule)
 
     # 프론트엔드에 응답 확인 브로드캐스트
     ws_manager = get_ws_manager()
@@ -18,6 +18,7 @@ from app.api.dependencies import (
     get_workspace_service,
     get_ws_manager,
 )
+from app.core.tracing import tracer
 from app.schemas.common import StatusResponse
 from app.services.pending_questions import clear_pending_question
 from app.api.v1.endpoints.permissions import clear_session_trusted
@@ -129,13 +130,15 @@ async def list_sessions(
     ws_manager: WebSocketManager = Depends(get_ws_manager),
 ):
     sessions = await manager.list_all(limit=limit)
+    activities = ws_manager.get_activities(
+        [s["id"] for s in sessions if s.get("status") == "running"]
+    )
     result = []
     for s in sessions:
         info = manager.to_info(s)
-        if s.get("status") == "running":
-            activity = ws_manager.get_current_activity(s["id"])
-            if activity:
-                info.current_activity = CurrentActivity(**activity)
+        activity = activities.get(s["id"])
+        if activity:
+            info.current_activity = CurrentActivity(**activity)
         result.append(info)
     return result
 
@@ -154,6 +157,12 @@ async def search_sessions(
     order: str = Query("desc", description="정렬 방향 (asc/desc)"),
     limit: int = Query(50, ge=1, le=100, description="페이지 크기"),
     offset: int = Query(0, ge=0, description="오프셋"),
+    cursor: Optional[str] = Query(
+        None, description="keyset 커서 (이전 응답의 next_cursor, created_at 정렬 전용)"
+    ),
+    total_mode: str = Query(
+        "exact", pattern="^(exact|estimated)$", description="total 계산 방식"
+    ),
     include_tags: bool = Query(False, description="태그 포함 여부"),
     search_service: SearchService = Depends(get_search_service),
 ):
@@ -176,6 +185,8 @@ async def search_sessions(
         limit=limit,
         offset=offset,
         include_tags=include_tags,
+        cursor=cursor,
+        total_mode=total_mode,
     )
 
 
@@ -268,6 +279,35 @@ async def get_session_stats(
     }
 
 
+@router.get("/{session_id}/traces")
+async def list_session_traces(
+    session_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    manager: SessionManager = Depends(get_session_manager),
+):
+    """최근 턴 트레이스 요약 (최신순, 최상위 구간별 소요 시간 포함)."""
+    await manager.get(session_id)  # 존재 확인 (NotFoundError 발생)
+    return tracer.traces(session_id, limit)
+
+
+@router.get("/{session_id}/traces/flamegraph")
+async def get_session_flamegraph(
+    session_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    format: str = Query("json", pattern="^(json|folded)$"),
+    manager: SessionManager = Depends(get_session_manager),
+):
+    """최근 턴들의 span 경로별 소요 시간 집계.
+
+    format=folded이면 flamegraph.pl / speedscope용 folded stacks 텍스트를 반환합니다.
+    """
+    await manager.get(session_id)
+    graph = tracer.flamegraph(session_id, limit)
+    if format == "folded":
+        return PlainTextResponse(content=graph["folded"])
+    return graph
+
+
 @router.get("/{session_id}/export")
 async def export_session(
     session_id: str,
@@ -393,11 +433,13 @@ async def delete_session(
     claude_runner: ClaudeRunner = Depends(get_claude_runner),
 ):
     await manager.delete(session_id)
-    # 인메모리 자원 정리 (seq 카운터, 이벤트 버퍼, 세션 신뢰 도구, 대기 질문, 레이트 리미터)
+    # 인메모리 자원 정리 (seq 카운터, 이벤트 버퍼, 세션 신뢰 도구, 대기 질문,
+    # 레이트 리미터, 턴 트레이스 요약)
     ws_manager.reset_session(session_id)
     clear_session_trusted(session_id)
     await clear_pending_question(session_id)
     claude_runner.cleanup_session_limiter(session_id)
+    tracer.forget(session_id)
     return StatusResponse(status="deleted")
 
 
@@ -30,6 +30,7 @@ from app.schemas.workflow import (
     WorkflowStatusResponse,
 )
 from app.services.claude_runner import ClaudeRunner, _auto_chain_done, _validation_retry_counts
+from app.services.turn_scheduler import TurnPriority
 from app.services.session_manager import SessionManager
 from app.services.websocket_manager import WebSocketManager
 from app.services.workflow_service import WorkflowService
@@ -318,6 +319,7 @@ async def approve_phase(
                     workflow_step_config=(
                         next_step.model_dump() if next_step else None
                     ),
+                    priority=TurnPriority.AUTO_CHAIN,
                 )
             )
             task.add_done_callback(lambda t: _auto_chain_done(t, session_id, manager))
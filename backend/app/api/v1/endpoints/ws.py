@@ -1,6 +1,7 @@
 """WebSocket 엔드포인트 - 실시간 스트리밍."""
 
 import asyncio
+import time
 from collections import OrderedDict
 from uuid import uuid4
 
@@ -12,15 +13,20 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.api.dependencies import (
     get_claude_memory_service,
     get_claude_runner,
+    get_git_watcher,
     get_insight_service,
     get_jsonl_watcher,
     get_mcp_service,
+    get_pr_review_service,
     get_session_manager,
     get_settings,
     get_settings_service,
     get_workflow_service,
     get_ws_manager,
 )
+from app.core.database import track_round_trips
+from app.core.exceptions import NotFoundError
+from app.core.tracing import tracer
 from app.core.utils import utc_now
 from app.services.pending_questions import (
     clear_pending_question,
@@ -29,6 +35,7 @@ from app.services.pending_questions import (
 from app.api.v1.endpoints.permissions import get_pending, respond_permission
 from app.models.event_types import WsEventType
 from app.services.claude_runner import ClaudeRunner
+from app.services.pr_review_service import pr_review_channel
 from app.services.session_manager import SessionManager
 from app.services.websocket_manager import WebSocketManager
 
@@ -109,227 +116,249 @@ async def _handle_prompt(
         # ---- 턴 ID 생성 + 컨텍스트 바인딩 ----
         turn_id = uuid4().hex[:12]
         bind_contextvars(turn_id=turn_id)
-        logger.info(
-            "프롬프트 수신",
-            component="ws",
-            operation="message_receive",
-            prompt_length=len(prompt),
-        )
-
-        # 세션 정보 로드
-        current_session = await manager.get(session_id)
-        if current_session and current_session.get("workspace_id"):
-            bind_contextvars(workspace_id=current_session["workspace_id"])
-
-        # 글로벌 기본 설정 로드
-        settings_service = get_settings_service()
-        global_settings = await settings_service.get()
-
-        # allowed_tools: 요청 > 세션 > 글로벌 > env
-        allowed_tools = (
-            data.get("allowed_tools")
-            or (current_session.get("allowed_tools") if current_session else None)
-            or global_settings.get("allowed_tools")
-            or settings.claude_allowed_tools
-        )
-
-        # 이미지 경로 목록 (업로드 API로 먼저 업로드한 파일 경로)
-        images = data.get("images", [])
-
-        # 세션에 이름이 없으면 첫 프롬프트로 자동 이름 설정
-        if current_session and not current_session.get("name"):
-            auto_name = prompt[:40].strip()
-            if len(prompt) > 40:
-                auto_name += "…"
-            await manager.update_settings(session_id, name=auto_name)
-
-        # 메시지 DB 저장 + USER_MESSAGE 즉시 브로드캐스트 (워크플로우 처리 전)
-        ts_dt = utc_now()
-        await manager.add_message(
-            session_id=session_id,
-            role="user",
-            content=prompt,
-            timestamp=ts_dt,
-        )
-        user_msg = {
-            "role": "user",
-            "content": prompt,
-            "timestamp": ts_dt.isoformat(),
-        }
-        await ws_manager.broadcast_event(
-            session_id, {"type": WsEventType.USER_MESSAGE, "message": user_msg}
-        )
-
-        # 대기 중인 AskUserQuestion 클리어 (사용자가 답변 또는 새 프롬프트 전송)
-        await clear_pending_question(session_id)
-
-        # 워크플로우 처리
-        workflow_phase = None
-        workflow_service = None
-        workflow_step_config = None
-        claude_prompt = prompt
-
-        # 워크플로우 활성 상태면 준비 중 상태 알림
-        has_workflow = current_session and (
-            current_session.get("workflow_phase")
-            or (
-                current_session.get("workflow_phase_status")
-                and current_session.get("workflow_phase_status") != "completed"
-            )
-        )
-        if has_workflow:
-            await ws_manager.broadcast_event(
-                session_id, {"type": WsEventType.STATUS, "status": "preparing"}
+        # 턴 트레이스 시작 (러너 실행 종료 시 ClaudeRunner.run에서 종료)
+        trace = tracer.start_turn(session_id, turn_id, trigger="prompt")
+        try:
+            dispatch_started = time.perf_counter()
+            db_round_trips = track_round_trips()
+            logger.info(
+                "프롬프트 수신",
+                component="ws",
+                operation="message_receive",
+                prompt_length=len(prompt),
             )
 
-        if current_session:
-            wf_phase = current_session.get("workflow_phase")
-            wf_status = current_session.get("workflow_phase_status")
+            with tracer.span("session.load"):
+                # 세션 정보 로드
+                current_session = await manager.get(session_id)
+                if current_session and current_session.get("workspace_id"):
+                    bind_contextvars(workspace_id=current_session["workspace_id"])
+
+                # 글로벌 기본 설정 로드
+                settings_service = get_settings_service()
+                global_settings = await settings_service.get()
+
+            # allowed_tools: 요청 > 세션 > 글로벌 > env
+            allowed_tools = (
+                data.get("allowed_tools")
+                or (current_session.get("allowed_tools") if current_session else None)
+                or global_settings.get("allowed_tools")
+                or settings.claude_allowed_tools
+            )
 
-            # 워크플로우 활성화 상태인 경우에만 게이트 로직 실행
-            if wf_phase or (wf_status and wf_status != "completed"):
-                workflow_service = get_workflow_service()
-                workflow_phase, workflow_step_config, gate_error = (
-                    await workflow_service.resolve_workflow_state(
-                        session_id, current_session, manager, ws_manager,
-                    )
+            # 이미지 경로 목록 (업로드 API로 먼저 업로드한 파일 경로)
+            images = data.get("images", [])
+
+            # 세션에 이름이 없으면 첫 프롬프트로 자동 이름 설정
+            if current_session and not current_session.get("name"):
+                auto_name = prompt[:40].strip()
+                if len(prompt) > 40:
+                    auto_name += "…"
+                await manager.update_settings(session_id, name=auto_name)
+
+            # 메시지 DB 저장 + USER_MESSAGE 즉시 브로드캐스트 (워크플로우 처리 전)
+            ts_dt = utc_now()
+            with tracer.span("message.save"):
+                await manager.add_message(
+                    session_id=session_id,
+                    role="user",
+                    content=prompt,
+                    timestamp=ts_dt,
+                )
+                user_msg = {
+                    "role": "user",
+                    "content": prompt,
+                    "timestamp": ts_dt.isoformat(),
+                }
+                await ws_manager.broadcast_event(
+                    session_id, {"type": WsEventType.USER_MESSAGE, "message": user_msg}
                 )
-                # resolve_workflow_state가 phase를 업데이트했을 수 있으므로 로컬 반영
-                # (DB 재조회 대신 변경된 필드만 머지하여 왕복 절약)
-                if workflow_phase:
-                    current_session["workflow_phase"] = workflow_phase
-                    # 자동 복구 경로에서 DB에 "in_progress"가 저장됨.
-                    # 기존값이 있으면 유지, None이면 기본값 설정.
-                    if not current_session.get("workflow_phase_status"):
-                        current_session["workflow_phase_status"] = "in_progress"
-
-                if gate_error:
-                    await ws.send_json(
-                        {"type": WsEventType.ERROR, "message": gate_error}
-                    )
-                    return
-
-                # 워크플로우 최초 프롬프트 저장 (phase 컨텍스트 빌드에 사용)
-                if workflow_phase and not current_session.get("workflow_original_prompt"):
-                    await manager.update_settings(
-                        session_id, workflow_original_prompt=prompt
-                    )
-
-                # Phase별 컨텍스트 프롬프트 구성
-                if workflow_phase and workflow_service:
-                    # claude_session_id가 있으면 경량 컨텍스트 (continuation turn)
-                    has_session = bool(current_session.get("claude_session_id"))
-                    phase_context = await workflow_service.build_phase_context(
-                        session_id,
-                        workflow_phase,
-                        prompt,
-                        session_manager=manager,
-                        is_continuation=has_session,
-                    )
-                    if phase_context:
-                        claude_prompt = phase_context
-
-        # 글로벌 기본값으로 세션 설정 병합
-        merged_session = settings_service.merge_session_with_globals(
-            current_session, global_settings
-        )
-
-        # Knowledge Base + Workspace Insights 컨텍스트 병렬 로드
-        work_dir = current_session.get("work_dir") if current_session else None
-        ws_id = current_session.get("workspace_id") if current_session else None
 
-        async def _load_memory_ctx():
-            if not work_dir:
-                return None
-            svc = get_claude_memory_service()
-            return await svc.build_memory_context(work_dir)
+            # 대기 중인 AskUserQuestion 클리어 (사용자가 답변 또는 새 프롬프트 전송)
+            await clear_pending_question(session_id)
+
+            # 워크플로우 처리
+            workflow_phase = None
+            workflow_service = None
+            workflow_step_config = None
+            claude_prompt = prompt
+
+            # 워크플로우 활성 상태면 준비 중 상태 알림
+            has_workflow = current_session and (
+                current_session.get("workflow_phase")
+                or (
+                    current_session.get("workflow_phase_status")
+                    and current_session.get("workflow_phase_status") != "completed"
+                )
+            )
+            if has_workflow:
+                await ws_manager.broadcast_event(
+                    session_id, {"type": WsEventType.STATUS, "status": "preparing"}
+                )
 
-        async def _load_insight_ctx():
-            if not ws_id:
-                return ""
-            svc = get_insight_service()
-            return await svc.build_insight_context(ws_id)
+            if current_session:
+                wf_phase = current_session.get("workflow_phase")
+                wf_status = current_session.get("workflow_phase_status")
+
+                # 워크플로우 활성화 상태인 경우에만 게이트 로직 실행
+                if wf_phase or (wf_status and wf_status != "completed"):
+                    workflow_service = get_workflow_service()
+                    with tracer.span("workflow.resolve"):
+                        workflow_phase, workflow_step_config, gate_error = (
+                            await workflow_service.resolve_workflow_state(
+                                session_id, current_session, manager, ws_manager,
+                            )
+                        )
+                    # resolve_workflow_state가 phase를 업데이트했을 수 있으므로 로컬 반영
+                    # (DB 재조회 대신 변경된 필드만 머지하여 왕복 절약)
+                    if workflow_phase:
+                        current_session["workflow_phase"] = workflow_phase
+                        # 자동 복구 경로에서 DB에 "in_progress"가 저장됨.
+                        # 기존값이 있으면 유지, None이면 기본값 설정.
+                        if not current_session.get("workflow_phase_status"):
+                            current_session["workflow_phase_status"] = "in_progress"
+
+                    if gate_error:
+                        await ws.send_json(
+                            {"type": WsEventType.ERROR, "message": gate_error}
+                        )
+                        tracer.end_turn(trace, status="rejected")
+                        return
+
+                    # 워크플로우 최초 프롬프트 저장 (phase 컨텍스트 빌드에 사용)
+                    if workflow_phase and not current_session.get(
+                        "workflow_original_prompt"
+                    ):
+                        await manager.update_settings(
+                            session_id, workflow_original_prompt=prompt
+                        )
+
+                    # Phase별 컨텍스트 프롬프트 구성
+                    if workflow_phase and workflow_service:
+                        # claude_session_id가 있으면 경량 컨텍스트 (continuation turn)
+                        has_session = bool(current_session.get("claude_session_id"))
+                        with tracer.span("workflow.context", phase=workflow_phase):
+                            phase_context = await workflow_service.build_phase_context(
+                                session_id,
+                                workflow_phase,
+                                prompt,
+                                session_manager=manager,
+                                is_continuation=has_session,
+                            )
+                        if phase_context:
+                            claude_prompt = phase_context
+
+            # 글로벌 기본값으로 세션 설정 병합
+            merged_session = settings_service.merge_session_with_globals(
+                current_session, global_settings
+            )
 
-        memory_ctx, insight_ctx = await asyncio.gather(
-            _load_memory_ctx(), _load_insight_ctx(), return_exceptions=True,
-        )
+            # Knowledge Base + Workspace Insights 컨텍스트 병렬 로드
+            work_dir = current_session.get("work_dir") if current_session else None
+            ws_id = current_session.get("workspace_id") if current_session else None
+
+            async def _load_memory_ctx():
+                if not work_dir:
+                    return None
+                svc = get_claude_memory_service()
+                with tracer.span("context.memory"):
+                    return await svc.build_memory_context(work_dir)
+
+            async def _load_insight_ctx():
+                if not ws_id:
+                    return ""
+                svc = get_insight_service()
+                with tracer.span("context.insights"):
+                    return await svc.build_insight_context(ws_id)
+
+            with tracer.span("context.build"):
+                memory_ctx, insight_ctx = await asyncio.gather(
+                    _load_memory_ctx(), _load_insight_ctx(), return_exceptions=True,
+                )
 
-        # KB 컨텍스트 주입
-        if isinstance(memory_ctx, Exception):
-            logger.warning(
-                "KB 컨텍스트 주입 실패",
-                component="context",
-                operation="kb_inject",
-                is_error=True,
-                error=str(memory_ctx),
-            )
-            memory_ctx = None
-        if memory_ctx and memory_ctx.context_text:
-            existing = merged_session.get("system_prompt") or ""
-            kb_block = (
-                "\n\n<knowledge_base>\n"
-                + memory_ctx.context_text
-                + "\n</knowledge_base>"
-            )
-            merged_session["system_prompt"] = (
-                existing + kb_block if existing else kb_block
-            )
-            logger.info(
-                "KB 컨텍스트 주입 성공",
-                component="context",
-                operation="kb_inject",
-                context_length=len(memory_ctx.context_text),
-            )
+            # KB 컨텍스트 주입
+            if isinstance(memory_ctx, Exception):
+                logger.warning(
+                    "KB 컨텍스트 주입 실패",
+                    component="context",
+                    operation="kb_inject",
+                    is_error=True,
+                    error=str(memory_ctx),
+                )
+                memory_ctx = None
+            if memory_ctx and memory_ctx.context_text:
+                existing = merged_session.get("system_prompt") or ""
+                kb_block = (
+                    "\n\n<knowledge_base>\n"
+                    + memory_ctx.context_text
+                    + "\n</knowledge_base>"
+                )
+                merged_session["system_prompt"] = (
+                    existing + kb_block if existing else kb_block
+                )
+                logger.info(
+                    "KB 컨텍스트 주입 성공",
+                    component="context",
+                    operation="kb_inject",
+                    context_length=len(memory_ctx.context_text),
+                )
 
-        # Insights 컨텍스트 주입
-        if isinstance(insight_ctx, Exception):
-            logger.warning(
-                "인사이트 컨텍스트 주입 실패",
-                component="context",
-                operation="insights_inject",
-                is_error=True,
-                error=str(insight_ctx),
-            )
-            insight_ctx = ""
-        if insight_ctx:
-            existing = merged_session.get("system_prompt") or ""
-            insights_block = (
-                "\n\n<workspace_insights>\n"
-                + insight_ctx
-                + "\n</workspace_insights>"
-            )
-            merged_session["system_prompt"] = (
-                existing + insights_block
-                if existing
-                else insights_block
-            )
-            logger.info(
-                "인사이트 컨텍스트 주입 성공",
-                component="context",
-                operation="insights_inject",
-                context_length=len(insight_ctx),
-            )
+            # Insights 컨텍스트 주입
+            if isinstance(insight_ctx, Exception):
+                logger.warning(
+                    "인사이트 컨텍스트 주입 실패",
+                    component="context",
+                    operation="insights_inject",
+                    is_error=True,
+                    error=str(insight_ctx),
+                )
+                insight_ctx = ""
+            if insight_ctx:
+                existing = merged_session.get("system_prompt") or ""
+                insights_block = (
+                    "\n\n<workspace_insights>\n"
+                    + insight_ctx
+                    + "\n</workspace_insights>"
+                )
+                merged_session["system_prompt"] = (
+                    existing + insights_block
+                    if existing
+                    else insights_block
+                )
+                logger.info(
+                    "인사이트 컨텍스트 주입 성공",
+                    component="context",
+                    operation="insights_inject",
+                    context_length=len(insight_ctx),
+                )
 
-        # MCP 서비스 주입
-        mcp_service = get_mcp_service()
-
-        # ClaudeRunner에 최신 세션 정보 전달
-        task = asyncio.create_task(
-            runner.run(
-                merged_session,
-                claude_prompt if workflow_phase else prompt,
-                allowed_tools,
-                session_id,
-                ws_manager,
-                manager,
-                images=images,
-                mcp_service=mcp_service,
-                workflow_phase=workflow_phase,
-                workflow_service=workflow_service,
-                original_prompt=prompt,
-                workflow_step_config=workflow_step_config,
+            # MCP 서비스 주입
+            mcp_service = get_mcp_service()
+
+            # ClaudeRunner에 최신 세션 정보 전달
+            task = asyncio.create_task(
+                runner.run(
+                    merged_session,
+                    claude_prompt if workflow_phase else prompt,
+                    allowed_tools,
+                    session_id,
+                    ws_manager,
+                    manager,
+                    images=images,
+                    mcp_service=mcp_service,
+                    workflow_phase=workflow_phase,
+                    workflow_service=workflow_service,
+                    original_prompt=prompt,
+                    workflow_step_config=workflow_step_config,
+                )
             )
-        )
+        except BaseException:
+            tracer.end_turn(trace, status="error")
+            raise
+        finally:
+            # 러너 Task는 생성 시 컨텍스트를 복사해 트레이스를 이어받음 → 이후 WS
+            # 루프 작업이 턴 span 아래에 기록되지 않도록 현재 span 복원
+            tracer.detach(trace)
         task.add_done_callback(lambda t: _on_runner_task_done(t, session_id, manager))
         manager.set_runner_task(session_id, task)
         logger.info(
@@ -338,6 +367,8 @@ async def _handle_prompt(
             operation="turn_start",
             workflow_phase=workflow_phase,
             has_images=bool(images),
+            dispatch_ms=round((time.perf_counter() - dispatch_started) * 1000, 1),
+            db_round_trips=db_round_trips.count,
         )
         if workflow_phase:
             bind_contextvars(workflow_phase=workflow_phase)
@@ -387,7 +418,7 @@ async def _handle_permission_respond(data: dict) -> None:
     behavior = data.get("behavior", "deny")
     trust_level = data.get("trust_level", "once")
     if perm_id:
-        await respond_permission(perm_id, behavior, trust_level)
+        await respond_permission(perm_id, behavior, trust_level, data.get("rule"))
 
 
 @router.websocket("/ws/{session_id}")
@@ -408,6 +439,7 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
     settings = get_settings()
     runner = get_claude_runner()
     jsonl_watcher = get_jsonl_watcher()
+    git_watcher = get_git_watcher()
 
     session = await manager.get(session_id)
     if not session:
@@ -428,6 +460,9 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
     )
 
     ws_manager.register(session_id, ws)
+    # 작업 디렉토리 저장소의 git_status_changed 이벤트 구독
+    if git_watcher is not None:
+        await git_watcher.subscribe(session_id, session["work_dir"])
 
     try:
         # is_running 판단을 먼저 수행 (try_auto_start 이전)
@@ -570,4 +605,37 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
         clear_contextvars()
         # runner_task는 취소하지 않음 - Claude 프로세스와 함께 살아있어야 함
         ws_manager.unregister(session_id, ws)
+        if git_watcher is not None and not ws_manager.has_connections(session_id):
+            git_watcher.unsubscribe(session_id)
         # LRU가 자동으로 크기를 관리하므로 명시적 정리 불필요
+
+
+@router.websocket("/ws/pr-reviews/{job_id}")
+async def pr_review_websocket(ws: WebSocket, job_id: str):
+    """PR 리뷰 진행 상황 구독.
+
+    연결 직후 현재 상태(생성된 텍스트 포함)를 보내고, 이후 pr_review_delta
+    (offset 포함, 중복 수신 시 offset으로 무시)와 pr_review_status를 전송합니다.
+    """
+    await ws.accept()
+    ws_manager = get_ws_manager()
+    channel = pr_review_channel(job_id)
+    # 스냅샷 이전에 등록하여 그 사이의 델타 유실 방지
+    ws_manager.register(channel, ws)
+    try:
+        try:
+            status = await get_pr_review_service().get_status(job_id)
+        except NotFoundError as e:
+            await ws.send_json({"type": WsEventType.ERROR, "message": e.message})
+            await ws.close()
+            return
+        await ws.send_json(
+            {"type": WsEventType.PR_REVIEW_STATUS, **status.model_dump()}
+        )
+        # 클라이언트 메시지는 사용하지 않음 (연결 종료 감지용 수신)
+        while True:
+            await ws.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        ws_manager.unregister(channel, ws)
@@ -29,9 +29,95 @@ class Settings(BaseSettings):
     db_max_overflow: int = 40
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600
+    # asyncpg 연결별 prepared statement 캐시 / SQLAlchemy 컴파일 캐시 크기
+    db_statement_cache_size: int = 500
+    db_query_cache_size: int = 1000
+
+    # 글로벌 설정 read-through 캐시 TTL (초)
+    hot_cache_ttl_seconds: float = 5.0
+
+    # 세션 상태 캐시 (write-through LRU). TTL은 SessionManager 우회 쓰기 흡수용
+    session_cache_ttl_seconds: float = 300.0
+    session_cache_max_entries: int = 1000
+
+    # Git 상태 캐시: "watch"(파일시스템 변경 시에만 무효화) | "ttl"(10초 TTL)
+    # WSL2 /mnt 드라이브 등 OS 변경 알림이 동작하지 않는 환경에서는 "ttl" 사용
+    git_cache_mode: str = "watch"
+    git_watch_max_repos: int = 32
+    git_watch_debounce_ms: int = 300
+
+    # git 명령 동시 실행 한도 (전역 / 저장소별)
+    git_max_concurrency: int = 16
+    git_repo_max_concurrency: int = 4
+
+    # 백그라운드 원격 ref 동기화 (git fetch) 주기/동시 실행 수.
+    # 브랜치 목록 조회는 fetch 없이 캐시된 ref를 사용 (interval 0이면 비활성화)
+    git_ref_sync_interval_seconds: float = 300.0
+    git_ref_sync_concurrency: int = 2
+
+    # 워크스페이스 디스크 사용량 백그라운드 갱신 주기 (0이면 비활성화) /
+    # 병렬 스캔 작업 수 (FS_SCAN 실행기 공유)
+    workspace_disk_usage_interval_seconds: float = 600.0
+    workspace_disk_usage_parallelism: int = 4
+
+    # asyncio.to_thread 기본 실행기 스레드 수 (0이면 Python 기본값)
+    default_executor_max_workers: int = 0
+    # 작업 부하 유형별 실행기 크기
+    # pipe: 0이면 max_concurrent_sessions * 3 (Windows 세션당 stdout/stderr/wait)
+    pipe_executor_workers: int = 0
+    git_executor_workers: int = 8
+    scan_executor_workers: int = 4
+    cpu_executor_workers: int = 2  # JSONL 파싱 프로세스 풀 (0이면 스캔 스레드 사용)
+
+    # GitHub PR 목록/상세 캐시: fresh 이내는 그대로, stale 이내는 즉시 반환 +
+    # 백그라운드 갱신 (초)
+    github_pr_cache_fresh_seconds: float = 30.0
+    github_pr_cache_stale_seconds: float = 600.0
+
+    # PR 리뷰 작업 큐: 동시 처리 작업 수 / 대기열 크기 / claude 동시 실행 수.
+    # chunk_chars를 넘는 diff는 분할 리뷰 후 통합 (최대 max_chunks개 부분)
+    pr_review_workers: int = 2
+    pr_review_queue_size: int = 32
+    pr_review_claude_concurrency: int = 4
+    pr_review_chunk_chars: int = 50000
+    pr_review_max_chunks: int = 12
+    pr_review_timeout_seconds: float = 600.0
+
+    # diff 결과 캐시 (커밋 해시/blob OID 키, 메모리 + 디스크 크기 기반 LRU)
+    diff_cache_dir: str = ""
+    diff_cache_memory_bytes: int = 32 * 1024 * 1024
+    diff_cache_disk_bytes: int = 512 * 1024 * 1024
 
     # 동시성 제한
     max_concurrent_sessions: int = 50
+    # 턴 스케줄러: 낮은 우선순위 대기 턴을 한 단계 올리는 간격(초),
+    # 워크스페이스별 공정 큐잉 가중치 (workspace_id 또는 work_dir 키, 기본 1.0)
+    turn_scheduler_aging_seconds: float = 60.0
+    turn_scheduler_workspace_weights: dict[str, float] = {}
+    # 호스트 부하 admission: 코어당 1분 load average 상한 / 최소 가용 메모리
+    # (0이면 해당 검사 비활성화). 실행 중인 턴이 없으면 항상 허용
+    turn_admission_max_load_per_cpu: float = 2.0
+    turn_admission_min_available_mb: int = 512
+    # claude 프로세스 트리 자원 샘플링 주기 (초, 0이면 비활성화, Linux 전용).
+    # 메모리 PSI(some avg10 %)가 high 이상이거나 가용 메모리가 reserve 미만이면
+    # 동시 실행 한도를 줄이고(최소 min_concurrent_sessions), low 이하이면 복구
+    process_monitor_interval_seconds: float = 2.0
+    memory_pressure_high: float = 10.0
+    memory_pressure_low: float = 1.0
+    memory_reserve_mb: int = 1024
+    min_concurrent_sessions: int = 2
+    # 다음 턴 claude 프로세스 사전 기동 풀 크기 (0이면 비활성화) / warm 프로세스
+    # 유지 시간 (초). warm 프로세스도 Node + MCP 서버 메모리를 점유함
+    claude_warm_pool_size: int = 0
+    claude_warm_pool_idle_seconds: float = 300.0
+    # 세션 상주 claude 프로세스 최대 수 (0이면 비활성화 → 매 턴 --resume 실행) /
+    # 유휴 종료 시간 (초) / 턴 종료 시 프로세스 트리 RSS 상한 (MB, 0이면 무제한,
+    # process_monitor 필요). 재활용된 세션의 다음 턴은 --resume으로 복원
+    claude_resident_sessions: int = 0
+    claude_resident_idle_seconds: float = 600.0
+    claude_resident_max_rss_mb: int = 1536
+    # --mcp-config 파일 디렉토리 (내용 해시 파일명으로 턴 간 재사용)
+    mcp_config_dir: str = ""
 
     # 이벤트 큐 설정
     event_queue_maxsize: int = 50000
@@ -42,9 +128,23 @@ class Settings(BaseSettings):
     message_queue_maxsize: int = 50000
     message_flush_interval: float = 0.3
 
+    # Spill 저널: DB 장애 시 전달 불가 배치를 로컬 디스크에 보존 후 replay
+    spill_dir: str = ""
+    spill_max_bytes: int = 512 * 1024 * 1024  # 저널별 디스크 쿼터
+    spill_segment_bytes: int = 8 * 1024 * 1024
+
     # 하트비트 간격 (초)
     ws_heartbeat_interval: int = 15
 
+    # 턴 트레이싱: 턴당 최대 span 수 (초과분은 드롭 후 집계) / 세션별 보관 턴 수
+    # (flamegraph API). export 경로가 있으면 OTLP JSON을 줄 단위로 추가하고,
+    # OTLP 엔드포인트가 있으면 HTTP로 전송 (예: http://localhost:4318/v1/traces)
+    tracing_enabled: bool = True
+    tracing_max_spans_per_turn: int = 10000
+    tracing_retained_turns: int = 20
+    tracing_export_path: str = ""
+    tracing_otlp_endpoint: str = ""
+
     # Sentry / GlitchTip
     sentry_dsn: str = ""  # 비어있으면 비활성화
     sentry_environment: str = "development"
@@ -55,6 +155,10 @@ class Settings(BaseSettings):
     # 세션별: 분당 최대 프롬프트 수
     rate_limit_session_per_minute: float = 20
 
+    # Permission MCP 전송 방식: "http"(백엔드가 직접 호스팅, 전 세션 공유) |
+    # "stdio"(턴마다 permission_mcp_server.py 프로세스 실행, HTTP MCP 미지원 CLI용)
+    permission_mcp_transport: str = "http"
+
     # Stall Detection
     stall_timeout_seconds: int = 300
     max_retries: int = 2
@@ -85,6 +189,33 @@ class Settings(BaseSettings):
 
         return str(Path(tempfile.gettempdir()) / "rocket-session-uploads")
 
+    @property
+    def resolved_spill_dir(self) -> str:
+        if self.spill_dir:
+            return self.spill_dir
+        import tempfile
+        from pathlib import Path
+
+        return str(Path(tempfile.gettempdir()) / "rocket-session-spill")
+
+    @property
+    def resolved_diff_cache_dir(self) -> str:
+        if self.diff_cache_dir:
+            return self.diff_cache_dir
+        import tempfile
+        from pathlib import Path
+
+        return str(Path(tempfile.gettempdir()) / "rocket-session-diff-cache")
+
+    @property
+    def resolved_mcp_config_dir(self) -> str:
+        if self.mcp_config_dir:
+            return self.mcp_config_dir
+        import tempfile
+        from pathlib import Path
+
+        return str(Path(tempfile.gettempdir()) / "rocket-session-mcp")
+
     @property
     def sync_database_url(self) -> str:
         """Alembic 등 동기 실행용 URL (asyncpg -> psycopg2)."""
@@ -4,8 +4,10 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -15,6 +17,38 @@ from sqlalchemy.ext.asyncio import (
 logger = logging.getLogger(__name__)
 
 
+class RoundTripCounter:
+    """현재 컨텍스트에서 실행된 SQL 왕복(cursor execute) 횟수."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# 컨텍스트별 왕복 카운터 (자식 Task는 컨텍스트 복사로 같은 카운터를 공유)
+_round_trip_counter: ContextVar[RoundTripCounter | None] = ContextVar(
+    "db_round_trip_counter", default=None
+)
+
+
+def track_round_trips() -> RoundTripCounter:
+    """현재 컨텍스트에 새 왕복 카운터를 바인딩하고 반환.
+
+    이후 같은 컨텍스트(및 여기서 생성된 Task)의 SQL 실행이 집계됩니다.
+    structlog bind_contextvars와 같이 요청/턴 단위로 덮어쓰는 방식입니다.
+    """
+    counter = RoundTripCounter()
+    _round_trip_counter.set(counter)
+    return counter
+
+
+def _on_before_cursor_execute(*_args) -> None:
+    counter = _round_trip_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
 class Database:
     """asyncpg 기반 비동기 PostgreSQL 데이터베이스 관리.
 
@@ -28,6 +62,8 @@ class Database:
         max_overflow: int = 40,
         pool_timeout: int = 30,
         pool_recycle: int = 3600,
+        statement_cache_size: int = 500,
+        query_cache_size: int = 1000,
     ):
         self._database_url = database_url
         self._engine = create_async_engine(
@@ -38,11 +74,18 @@ class Database:
             pool_recycle=pool_recycle,
             pool_pre_ping=True,
             echo=False,
+            # SQLAlchemy 컴파일 캐시 (동일 구조 statement의 SQL 재컴파일 방지)
+            query_cache_size=query_cache_size,
             connect_args={
                 "timeout": 10,
                 "command_timeout": 60,
+                # 연결별 asyncpg prepared statement LRU (핫 쿼리 parse/plan 생략)
+                "prepared_statement_cache_size": statement_cache_size,
             },
         )
+        event.listen(
+            self._engine.sync_engine, "before_cursor_execute", _on_before_cursor_execute
+        )
         self._session_factory = async_sessionmaker(
             self._engine,
             class_=AsyncSession,
@@ -108,6 +151,15 @@ class Database:
             raw = await conn.get_raw_connection()
             yield raw.dbapi_connection
 
+    async def ping(self) -> bool:
+        """DB 연결 가능 여부 확인 (SELECT 1). 실패 시 False."""
+        try:
+            async with self._engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
     async def close(self):
         """엔진 및 연결 풀 종료."""
         await self._engine.dispose()
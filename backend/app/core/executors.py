@@ -0,0 +1,237 @@
+"""작업 부하 유형별 실행기 + 계측.
+
+블로킹 작업을 유형별로 독립된 크기의 실행기에서 실행하여, 대량 스캔이
+실행 중 세션의 파이프 읽기를 지연시키지 않도록 합니다. 모든 실행기는
+대기열 깊이/대기 시간을 측정하여 /health/detailed에서 포화 여부를
+확인할 수 있습니다. 분류되지 않은 asyncio.to_thread() 작업은 계측된
+기본 실행기를 사용합니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorKind:
+    """작업 부하 유형별 실행기 이름."""
+
+    # 실행 중 세션의 파이프/JSONL tail 읽기, /proc 조회, 명령 구성 (지연 민감)
+    PIPE = "pipe"
+    # diff 뷰어 작업 트리 파일 읽기, diff 캐시 디스크 I/O
+    GIT = "git"
+    # 디렉토리/로컬 세션 스캔, 디스크 사용량 계산, 메모리 파일, rmtree (대량)
+    FS_SCAN = "fs_scan"
+    # JSONL 메타데이터 파싱 (프로세스 풀, GIL 경합 회피)
+    CPU = "cpu"
+
+
+# configure_executors() 이전(테스트 등) 사용 시 기본 크기
+_DEFAULT_SIZES = {
+    ExecutorKind.PIPE: 32,
+    ExecutorKind.GIT: 8,
+    ExecutorKind.FS_SCAN: 4,
+    ExecutorKind.CPU: 2,
+}
+
+_default_executor: "InstrumentedThreadPoolExecutor | None" = None
+_sizes: dict[str, int] = dict(_DEFAULT_SIZES)
+_executors: dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """제출~실행 시작 대기 시간과 대기열 깊이를 기록하는 ThreadPoolExecutor."""
+
+    def __init__(self, max_workers: int, name: str):
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+        self.name = name
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        enqueued = time.monotonic()
+
+        def _run():
+            waited = time.monotonic() - enqueued
+            with self._stats_lock:
+                self._started += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self._completed += 1
+
+        with self._stats_lock:
+            self._submitted += 1
+        return super().submit(_run)
+
+    def get_metrics(self) -> dict:
+        """스레드 수, 실행/대기 작업 수, 대기 시간."""
+        with self._stats_lock:
+            submitted, started, completed = (
+                self._submitted,
+                self._started,
+                self._completed,
+            )
+            wait_total, wait_max = self._wait_total, self._wait_max
+        active = started - completed
+        return {
+            "max_workers": self._max_workers,
+            "threads": len(self._threads),
+            "active": active,
+            "queued": submitted - started,
+            "saturated": active >= self._max_workers,
+            "submitted_total": submitted,
+            "wait_ms_avg": round(wait_total / started * 1000, 2) if started else 0.0,
+            "wait_ms_max": round(wait_max * 1000, 2),
+        }
+
+
+class InstrumentedProcessPoolExecutor(ProcessPoolExecutor):
+    """제출~완료 시간과 미완료 작업 수를 기록하는 ProcessPoolExecutor."""
+
+    def __init__(self, max_workers: int, name: str):
+        # fork는 스레드가 있는 서버 프로세스에서 안전하지 않으므로 spawn 사용
+        super().__init__(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.name = name
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        submitted_at = time.monotonic()
+        future = super().submit(fn, *args, **kwargs)
+        with self._stats_lock:
+            self._submitted += 1
+
+        def _done(_: Future) -> None:
+            elapsed = time.monotonic() - submitted_at
+            with self._stats_lock:
+                self._completed += 1
+                self._run_total += elapsed
+                self._run_max = max(self._run_max, elapsed)
+
+        future.add_done_callback(_done)
+        return future
+
+    def get_metrics(self) -> dict:
+        """미완료 작업 수, 제출~완료 시간 (대기 포함)."""
+        with self._stats_lock:
+            submitted, completed = self._submitted, self._completed
+            run_total, run_max = self._run_total, self._run_max
+        pending = submitted - completed
+        return {
+            "max_workers": self.max_workers,
+            "pending": pending,
+            "saturated": pending >= self.max_workers,
+            "submitted_total": submitted,
+            "run_ms_avg": round(run_total / completed * 1000, 2) if completed else 0.0,
+            "run_ms_max": round(run_max * 1000, 2),
+        }
+
+
+def install_default_executor(
+    max_workers: int | None = None,
+) -> InstrumentedThreadPoolExecutor:
+    """실행 중인 이벤트 루프의 기본 실행기를 계측 실행기로 교체."""
+    global _default_executor
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    executor = InstrumentedThreadPoolExecutor(workers, "default")
+    asyncio.get_running_loop().set_default_executor(executor)
+    _default_executor = executor
+    return executor
+
+
+def configure_executors(sizes: dict[str, int]) -> None:
+    """유형별 실행기 크기 설정 (생성 전에 호출). CPU 크기 0이면 프로세스 풀 미사용."""
+    _sizes.update(sizes)
+
+
+def get_executor(kind: str) -> Executor:
+    """유형별 실행기 (최초 사용 시 생성)."""
+    executor = _executors.get(kind)
+    if executor is not None:
+        return executor
+    with _executors_lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            size = _sizes.get(kind) or _DEFAULT_SIZES[kind]
+            if kind == ExecutorKind.CPU:
+                executor = InstrumentedProcessPoolExecutor(size, kind)
+            else:
+                executor = InstrumentedThreadPoolExecutor(size, kind)
+            _executors[kind] = executor
+        return executor
+
+
+async def run_in_executor(kind: str, fn: Callable[..., T], /, *args: Any) -> T:
+    """유형별 스레드 실행기에서 fn 실행 (asyncio.to_thread처럼 contextvars 전파)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args)
+    return await loop.run_in_executor(get_executor(kind), call)
+
+
+async def run_cpu_bound(fn: Callable[..., T], /, *args: Any) -> T:
+    """CPU 작업을 프로세스 풀에서 실행.
+
+    fn과 인자는 pickle 가능해야 합니다 (모듈 수준 함수/staticmethod).
+    프로세스 풀을 쓸 수 없으면 FS_SCAN 스레드 실행기로 대체합니다.
+    """
+    if not _sizes.get(ExecutorKind.CPU):
+        return await run_in_executor(ExecutorKind.FS_SCAN, fn, *args)
+    loop = asyncio.get_running_loop()
+    executor = get_executor(ExecutorKind.CPU)
+    try:
+        return await loop.run_in_executor(executor, functools.partial(fn, *args))
+    except BrokenProcessPool as e:
+        # 워커 비정상 종료 → 다음 호출에서 새 풀 생성
+        logger.warning("CPU 프로세스 풀 손상, 스레드 실행기로 대체: %s", e)
+        with _executors_lock:
+            if _executors.get(ExecutorKind.CPU) is executor:
+                del _executors[ExecutorKind.CPU]
+        executor.shutdown(wait=False, cancel_futures=True)
+        return await run_in_executor(ExecutorKind.FS_SCAN, fn, *args)
+
+
+def shutdown_executors() -> None:
+    """유형별 실행기 종료 (진행 중 작업 완료를 기다리지 않음)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_executor_metrics() -> dict:
+    """실행기별 메트릭 (생성된 실행기만)."""
+    result = {}
+    if _default_executor is not None:
+        result[_default_executor.name] = _default_executor.get_metrics()
+    for kind, executor in list(_executors.items()):
+        result[kind] = executor.get_metrics()
+    return result
@@ -0,0 +1,607 @@
+"""턴 단위 성능 트레이싱 (OpenTelemetry 스타일 span).
+
+프롬프트 수신부터 워크플로우/컨텍스트 준비, 명령 구성, 프로세스 실행, 첫 stdout
+바이트, 이벤트 처리, WebSocket 전송, DB flush까지를 span 트리로 기록합니다.
+현재 span은 ContextVar로 전파되므로 턴 Task에서 생성된 자식 Task(fire-and-forget
+broadcast 등)도 같은 트레이스에 기록되고, 턴 컨텍스트 밖의 작업(배치 DB writer)은
+record_batch()로 세션의 활성 트레이스에 붙입니다.
+
+trace_id는 structlog에 바인딩되는 turn_id를 32자리로 패딩한 값이라 로그와
+바로 대조할 수 있습니다. 종료된 트레이스는 경로별 집계(flamegraph용)만 세션별로
+보관하고, 원본 span은 export(OTLP JSON 파일 / OTLP HTTP)로만 내보냅니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+_SERVICE_NAME = "rocket-session-backend"
+_EXPORT_QUEUE_MAXSIZE = 256
+
+
+class _NoopSpan:
+    """트레이스가 없거나 span 한도를 넘었을 때 반환되는 빈 span."""
+
+    __slots__ = ()
+    recording = False
+
+    def set(self, **attrs) -> None:
+        return None
+
+    def end(self) -> None:
+        return None
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """시작/종료 시각(perf_counter_ns)과 속성을 가진 구간.
+
+    with 블록으로 사용하면 블록 동안 현재 span이 되어 하위 span의 부모가 되고,
+    직접 end()를 호출하면 현재 span을 바꾸지 않고 구간만 기록합니다.
+    """
+
+    __slots__ = (
+        "_trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attrs",
+        "_token",
+    )
+    recording = True
+
+    def __init__(
+        self, trace: "Trace", span_id: int, parent_id: int | None, name: str, attrs
+    ):
+        self._trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self._token = None
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.end()
+        _current_span.reset(self._token)
+
+
+# 현재 span (Task 생성 시 컨텍스트 복사로 자식 Task에 전파)
+_current_span: ContextVar[Span | None] = ContextVar("trace_current_span", default=None)
+
+
+class Trace:
+    """턴 하나의 span 목록. 루트 span("turn")이 첫 항목."""
+
+    __slots__ = (
+        "trace_id",
+        "turn_id",
+        "session_id",
+        "spans",
+        "dropped",
+        "claimed",
+        "ended",
+        "_max_spans",
+        "_next_id",
+        "_wall_offset_ns",
+        "_token",
+    )
+
+    def __init__(self, session_id: str, turn_id: str, max_spans: int, attrs: dict):
+        self.turn_id = turn_id
+        self.trace_id = turn_id.rjust(32, "0")
+        self.session_id = session_id
+        self.spans: list[Span] = []
+        self.dropped = 0
+        # 러너가 이 트레이스를 이어받았는지 (자동 체이닝 턴은 새 트레이스)
+        self.claimed = False
+        self.ended = False
+        self._max_spans = max_spans
+        self._next_id = 1
+        self._wall_offset_ns = time.time_ns() - time.perf_counter_ns()
+        # start_turn이 현재 span을 바꾸기 전 값 (detach로 복원)
+        self._token = None
+        self.spans.append(Span(self, 1, None, "turn", attrs))
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    def new_span(self, name: str, parent_id: int, attrs: dict) -> Span | _NoopSpan:
+        if self.ended:
+            return _NOOP
+        if len(self.spans) >= self._max_spans:
+            self.dropped += 1
+            return _NOOP
+        self._next_id += 1
+        span = Span(self, self._next_id, parent_id, name, attrs)
+        self.spans.append(span)
+        return span
+
+    def unix_ns(self, perf_ns: int) -> int:
+        return self._wall_offset_ns + perf_ns
+
+
+@dataclass
+class TraceSummary:
+    """종료된 턴의 요약 + 경로별 집계 (path → [횟수, 총 ns, self ns])."""
+
+    trace_id: str
+    turn_id: str
+    started_at: str
+    duration_ms: float
+    span_count: int
+    dropped_spans: int
+    attrs: dict
+    stacks: dict[str, list[int]] = field(repr=False)
+
+    def to_dict(self) -> dict:
+        breakdown = {
+            path.split(";", 1)[1]: round(total / 1e6, 1)
+            for path, (_, total, _) in self.stacks.items()
+            if path.count(";") == 1
+        }
+        return {
+            "trace_id": self.trace_id,
+            "turn_id": self.turn_id,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "span_count": self.span_count,
+            "dropped_spans": self.dropped_spans,
+            "attrs": self.attrs,
+            "breakdown_ms": breakdown,
+        }
+
+
+def _aggregate(trace: Trace) -> dict[str, list[int]]:
+    """span 트리를 "turn;runner.run;..." 경로별 [횟수, 총 ns, self ns]로 집계.
+
+    종료되지 않은 span(예외 경로)은 루트 종료 시각까지로 계산합니다.
+    자식이 부모보다 오래 걸린 경우(fire-and-forget 전송) self는 0으로 자릅니다.
+    """
+    default_end = trace.root.end_ns or time.perf_counter_ns()
+    durations: dict[int, int] = {}
+    child_total: dict[int, int] = {}
+    for span in trace.spans:
+        duration = max((span.end_ns or default_end) - span.start_ns, 0)
+        durations[span.span_id] = duration
+        if span.parent_id is not None:
+            child_total[span.parent_id] = child_total.get(span.parent_id, 0) + duration
+
+    paths: dict[int, str] = {}
+    stacks: dict[str, list[int]] = {}
+    for span in trace.spans:
+        parent_path = paths.get(span.parent_id) if span.parent_id else None
+        path = f"{parent_path};{span.name}" if parent_path else span.name
+        paths[span.span_id] = path
+        duration = durations[span.span_id]
+        agg = stacks.get(path)
+        if agg is None:
+            agg = stacks[path] = [0, 0, 0]
+        agg[0] += 1
+        agg[1] += duration
+        agg[2] += max(duration - child_total.get(span.span_id, 0), 0)
+    return stacks
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_payload(trace: Trace) -> dict:
+    """OTLP/JSON ExportTraceServiceRequest."""
+    default_end = trace.root.end_ns or time.perf_counter_ns()
+    spans = []
+    for span in trace.spans:
+        item = {
+            "traceId": trace.trace_id,
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(trace.unix_ns(span.start_ns)),
+            "endTimeUnixNano": str(trace.unix_ns(span.end_ns or default_end)),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in span.attrs.items()
+            ],
+        }
+        if span.parent_id is not None:
+            item["parentSpanId"] = f"{span.parent_id:016x}"
+        spans.append(item)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": _SERVICE_NAME}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class FileSpanExporter:
+    """OTLP JSON 요청을 한 줄씩 파일에 추가 (collector 없이 로컬 분석용)."""
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def _append(self, line: str) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    async def export(self, payload: dict) -> None:
+        line = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+        await asyncio.to_thread(self._append, line)
+
+    async def close(self) -> None:
+        return None
+
+
+class OtlpHttpExporter:
+    """OTLP/HTTP JSON 전송 (예: http://localhost:4318/v1/traces)."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        import httpx
+
+        self._endpoint = endpoint
+        self._client = httpx.AsyncClient(timeout=timeout)
+
+    async def export(self, payload: dict) -> None:
+        response = await self._client.post(self._endpoint, json=payload)
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class Tracer:
+    """턴 트레이스 생성/종료, 세션별 요약 보관, 비동기 export."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_spans: int = 10000,
+        retained_turns: int = 20,
+        max_sessions: int = 200,
+    ):
+        self._enabled = enabled
+        self._max_spans = max_spans
+        self._retained_turns = retained_turns
+        self._max_sessions = max_sessions
+        self._active: dict[str, Trace] = {}
+        self._summaries: OrderedDict[str, deque[TraceSummary]] = OrderedDict()
+        self._exporters: list = []
+        self._export_queue: asyncio.Queue[Trace | None] | None = None
+        self._export_task: asyncio.Task | None = None
+        # 메트릭
+        self._traces_started = 0
+        self._traces_finished = 0
+        self._spans_recorded = 0
+        self._spans_dropped = 0
+        self._exported = 0
+        self._export_failures = 0
+        self._export_dropped = 0
+
+    def configure(
+        self,
+        *,
+        enabled: bool = True,
+        max_spans: int = 10000,
+        retained_turns: int = 20,
+        export_path: str = "",
+        otlp_endpoint: str = "",
+    ) -> None:
+        self._enabled = enabled
+        self._max_spans = max_spans
+        self._retained_turns = retained_turns
+        self._exporters = []
+        if enabled and export_path:
+            self._exporters.append(FileSpanExporter(export_path))
+        if enabled and otlp_endpoint:
+            self._exporters.append(OtlpHttpExporter(otlp_endpoint))
+
+    def start(self) -> None:
+        """export 워커 시작 (exporter가 설정된 경우)."""
+        if not self._exporters or self._export_task is not None:
+            return
+        self._export_queue = asyncio.Queue(maxsize=_EXPORT_QUEUE_MAXSIZE)
+        self._export_task = asyncio.create_task(self._export_loop())
+
+    async def close(self) -> None:
+        """대기 중인 트레이스 export 후 종료."""
+        if self._export_task is not None:
+            try:
+                self._export_queue.put_nowait(None)
+                await asyncio.wait_for(self._export_task, timeout=5)
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                self._export_task.cancel()
+            self._export_task = None
+            self._export_queue = None
+        for exporter in self._exporters:
+            try:
+                await exporter.close()
+            except Exception:
+                logger.debug("트레이스 exporter 종료 실패", exc_info=True)
+
+    async def _export_loop(self) -> None:
+        while True:
+            trace = await self._export_queue.get()
+            if trace is None:
+                return
+            payload = _otlp_payload(trace)
+            for exporter in self._exporters:
+                try:
+                    await exporter.export(payload)
+                    self._exported += 1
+                except Exception as e:
+                    self._export_failures += 1
+                    logger.warning(
+                        "트레이스 export 실패 (%s): %s", type(exporter).__name__, e
+                    )
+
+    # --- 트레이스 생성/종료 ---
+
+    def start_turn(
+        self, session_id: str, turn_id: str | None = None, **attrs
+    ) -> Trace | None:
+        """새 턴 트레이스를 시작하고 루트 span을 현재 span으로 설정."""
+        if not self._enabled:
+            return None
+        turn_id = turn_id or uuid4().hex[:12]
+        trace = Trace(
+            session_id,
+            turn_id,
+            self._max_spans,
+            {"session.id": session_id, "turn.id": turn_id, **attrs},
+        )
+        self._active[session_id] = trace
+        self._traces_started += 1
+        trace._token = _current_span.set(trace.root)
+        return trace
+
+    def detach(self, trace: Trace | None) -> None:
+        """start_turn 이전의 현재 span 복원 (트레이스는 종료하지 않음).
+
+        턴 Task는 생성 시점의 컨텍스트를 복사하므로 Task 생성 후 호출해도 턴
+        기록에는 영향이 없고, 호출한 컨텍스트의 이후 작업만 트레이스에서 빠집니다.
+        """
+        if trace is None or trace._token is None:
+            return
+        token, trace._token = trace._token, None
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            pass  # 다른 컨텍스트에서 시작된 트레이스
+
+    def current_trace(self) -> Trace | None:
+        span = _current_span.get()
+        if span is None or span._trace.ended:
+            return None
+        return span._trace
+
+    def claim_turn(self, session_id: str, **attrs) -> Trace | None:
+        """러너 실행 시작: 프롬프트 처리에서 시작된 트레이스를 이어받거나 새로 시작.
+
+        이미 다른 러너가 이어받은 트레이스(자동 체이닝 등)이면 새 트레이스를 만듭니다.
+        """
+        trace = self.current_trace()
+        if trace is None or trace.claimed or trace.session_id != session_id:
+            trace = self.start_turn(session_id, **attrs)
+            if trace is None:
+                return None
+        trace.claimed = True
+        return trace
+
+    def end_turn(self, trace: Trace | None, **attrs) -> None:
+        """루트 span 종료 → 요약 보관 + export 대기열 적재."""
+        if trace is None or trace.ended:
+            return
+        root = trace.root
+        root.set(**attrs)
+        root.end()
+        trace.ended = True
+        if self._active.get(trace.session_id) is trace:
+            del self._active[trace.session_id]
+        self._traces_finished += 1
+        self._spans_recorded += len(trace.spans)
+        self._spans_dropped += trace.dropped
+
+        summary = TraceSummary(
+            trace_id=trace.trace_id,
+            turn_id=trace.turn_id,
+            started_at=datetime.fromtimestamp(
+                trace.unix_ns(root.start_ns) / 1e9, tz=timezone.utc
+            ).isoformat(),
+            duration_ms=round((root.end_ns - root.start_ns) / 1e6, 1),
+            span_count=len(trace.spans),
+            dropped_spans=trace.dropped,
+            attrs={
+                k: v
+                for k, v in root.attrs.items()
+                if k not in ("session.id", "turn.id")
+            },
+            stacks=_aggregate(trace),
+        )
+        summaries = self._summaries.get(trace.session_id)
+        if summaries is None:
+            summaries = self._summaries[trace.session_id] = deque(
+                maxlen=self._retained_turns
+            )
+        self._summaries.move_to_end(trace.session_id)
+        summaries.append(summary)
+        while len(self._summaries) > self._max_sessions:
+            self._summaries.popitem(last=False)
+
+        if self._export_queue is not None:
+            try:
+                self._export_queue.put_nowait(trace)
+            except asyncio.QueueFull:
+                self._export_dropped += 1
+
+    # --- span 기록 ---
+
+    def span(self, name: str, **attrs) -> Span | _NoopSpan:
+        """현재 span의 자식 span (현재 트레이스가 없으면 no-op)."""
+        parent = _current_span.get()
+        if parent is None:
+            return _NOOP
+        return parent._trace.new_span(name, parent.span_id, attrs)
+
+    def record(
+        self, session_id: str, name: str, start_ns: int, end_ns: int, **attrs
+    ) -> None:
+        """이미 끝난 구간을 세션의 활성 트레이스에 기록 (턴 컨텍스트 밖 작업용)."""
+        trace = self._active.get(session_id)
+        if trace is None:
+            return
+        parent = _current_span.get()
+        if parent is None or parent._trace is not trace:
+            parent = trace.root
+        span = trace.new_span(name, parent.span_id, attrs)
+        if span.recording:
+            span.start_ns = start_ns
+            span.end_ns = end_ns
+
+    def record_batch(
+        self, name: str, start_ns: int, end_ns: int, session_ids: Iterable[str]
+    ) -> None:
+        """여러 세션의 이벤트를 한 번에 처리한 구간을 세션별로 기록 (DB 배치 flush)."""
+        if not self._active:
+            return
+        counts: dict[str, int] = {}
+        for session_id in session_ids:
+            counts[session_id] = counts.get(session_id, 0) + 1
+        batch_size = sum(counts.values())
+        for session_id, count in counts.items():
+            self.record(
+                session_id, name, start_ns, end_ns, events=count, batch=batch_size
+            )
+
+    # --- 조회 ---
+
+    def traces(self, session_id: str, limit: int = 20) -> list[dict]:
+        """세션의 최근 턴 트레이스 요약 (최신순)."""
+        summaries = self._summaries.get(session_id) or ()
+        return [s.to_dict() for s in reversed(list(summaries)[-limit:])]
+
+    def flamegraph(self, session_id: str, limit: int = 20) -> dict:
+        """최근 턴들의 span 경로 집계 (folded stacks + 트리).
+
+        folded는 "turn;runner.run;process.spawn <self µs>" 형식이라
+        flamegraph.pl / speedscope에 그대로 넣을 수 있습니다.
+        """
+        summaries = list(self._summaries.get(session_id) or ())[-limit:]
+        merged: dict[str, list[int]] = {}
+        for summary in summaries:
+            for path, (count, total, self_ns) in summary.stacks.items():
+                agg = merged.get(path)
+                if agg is None:
+                    agg = merged[path] = [0, 0, 0]
+                agg[0] += count
+                agg[1] += total
+                agg[2] += self_ns
+
+        root: dict = {"children": {}}
+        for path, (count, total, self_ns) in merged.items():
+            node = root
+            for frame in path.split(";"):
+                node = node["children"].setdefault(
+                    frame,
+                    {
+                        "name": frame,
+                        "count": 0,
+                        "total_ms": 0.0,
+                        "self_ms": 0.0,
+                        "children": {},
+                    },
+                )
+            node["count"] += count
+            node["total_ms"] += total / 1e6
+            node["self_ms"] += self_ns / 1e6
+
+        def _finish(node: dict) -> dict:
+            node["total_ms"] = round(node["total_ms"], 1)
+            node["self_ms"] = round(node["self_ms"], 1)
+            children = [_finish(child) for child in node["children"].values()]
+            node["children"] = sorted(
+                children, key=lambda c: c["total_ms"], reverse=True
+            )
+            return node
+
+        tree = _finish(root["children"]["turn"]) if "turn" in root["children"] else None
+        folded = "\n".join(
+            f"{path} {self_ns // 1000}"
+            for path, (_, _, self_ns) in sorted(merged.items())
+            if self_ns >= 1000
+        )
+        return {
+            "session_id": session_id,
+            "turns": len(summaries),
+            "total_ms": tree["total_ms"] if tree else 0.0,
+            "tree": tree,
+            "folded": folded,
+        }
+
+    def forget(self, session_id: str) -> None:
+        self._summaries.pop(session_id, None)
+
+    def get_metrics(self) -> dict:
+        return {
+            "enabled": self._enabled,
+            "active_traces": len(self._active),
+            "sessions_retained": len(self._summaries),
+            "traces_started": self._traces_started,
+            "traces_finished": self._traces_finished,
+            "spans_recorded": self._spans_recorded,
+            "spans_dropped": self._spans_dropped,
+            "exporters": [type(e).__name__ for e in self._exporters],
+            "exported": self._exported,
+            "export_failures": self._export_failures,
+            "export_dropped": self._export_dropped,
+        }
+
+
+tracer = Tracer()
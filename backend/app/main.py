@@ -31,10 +31,13 @@ if sys.platform == "win32":
 
 from app.core.exceptions import AppError  # noqa: E402
 from app.api.dependencies import (  # noqa: E402
+    get_claude_runner,
     get_database,
+    get_git_ref_sync,
     get_session_manager,
     get_settings,
     get_usage_service,
+    get_workspace_service,
     get_ws_manager,
     init_dependencies,
     shutdown_dependencies,
@@ -122,12 +125,44 @@ async def _run_background_tasks(shutdown_event: asyncio.Event) -> None:
             except Exception as e:
                 logging.getLogger(__name__).warning("세션 정합성 점검 실패: %s", e)
 
+    async def _guarded_ref_sync():
+        """워크스페이스/최근 조회 저장소 원격 ref 동기화."""
+        ref_sync = get_git_ref_sync()
+        if ref_sync is None:
+            return
+        try:
+            await ref_sync.run(shutdown_event)
+        except Exception as e:
+            logging.getLogger(__name__).error("원격 ref 동기화 루프 실패: %s", e)
+
+    async def _guarded_process_monitor():
+        """claude 프로세스 자원 샘플링 + 메모리 압박 기반 동시 실행 한도 조정."""
+        try:
+            await get_claude_runner().process_monitor.run(shutdown_event)
+        except Exception as e:
+            logging.getLogger(__name__).error("프로세스 자원 샘플링 루프 실패: %s", e)
+
+    async def _guarded_disk_usage():
+        """워크스페이스 디스크 사용량 주기적 갱신."""
+        interval = get_settings().workspace_disk_usage_interval_seconds
+        if interval <= 0:
+            return
+        try:
+            await get_workspace_service().run_disk_usage_refresh(
+                shutdown_event, interval
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error("디스크 사용량 갱신 루프 실패: %s", e)
+
     try:
         async with asyncio.TaskGroup() as tg:
             tg.create_task(_guarded_cleanup())
             tg.create_task(_guarded_mv_refresh())
             tg.create_task(_guarded_warmup())
             tg.create_task(_guarded_reconciliation())
+            tg.create_task(_guarded_ref_sync())
+            tg.create_task(_guarded_disk_usage())
+            tg.create_task(_guarded_process_monitor())
             # shutdown 시그널 대기 후 TaskGroup 탈출
             tg.create_task(shutdown_event.wait())
     except* Exception as eg:
@@ -149,6 +184,24 @@ async def lifespan(application: FastAPI):
 
     setup_sentry(settings.sentry_dsn, settings.sentry_environment)
 
+    from app.core.executors import (
+        ExecutorKind,
+        configure_executors,
+        install_default_executor,
+        shutdown_executors,
+    )
+
+    install_default_executor(settings.default_executor_max_workers or None)
+    configure_executors(
+        {
+            ExecutorKind.PIPE: settings.pipe_executor_workers
+            or settings.max_concurrent_sessions * 3,
+            ExecutorKind.GIT: settings.git_executor_workers,
+            ExecutorKind.FS_SCAN: settings.scan_executor_workers,
+            ExecutorKind.CPU: settings.cpu_executor_workers,
+        }
+    )
+
     await init_dependencies()
 
     shutdown_event = asyncio.Event()
@@ -170,6 +223,7 @@ async def lifespan(application: FastAPI):
     clear_pending()
     clear_all_cache()
     await shutdown_dependencies()
+    shutdown_executors()
 
 
 async def _app_error_handler(request: Request, exc: AppError) -> JSONResponse:
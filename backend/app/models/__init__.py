@@ -7,6 +7,8 @@ from app.models.global_settings import GlobalSettings
 from app.models.mcp_server import McpServer
 from app.models.memo_block import MemoBlock
 from app.models.message import Message
+from app.models.permission_request import PermissionRequestRecord
+from app.models.pr_review_job import PRReviewJob
 from app.models.session import Session, SessionStatus
 from app.models.session_artifact import ArtifactAnnotation, SessionArtifact
 from app.models.tag import SessionTag, Tag
@@ -23,6 +25,8 @@ __all__ = [
     "McpServer",
     "MemoBlock",
     "Message",
+    "PermissionRequestRecord",
+    "PRReviewJob",
     "Session",
     "SessionStatus",
     "SessionTag",
@@ -12,6 +12,8 @@ class CliEventType:
     ASSISTANT = "assistant"
     USER = "user"
     RESULT = "result"
+    # --include-partial-messages 사용 시 스트리밍 델타
+    STREAM_EVENT = "stream_event"
 
 
 class WsEventType:
@@ -21,6 +23,7 @@ class WsEventType:
     SESSION_STATE = "session_state"
     SESSION_INFO = "session_info"
     STATUS = "status"
+    QUEUE_POSITION = "queue_position"
     STOPPED = "stopped"
 
     # Messages
@@ -74,5 +77,12 @@ class WsEventType:
     STALL_DETECTED = "stall_detected"
     RETRY_ATTEMPT = "retry_attempt"
 
+    # Git
+    GIT_STATUS_CHANGED = "git_status_changed"
+
+    # PR review (/ws/pr-reviews/{job_id})
+    PR_REVIEW_STATUS = "pr_review_status"
+    PR_REVIEW_DELTA = "pr_review_delta"
+
 
 
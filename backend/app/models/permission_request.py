@@ -0,0 +1,41 @@
+"""Permission 요청 모델."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class PermissionRequestRecord(Base):
+    """permission_requests 테이블 ORM 모델.
+
+    사용자 응답을 기다리는 권한 요청을 보관하여 서버 재시작 후에도 프론트엔드
+    프롬프트를 복원하고, 재시작 전에 받은 응답을 CLI의 재요청에 적용합니다.
+    status: pending | allow | deny | expired
+    """
+
+    __tablename__ = "permission_requests"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    session_id: Mapped[str] = mapped_column(
+        String, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False
+    )
+    tool_name: Mapped[str] = mapped_column(String, nullable=False)
+    tool_input: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    status: Mapped[str] = mapped_column(String, nullable=False, default="pending")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    decided_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+
+    __table_args__ = (
+        Index("idx_permission_requests_status", "status"),
+        Index("idx_permission_requests_session_id", "session_id"),
+    )
@@ -0,0 +1,46 @@
+"""PR 리뷰 작업 모델."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class PRReviewJob(Base):
+    """pr_review_jobs 테이블 ORM 모델.
+
+    Claude Code CLI로 생성하는 PR 리뷰 작업과 결과를 보관합니다.
+    status: pending(대기/실행 중) | completed | error
+    """
+
+    __tablename__ = "pr_review_jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    repo_path: Mapped[str] = mapped_column(Text, nullable=False)
+    pr_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    head_sha: Mapped[str | None] = mapped_column(String, default=None)
+    status: Mapped[str] = mapped_column(String, nullable=False, default="pending")
+    review_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    error: Mapped[str | None] = mapped_column(Text, default=None)
+    # 대용량 diff 분할 리뷰 진행 상황 (단일 리뷰는 1)
+    chunks_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chunks_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+
+    __table_args__ = (
+        Index("idx_pr_review_jobs_status", "status"),
+        Index("idx_pr_review_jobs_repo_pr", "repo_path", "pr_number"),
+        Index("idx_pr_review_jobs_created_at", "created_at"),
+    )
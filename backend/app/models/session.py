@@ -85,6 +85,13 @@ class Session(Base):
         String, ForeignKey("workflow_definitions.id", ondelete="SET NULL"), default=None
     )
     pending_question: Mapped[dict | None] = mapped_column(JSONB, default=None)
+    # 비정규화 카운터 (메시지/파일 변경 Repository가 INSERT/DELETE와 같은 트랜잭션에서 유지)
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    file_changes_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Relationships — lazy="raise"로 실수로 N+1 쿼리가 발생하는 것을 방지
     # 필요 시 selectinload()로 명시적으로 로드해야 함
@@ -116,7 +123,7 @@ class Session(Base):
     )
 
     __table_args__ = (
-        Index("idx_sessions_created_at", "created_at"),
+        Index("idx_sessions_created_at_id", "created_at", "id"),
         Index("idx_sessions_claude_session_id", "claude_session_id"),
         Index("idx_sessions_status", "status"),
         Index("idx_sessions_model", "model"),
@@ -40,6 +40,8 @@ class Workspace(Base):
     validation_commands: Mapped[list | None] = mapped_column(
         JSONB, default=None
     )
+    # 워크스페이스 범위 permission 신뢰 규칙 (permission_engine 규칙 형식)
+    trusted_tools: Mapped[list | None] = mapped_column(JSONB, default=None)
 
     # Relationships
     sessions: Mapped[list["Session"]] = relationship(
@@ -1,9 +1,12 @@
 """파일 변경 Repository."""
 
+from collections import Counter
+
 from sqlalchemy import delete, func, select
 
 from app.models.file_change import FileChange
 from app.repositories.base import BaseRepository
+from app.repositories.session_repo import SessionRepository
 
 
 class FileChangeRepository(BaseRepository[FileChange]):
@@ -12,10 +15,13 @@ class FileChangeRepository(BaseRepository[FileChange]):
     model_class = FileChange
 
     async def add_file_change(self, **kwargs) -> None:
-        """단일 파일 변경 기록 추가."""
+        """단일 파일 변경 기록 추가 (sessions.file_changes_count 동시 갱신)."""
         fc = FileChange(**kwargs)
         self._session.add(fc)
         await self._session.flush()
+        await SessionRepository(self._session).increment_file_change_counts(
+            {fc.session_id: 1}
+        )
 
     async def add_batch(self, records: list[dict]) -> None:
         """파일 변경 기록 배치 추가."""
@@ -24,6 +30,9 @@ class FileChangeRepository(BaseRepository[FileChange]):
         for rec in records:
             self._session.add(FileChange(**rec))
         await self._session.flush()
+        await SessionRepository(self._session).increment_file_change_counts(
+            Counter(rec["session_id"] for rec in records)
+        )
 
     async def get_by_session(self, session_id: str) -> list[dict]:
         """세션의 파일 변경 기록 조회 (시간순)."""
@@ -56,3 +65,4 @@ class FileChangeRepository(BaseRepository[FileChange]):
         """세션의 전체 파일 변경 기록 삭제."""
         stmt = delete(FileChange).where(FileChange.session_id == session_id)
         await self._session.execute(stmt)
+        await SessionRepository(self._session).reset_counts(session_id, messages=False)
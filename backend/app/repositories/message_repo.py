@@ -1,9 +1,12 @@
 """메시지 Repository."""
 
+from collections import Counter
+
 from sqlalchemy import delete, func, insert, literal_column, select
 
 from app.models.message import Message
 from app.repositories.base import BaseRepository
+from app.repositories.session_repo import SessionRepository
 
 
 class MessageRepository(BaseRepository[Message]):
@@ -12,17 +15,23 @@ class MessageRepository(BaseRepository[Message]):
     model_class = Message
 
     async def add_message(self, **kwargs) -> None:
-        """단일 메시지 추가."""
+        """단일 메시지 추가 (sessions.message_count 동시 갱신)."""
         msg = Message(**kwargs)
         self._session.add(msg)
         await self._session.flush()
+        await SessionRepository(self._session).increment_message_counts(
+            {msg.session_id: 1}
+        )
 
     async def add_batch(self, messages: list[dict]) -> None:
-        """메시지 배치 저장 (import 등에서 사용)."""
+        """메시지 배치 저장 (import 등에서 사용). sessions.message_count 동시 갱신."""
         if not messages:
             return
         stmt = insert(Message).values(messages)
         await self._session.execute(stmt)
+        await SessionRepository(self._session).increment_message_counts(
+            Counter(m["session_id"] for m in messages)
+        )
 
     _MESSAGE_COLUMNS = [
         Message.role,
@@ -93,6 +102,9 @@ class MessageRepository(BaseRepository[Message]):
         """세션의 전체 메시지 삭제."""
         stmt = delete(Message).where(Message.session_id == session_id)
         await self._session.execute(stmt)
+        await SessionRepository(self._session).reset_counts(
+            session_id, file_changes=False
+        )
 
     async def copy_messages_to_session(
         self,
@@ -150,4 +162,7 @@ class MessageRepository(BaseRepository[Message]):
         )
         result = await self._session.execute(insert_stmt)
         await self._session.flush()
+        await SessionRepository(self._session).increment_message_counts(
+            {target_session_id: result.rowcount}
+        )
         return result.rowcount
@@ -0,0 +1,56 @@
+"""Permission 요청 Repository."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+
+from app.models.permission_request import PermissionRequestRecord
+from app.repositories.base import BaseRepository
+
+
+class PermissionRequestRepository(BaseRepository[PermissionRequestRecord]):
+    """permission_requests CRUD + 재시작 복구/정리 쿼리."""
+
+    model_class = PermissionRequestRecord
+
+    async def list_pending(self) -> list[PermissionRequestRecord]:
+        """응답 대기 중인 요청 (생성 순)."""
+        stmt = (
+            select(PermissionRequestRecord)
+            .where(PermissionRequestRecord.status == "pending")
+            .order_by(PermissionRequestRecord.created_at)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def set_status(
+        self, request_id: str, status: str, decided_at: datetime
+    ) -> None:
+        """요청 상태 갱신 (조회 없이)."""
+        await self._session.execute(
+            update(PermissionRequestRecord)
+            .where(PermissionRequestRecord.id == request_id)
+            .values(status=status, decided_at=decided_at)
+        )
+
+    async def expire_pending_before(self, cutoff: datetime, now: datetime) -> int:
+        """cutoff 이전에 생성된 대기 요청을 expired로 전환."""
+        stmt = (
+            update(PermissionRequestRecord)
+            .where(
+                PermissionRequestRecord.status == "pending",
+                PermissionRequestRecord.created_at < cutoff,
+            )
+            .values(status="expired", decided_at=now)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def delete_decided_before(self, cutoff: datetime) -> int:
+        """cutoff 이전에 생성된 처리 완료 요청 삭제."""
+        stmt = delete(PermissionRequestRecord).where(
+            PermissionRequestRecord.created_at < cutoff,
+            PermissionRequestRecord.status != "pending",
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
@@ -0,0 +1,38 @@
+"""PR 리뷰 작업 Repository."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+
+from app.models.pr_review_job import PRReviewJob
+from app.repositories.base import BaseRepository
+
+
+class PRReviewJobRepository(BaseRepository[PRReviewJob]):
+    """pr_review_jobs CRUD + 복구/정리 쿼리."""
+
+    model_class = PRReviewJob
+
+    async def list_unfinished(self) -> list[PRReviewJob]:
+        """완료되지 않은 작업 (생성 순)."""
+        stmt = (
+            select(PRReviewJob)
+            .where(PRReviewJob.status == "pending")
+            .order_by(PRReviewJob.created_at)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def update_fields(self, job_id: str, **values) -> None:
+        """작업 필드 업데이트 (조회 없이)."""
+        await self._session.execute(
+            update(PRReviewJob).where(PRReviewJob.id == job_id).values(**values)
+        )
+
+    async def delete_older_than(self, cutoff: datetime) -> int:
+        """cutoff 이전에 생성된 완료/실패 작업 삭제."""
+        stmt = delete(PRReviewJob).where(
+            PRReviewJob.created_at < cutoff, PRReviewJob.status != "pending"
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
@@ -1,10 +1,11 @@
 """세션 검색 Repository (PostgreSQL tsvector/tsquery 기반)."""
 
-from sqlalchemy import func, literal_column, select
+import json
+from datetime import datetime
+
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.file_change import FileChange
-from app.models.message import Message
 from app.models.session import Session
 from app.models.tag import SessionTag
 from app.repositories.session_repo import _session_to_dict
@@ -31,10 +32,14 @@ class SearchRepository:
         order: str = "desc",
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
-        """세션 검색. (items, total) 튜플 반환.
+        after: tuple[datetime, str] | None = None,
+        estimate_total: bool = False,
+    ) -> tuple[list[dict], int, tuple[datetime, str] | None]:
+        """세션 검색. (items, total, next_key) 튜플 반환.
 
-        COUNT(*) OVER() 윈도우 함수로 count/data 쿼리를 단일 쿼리로 통합.
+        created_at 정렬은 (created_at, id) keyset 페이지네이션을 지원하며,
+        next_key는 다음 페이지 조회용 마지막 행의 (created_at, id)입니다.
+        message_count/file_changes_count는 sessions 비정규화 컬럼을 사용합니다.
 
         Args:
             q: LIKE 검색어 (이름/ID 부분 일치)
@@ -48,29 +53,10 @@ class SearchRepository:
             sort: 정렬 기준 컬럼
             order: 정렬 방향 (asc/desc)
             limit: 조회 제한
-            offset: 조회 시작 위치
+            offset: 조회 시작 위치 (after 지정 시 무시)
+            after: keyset 커서 — 이 (created_at, id) 다음 행부터 조회
+            estimate_total: True면 total을 플래너 추정치로 대체 (COUNT 생략)
         """
-        # correlated subquery로 메시지 수/파일 변경 수 계산
-        msg_count = (
-            select(func.count())
-            .where(Message.session_id == Session.id)
-            .correlate(Session)
-            .scalar_subquery()
-            .label("message_count")
-        )
-        fc_count = (
-            select(func.count())
-            .where(FileChange.session_id == Session.id)
-            .correlate(Session)
-            .scalar_subquery()
-            .label("file_changes_count")
-        )
-
-        # COUNT(*) OVER() 윈도우 함수: 별도 count 쿼리 없이 총 개수 계산
-        total_count = func.count().over().label("total_count")
-
-        base = select(Session, msg_count, fc_count, total_count)
-
         # 필터 조건 누적
         filters = []
 
@@ -108,37 +94,50 @@ class SearchRepository:
             )
             filters.append(Session.id.in_(select(tag_sub.c.session_id)))
 
-        if filters:
-            base = base.where(*filters)
-
-        # 정렬 컬럼 결정
-        allowed_sorts = {"created_at", "name", "status", "model"}
-        if sort == "message_count":
-            order_col = literal_column("message_count")
-        elif sort in allowed_sorts:
-            order_col = getattr(Session, sort)
+        # 정렬 컬럼 결정 (id를 보조 정렬 키로 추가하여 페이지 경계 안정화)
+        allowed_sorts = {"created_at", "name", "status", "model", "message_count"}
+        order_col = getattr(Session, sort if sort in allowed_sorts else "created_at")
+        ascending = order.lower() == "asc"
+        keyset = order_col is Session.created_at
+
+        base = select(Session).where(*filters)
+        if after is not None and keyset:
+            key = tuple_(Session.created_at, Session.id)
+            base = base.where(key > tuple_(*after) if ascending else key < tuple_(*after))
+        elif offset:
+            base = base.offset(offset)
+        if ascending:
+            base = base.order_by(order_col.asc(), Session.id.asc())
         else:
-            order_col = Session.created_at
+            base = base.order_by(order_col.desc(), Session.id.desc())
 
-        if order.lower() == "asc":
-            base = base.order_by(order_col.asc())
-        else:
-            base = base.order_by(order_col.desc())
+        # limit + 1개를 조회해 다음 페이지 존재 여부 판단
+        result = await self._session.execute(base.limit(limit + 1))
+        entities = list(result.scalars().all())
+        has_more = len(entities) > limit
+        entities = entities[:limit]
 
-        base = base.limit(limit).offset(offset)
+        next_key = None
+        if keyset and has_more:
+            next_key = (entities[-1].created_at, entities[-1].id)
 
-        result = await self._session.execute(base)
-        rows = result.all()
+        if estimate_total:
+            total = await self._estimate_count(select(Session.id).where(*filters))
+        else:
+            count_stmt = select(func.count()).select_from(Session).where(*filters)
+            total = (await self._session.execute(count_stmt)).scalar_one()
 
-        # 첫 행에서 total_count 추출 (결과가 없으면 0)
-        total = rows[0][3] if rows else 0
+        items = [_session_to_dict(entity) for entity in entities]
+        return items, total, next_key
 
-        items = [
-            {
-                **_session_to_dict(row[0]),
-                "message_count": row[1],
-                "file_changes_count": row[2],
-            }
-            for row in rows
-        ]
-        return items, total
+    async def _estimate_count(self, stmt) -> int:
+        """플래너 행 수 추정치 (EXPLAIN) — 대용량 테이블에서 COUNT(*) 스캔 회피."""
+        conn = await self._session.connection()
+        sql = stmt.compile(
+            dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+        )
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
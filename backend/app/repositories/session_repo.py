@@ -1,8 +1,9 @@
 """세션 Repository."""
 
-from sqlalchemy import func, literal, select, update
+from collections.abc import Mapping
+
+from sqlalchemy import bindparam, func, literal, select, update
 
-from app.models.file_change import FileChange
 from app.models.message import Message
 from app.models.session import Session
 from app.repositories.base import BaseRepository
@@ -40,77 +41,58 @@ class SessionRepository(BaseRepository[Session]):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    def _counts_query(self):
-        """message/file_change 카운트 서브쿼리를 포함한 기본 SELECT 반환."""
-        msg_sub = (
-            select(Message.session_id, func.count().label("cnt"))
-            .group_by(Message.session_id)
-            .subquery()
-        )
-        fc_sub = (
-            select(FileChange.session_id, func.count().label("cnt"))
-            .group_by(FileChange.session_id)
-            .subquery()
-        )
-        return (
-            select(
-                Session,
-                func.coalesce(msg_sub.c.cnt, 0).label("message_count"),
-                func.coalesce(fc_sub.c.cnt, 0).label("file_changes_count"),
-            )
-            .outerjoin(msg_sub, msg_sub.c.session_id == Session.id)
-            .outerjoin(fc_sub, fc_sub.c.session_id == Session.id)
-        )
-
     async def list_with_counts(self, *, limit: int = 200) -> list[dict]:
-        """세션 목록 + message_count, file_changes_count.
-
-        LIMIT 적용 후 상관 서브쿼리로 카운트를 조회하여
-        전체 테이블 GROUP BY를 방지합니다.
-        """
-        msg_count_sub = (
-            select(func.count())
-            .where(Message.session_id == Session.id)
-            .correlate(Session)
-            .scalar_subquery()
-        )
-        fc_count_sub = (
-            select(func.count())
-            .where(FileChange.session_id == Session.id)
-            .correlate(Session)
-            .scalar_subquery()
-        )
+        """세션 목록 (최신순). message_count/file_changes_count는 비정규화 컬럼."""
         stmt = (
-            select(
-                Session,
-                msg_count_sub.label("message_count"),
-                fc_count_sub.label("file_changes_count"),
-            )
-            .order_by(Session.created_at.desc())
+            select(Session)
+            .order_by(Session.created_at.desc(), Session.id.desc())
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return [
-            {
-                **_session_to_dict(row[0]),
-                "message_count": row[1],
-                "file_changes_count": row[2],
-            }
-            for row in result.all()
-        ]
+        return [_session_to_dict(entity) for entity in result.scalars().all()]
 
     async def get_with_counts(self, session_id: str) -> dict | None:
         """단일 세션 + message_count, file_changes_count."""
-        stmt = self._counts_query().where(Session.id == session_id)
-        result = await self._session.execute(stmt)
-        row = result.one_or_none()
-        if not row:
-            return None
-        return {
-            **_session_to_dict(row[0]),
-            "message_count": row[1],
-            "file_changes_count": row[2],
-        }
+        entity = await self.get_by_id(session_id)
+        return _session_to_dict(entity) if entity else None
+
+    async def increment_message_counts(self, deltas: Mapping[str, int]) -> None:
+        """세션별 message_count 증감 (메시지 INSERT와 같은 트랜잭션에서 호출)."""
+        await self._increment_counter(Session.__table__.c.message_count, deltas)
+
+    async def increment_file_change_counts(self, deltas: Mapping[str, int]) -> None:
+        """세션별 file_changes_count 증감."""
+        await self._increment_counter(Session.__table__.c.file_changes_count, deltas)
+
+    async def _increment_counter(self, column, deltas: Mapping[str, int]) -> None:
+        # 세션 ID 정렬 순서로 갱신 → 동시 배치 간 행 잠금 순서 고정 (데드락 방지)
+        params = [
+            {"sid": sid, "delta": delta}
+            for sid, delta in sorted(deltas.items())
+            if delta
+        ]
+        if not params:
+            return
+        table = Session.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("sid"))
+            .values({column: column + bindparam("delta")})
+        )
+        await self._session.execute(stmt, params)
+
+    async def reset_counts(
+        self, session_id: str, *, messages: bool = True, file_changes: bool = True
+    ) -> None:
+        """카운터 초기화 (세션 히스토리 삭제 시)."""
+        values: dict = {}
+        if messages:
+            values["message_count"] = 0
+        if file_changes:
+            values["file_changes_count"] = 0
+        if values:
+            stmt = update(Session).where(Session.id == session_id).values(**values)
+            await self._session.execute(stmt)
 
     async def get_stats(self, session_id: str) -> dict | None:
         """세션별 누적 통계 (토큰, 비용, 소요 시간)."""
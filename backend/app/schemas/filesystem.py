@@ -135,6 +135,7 @@ class GitHubPREntry(BaseModel):
     draft: bool = False
     additions: int = 0
     deletions: int = 0
+    head_sha: str = ""
 
 
 class GitHubPRListResponse(BaseModel):
@@ -179,6 +180,7 @@ class GitHubPRDetail(BaseModel):
     reviews: list[GitHubPRReview] = []
     comments: list[GitHubPRComment] = []
     mergeable: Optional[str] = None
+    head_sha: str = ""
     error: Optional[str] = None
 
 
@@ -211,7 +213,14 @@ class PRReviewStatusResponse(BaseModel):
 
     job_id: str
     status: str  # pending | completed | error
+    # pending 세부 단계: queued | reviewing | merging (분할 리뷰 통합)
+    phase: str = ""
+    pr_number: int = 0
+    head_sha: Optional[str] = None
+    # 진행 중이면 지금까지 생성된 부분 텍스트
     review_text: str = ""
+    chunks_total: int = 0
+    chunks_done: int = 0
     error: Optional[str] = None
 
 
@@ -12,3 +12,7 @@ class PaginatedSessionsResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    # created_at 정렬 시 다음 페이지 keyset 커서 (마지막 페이지면 None)
+    next_cursor: str | None = None
+    # total_mode=estimated 요청 시 True (total은 플래너 추정치)
+    total_estimated: bool = False
@@ -10,12 +10,12 @@ Memory 파일 위치:
 - Serena Memory: <project_root>/.serena/memories/*.md
 """
 
-import asyncio
 import logging
 import time
 from pathlib import Path
 from typing import Any
 
+from app.core.executors import ExecutorKind, run_in_executor
 from app.schemas.claude_memory import (
     MemoryContextResponse,
     MemoryFileContent,
@@ -106,7 +106,7 @@ class ClaudeMemoryService:
         path = path.replace("/", "-")
         return path
 
-    # ── 동기 구현체 (asyncio.to_thread에서 실행) ──────────────
+    # ── 동기 구현체 (FS_SCAN 실행기에서 실행) ──────────────
 
     def _list_memory_files_sync(self, local_path: str) -> list[MemoryFileInfo]:
         """파일시스템에서 Memory 파일 목록 수집 (블로킹 I/O)."""
@@ -219,7 +219,9 @@ class ClaudeMemoryService:
         if cached is not None:
             return cached
 
-        files = await asyncio.to_thread(self._list_memory_files_sync, local_path)
+        files = await run_in_executor(
+            ExecutorKind.FS_SCAN, self._list_memory_files_sync, local_path
+        )
         self._set_cached(cache_key, files)
         return files
 
@@ -234,8 +236,8 @@ class ClaudeMemoryService:
         """
         if not local_path or not local_path.strip():
             return None
-        return await asyncio.to_thread(
-            self._read_memory_file_sync, local_path, relative_path
+        return await run_in_executor(
+            ExecutorKind.FS_SCAN, self._read_memory_file_sync, local_path, relative_path
         )
 
     async def build_memory_context(
@@ -265,7 +267,8 @@ class ClaudeMemoryService:
 
         # P3: 일괄 파일 읽기 — 단일 thread 호출로 N번 스위칭 방지
         target_files = files[:limit]
-        contents = await asyncio.to_thread(
+        contents = await run_in_executor(
+            ExecutorKind.FS_SCAN,
             self._read_multiple_files_sync,
             local_path,
             [f.relative_path for f in target_files],
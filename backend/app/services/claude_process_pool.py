@@ -0,0 +1,267 @@
+"""사전 기동(warm) Claude CLI 프로세스 풀.
+
+매 턴마다 claude를 새로 실행하면 Node 기동, CLI 초기화, MCP 서버 실행,
+--resume 대화 기록 로드 비용을 모두 치른 뒤에야 첫 이벤트가 나옵니다.
+이 풀은 턴이 끝난 세션의 "다음 턴" 프로세스를 --input-format stream-json
+모드로 미리 실행해 두고, 다음 프롬프트가 오면 프로세스를 새로 만들지 않고
+stdin에 사용자 메시지를 기록합니다.
+
+명령줄 인자(프롬프트 제외)와 작업 디렉토리, --mcp-config 파일 내용이
+모두 같을 때만 재사용하고, 다르면 폐기 후 새로 실행합니다. 세션당 최대
+1개, 전체 max_size개까지 유지하며 idle_ttl이 지나면 종료합니다.
+
+warm 프로세스가 참조하는 MCP config 파일은 항목이 살아 있는 동안 참조를
+유지하고(다른 턴의 정리로 삭제되지 않도록), 사용/만료/폐기 시 반납합니다.
+ProcessMonitor에는 유휴 프로세스로 등록되어 메모리 압박 시 먼저 회수됩니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.services.process_monitor import ProcessMonitor
+
+logger = logging.getLogger(__name__)
+
+# (cmd, work_dir) → stdin/stdout/stderr PIPE 프로세스
+SpawnFunc = Callable[[list[str], str], Awaitable[asyncio.subprocess.Process]]
+
+STREAM_INPUT_ARGS = ["--input-format", "stream-json"]
+
+
+def to_stream_input(cmd: list[str]) -> tuple[list[str], str]:
+    """["claude", "-p", prompt, ...] → (stdin 입력 모드 명령, prompt)."""
+    if len(cmd) < 3 or cmd[1] != "-p":
+        raise ValueError(f"claude -p 명령이 아닙니다: {cmd[:2]}")
+    return [cmd[0], "-p", *STREAM_INPUT_ARGS, *cmd[3:]], cmd[2]
+
+
+def user_message_line(prompt: str) -> bytes:
+    """stream-json 입력용 사용자 메시지 한 줄."""
+    message = {
+        "type": "user",
+        "message": {"role": "user", "content": [{"type": "text", "text": prompt}]},
+    }
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def command_signature(cmd: list[str], work_dir: str) -> tuple:
+    """재사용 판정 키.
+
+    --mcp-config 경로는 McpConfigStore의 내용 해시 파일명이므로 경로 비교가
+    곧 내용 비교입니다 (파일을 다시 읽지 않음).
+    """
+    return (work_dir, tuple(cmd))
+
+
+@dataclass(eq=False)
+class _Warm:
+    key: str
+    signature: tuple
+    process: asyncio.subprocess.Process
+    spawned_at: float
+    mcp_config: Path | None = None
+    expiry: asyncio.TimerHandle | None = None
+
+
+class ClaudeProcessPool:
+    """세션별 다음 턴용 warm 프로세스 관리."""
+
+    def __init__(
+        self,
+        spawn: SpawnFunc,
+        *,
+        max_size: int = 0,
+        idle_ttl: float = 300.0,
+        release_config: Callable[[Path | None], None] | None = None,
+        monitor: ProcessMonitor | None = None,
+    ):
+        self._spawn = spawn
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._release_config = release_config
+        self._monitor = monitor
+        self._warm: OrderedDict[str, _Warm] = OrderedDict()
+        self._prewarming: dict[str, asyncio.Task] = {}
+        self._reapers: set[asyncio.Task] = set()
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+        self._mismatches = 0
+        self._dead = 0
+        self._expired = 0
+        self._evicted = 0
+        self._reclaimed = 0
+        self._prewarmed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    async def acquire(
+        self, key: str, cmd: list[str], work_dir: str
+    ) -> tuple[asyncio.subprocess.Process, bool]:
+        """일치하는 warm 프로세스가 있으면 반환, 없으면 새로 실행 → (process, warm)."""
+        pending = self._prewarming.get(key)
+        if pending is not None and not pending.done():
+            # 사전 기동 중 → 완료를 기다리는 편이 새 실행보다 빠름
+            await asyncio.wait({pending})
+        entry = self._warm.pop(key, None)
+        if entry is not None:
+            if entry.process.returncode is not None:
+                self._dead += 1
+                self._release(entry)
+            elif entry.signature != command_signature(cmd, work_dir):
+                self._mismatches += 1
+                self._release(entry)
+            else:
+                self._hits += 1
+                # 이후 자원 추적/config 참조는 턴 쪽에서 관리
+                self._detach(entry)
+                return entry.process, True
+        self._misses += 1
+        return await self._spawn(cmd, work_dir), False
+
+    def prewarm(
+        self,
+        key: str,
+        cmd: list[str],
+        work_dir: str,
+        *,
+        mcp_config: Path | None = None,
+    ) -> None:
+        """key의 다음 턴 프로세스를 백그라운드로 실행 (기존 warm 항목 교체).
+
+        mcp_config는 호출자가 획득한 config 참조이며 소유권이 풀로 넘어옵니다.
+        """
+        if not self.enabled:
+            self._release_config_ref(mcp_config)
+            return
+        previous = self._prewarming.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        task = asyncio.create_task(self._prewarm(key, cmd, work_dir, mcp_config))
+        self._prewarming[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._prewarming.get(key) is t:
+                del self._prewarming[key]
+            if t.cancelled() or t.exception() is not None:
+                # 항목 등록 전 종료 → config 참조는 여기서 반납
+                self._release_config_ref(mcp_config)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(
+                    "세션 %s: 프로세스 사전 기동 실패: %s", key, t.exception()
+                )
+
+        task.add_done_callback(_done)
+
+    async def _prewarm(
+        self, key: str, cmd: list[str], work_dir: str, mcp_config: Path | None
+    ) -> None:
+        signature = command_signature(cmd, work_dir)
+        process = await self._spawn(cmd, work_dir)
+        self.discard(key)
+        entry = _Warm(key, signature, process, time.monotonic(), mcp_config)
+        entry.expiry = asyncio.get_running_loop().call_later(
+            self._idle_ttl, self._expire, key, entry
+        )
+        self._warm[key] = entry
+        if self._monitor is not None:
+            self._monitor.track_idle(
+                self._monitor_key(key), process.pid, lambda: self._reclaim(key, entry)
+            )
+        self._prewarmed += 1
+        while len(self._warm) > self._max_size:
+            _, oldest = self._warm.popitem(last=False)
+            self._evicted += 1
+            self._release(oldest)
+
+    def _expire(self, key: str, entry: _Warm) -> None:
+        if self._warm.get(key) is entry:
+            del self._warm[key]
+            self._expired += 1
+            entry.expiry = None
+            self._release(entry)
+
+    def _reclaim(self, key: str, entry: _Warm) -> None:
+        """메모리 압박 시 ProcessMonitor가 호출."""
+        if self._warm.get(key) is entry:
+            del self._warm[key]
+            self._reclaimed += 1
+            self._release(entry)
+
+    def discard(self, key: str) -> None:
+        """key의 warm 프로세스/사전 기동 작업 폐기 (세션 삭제, 설정 변경 등)."""
+        entry = self._warm.pop(key, None)
+        if entry is not None:
+            self._release(entry)
+
+    def _release(self, entry: _Warm) -> None:
+        self._detach(entry)
+        self._kill(entry.process)
+
+    def _detach(self, entry: _Warm) -> None:
+        """만료 타이머, 자원 추적, config 참조 해제 (프로세스는 유지)."""
+        self._cancel_expiry(entry)
+        if self._monitor is not None:
+            self._monitor.untrack(self._monitor_key(entry.key))
+        mcp_config, entry.mcp_config = entry.mcp_config, None
+        self._release_config_ref(mcp_config)
+
+    def _release_config_ref(self, mcp_config: Path | None) -> None:
+        if mcp_config is not None and self._release_config is not None:
+            self._release_config(mcp_config)
+
+    @staticmethod
+    def _monitor_key(key: str) -> str:
+        return f"warm:{key}"
+
+    @staticmethod
+    def _cancel_expiry(entry: _Warm) -> None:
+        if entry.expiry is not None:
+            entry.expiry.cancel()
+            entry.expiry = None
+
+    def _kill(self, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        # 좀비 방지: 종료 대기는 백그라운드에서
+        task = asyncio.ensure_future(process.wait())
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    async def close(self) -> None:
+        for task in list(self._prewarming.values()):
+            task.cancel()
+        await asyncio.gather(*self._prewarming.values(), return_exceptions=True)
+        for key in list(self._warm):
+            self.discard(key)
+        await asyncio.gather(*self._reapers, return_exceptions=True)
+
+    def get_metrics(self) -> dict:
+        """warm 적중/불일치/만료 수."""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "max_size": self._max_size,
+            "warm": len(self._warm),
+            "prewarming": len(self._prewarming),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "mismatches": self._mismatches,
+            "dead": self._dead,
+            "expired": self._expired,
+            "evicted": self._evicted,
+            "reclaimed": self._reclaimed,
+            "prewarmed_total": self._prewarmed,
+        }
@@ -0,0 +1,402 @@
+"""세션 상주(resident) Claude CLI 프로세스.
+
+매 턴 --resume으로 새 프로세스를 실행하면 CLI가 대화 기록 전체를 디스크에서
+다시 읽어 복원하므로, 대화가 길어질수록 턴 시작 비용이 커집니다. 상주 모드는
+세션마다 --input-format stream-json 프로세스 하나를 유지하면서 턴마다 stdin에
+사용자 메시지를 기록하고(stdin은 닫지 않음), stdout은 result 이벤트를 턴
+경계로 삼아 턴 단위로 나누어 읽습니다. stdout은 프로세스마다 하나의
+LineReader로 청크 단위로 읽으며, 한 묶음에서 result 뒤에 온 줄은 다음 턴
+몫으로 보관합니다.
+
+다음 경우에는 프로세스를 종료하고, 다음 턴은 기존처럼 --resume으로 새로
+시작합니다.
+
+- idle_ttl 동안 턴이 없는 경우
+- 턴 종료 시점의 프로세스 트리 RSS가 max_rss_mb를 넘는 경우
+- 턴이 result 없이 끝난 경우 (중단, stall, 타임아웃, AskUserQuestion, 비정상 종료)
+- 명령줄 인자, 작업 디렉토리, MCP config 내용이 달라졌거나, --resume 대상이
+  이 프로세스가 이어 온 대화가 아닌 경우
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+from app.services.claude_process_pool import (
+    SpawnFunc,
+    command_signature,
+    user_message_line,
+)
+from app.services.stream_lines import LineReader
+
+logger = logging.getLogger(__name__)
+
+# 턴 사이에 보관할 stderr 최대 크기
+_STDERR_TAIL_BYTES = 64 * 1024
+# 재활용 시 SIGTERM 후 강제 종료까지 대기 (대화 기록 저장 시간 확보)
+_RETIRE_GRACE_SECONDS = 5.0
+
+
+def _split_resume(cmd: list[str]) -> tuple[list[str], str | None]:
+    """--resume <id>를 분리 → (나머지 명령, id). 대화 id는 턴마다 바뀔 수 있음."""
+    if "--resume" not in cmd:
+        return cmd, None
+    idx = cmd.index("--resume")
+    return cmd[:idx] + cmd[idx + 2 :], cmd[idx + 1]
+
+
+@dataclass(eq=False)
+class _Resident:
+    key: str
+    signature: tuple
+    process: asyncio.subprocess.Process
+    # 이 프로세스가 이어 온 대화 id (--resume 값 + result 이벤트의 session_id)
+    session_ids: set[str]
+    started_at: float
+    lines: LineReader
+    # 이전 턴의 result 뒤에 같은 묶음으로 읽힌 줄
+    pending: deque[bytes] = field(default_factory=deque)
+    turns: int = 0
+    busy: bool = False
+    stderr: bytearray = field(default_factory=bytearray)
+    stderr_task: asyncio.Task | None = None
+    expiry: asyncio.TimerHandle | None = None
+
+
+class _TurnStdout:
+    """result 이벤트까지만 읽고 EOF를 반환하는 턴 단위 stdout."""
+
+    def __init__(self, turn: "ResidentTurn"):
+        self._turn = turn
+        self._lines: deque[bytes] = deque()
+        self._dropped_base = turn.entry.lines.dropped_lines
+
+    @property
+    def dropped_lines(self) -> int:
+        """이 턴 동안 최대 크기를 넘어 버려진 줄 수."""
+        return self._turn.entry.lines.dropped_lines - self._dropped_base
+
+    async def read_batch(self) -> list[bytes]:
+        """완전한 줄 묶음 (줄바꿈 제외, 빈 목록은 턴 종료)."""
+        turn = self._turn
+        if turn.completed:
+            return []
+        entry = turn.entry
+        if entry.pending:
+            batch = list(entry.pending)
+            entry.pending.clear()
+        else:
+            batch = await entry.lines.read_batch()
+        for i, line in enumerate(batch):
+            if b'"result"' in line and self._is_result(line):
+                turn.completed = True
+                entry.pending.extend(batch[i + 1 :])
+                return batch[: i + 1]
+        return batch
+
+    def _is_result(self, line: bytes) -> bool:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return False
+        if not isinstance(event, dict) or event.get("type") != "result":
+            return False
+        if event.get("session_id"):
+            self._turn.entry.session_ids.add(event["session_id"])
+        return True
+
+    async def readline(self) -> bytes:
+        if not self._lines:
+            self._lines.extend(await self.read_batch())
+            if not self._lines:
+                return b""
+        return self._lines.popleft() + b"\n"
+
+
+class _TurnStderr:
+    """턴 동안 수집된 stderr (read 시 비움)."""
+
+    def __init__(self, entry: _Resident):
+        self._entry = entry
+
+    async def read(self) -> bytes:
+        data = bytes(self._entry.stderr)
+        self._entry.stderr.clear()
+        return data
+
+
+class ResidentTurn:
+    """상주 프로세스의 한 턴. runner에서는 일반 프로세스처럼 다룹니다.
+
+    terminate/kill은 상주 프로세스 자체를 종료하며(다음 턴은 --resume),
+    wait는 턴이 정상 완료된 경우 프로세스 종료를 기다리지 않습니다.
+    """
+
+    def __init__(self, entry: _Resident, reused: bool):
+        self.entry = entry
+        self.reused = reused
+        self.completed = False
+        self.stopped = False
+        self.stdout = _TurnStdout(self)
+        self.stderr = _TurnStderr(entry)
+
+    @property
+    def pid(self) -> int:
+        return self.entry.process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        return self.entry.process.returncode
+
+    def terminate(self) -> None:
+        self._signal(self.entry.process.terminate)
+
+    def kill(self) -> None:
+        self._signal(self.entry.process.kill)
+
+    def _signal(self, send) -> None:
+        self.stopped = True
+        if self.entry.process.returncode is None:
+            try:
+                send()
+            except ProcessLookupError:
+                pass
+
+    async def wait(self) -> int:
+        if self.completed and not self.stopped:
+            return 0
+        return await self.entry.process.wait()
+
+
+class ResidentProcessRegistry:
+    """세션별 상주 프로세스 관리 (최대 max_size개, 초과 시 유휴 프로세스 LRU 축출)."""
+
+    def __init__(
+        self,
+        spawn: SpawnFunc,
+        *,
+        max_size: int = 0,
+        idle_ttl: float = 600.0,
+        max_rss_mb: int = 0,
+    ):
+        self._spawn = spawn
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._max_rss = max_rss_mb * 1024 * 1024
+        self._entries: OrderedDict[str, _Resident] = OrderedDict()
+        self._reapers: set[asyncio.Task] = set()
+        # 메트릭
+        self._spawned = 0
+        self._reused = 0
+        self._mismatches = 0
+        self._dead = 0
+        self._expired = 0
+        self._evicted = 0
+        self._recycled_memory = 0
+        self._incomplete = 0
+        self._fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def holds(self, key: str) -> bool:
+        """key의 상주 프로세스가 살아 있는지 여부."""
+        entry = self._entries.get(key)
+        return entry is not None and entry.process.returncode is None
+
+    async def start_turn(
+        self, key: str, cmd: list[str], work_dir: str, prompt: str
+    ) -> ResidentTurn | None:
+        """상주 프로세스에 프롬프트 전송 → ResidentTurn.
+
+        cmd는 stream-json 입력 모드 명령입니다. 같은 세션의 턴이 이미 진행 중이거나
+        빈 자리가 없으면 None을 반환하며, 호출자는 일회성 프로세스를 사용합니다.
+        """
+        base_cmd, resume = _split_resume(cmd)
+        signature = command_signature(base_cmd, work_dir)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.busy:
+                self._fallbacks += 1
+                return None
+            self._cancel_expiry(entry)
+            if entry.process.returncode is not None:
+                self._dead += 1
+                self._retire(entry)
+            elif entry.signature != signature or resume not in entry.session_ids:
+                self._mismatches += 1
+                self._retire(entry)
+            else:
+                entry.busy = True
+                try:
+                    await self._send(entry, prompt)
+                except (BrokenPipeError, ConnectionResetError):
+                    self._dead += 1
+                    self._retire(entry)
+                else:
+                    self._reused += 1
+                    self._entries.move_to_end(key)
+                    return ResidentTurn(entry, reused=True)
+
+        if not self._make_room():
+            self._fallbacks += 1
+            return None
+        process = await self._spawn(cmd, work_dir)
+        entry = _Resident(
+            key=key,
+            signature=signature,
+            process=process,
+            session_ids={resume} if resume else set(),
+            started_at=time.monotonic(),
+            lines=LineReader(process.stdout.read),
+            busy=True,
+        )
+        entry.stderr_task = asyncio.create_task(self._drain_stderr(entry))
+        self._entries[key] = entry
+        self._spawned += 1
+        try:
+            await self._send(entry, prompt)
+        except BaseException:
+            self._retire(entry)
+            raise
+        return ResidentTurn(entry, reused=False)
+
+    def finish_turn(
+        self, turn: ResidentTurn, *, rss_bytes: int | None = None
+    ) -> None:
+        """턴 종료 처리: 재사용 가능하면 유휴 상태로, 아니면 프로세스 종료."""
+        entry = turn.entry
+        entry.busy = False
+        if self._entries.get(entry.key) is not entry:
+            return  # 턴 도중 discard됨 (이미 종료 처리)
+        reason = None
+        if turn.stopped or not turn.completed:
+            self._incomplete += 1
+            reason = "턴 미완료"
+        elif entry.process.returncode is not None:
+            self._dead += 1
+            reason = "프로세스 종료"
+        elif self._max_rss and rss_bytes and rss_bytes > self._max_rss:
+            self._recycled_memory += 1
+            reason = f"RSS {rss_bytes // (1024 * 1024)}MB"
+        if reason is not None:
+            logger.info(
+                "세션 %s: 상주 프로세스 재활용 (%s, %d턴)",
+                entry.key,
+                reason,
+                entry.turns + 1,
+            )
+            self._retire(entry)
+            return
+        entry.turns += 1
+        entry.expiry = asyncio.get_running_loop().call_later(
+            self._idle_ttl, self._expire, entry
+        )
+
+    @staticmethod
+    async def _send(entry: _Resident, prompt: str) -> None:
+        entry.process.stdin.write(user_message_line(prompt))
+        await entry.process.stdin.drain()
+
+    @staticmethod
+    async def _drain_stderr(entry: _Resident) -> None:
+        """stderr 파이프가 가득 차 CLI가 멈추지 않도록 계속 읽어 최근 부분만 보관."""
+        stream = entry.process.stderr
+        if stream is None:
+            return
+        while True:
+            chunk = await stream.read(4096)
+            if not chunk:
+                return
+            entry.stderr += chunk
+            if len(entry.stderr) > _STDERR_TAIL_BYTES:
+                del entry.stderr[:-_STDERR_TAIL_BYTES]
+
+    def _make_room(self) -> bool:
+        if len(self._entries) < self._max_size:
+            return True
+        for entry in self._entries.values():
+            if not entry.busy:
+                self._evicted += 1
+                self._retire(entry)
+                return True
+        return False
+
+    def _expire(self, entry: _Resident) -> None:
+        entry.expiry = None
+        if self._entries.get(entry.key) is entry and not entry.busy:
+            self._expired += 1
+            self._retire(entry)
+
+    def discard(self, key: str) -> None:
+        """key의 상주 프로세스 종료 (세션 삭제 등). 진행 중인 턴도 중단됨."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._retire(entry)
+
+    def _retire(self, entry: _Resident) -> None:
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        self._cancel_expiry(entry)
+        self._stop(entry)
+
+    @staticmethod
+    def _cancel_expiry(entry: _Resident) -> None:
+        if entry.expiry is not None:
+            entry.expiry.cancel()
+            entry.expiry = None
+
+    def _stop(self, entry: _Resident) -> None:
+        # 좀비 방지 + 대화 기록 저장 시간 확보: SIGTERM 후 백그라운드에서 대기
+        task = asyncio.ensure_future(self._reap(entry))
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    @staticmethod
+    async def _reap(entry: _Resident) -> None:
+        process = entry.process
+        if process.returncode is None:
+            try:
+                process.stdin.close()
+                process.terminate()
+                await asyncio.wait_for(process.wait(), _RETIRE_GRACE_SECONDS)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        await process.wait()
+        if entry.stderr_task is not None:
+            await entry.stderr_task
+
+    async def close(self) -> None:
+        for entry in list(self._entries.values()):
+            self._retire(entry)
+        await asyncio.gather(*self._reapers, return_exceptions=True)
+
+    def get_metrics(self) -> dict:
+        """상주 프로세스 수, 재사용/재활용 사유별 횟수."""
+        turns = self._spawned + self._reused
+        return {
+            "enabled": self.enabled,
+            "max_size": self._max_size,
+            "resident": len(self._entries),
+            "busy": sum(1 for e in self._entries.values() if e.busy),
+            "spawned_total": self._spawned,
+            "reused_total": self._reused,
+            "reuse_rate": round(self._reused / turns, 3) if turns else 0.0,
+            "mismatches": self._mismatches,
+            "dead": self._dead,
+            "expired": self._expired,
+            "evicted": self._evicted,
+            "recycled_memory": self._recycled_memory,
+            "incomplete": self._incomplete,
+            "fallbacks": self._fallbacks,
+        }
@@ -7,9 +7,8 @@ import json
 import os
 import subprocess
 import sys
-import tempfile
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,6 +20,8 @@ from structlog.contextvars import bind_contextvars
 
 from app.core.config import Settings
 from app.core.constants import READONLY_TOOLS
+from app.core.executors import ExecutorKind, run_in_executor
+from app.core.tracing import tracer
 from app.core.utils import utc_now, utc_now_iso
 from app.models.event_types import CliEventType, WsEventType
 from app.models.session import SessionStatus
@@ -29,6 +30,19 @@ from app.services.event_handler import (
     extract_tool_result_output,
     extract_tool_use_info,
 )
+from app.services.claude_process_pool import (
+    ClaudeProcessPool,
+    to_stream_input,
+    user_message_line,
+)
+from app.services.claude_resident_process import (
+    ResidentProcessRegistry,
+    ResidentTurn,
+)
+from app.services.mcp_config_store import McpConfigStore
+from app.services.process_monitor import ProcessMonitor
+from app.services.stream_lines import LineReader
+from app.services.turn_scheduler import HostLoadAdmission, TurnPriority, TurnScheduler
 from app.services.websocket_manager import WebSocketManager
 
 if TYPE_CHECKING:
@@ -75,37 +89,40 @@ class TurnState:
 class _AsyncStreamReader:
     """Windows subprocess 파이프를 비동기로 읽기 위한 래퍼.
 
-    단순 readline 대신 청크 단위로 읽어 스레드풀 호출 횟수를 줄임.
+    청크 단위로 읽어 스레드풀 호출 횟수를 줄이고, LineReader로 줄을 분할.
     """
 
-    _CHUNK_SIZE = 65536  # 64KB 청크
-
     def __init__(self, stream):
         self._stream = stream
-        self._buffer = b""
+        self._lines = LineReader(self._read_chunk)
+        self._pending: deque[bytes] = deque()
+
+    @property
+    def dropped_lines(self) -> int:
+        return self._lines.dropped_lines
+
+    async def _read_chunk(self, size: int) -> bytes:
+        # read1()은 내부 버퍼 + 1회 OS read만 수행하여 블로킹 최소화
+        read_fn = getattr(self._stream, "read1", self._stream.read)
+        return await run_in_executor(ExecutorKind.PIPE, read_fn, size)
+
+    async def read_batch(self) -> list[bytes]:
+        """완전한 줄 묶음 (줄바꿈 제외, 빈 목록은 EOF)."""
+        if self._pending:
+            batch = list(self._pending)
+            self._pending.clear()
+            return batch
+        return await self._lines.read_batch()
 
     async def readline(self) -> bytes:
-        while True:
-            # 버퍼에 완전한 라인이 있으면 즉시 반환 (스레드풀 호출 없음)
-            newline_pos = self._buffer.find(b"\n")
-            if newline_pos >= 0:
-                line = self._buffer[: newline_pos + 1]
-                self._buffer = self._buffer[newline_pos + 1 :]
-                return line
-
-            # 스트림에서 청크 읽기 (한 번의 to_thread로 여러 라인 분량)
-            # read1()은 내부 버퍼 + 1회 OS read만 수행하여 블로킹 최소화
-            read_fn = getattr(self._stream, "read1", self._stream.read)
-            chunk = await asyncio.to_thread(read_fn, self._CHUNK_SIZE)
-            if not chunk:
-                # EOF: 버퍼에 남은 데이터 반환
-                remaining = self._buffer
-                self._buffer = b""
-                return remaining
-            self._buffer += chunk
+        if not self._pending:
+            self._pending.extend(await self._lines.read_batch())
+            if not self._pending:
+                return b""
+        return self._pending.popleft() + b"\n"
 
     async def read(self):
-        return await asyncio.to_thread(self._stream.read)
+        return await run_in_executor(ExecutorKind.PIPE, self._stream.read)
 
 
 class _AsyncProcessWrapper:
@@ -124,7 +141,7 @@ class _AsyncProcessWrapper:
         self._popen.kill()
 
     async def wait(self):
-        return await asyncio.to_thread(self._popen.wait)
+        return await run_in_executor(ExecutorKind.PIPE, self._popen.wait)
 
     @property
     def returncode(self):
@@ -175,7 +192,47 @@ class ClaudeRunner:
 
     def __init__(self, settings: Settings):
         self._settings = settings
-        self._semaphore = asyncio.Semaphore(settings.max_concurrent_sessions)
+        # 동시 실행 턴 제한: 우선순위 클래스 + 워크스페이스별 공정 큐잉
+        self._scheduler = TurnScheduler(
+            settings.max_concurrent_sessions,
+            weights=settings.turn_scheduler_workspace_weights,
+            aging_seconds=settings.turn_scheduler_aging_seconds,
+            admission=HostLoadAdmission(
+                max_load_per_cpu=settings.turn_admission_max_load_per_cpu,
+                min_available_mb=settings.turn_admission_min_available_mb,
+            ),
+        )
+        # 프로세스 트리 RSS/CPU 추적 + 메모리 압박 시 동시 실행 한도 축소
+        self._process_monitor = ProcessMonitor(
+            interval=settings.process_monitor_interval_seconds,
+            scheduler=self._scheduler,
+            max_limit=settings.max_concurrent_sessions,
+            min_limit=settings.min_concurrent_sessions,
+            pressure_high=settings.memory_pressure_high,
+            pressure_low=settings.memory_pressure_low,
+            memory_reserve_mb=settings.memory_reserve_mb,
+        )
+        # 다음 턴 프로세스 사전 기동 (stream-json stdin 입력, Windows 미지원)
+        self._process_pool = ClaudeProcessPool(
+            self._spawn_stream_input,
+            max_size=(
+                settings.claude_warm_pool_size if sys.platform != "win32" else 0
+            ),
+            idle_ttl=settings.claude_warm_pool_idle_seconds,
+            release_config=self._cleanup_mcp_config,
+            monitor=self._process_monitor,
+        )
+        # 세션 상주 프로세스 (턴 간 대화 유지, 재활용 시 --resume 폴백)
+        self._resident = ResidentProcessRegistry(
+            self._spawn_stream_input,
+            max_size=(
+                settings.claude_resident_sessions if sys.platform != "win32" else 0
+            ),
+            idle_ttl=settings.claude_resident_idle_seconds,
+            max_rss_mb=settings.claude_resident_max_rss_mb,
+        )
+        # --mcp-config 파일 (내용 해시 경로, 동시 턴 간 참조 수 관리)
+        self._mcp_configs = McpConfigStore(settings.resolved_mcp_config_dir)
         # 글로벌 레이트 리미터: 분당 최대 세션 시작 수
         self._global_limiter = AsyncLimiter(
             max_rate=settings.rate_limit_global_per_minute, time_period=60
@@ -218,7 +275,7 @@ class ClaudeRunner:
             if sys.platform != "linux":
                 return True
 
-            stat_text = await asyncio.to_thread(proc_stat.read_text)
+            stat_text = await run_in_executor(ExecutorKind.PIPE, proc_stat.read_text)
             fields = stat_text.rsplit(")", 1)[-1].split()
             cpu_time_1 = int(fields[11]) + int(fields[12])
 
@@ -227,7 +284,7 @@ class ClaudeRunner:
             if process.returncode is not None:
                 return False
 
-            stat_text = await asyncio.to_thread(proc_stat.read_text)
+            stat_text = await run_in_executor(ExecutorKind.PIPE, proc_stat.read_text)
             fields = stat_text.rsplit(")", 1)[-1].split()
             cpu_time_2 = int(fields[11]) + int(fields[12])
 
@@ -373,7 +430,19 @@ class ClaudeRunner:
         return cmd, system_prompt, mcp_config_path
 
     def _build_permission_mcp_dict(self, session_id: str) -> dict:
-        """Permission MCP 서버 설정 dict를 반환 (파일 기록 없이)."""
+        """Permission MCP 서버 설정 dict를 반환 (파일 기록 없이).
+
+        기본은 백엔드가 호스팅하는 HTTP MCP 엔드포인트이며, "stdio" 설정에서만
+        턴마다 별도 Python 프로세스로 permission_mcp_server.py를 실행합니다.
+        """
+        api_base = f"http://localhost:{self._settings.backend_port}"
+        if self._settings.permission_mcp_transport != "stdio":
+            return {
+                "permission": {
+                    "type": "http",
+                    "url": f"{api_base}/api/permissions/{session_id}/mcp",
+                }
+            }
         mcp_server_script = str(Path(__file__).parent / "permission_mcp_server.py")
         return {
             "permission": {
@@ -381,18 +450,12 @@ class ClaudeRunner:
                 "args": [mcp_server_script],
                 "env": {
                     "PERMISSION_SESSION_ID": session_id,
-                    "PERMISSION_API_BASE": f"http://localhost:{self._settings.backend_port}",
+                    "PERMISSION_API_BASE": api_base,
                     "PERMISSION_TIMEOUT": "120",
                 },
             }
         }
 
-    def _write_mcp_config(self, session_id: str, config: dict) -> Path:
-        """MCP config dict를 임시 파일에 기록하고 Path를 반환."""
-        mcp_config_path = Path(tempfile.gettempdir()) / f"mcp-{session_id}.json"
-        mcp_config_path.write_text(json.dumps(config), encoding="utf-8")
-        return mcp_config_path
-
     async def _setup_mcp_config(
         self,
         session: dict,
@@ -403,7 +466,8 @@ class ClaudeRunner:
         """사용자 MCP 서버 + Permission MCP를 병합하여 --mcp-config에 추가.
 
         Returns:
-            mcp_config_path: 생성된 임시 파일 경로 (정리 대상), 없으면 None
+            mcp_config_path: 참조 중인 config 파일 경로 (_cleanup_mcp_config로
+            반납 대상), 없으면 None
         """
         has_permission = bool(session.get("permission_mode"))
 
@@ -431,7 +495,7 @@ class ClaudeRunner:
         if not config.get("mcpServers"):
             return None
 
-        mcp_config_path = self._write_mcp_config(session_id, config)
+        mcp_config_path = self._mcp_configs.acquire(config)
         cmd.extend(["--mcp-config", str(mcp_config_path)])
 
         # MCP 도구 패턴을 --allowedTools에 자동 병합
@@ -452,6 +516,123 @@ class ClaudeRunner:
 
         return mcp_config_path
 
+    async def _launch_process(
+        self, session_id: str, cmd: list[str], work_dir: str, *, resident: bool = False
+    ) -> _AsyncProcessWrapper | asyncio.subprocess.Process | ResidentTurn:
+        """턴 프로세스 시작. warm 풀 활성화 시 사전 기동된 프로세스 stdin에 프롬프트 기록.
+
+        resident=True이고 상주 모드가 활성화되어 있으면 세션 상주 프로세스에
+        프롬프트를 전송합니다 (자리가 없으면 일회성 프로세스로 대체).
+        """
+        if resident and self._resident.enabled:
+            stream_cmd, prompt = to_stream_input(cmd)
+            turn = await self._resident.start_turn(
+                session_id, stream_cmd, work_dir, prompt
+            )
+            if turn is not None:
+                logger.info(
+                    "프로세스 획득",
+                    component="runner",
+                    operation="process_acquire",
+                    resident=True,
+                    warm=turn.reused,
+                )
+                return turn
+        if not self._process_pool.enabled:
+            return await self._start_process(cmd, work_dir)
+
+        stream_cmd, prompt = to_stream_input(cmd)
+        process, warm = await self._process_pool.acquire(
+            session_id, stream_cmd, work_dir
+        )
+        try:
+            await self._send_prompt(process, prompt)
+        except (BrokenPipeError, ConnectionResetError):
+            if not warm:
+                raise
+            # 재사용 직전 종료된 warm 프로세스 → 새로 실행
+            process = await self._spawn_stream_input(stream_cmd, work_dir)
+            await self._send_prompt(process, prompt)
+            warm = False
+        logger.info(
+            "프로세스 획득",
+            component="runner",
+            operation="process_acquire",
+            warm=warm,
+        )
+        return process
+
+    @staticmethod
+    async def _send_prompt(process: asyncio.subprocess.Process, prompt: str) -> None:
+        """stream-json 사용자 메시지 기록 후 stdin 종료 (단일 턴)."""
+        process.stdin.write(user_message_line(prompt))
+        await process.stdin.drain()
+        process.stdin.close()
+
+    async def _spawn_stream_input(
+        self, cmd: list[str], work_dir: str
+    ) -> asyncio.subprocess.Process:
+        env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=work_dir,
+            env=env,
+            limit=self._SUBPROCESS_BUFFER_LIMIT,
+        )
+
+    def _schedule_prewarm(
+        self,
+        session_id: str,
+        session: dict,
+        session_manager: "SessionManager",
+        allowed_tools: str,
+        mcp_service=None,
+    ) -> None:
+        """정상 완료된 턴 이후 같은 설정의 다음 턴(--resume) 프로세스를 사전 기동.
+
+        session은 이번 턴이 실행된 세션(글로벌 기본값, KB/인사이트 system_prompt
+        병합 완료)입니다. 다음 턴도 같은 방식으로 병합되므로 DB 원본 대신 이를
+        사용하고, 턴 중 갱신된 대화 id만 DB에서 반영합니다.
+        """
+        if not self._process_pool.enabled:
+            return
+
+        async def _prewarm() -> None:
+            stored = await session_manager.get(session_id)
+            if not stored or not stored.get("claude_session_id"):
+                return
+            next_session = {**session, "claude_session_id": stored["claude_session_id"]}
+            cmd, _, _ = await run_in_executor(
+                ExecutorKind.PIPE,
+                self._build_command,
+                next_session,
+                "",
+                allowed_tools,
+                session_id,
+            )
+            # config 참조는 warm 항목이 사용/만료/폐기될 때 풀이 반납
+            mcp_config_path = await self._setup_mcp_config(
+                next_session, session_id, cmd, mcp_service
+            )
+            stream_cmd, _ = to_stream_input(cmd)
+            self._process_pool.prewarm(
+                session_id,
+                stream_cmd,
+                next_session.get("work_dir", ""),
+                mcp_config=mcp_config_path,
+            )
+
+        def _done(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    "세션 %s: 사전 기동 준비 실패: %s", session_id, task.exception()
+                )
+
+        asyncio.create_task(_prewarm()).add_done_callback(_done)
+
     async def _start_process(
         self, cmd: list[str], work_dir: str
     ) -> _AsyncProcessWrapper | asyncio.subprocess.Process:
@@ -975,59 +1156,83 @@ class ClaudeRunner:
 
         turn_state dict를 in-place로 갱신합니다.
         should_terminate 키가 True이면 AskUserQuestion으로 인한 조기 중단을 의미.
+
+        stdout은 청크 단위로 읽어 청크 안의 줄들을 묶음으로 처리하고, 한 묶음에서
+        나온 이벤트의 WebSocket 전송은 coalesce로 한 번에 보냅니다.
         """
+        stdout = process.stdout
+        if isinstance(stdout, asyncio.StreamReader):
+            reader = LineReader(stdout.read)
+        else:
+            reader = stdout  # Windows 래퍼 / 상주 프로세스 턴 (read_batch 제공)
+
+        # 프로세스 시작(프롬프트 전송) ~ 첫 stdout 줄 수신 구간
+        first_output = tracer.span("process.first_output")
 
-        while True:
+        while not turn_state.should_terminate:
             try:
-                line = await process.stdout.readline()
+                batch = await reader.read_batch()
             except (OSError, BrokenPipeError):
                 logger.debug("세션 %s: 스트림 종료 (프로세스 kill)", session_id)
                 break
-            if not line:
+            if not batch:
                 break
-
-            line_str = line.decode("utf-8").strip()
-            if not line_str:
-                continue
+            first_output.end()
 
             # Stall detection: 모든 수신 데이터에 대해 타임스탬프 갱신
             turn_state.last_event_at = time.monotonic()
 
-            try:
-                event = json.loads(line_str)
-            except json.JSONDecodeError:
-                await ws_manager.broadcast_event(
-                    session_id, {"type": WsEventType.RAW, "text": line_str}
-                )
-                continue
+            # span을 바깥에 두어 coalesce 종료 시 생성되는 전송 Task가 이 묶음의
+            # 자식 span으로 기록되도록 함
+            with (
+                tracer.span("stream.batch", lines=len(batch)),
+                ws_manager.coalesce(session_id),
+            ):
+                for line in batch:
+                    if not line or line.isspace():
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        await ws_manager.broadcast_event(
+                            session_id,
+                            {
+                                "type": WsEventType.RAW,
+                                "text": line.decode("utf-8", "replace").strip(),
+                            },
+                        )
+                        continue
 
-            await self._handle_stream_event(
-                event,
-                session_id,
-                ws_manager,
-                session_manager,
-                turn_state,
-            )
+                    event_type = event.get("type") or "unknown"
+                    with tracer.span(f"stream.event.{event_type}"):
+                        await self._handle_stream_event(
+                            event,
+                            session_id,
+                            ws_manager,
+                            session_manager,
+                            turn_state,
+                        )
 
-            # AskUserQuestion 감지 시 스트림 파싱 중단 (caller에서 프로세스 종료)
-            if turn_state.should_terminate:
-                break
+                    # AskUserQuestion 감지 시 스트림 파싱 중단 (caller에서 프로세스 종료)
+                    if turn_state.should_terminate:
+                        break
 
-    @staticmethod
-    def _cleanup_mcp_config(mcp_config_path: Path | None) -> None:
-        """MCP config 임시 파일 정리."""
-        if mcp_config_path and mcp_config_path.exists():
-            try:
-                mcp_config_path.unlink()
-            except OSError:
-                logger.debug("MCP config 정리 실패: %s", mcp_config_path, exc_info=True)
+        first_output.end()
+        dropped = getattr(reader, "dropped_lines", 0)
+        if dropped:
+            logger.warning("세션 %s: 크기 한도 초과 줄 %d개 무시", session_id, dropped)
+
+    def _cleanup_mcp_config(self, mcp_config_path: Path | None) -> None:
+        """MCP config 파일 참조 반납 (다른 턴이 참조 중이면 유지)."""
+        self._mcp_configs.release(mcp_config_path)
 
     @asynccontextmanager
     async def _mcp_config_scope(self, session, session_id, cmd, mcp_service=None):
         """MCP config 파일 생성 → yield → 정리를 보장하는 컨텍스트 매니저."""
-        mcp_config_path = await self._setup_mcp_config(
-            session, session_id, cmd, mcp_service
-        )
+        with tracer.span("mcp.config"):
+            mcp_config_path = await self._setup_mcp_config(
+                session, session_id, cmd, mcp_service
+            )
         try:
             yield mcp_config_path
         finally:
@@ -1041,7 +1246,7 @@ class ClaudeRunner:
         turn_state: TurnState,
         stall_timeout: int,
     ) -> None:
-        """프로세스 stall(무출력) 감지 워처.
+        """프로세스 stall(무출력) 감지 워처 (ProcessMonitor 미실행 시 대체 경로).
 
         소프트 타임아웃: 프로세스 비활동 시에만 stall 판정.
         하드 타임아웃(×3): 프로세스 상태와 무관하게 stall 판정.
@@ -1060,19 +1265,8 @@ class ClaudeRunner:
 
             # 하드 리밋 초과 → 무조건 stall
             if elapsed >= hard_limit:
-                turn_state.stall_detected = True
-                logger.warning(
-                    "세션 %s: hard stall 감지 — %d초 무출력", session_id, int(elapsed)
-                )
-                await ws_manager.broadcast_event(
-                    session_id,
-                    {
-                        "type": WsEventType.STALL_DETECTED,
-                        "message": f"프로세스 무응답 감지 ({int(elapsed)}초)",
-                    },
-                )
-                await self._terminate_process(
-                    process, self._GRACEFUL_TERMINATE_TIMEOUT, session_id
+                await self._handle_stall(
+                    process, session_id, ws_manager, turn_state, elapsed, hard=True
                 )
                 break
 
@@ -1088,23 +1282,44 @@ class ClaudeRunner:
                 continue
 
             # 프로세스 비활동 + 소프트 타임아웃 초과 → stall
-            turn_state.stall_detected = True
+            await self._handle_stall(
+                process, session_id, ws_manager, turn_state, elapsed, hard=False
+            )
+            break
+
+    async def _handle_stall(
+        self,
+        process: asyncio.subprocess.Process,
+        session_id: str,
+        ws_manager: WebSocketManager,
+        turn_state: TurnState,
+        elapsed: float,
+        hard: bool,
+    ) -> None:
+        """stall 판정 → 이벤트 전송 + 프로세스 종료."""
+        if process.returncode is not None:
+            return
+        turn_state.stall_detected = True
+        if hard:
+            logger.warning(
+                "세션 %s: hard stall 감지 — %d초 무출력", session_id, int(elapsed)
+            )
+        else:
             logger.warning(
                 "세션 %s: stall 감지 — %d초 무출력 + 프로세스 비활동",
                 session_id,
                 int(elapsed),
             )
-            await ws_manager.broadcast_event(
-                session_id,
-                {
-                    "type": WsEventType.STALL_DETECTED,
-                    "message": f"프로세스 무응답 감지 ({int(elapsed)}초)",
-                },
-            )
-            await self._terminate_process(
-                process, self._GRACEFUL_TERMINATE_TIMEOUT, session_id
-            )
-            break
+        await ws_manager.broadcast_event(
+            session_id,
+            {
+                "type": WsEventType.STALL_DETECTED,
+                "message": f"프로세스 무응답 감지 ({int(elapsed)}초)",
+            },
+        )
+        await self._terminate_process(
+            process, self._GRACEFUL_TERMINATE_TIMEOUT, session_id
+        )
 
     async def _run_process_lifecycle(
         self,
@@ -1118,17 +1333,41 @@ class ClaudeRunner:
         """프로세스 시작 → 스트림 파싱 (+ stall 감지) → 종료 처리."""
         timeout_seconds = session.get("timeout_seconds")
         stall_timeout = self._settings.stall_timeout_seconds
-        process = await self._start_process(cmd, session["work_dir"])
+        # 워크플로우 phase는 단계마다 권한 모드/도구가 달라 상주 프로세스 미사용
+        with tracer.span("process.spawn") as spawn_span:
+            process = await self._launch_process(
+                session_id,
+                cmd,
+                session["work_dir"],
+                resident=not turn_state.workflow_phase,
+            )
+            spawn_span.set(resident=isinstance(process, ResidentTurn))
         session_manager.set_process(session_id, process)
+        self._process_monitor.track(session_id, process.pid)
 
-        # stall 감지 워처 — parse_stream과 병렬 실행
+        # stall 감지 — ProcessMonitor 샘플링 틱에서 판정 (세션별 폴링 없음).
+        # 모니터가 실행 중이 아니면(/proc 미지원 등) 세션별 워처로 대체
         stall_task: asyncio.Task | None = None
         if stall_timeout and stall_timeout > 0:
-            stall_task = asyncio.create_task(
-                self._stall_watcher(
-                    process, session_id, ws_manager, turn_state, stall_timeout
+            if self._process_monitor.running:
+
+                async def _on_stall(elapsed: float, hard: bool) -> None:
+                    await self._handle_stall(
+                        process, session_id, ws_manager, turn_state, elapsed, hard
+                    )
+
+                self._process_monitor.watch_stall(
+                    session_id,
+                    last_output=lambda: turn_state.last_event_at,
+                    timeout=stall_timeout,
+                    on_stall=_on_stall,
+                )
+            else:
+                stall_task = asyncio.create_task(
+                    self._stall_watcher(
+                        process, session_id, ws_manager, turn_state, stall_timeout
+                    )
                 )
-            )
 
         parse_coro = self._parse_stream(
             process, session_id, ws_manager, session_manager, turn_state=turn_state
@@ -1156,6 +1395,13 @@ class ClaudeRunner:
             else:
                 await parse_coro
         finally:
+            usage = self._process_monitor.usage(session_id)
+            self._process_monitor.untrack(session_id)
+            if isinstance(process, ResidentTurn):
+                # result로 끝난 턴만 유휴 상태로 유지 (중단/stall/타임아웃은 재활용)
+                self._resident.finish_turn(
+                    process, rss_bytes=usage.rss_bytes if usage else None
+                )
             # stall 워처 정리
             if stall_task and not stall_task.done():
                 stall_task.cancel()
@@ -1208,7 +1454,8 @@ class ClaudeRunner:
                     )
                     process.kill()
 
-            await asyncio.gather(_read_stderr(), _wait_process())
+            with tracer.span("process.wait"):
+                await asyncio.gather(_read_stderr(), _wait_process())
 
     async def _run_entry_validation(
         self,
@@ -1345,6 +1592,7 @@ class ClaudeRunner:
                     workflow_step_config=(
                         impl_step.model_dump() if impl_step else None
                     ),
+                    priority=TurnPriority.AUTO_CHAIN,
                 )
             )
             chain_task.add_done_callback(
@@ -1560,6 +1808,7 @@ class ClaudeRunner:
                         workflow_step_config=(
                             next_step_config.model_dump() if next_step_config else None
                         ),
+                        priority=TurnPriority.AUTO_CHAIN,
                     )
                 )
                 chain_task.add_done_callback(
@@ -1626,59 +1875,128 @@ class ClaudeRunner:
         workflow_service=None,
         original_prompt: str | None = None,
         workflow_step_config: dict | None = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
     ):
-        """Claude CLI 실행 및 스트림 처리 오케스트레이션."""
+        """Claude CLI 실행 및 스트림 처리 오케스트레이션.
+
+        Args:
+            priority: 턴 스케줄러 우선순위 (자동 체이닝은 AUTO_CHAIN)
+        """
         bind_contextvars(session_id=session_id)
 
-        # 세션별 레이트 리미터 (분당 프롬프트 수 제한)
-        if session_id not in self._session_limiters:
-            self._session_limiters[session_id] = AsyncLimiter(
-                max_rate=self._session_rate_per_minute, time_period=60
-            )
-        self._session_limiters.move_to_end(session_id)
-        while len(self._session_limiters) > self._max_session_limiters:
-            self._session_limiters.popitem(last=False)
-        await self._session_limiters[session_id].acquire()
+        # 턴 트레이스: 프롬프트 처리에서 시작된 트레이스를 이어받거나 새로 시작
+        trace = tracer.claim_turn(session_id, trigger=priority.name.lower())
+        if trace is not None:
+            bind_contextvars(turn_id=trace.turn_id)
+        try:
+            # 레이트 리미터 + 스케줄러 슬롯 대기 구간
+            queue_span = tracer.span("runner.queue")
 
-        # 글로벌 레이트 리미터 (분당 전체 세션 시작 수 제한)
-        await self._global_limiter.acquire()
+            # 세션별 레이트 리미터 (분당 프롬프트 수 제한)
+            if session_id not in self._session_limiters:
+                self._session_limiters[session_id] = AsyncLimiter(
+                    max_rate=self._session_rate_per_minute, time_period=60
+                )
+            self._session_limiters.move_to_end(session_id)
+            while len(self._session_limiters) > self._max_session_limiters:
+                self._session_limiters.popitem(last=False)
+            await self._session_limiters[session_id].acquire()
+
+            # 글로벌 레이트 리미터 (분당 전체 세션 시작 수 제한)
+            await self._global_limiter.acquire()
+
+            # 턴 스케줄러 대기 (동시 실행 제한). 처음 대기 시 queued 상태를 기록하고,
+            # 이후 순서 변경은 이벤트 저장 없이 전송
+            queued_notified = False
+
+            async def _on_position(position: int, total: int) -> None:
+                nonlocal queued_notified
+                if not queued_notified:
+                    queued_notified = True
+                    await ws_manager.broadcast_event(
+                        session_id,
+                        {
+                            "type": WsEventType.STATUS,
+                            "status": "queued",
+                            "message": "동시 실행 한도에 도달하여 대기 중입니다.",
+                            "queue_position": position,
+                            "queue_length": total,
+                        },
+                    )
+                    return
+                await ws_manager.broadcast(
+                    session_id,
+                    {
+                        "type": WsEventType.QUEUE_POSITION,
+                        "queue_position": position,
+                        "queue_length": total,
+                    },
+                )
 
-        # 세마포어 대기 (동시 세션 제한)
-        if self._semaphore.locked():
-            logger.info(
-                "세션 %s: 동시 실행 한도 도달 — 대기 중 (%d/%d)",
-                session_id,
-                self._settings.max_concurrent_sessions - self._semaphore._value,
-                self._settings.max_concurrent_sessions,
-            )
-            await ws_manager.broadcast_event(
+            async with self._scheduler.slot(
                 session_id,
-                {
-                    "type": WsEventType.STATUS,
-                    "status": "queued",
-                    "message": "동시 실행 한도에 도달하여 대기 중입니다.",
-                },
-            )
+                workspace=session.get("workspace_id") or session.get("work_dir"),
+                priority=priority,
+                on_position=_on_position,
+            ) as waited:
+                queue_span.end()
+                if waited >= 1.0:
+                    logger.info(
+                        "턴 스케줄러 대기 완료",
+                        component="runner",
+                        operation="turn_queue",
+                        priority=priority.name,
+                        wait_ms=round(waited * 1000),
+                    )
+                with tracer.span("runner.run"):
+                    await self._run_inner(
+                        session,
+                        prompt,
+                        allowed_tools,
+                        session_id,
+                        ws_manager,
+                        session_manager,
+                        images,
+                        mcp_service,
+                        workflow_phase,
+                        workflow_service,
+                        original_prompt,
+                        workflow_step_config,
+                    )
+        finally:
+            tracer.end_turn(trace)
 
-        async with self._semaphore:
-            await self._run_inner(
-                session,
-                prompt,
-                allowed_tools,
-                session_id,
-                ws_manager,
-                session_manager,
-                images,
-                mcp_service,
-                workflow_phase,
-                workflow_service,
-                original_prompt,
-                workflow_step_config,
-            )
+    @property
+    def scheduler(self) -> TurnScheduler:
+        return self._scheduler
+
+    @property
+    def process_monitor(self) -> ProcessMonitor:
+        return self._process_monitor
+
+    @property
+    def process_pool(self) -> ClaudeProcessPool:
+        return self._process_pool
+
+    @property
+    def resident_processes(self) -> ResidentProcessRegistry:
+        return self._resident
+
+    @property
+    def mcp_configs(self) -> McpConfigStore:
+        return self._mcp_configs
 
     def cleanup_session_limiter(self, session_id: str) -> None:
-        """세션 삭제 시 해당 세션의 레이트 리미터를 정리."""
+        """세션 삭제 시 해당 세션의 레이트 리미터와 warm/상주 프로세스를 정리."""
         self._session_limiters.pop(session_id, None)
+        self._process_pool.discard(session_id)
+        self._resident.discard(session_id)
+
+    async def close(self) -> None:
+        """앱 종료 시 warm/상주 프로세스 정리."""
+        await self._process_pool.close()
+        await self._resident.close()
+        self._mcp_configs.close()
 
     @staticmethod
     def _trigger_session_analysis(
@@ -1732,16 +2050,18 @@ class ClaudeRunner:
             work_dir=session.get("work_dir", ""),
         )
 
-        cmd, _, _ = await asyncio.to_thread(
-            self._build_command,
-            session,
-            prompt,
-            allowed_tools,
-            session_id,
-            images,
-            workflow_phase,
-            workflow_step_config,
-        )
+        with tracer.span("runner.build_command"):
+            cmd, _, _ = await run_in_executor(
+                ExecutorKind.PIPE,
+                self._build_command,
+                session,
+                prompt,
+                allowed_tools,
+                session_id,
+                images,
+                workflow_phase,
+                workflow_step_config,
+            )
 
         work_dir = session.get("work_dir", "")
         worktree_name = session.get("worktree_name")
@@ -1758,14 +2078,15 @@ class ClaudeRunner:
         async with self._mcp_config_scope(session, session_id, cmd, mcp_service):
             for attempt in range(max_retries + 1):
                 try:
-                    await self._run_process_lifecycle(
-                        cmd,
-                        session,
-                        session_id,
-                        ws_manager,
-                        session_manager,
-                        turn_state,
-                    )
+                    with tracer.span("process.lifecycle", attempt=attempt):
+                        await self._run_process_lifecycle(
+                            cmd,
+                            session,
+                            session_id,
+                            ws_manager,
+                            session_manager,
+                            turn_state,
+                        )
                 except Exception as e:
                     error_msg = str(e) or f"{type(e).__name__}: (no message)"
                     logger.error(
@@ -1850,7 +2171,8 @@ class ClaudeRunner:
                     )
 
             # 턴 종료 시 잔여 배치 메시지 flush
-            await session_manager.flush_messages()
+            with tracer.span("db.flush_messages"):
+                await session_manager.flush_messages()
 
             # ERROR 상태인 경우 보존, 그 외에는 IDLE로 전환
             current_session = await session_manager.get(session_id)
@@ -1905,3 +2227,15 @@ class ClaudeRunner:
                     session_id, session.get("workspace_id")
                 )
 
+        # 다음 턴 프로세스 사전 기동 — MCP config 정리(scope 종료) 이후에 실행해야
+        # warm 프로세스가 읽을 config 파일이 삭제되지 않음. 상주 프로세스가
+        # 유지 중인 세션은 불필요
+        if (
+            not workflow_phase
+            and turn_state.result_received
+            and not turn_state.is_error
+            and not self._resident.holds(session_id)
+        ):
+            self._schedule_prewarm(
+                session_id, session, session_manager, allowed_tools, mcp_service
+            )
@@ -0,0 +1,276 @@
+"""diff 결과 캐시 (메모리 + 디스크 2단계, 크기 기반 LRU).
+
+커밋 diff는 커밋 해시, 작업 트리 diff는 (HEAD/index blob OID, 작업 트리
+내용 해시)로 키를 만들기 때문에 내용이 바뀌면 키도 바뀌어 무효화가
+필요 없습니다. 작은 결과는 메모리에, 모든 결과는 디스크에 보관하며
+대용량 diff는 str로 버퍼링하지 않고 청크 단위로 스트리밍합니다.
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+from app.core.executors import ExecutorKind, run_in_executor
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+_SUFFIX = ".diff"
+
+
+class DiffCache:
+    """diff 결과 2단계 LRU 캐시.
+
+    directory가 None이면 메모리 캐시만 사용합니다. 디스크 LRU 순서는 파일
+    mtime으로 유지되어 재시작 후에도 이어집니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        memory_entry_max_bytes: int = 1024 * 1024,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self._dir = Path(directory) if directory else None
+        self._memory_max_bytes = memory_max_bytes
+        self._memory_entry_max_bytes = memory_entry_max_bytes
+        self._disk_max_bytes = disk_max_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        # 파일명 -> 크기 (오래된 순)
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        # 메트릭
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._streamed_bytes = 0
+
+    async def open(self) -> None:
+        """디스크 캐시 디렉토리 준비 + 기존 항목 색인 (mtime 오래된 순)."""
+        if self._dir is None:
+            return
+
+        def _scan() -> list[tuple[float, str, int]]:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self._dir):
+                if entry.name.endswith(".tmp"):
+                    os.unlink(entry.path)  # 이전 프로세스의 미완료 기록
+                elif entry.name.endswith(_SUFFIX):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
+            return sorted(entries)
+
+        for _, name, size in await run_in_executor(ExecutorKind.GIT, _scan):
+            self._disk[name] = size
+            self._disk_bytes += size
+        await self._evict_disk()
+        logger.info(
+            "diff 캐시 색인: dir=%s, entries=%d, bytes=%d",
+            self._dir,
+            len(self._disk),
+            self._disk_bytes,
+        )
+
+    @staticmethod
+    def _filename(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest() + _SUFFIX
+
+    # ── 메모리 단계 ──
+
+    def _memory_get(self, key: str) -> bytes | None:
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        return data
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        if len(data) > self._memory_entry_max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self._memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._evictions += 1
+
+    # ── 디스크 단계 ──
+
+    def _disk_lookup(self, key: str) -> Path | None:
+        if self._dir is None:
+            return None
+        name = self._filename(key)
+        if name not in self._disk:
+            return None
+        self._disk.move_to_end(name)
+        return self._dir / name
+
+    async def _disk_add(self, name: str, size: int) -> None:
+        old = self._disk.pop(name, None)
+        if old is not None:
+            self._disk_bytes -= old
+        self._disk[name] = size
+        self._disk_bytes += size
+        await self._evict_disk()
+
+    async def _evict_disk(self) -> None:
+        victims: list[Path] = []
+        while self._disk_bytes > self._disk_max_bytes and self._disk:
+            name, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._evictions += 1
+            victims.append(self._dir / name)
+        if victims:
+            await run_in_executor(
+                ExecutorKind.GIT, lambda: [p.unlink(missing_ok=True) for p in victims]
+            )
+
+    # ── 공개 API ──
+
+    async def get(self, key: str) -> str | None:
+        """캐시된 diff 텍스트 조회 (없으면 None)."""
+        data = self._memory_get(key)
+        if data is not None:
+            self._memory_hits += 1
+            return data.decode()
+        path = self._disk_lookup(key)
+        if path is not None:
+            try:
+                data = await run_in_executor(
+                    ExecutorKind.GIT, self._read_and_touch, path
+                )
+            except OSError:
+                self._disk_forget(path.name)
+            else:
+                self._disk_hits += 1
+                self._memory_put(key, data)
+                return data.decode()
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, text: str) -> None:
+        """diff 텍스트 저장 (메모리 + 디스크)."""
+        data = text.encode()
+        self._memory_put(key, data)
+        if self._dir is None:
+            return
+        name = self._filename(key)
+        try:
+            await run_in_executor(ExecutorKind.GIT, self._write_atomic, name, data)
+        except OSError as e:
+            logger.warning("diff 캐시 기록 실패: %s", e)
+            return
+        await self._disk_add(name, len(data))
+
+    async def stream(
+        self, key: str, produce: Callable[[], AsyncIterator[bytes]]
+    ) -> AsyncIterator[bytes]:
+        """캐시 hit이면 캐시에서, miss이면 produce() 출력을 흘려보내며 캐시에 기록.
+
+        대용량 결과도 청크 단위로 전달하여 전체를 메모리에 올리지 않습니다.
+        produce()가 실패하거나 소비자가 중간에 끊으면 기록을 폐기합니다.
+        """
+        data = self._memory_get(key)
+        if data is not None:
+            self._memory_hits += 1
+            for start in range(0, len(data), _CHUNK_SIZE):
+                yield data[start : start + _CHUNK_SIZE]
+            return
+
+        path = self._disk_lookup(key)
+        if path is not None:
+            try:
+                f = await run_in_executor(ExecutorKind.GIT, path.open, "rb")
+            except OSError:
+                self._disk_forget(path.name)
+            else:
+                self._disk_hits += 1
+                try:
+                    await run_in_executor(ExecutorKind.GIT, os.utime, path)
+                    while chunk := await run_in_executor(
+                        ExecutorKind.GIT, f.read, _CHUNK_SIZE
+                    ):
+                        yield chunk
+                finally:
+                    f.close()
+                return
+
+        self._misses += 1
+        name = self._filename(key)
+        tmp = self._dir / f"{name}.{os.getpid()}.{id(self)}.tmp" if self._dir else None
+        f = (
+            await run_in_executor(ExecutorKind.GIT, tmp.open, "wb") if tmp else None
+        )
+        buffer: list[bytes] | None = []
+        size = 0
+        completed = False
+        try:
+            async for chunk in produce():
+                size += len(chunk)
+                self._streamed_bytes += len(chunk)
+                if buffer is not None:
+                    buffer.append(chunk)
+                    if size > self._memory_entry_max_bytes:
+                        buffer = None  # 메모리 단계 대상 아님
+                if f is not None:
+                    await run_in_executor(ExecutorKind.GIT, f.write, chunk)
+                yield chunk
+            completed = True
+        finally:
+            if f is not None:
+                f.close()
+                if completed and size <= self._disk_max_bytes:
+                    try:
+                        await run_in_executor(
+                            ExecutorKind.GIT, os.replace, tmp, self._dir / name
+                        )
+                        await self._disk_add(name, size)
+                    except OSError as e:
+                        logger.warning("diff 캐시 기록 실패: %s", e)
+                else:
+                    tmp.unlink(missing_ok=True)
+            if completed and buffer is not None:
+                self._memory_put(key, b"".join(buffer))
+
+    def _disk_forget(self, name: str) -> None:
+        size = self._disk.pop(name, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    @staticmethod
+    def _read_and_touch(path: Path) -> bytes:
+        data = path.read_bytes()
+        os.utime(path)  # 재시작 후 LRU 순서 보존
+        return data
+
+    def _write_atomic(self, name: str, data: bytes) -> None:
+        tmp = self._dir / f"{name}.{os.getpid()}.{id(self)}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, self._dir / name)
+
+    def get_metrics(self) -> dict:
+        """hit/miss 및 단계별 사용량."""
+        hits = self._memory_hits + self._disk_hits
+        lookups = hits + self._misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "streamed_bytes": self._streamed_bytes,
+        }
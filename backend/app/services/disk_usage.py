@@ -0,0 +1,189 @@
+"""워크스페이스 디스크 사용량 계산 (병렬 scandir + 디렉토리 mtime 캐시).
+
+os.walk + getsize는 파일마다 stat을 두 번 호출하고 단일 스레드로 동작하여
+node_modules가 있는 모노레포에서는 수 분이 걸립니다. 이 모듈은:
+
+- os.scandir로 디렉토리를 읽고 st_blocks(실제 할당 크기, du와 동일)를 합산
+- 디렉토리 단위 결과(직속 파일 크기 합 + 하위 디렉토리 이름)를 mtime으로
+  캐시하여, 항목이 추가/삭제/이름 변경되지 않은 디렉토리는 stat 1회로 재사용
+- 탐색 스택을 배치 단위로 나누어 FS_SCAN 실행기에서 병렬 처리
+
+디렉토리 mtime은 파일 내용이 제자리에서 바뀔 때는 갱신되지 않으므로,
+주기적 전체 재계산(full=True)으로 보정합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+from app.core.executors import ExecutorKind, run_in_executor
+from app.services.github_pr_cache import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 한 배치에서 처리할 최대 디렉토리 수 (남은 스택은 다른 작업자에게 분배)
+_BATCH_DIRS = 256
+# 스캔 직전 이 시간 이내에 변경된 디렉토리는 캐시하지 않음 (같은 mtime 내 재변경)
+_RACY_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class _DirStat:
+    mtime_ns: int  # -1이면 다음 스캔에서 반드시 다시 읽음
+    ino: int
+    own_bytes: int  # 디렉토리 자체 + 직속 파일(심볼릭 링크 포함) 할당 크기
+    subdirs: tuple[str, ...]
+
+
+def _allocated(st: os.stat_result) -> int:
+    """실제 디스크 할당 크기 (st_blocks 미지원 플랫폼은 논리 크기)."""
+    blocks = getattr(st, "st_blocks", None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+def _scan_dir(path: str, st: os.stat_result, racy_after: int) -> _DirStat:
+    own = _allocated(st)
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    else:
+                        own += _allocated(entry.stat(follow_symlinks=False))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    mtime = st.st_mtime_ns if st.st_mtime_ns < racy_after else -1
+    return _DirStat(mtime, st.st_ino, own, tuple(subdirs))
+
+
+def _walk_batch(
+    stack: list[str], cached: dict[str, _DirStat], racy_after: int
+) -> tuple[list[tuple[str, _DirStat, bool]], list[str]]:
+    """스택에서 최대 _BATCH_DIRS개 디렉토리 처리 → (결과, 남은 스택).
+
+    mtime/inode가 캐시와 같은 디렉토리는 scandir 없이 재사용합니다.
+    """
+    results: list[tuple[str, _DirStat, bool]] = []
+    while stack and len(results) < _BATCH_DIRS:
+        path = stack.pop()
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            continue
+        prev = cached.get(path)
+        if (
+            prev is not None
+            and prev.mtime_ns == st.st_mtime_ns
+            and prev.ino == st.st_ino
+        ):
+            entry, reused = prev, True
+        else:
+            entry, reused = _scan_dir(path, st, racy_after), False
+        results.append((path, entry, reused))
+        stack.extend(os.path.join(path, name) for name in entry.subdirs)
+    return results, stack
+
+
+class DiskUsageScanner:
+    """루트 디렉토리별 증분 디스크 사용량 계산기."""
+
+    def __init__(self, parallelism: int = 4):
+        self._parallelism = max(1, parallelism)
+        self._cache: dict[str, dict[str, _DirStat]] = {}
+        self._flight = SingleFlight()
+        # 메트릭
+        self._scans = 0
+        self._full_scans = 0
+        self._dirs_scanned = 0
+        self._dirs_reused = 0
+        self._last_scan_ms = 0.0
+
+    async def measure(self, root: str, *, full: bool = False) -> int:
+        """root 이하 디스크 사용량 (bytes). 같은 root 동시 요청은 1회로 통합."""
+        return await self._flight.do(root, lambda: self._scan(root, full))
+
+    def forget(self, root: str) -> None:
+        self._cache.pop(root, None)
+
+    async def _scan(self, root: str, full: bool) -> int:
+        started = time.monotonic()
+        cached = {} if full else self._cache.get(root, {})
+        fresh: dict[str, _DirStat] = {}
+        racy_after = time.time_ns() - _RACY_NS
+        total = scanned = reused = 0
+
+        pending = [root]
+        running: set[asyncio.Future] = set()
+        while pending or running:
+            free = self._parallelism - len(running)
+            if pending and free > 0:
+                groups = [pending[i::free] for i in range(min(free, len(pending)))]
+                pending = []
+                for group in groups:
+                    running.add(
+                        asyncio.ensure_future(
+                            run_in_executor(
+                                ExecutorKind.FS_SCAN,
+                                _walk_batch,
+                                group,
+                                cached,
+                                racy_after,
+                            )
+                        )
+                    )
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                results, leftover = future.result()
+                pending.extend(leftover)
+                for path, entry, was_reused in results:
+                    fresh[path] = entry
+                    total += entry.own_bytes
+                    if was_reused:
+                        reused += 1
+                    else:
+                        scanned += 1
+
+        # 이번 스캔에서 도달하지 않은 디렉토리(삭제됨)는 자연히 제외
+        if os.path.isdir(root):
+            self._cache[root] = fresh
+        else:
+            self._cache.pop(root, None)
+
+        elapsed = (time.monotonic() - started) * 1000
+        self._scans += 1
+        self._full_scans += int(full or not cached)
+        self._dirs_scanned += scanned
+        self._dirs_reused += reused
+        self._last_scan_ms = round(elapsed, 1)
+        logger.debug(
+            "디스크 사용량 계산: %s (%d bytes, 스캔 %d / 재사용 %d 디렉토리, %.0fms)",
+            root,
+            total,
+            scanned,
+            reused,
+            elapsed,
+        )
+        return total
+
+    def get_metrics(self) -> dict:
+        """스캔 횟수, 디렉토리 재사용률, 캐시 크기."""
+        visited = self._dirs_scanned + self._dirs_reused
+        return {
+            "scans_total": self._scans,
+            "full_scans_total": self._full_scans,
+            "dirs_scanned": self._dirs_scanned,
+            "dirs_reused": self._dirs_reused,
+            "reuse_rate": round(self._dirs_reused / visited, 3) if visited else 0.0,
+            "last_scan_ms": self._last_scan_ms,
+            "cached_roots": len(self._cache),
+            "cached_dirs": sum(len(dirs) for dirs in self._cache.values()),
+            "inflight": len(self._flight),
+        }
@@ -5,12 +5,12 @@ Git 관련 기능은 git_service.py, GitHub 관련은 github_service.py,
 Skills 관련은 skills_service.py로 분리되었습니다.
 """
 
-import asyncio
 import logging
 import os
 from pathlib import Path
 
 from app.core.exceptions import ValidationError
+from app.core.executors import ExecutorKind, run_in_executor
 from app.schemas.filesystem import (
     DirectoryEntry,
     DirectoryListResponse,
@@ -98,7 +98,9 @@ class FilesystemService:
                     )
             return items
 
-        entries = await asyncio.to_thread(_scan_directory, validated_path)
+        entries = await run_in_executor(
+            ExecutorKind.FS_SCAN, _scan_directory, validated_path
+        )
 
         # 상위 디렉토리 계산 (루트이거나 root_dir 경계이면 None)
         at_root_boundary = validated_path.parent == validated_path or (
@@ -168,5 +170,5 @@ class FilesystemService:
                 pass
             return repos
 
-        repos = await asyncio.to_thread(_scan, base, max_depth)
+        repos = await run_in_executor(ExecutorKind.FS_SCAN, _scan, base, max_depth)
         return GitRepoScanResponse(repos=repos, scanned_path=str(base))
@@ -0,0 +1,357 @@
+"""장기 실행 git cat-file --batch / check-attr --stdin 워커 풀.
+
+저장소별로 `git cat-file --batch` 프로세스를 유지하여 blob/커밋 객체를
+요청마다 fork 없이 읽습니다. diff 뷰어(HEAD/index blob 조회)와
+HEAD 커밋 해석에 사용됩니다. diff 뷰어가 작업 트리 파일을 blob과 직접
+비교해도 되는지(.gitattributes 변환 여부) 판단하기 위한
+`git check-attr --stdin` 프로세스도 같은 방식으로 유지합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# 작업 트리 ↔ blob 변환에 영향을 주는 속성 (check-attr 조회 대상)
+CONVERSION_ATTRS = ("text", "eol", "crlf", "filter", "ident", "working-tree-encoding")
+
+
+class CatFileError(Exception):
+    """cat-file 워커 통신 실패 (호출자는 git 서브프로세스로 폴백)."""
+
+
+def _stat_stamp(path: str) -> tuple[int, int] | None:
+    """파일 stat 지문 (없으면 None)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _BatchWorker:
+    """저장소 하나에 붙은 장기 실행 git 프로세스 (요청은 lock으로 직렬화)."""
+
+    def __init__(self, repo_root: str, *, timeout: float):
+        self.repo_root = repo_root
+        self._timeout = timeout
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    @property
+    def exited(self) -> bool:
+        """시작된 프로세스가 종료됨 (아직 시작 전인 워커는 False)."""
+        return self._proc is not None and self._proc.returncode is not None
+
+    async def _spawn(self, *args: str) -> None:
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
+                cwd=self.repo_root,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except (OSError, ValueError) as e:
+            raise CatFileError(f"git {args[0]} 시작 실패: {e}") from e
+
+    async def retire(self) -> None:
+        """진행 중인 요청 완료 후 프로세스 종료."""
+        async with self._lock:
+            await self.close()
+
+    async def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=1.0)
+        except (asyncio.TimeoutError, OSError):
+            proc.kill()
+            await proc.wait()
+
+
+class CatFileWorker(_BatchWorker):
+    """단일 저장소용 `git cat-file --batch` 프로세스.
+
+    cat-file은 시작 시점의 index를 계속 사용하므로, index 파일의
+    stat(mtime, size)이 바뀌면 풀에서 워커를 재시작합니다.
+    """
+
+    def __init__(self, repo_root: str, index_path: str | None, *, timeout: float):
+        super().__init__(repo_root, timeout=timeout)
+        self._index_path = index_path
+        self.index_stamp = self.current_index_stamp()
+
+    def current_index_stamp(self) -> tuple[int, int] | None:
+        """index 파일 stat 지문 (없으면 None)."""
+        if not self._index_path:
+            return None
+        return _stat_stamp(self._index_path)
+
+    async def start(self) -> None:
+        await self._spawn("cat-file", "--batch")
+
+    async def read(self, specs: list[str]) -> list[tuple[str, bytes] | None]:
+        """객체 이름 목록을 파이프라이닝으로 조회하여 [(oid, content) | None] 반환.
+
+        존재하지 않거나 blob/commit이 아닌 객체(tree 등)는 None.
+        """
+        if any("\n" in spec for spec in specs):
+            raise CatFileError("객체 이름에 개행 문자를 포함할 수 없습니다")
+        async with self._lock:
+            if not self.alive:
+                await self.start()
+            self.last_used = time.monotonic()
+            try:
+                return await asyncio.wait_for(self._exchange(specs), self._timeout)
+            except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError) as e:
+                # 응답 스트림 위치를 알 수 없으므로 프로세스 폐기
+                await self.close()
+                raise CatFileError(f"cat-file 응답 실패: {e!r}") from e
+
+    async def _exchange(self, specs: list[str]) -> list[tuple[str, bytes] | None]:
+        assert self._proc is not None and self._proc.stdin and self._proc.stdout
+        self._proc.stdin.write("".join(f"{spec}\n" for spec in specs).encode())
+        await self._proc.stdin.drain()
+
+        results: list[tuple[str, bytes] | None] = []
+        stdout = self._proc.stdout
+        for _ in specs:
+            header = (await stdout.readline()).decode(errors="replace").rstrip("\n")
+            if not header:
+                raise asyncio.IncompleteReadError(b"", None)
+            if header.endswith((" missing", " ambiguous")):
+                results.append(None)
+                continue
+            oid, obj_type, size = header.rsplit(" ", 2)
+            content = await stdout.readexactly(int(size) + 1)  # 본문 + 개행
+            results.append(
+                (oid, content[:-1]) if obj_type in ("blob", "commit") else None
+            )
+        return results
+
+
+class CheckAttrWorker(_BatchWorker):
+    """단일 저장소용 `git check-attr --stdin -z` 프로세스 + core.autocrlf 값.
+
+    check-attr은 한 번 읽은 .gitattributes를 프로세스 안에 보관하므로, 조회한
+    경로의 상위 디렉토리 .gitattributes, info/attributes, config 파일 stat이
+    바뀌면 풀에서 워커를 재시작합니다 (autocrlf도 시작 시 한 번만 읽음).
+    """
+
+    def __init__(self, repo_root: str, git_dir: str | None, *, timeout: float):
+        super().__init__(repo_root, timeout=timeout)
+        self._fixed_paths = [os.path.expanduser("~/.gitconfig")]
+        if git_dir:
+            self._fixed_paths += [
+                os.path.join(git_dir, "config"),
+                os.path.join(git_dir, "info", "attributes"),
+            ]
+        self._stamps: dict[str, tuple[int, int] | None] = {}
+        self.autocrlf: str | None = None
+
+    def stale(self, rel_path: str) -> bool:
+        """rel_path 조회에 쓰일 속성/설정 파일이 워커가 읽은 뒤 바뀌었는지."""
+        paths = list(self._fixed_paths)
+        parts = rel_path.split("/")[:-1]
+        for depth in range(len(parts) + 1):
+            paths.append(
+                os.path.join(self.repo_root, *parts[:depth], ".gitattributes")
+            )
+        for path in paths:
+            stamp = _stat_stamp(path)
+            if path not in self._stamps:
+                self._stamps[path] = stamp
+            elif self._stamps[path] != stamp:
+                return True
+        return False
+
+    async def start(self) -> None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "config",
+                "--get",
+                "core.autocrlf",
+                cwd=self.repo_root,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            out, _ = await asyncio.wait_for(proc.communicate(), self._timeout)
+        except asyncio.TimeoutError as e:
+            proc.kill()
+            await proc.wait()
+            raise CatFileError(f"core.autocrlf 조회 시간 초과: {e!r}") from e
+        except (OSError, ValueError) as e:
+            raise CatFileError(f"core.autocrlf 조회 실패: {e!r}") from e
+        self.autocrlf = out.decode(errors="replace").strip().lower() or None
+        await self._spawn("check-attr", "--stdin", "-z", *CONVERSION_ATTRS)
+
+    async def check(self, rel_path: str) -> dict[str, str]:
+        """rel_path의 변환 속성 {이름: set|unset|unspecified|값}."""
+        if "\0" in rel_path:
+            raise CatFileError("경로에 NUL 문자를 포함할 수 없습니다")
+        async with self._lock:
+            if not self.alive:
+                await self.start()
+            self.last_used = time.monotonic()
+            try:
+                return await asyncio.wait_for(
+                    self._exchange(rel_path), self._timeout
+                )
+            except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError) as e:
+                await self.close()
+                raise CatFileError(f"check-attr 응답 실패: {e!r}") from e
+
+    async def _exchange(self, rel_path: str) -> dict[str, str]:
+        assert self._proc is not None and self._proc.stdin and self._proc.stdout
+        self._proc.stdin.write(rel_path.encode() + b"\0")
+        await self._proc.stdin.drain()
+
+        # -z 출력: 속성마다 <경로> NUL <속성> NUL <값> NUL
+        stdout = self._proc.stdout
+        attrs: dict[str, str] = {}
+        for _ in CONVERSION_ATTRS:
+            fields = [
+                (await stdout.readuntil(b"\0"))[:-1].decode(errors="replace")
+                for _ in range(3)
+            ]
+            attrs[fields[1]] = fields[2]
+        return attrs
+
+
+class CatFilePool:
+    """저장소별 cat-file/check-attr 워커 LRU 풀 (최대 워커 수 + 유휴 타임아웃)."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 16,
+        idle_timeout: float = 300.0,
+        timeout: float = 10.0,
+    ):
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._workers: OrderedDict[str, CatFileWorker] = OrderedDict()
+        self._attr_workers: OrderedDict[str, CheckAttrWorker] = OrderedDict()
+        # 저장소별 워커 교체 직렬화 (동시 요청이 각자 새 워커를 만들지 않도록).
+        # 대기 중인 요청이 들고 있을 수 있어 저장소 수만큼 유지
+        self._replace_locks: dict[str, asyncio.Lock] = {}
+        # 메트릭
+        self._requests = 0
+        self._objects = 0
+        self._spawns = 0
+        self._attr_spawns = 0
+        self._attr_requests = 0
+        self._failures = 0
+
+    async def read(
+        self, repo_root: str, index_path: str | None, specs: list[str]
+    ) -> list[tuple[str, bytes] | None]:
+        """저장소 워커로 객체 조회 (실패 시 CatFileError)."""
+        await self._reap_idle()
+        lock = self._replace_locks.setdefault(repo_root, asyncio.Lock())
+        async with lock:
+            worker = self._workers.get(repo_root)
+            if worker is not None and (
+                worker.exited or worker.index_stamp != worker.current_index_stamp()
+            ):
+                # index 변경(stage/commit/checkout) → 새 index로 재시작
+                del self._workers[repo_root]
+                await worker.retire()
+                worker = None
+            if worker is None:
+                worker = CatFileWorker(repo_root, index_path, timeout=self._timeout)
+                self._spawns += 1
+                self._workers[repo_root] = worker
+                while len(self._workers) > self._max_workers:
+                    _, oldest = self._workers.popitem(last=False)
+                    await oldest.retire()
+            else:
+                self._workers.move_to_end(repo_root)
+
+        self._requests += 1
+        self._objects += len(specs)
+        try:
+            return await worker.read(specs)
+        except CatFileError as e:
+            self._failures += 1
+            logger.warning("cat-file 워커 실패: repo=%s, error=%s", repo_root, e)
+            if self._workers.get(repo_root) is worker:
+                del self._workers[repo_root]
+            raise
+
+    async def check_attr(
+        self, repo_root: str, git_dir: str | None, rel_path: str
+    ) -> tuple[dict[str, str], str | None]:
+        """rel_path의 변환 속성과 core.autocrlf 값 (실패 시 CatFileError)."""
+        await self._reap_idle()
+        lock = self._replace_locks.setdefault(repo_root, asyncio.Lock())
+        async with lock:
+            worker = self._attr_workers.get(repo_root)
+            if worker is not None and (worker.exited or worker.stale(rel_path)):
+                # .gitattributes/config 변경 → 새로 읽도록 재시작
+                del self._attr_workers[repo_root]
+                await worker.retire()
+                worker = None
+            if worker is None:
+                worker = CheckAttrWorker(repo_root, git_dir, timeout=self._timeout)
+                worker.stale(rel_path)  # 시작 시점 파일 stat 기록
+                self._attr_spawns += 1
+                self._attr_workers[repo_root] = worker
+                while len(self._attr_workers) > self._max_workers:
+                    _, oldest = self._attr_workers.popitem(last=False)
+                    await oldest.retire()
+            else:
+                self._attr_workers.move_to_end(repo_root)
+
+        self._attr_requests += 1
+        try:
+            attrs = await worker.check(rel_path)
+        except CatFileError as e:
+            self._failures += 1
+            logger.warning("check-attr 워커 실패: repo=%s, error=%s", repo_root, e)
+            if self._attr_workers.get(repo_root) is worker:
+                del self._attr_workers[repo_root]
+            raise
+        return attrs, worker.autocrlf
+
+    async def _reap_idle(self) -> None:
+        now = time.monotonic()
+        for workers in (self._workers, self._attr_workers):
+            for repo_root, worker in list(workers.items()):
+                if now - worker.last_used > self._idle_timeout:
+                    del workers[repo_root]
+                    await worker.retire()
+
+    async def close_all(self) -> None:
+        workers = [*self._workers.values(), *self._attr_workers.values()]
+        self._workers.clear()
+        self._attr_workers.clear()
+        for worker in workers:
+            await worker.retire()
+
+    def get_metrics(self) -> dict:
+        return {
+            "workers": len(self._workers),
+            "requests": self._requests,
+            "objects": self._objects,
+            "spawns": self._spawns,
+            "attr_workers": len(self._attr_workers),
+            "attr_requests": self._attr_requests,
+            "attr_spawns": self._attr_spawns,
+            "failures": self._failures,
+        }
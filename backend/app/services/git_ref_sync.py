@@ -0,0 +1,168 @@
+"""저장소별 백그라운드 원격 ref 동기화 (git fetch) 스케줄러.
+
+브랜치 목록 조회가 매번 `git fetch --prune`(네트워크)를 실행하지 않도록,
+워크스페이스/최근 브랜치 조회 저장소를 주기적으로 fetch합니다.
+저장소별 주기에 지터를 두어 동시에 몰리지 않게 하고, 동시 fetch 수를
+제한하며, 실패 시 지수 백오프합니다. request_sync()로 즉시 동기화를
+요청할 수 있습니다 (webhook/수동 새로고침).
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+
+from app.services.git_service import GitService
+
+logger = logging.getLogger(__name__)
+
+# 실패 시 최대 백오프 배수 (interval * 2^n, 최대 8배)
+_MAX_BACKOFF_FACTOR = 8
+
+
+@dataclass
+class _RepoSync:
+    """저장소별 동기화 상태."""
+
+    next_due: float
+    last_interest: float
+    pinned: bool = False  # 워크스페이스 저장소 (관심 만료로 해제하지 않음)
+    last_synced: float | None = None
+    failures: int = 0
+    syncing: bool = False
+
+
+class RefSyncScheduler:
+    """저장소별 주기적 fetch + 동시성 제한 + 지터.
+
+    GitService.list_branches()가 touch()로 관심 저장소를 등록하며,
+    idle_ttl 동안 조회되지 않은 저장소(워크스페이스 제외)는 해제됩니다.
+    """
+
+    def __init__(
+        self,
+        git_service: GitService,
+        *,
+        interval: float = 300.0,
+        jitter: float = 0.2,
+        max_concurrency: int = 2,
+        idle_ttl: float = 3600.0,
+    ):
+        self._git = git_service
+        self._interval = interval
+        self._jitter = jitter
+        self._idle_ttl = idle_ttl
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._repos: dict[str, _RepoSync] = {}
+        self._wake = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+        # 메트릭
+        self._syncs_total = 0
+        self._sync_failures = 0
+        git_service.attach_ref_sync(self)
+
+    def _next_delay(self, failures: int = 0) -> float:
+        factor = min(2**failures, _MAX_BACKOFF_FACTOR)
+        spread = self._interval * self._jitter
+        return self._interval * factor + random.uniform(-spread, spread)
+
+    def register(self, repo_root: str, *, pinned: bool = False) -> None:
+        """저장소 등록 (첫 동기화는 지터 구간 내 임의 시점)."""
+        now = time.monotonic()
+        state = self._repos.get(repo_root)
+        if state is not None:
+            state.last_interest = now
+            state.pinned = state.pinned or pinned
+            return
+        self._repos[repo_root] = _RepoSync(
+            next_due=now + random.uniform(0, self._interval * self._jitter),
+            last_interest=now,
+            pinned=pinned,
+        )
+        self._wake.set()
+
+    def touch(self, repo_root: str) -> None:
+        """브랜치 조회 등 관심 표시 (미등록이면 등록)."""
+        self.register(repo_root)
+
+    def request_sync(self, repo_root: str) -> None:
+        """즉시 동기화 요청 (진행 중이면 무시)."""
+        self.register(repo_root)
+        self._repos[repo_root].next_due = time.monotonic()
+        self._wake.set()
+
+    def last_synced(self, repo_root: str) -> float | None:
+        """마지막 성공 동기화 시각 (time.monotonic 기준)."""
+        state = self._repos.get(repo_root)
+        return state.last_synced if state else None
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """스케줄 루프 (shutdown_event가 set될 때까지)."""
+        while not shutdown_event.is_set():
+            now = time.monotonic()
+            next_wake = now + self._interval
+            for repo_root, state in list(self._repos.items()):
+                if not state.pinned and now - state.last_interest > self._idle_ttl:
+                    del self._repos[repo_root]
+                    continue
+                if state.syncing:
+                    continue
+                if state.next_due <= now:
+                    state.syncing = True
+                    task = asyncio.create_task(self._sync(repo_root, state))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                else:
+                    next_wake = min(next_wake, state.next_due)
+
+            self._wake.clear()
+            stop = asyncio.ensure_future(shutdown_event.wait())
+            wake = asyncio.ensure_future(self._wake.wait())
+            try:
+                await asyncio.wait(
+                    {stop, wake},
+                    timeout=max(next_wake - time.monotonic(), 0.05),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                stop.cancel()
+                wake.cancel()
+
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _sync(self, repo_root: str, state: _RepoSync) -> None:
+        try:
+            if not os.path.isdir(repo_root):
+                # 삭제된 워크스페이스/저장소
+                self._repos.pop(repo_root, None)
+                return
+            async with self._semaphore:
+                success, message = await self._git.fetch_remote(repo_root)
+            self._syncs_total += 1
+            if success:
+                state.failures = 0
+                state.last_synced = time.monotonic()
+            else:
+                self._sync_failures += 1
+                state.failures += 1
+                logger.warning(
+                    "원격 ref 동기화 실패: repo=%s, %s", repo_root, message
+                )
+            state.next_due = time.monotonic() + self._next_delay(state.failures)
+        finally:
+            state.syncing = False
+            self._wake.set()
+
+    def get_metrics(self) -> dict:
+        """등록 저장소 수 및 동기화 결과."""
+        return {
+            "repos": len(self._repos),
+            "syncing": sum(1 for s in self._repos.values() if s.syncing),
+            "syncs_total": self._syncs_total,
+            "sync_failures": self._sync_failures,
+            "interval_seconds": self._interval,
+        }
@@ -4,13 +4,23 @@ Git 정보 조회, 워크트리 관리, diff, log 등 Git CLI 작업을 담당
 """
 
 import asyncio
+import difflib
+import hashlib
 import logging
 import os
+import re
 import time
 from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from app.core.exceptions import ValidationError
+from app.core.executors import ExecutorKind, run_in_executor
+from app.services.diff_cache import DiffCache
+from app.services.git_cat_file import CatFileError, CatFilePool
+from app.services.subprocess_runner import SubprocessRunError, SubprocessRunner
 from app.schemas.filesystem import (
     GitCommitEntry,
     GitInfo,
@@ -21,8 +31,38 @@ from app.schemas.filesystem import (
     WorktreeListResponse,
 )
 
+if TYPE_CHECKING:
+    from app.services.git_ref_sync import RefSyncScheduler
+    from app.services.git_watcher import GitChangeWatcher
+
 logger = logging.getLogger(__name__)
 
+# 커밋 diff 조회 대상 (축약/전체 16진수 해시, SHA-1/SHA-256)
+_COMMIT_HASH_RE = re.compile(r"[0-9a-fA-F]{7,64}")
+
+
+@dataclass(frozen=True)
+class RepoLayout:
+    """저장소 구조 정보 (거의 변하지 않으므로 스냅샷과 별도로 장기 캐시).
+
+    git_dir/common_dir은 절대 경로이며, linked worktree에서만 서로 다릅니다.
+    """
+
+    is_git_repo: bool
+    repo_root: str | None = None
+    git_dir: str | None = None
+    common_dir: str | None = None
+    is_worktree: bool = False
+    remote_url: str | None = None
+
+
+@dataclass(frozen=True)
+class _GitSnapshot:
+    """단일 git status 호출 결과에서 만든 GitInfo + GitStatusResponse 쌍."""
+
+    info: GitInfo
+    status: GitStatusResponse
+
 
 class GitService:
     """Git 저장소 정보 조회 및 워크트리 관리 서비스.
@@ -35,6 +75,12 @@ class GitService:
     # Git 정보 캐시 최대 항목 수
     _GIT_CACHE_MAX_SIZE = 100
 
+    # 저장소 구조(toplevel/워크트리 여부/remote URL) 캐시 TTL (초)
+    _LAYOUT_CACHE_TTL = 300.0
+
+    # 프로세스 내 diff 계산 대상 최대 파일 크기 (초과 시 git diff 폴백)
+    _INPROCESS_DIFF_MAX_BYTES = 1024 * 1024
+
     # Git 명령 타임아웃 (초)
     _DEFAULT_GIT_TIMEOUT = 10.0
     _WRITE_GIT_TIMEOUT = 30.0
@@ -61,11 +107,54 @@ class GitService:
         "core.checkStat=minimal",  # stat 비교를 mtime+size로 최소화
     )
 
-    def __init__(self, root_dir: str = ""):
-        self._git_cache: OrderedDict[str, tuple[float, GitInfo]] = OrderedDict()
-        self._git_cache_ttl: float = 10.0  # 10초 TTL
+    def __init__(
+        self,
+        root_dir: str = "",
+        *,
+        diff_cache: DiffCache | None = None,
+        runner: SubprocessRunner | None = None,
+    ):
+        # 경로(resolve된 cwd)별 최신 스냅샷: (저장 시각, 스냅샷, 조회 시작 시각).
+        # 만료 후에도 다음 스냅샷에서 HEAD가 같으면 커밋 정보를 재사용하기 위해
+        # LRU 퇴거 전까지 보관
+        self._git_cache: OrderedDict[str, tuple[float, _GitSnapshot, float]] = (
+            OrderedDict()
+        )
+        self._git_cache_ttl: float = 10.0  # 10초 TTL (변경 감시 미적용 저장소)
+        # 변경 감시기 (attach_watcher). 감시 중인 저장소의 스냅샷은 변경
+        # 통지 전까지 TTL 없이 유효
+        self._watcher: "GitChangeWatcher | None" = None
+        # 무효화 세대: 조회 도중 무효화되면 해당 스냅샷은 감시 기반 신뢰 불가
+        self._cache_epoch = 0
+        self._layout_cache: OrderedDict[str, tuple[float, RepoLayout]] = (
+            OrderedDict()
+        )
         # cache stampede 방지: 동일 경로 동시 캐시 미스 시 1회만 fetch
         self._inflight_fetches: dict[str, asyncio.Event] = {}
+        # git 명령 실행기 (전역 + 저장소별 동시 실행 제한, 타임아웃 시 kill)
+        self._runner = runner or SubprocessRunner("git")
+        # 저장소별 장기 실행 cat-file 워커 (diff 뷰어 blob 조회, HEAD 해석)
+        self._cat_file = CatFilePool()
+        # diff 결과 캐시 (blob OID/커밋 해시 키). 기본은 메모리 단계만 사용
+        self._diff_cache = diff_cache or DiffCache()
+        # (cwd, HEAD oid) -> rev-list --count 결과. 커밋 수는 HEAD가 같으면 불변
+        self._commit_counts: OrderedDict[tuple[str, str], int] = OrderedDict()
+        # git_dir -> (refs 스탬프, 브랜치 목록 결과). HEAD/packed-refs/loose ref
+        # 파일 stat이 같으면 ref가 변하지 않았으므로 재사용
+        self._branch_cache: OrderedDict[
+            str, tuple[tuple, tuple[list[str], str | None, str | None]]
+        ] = OrderedDict()
+        # 백그라운드 원격 ref 동기화 (attach_ref_sync)
+        self._ref_sync: "RefSyncScheduler | None" = None
+        # 메트릭
+        self._git_commands_total = 0
+        self._inprocess_diffs = 0
+        self._subprocess_diffs = 0
+        self._commit_count_hits = 0
+        self._snapshots_total = 0
+        self._snapshot_cache_hits = 0
+        self._branch_listings_total = 0
+        self._branch_cache_hits = 0
         # 동일 레포에 대한 동시 git 명령 직렬화 (index.lock 경합 방지)
         self._git_locks: OrderedDict[str, asyncio.Lock] = OrderedDict()
         # 탐색 경계: 이 디렉토리 상위로는 이동 불가
@@ -144,25 +233,125 @@ class GitService:
         return str(validated)
 
     def _invalidate_cache(self, path: str) -> None:
-        """지정 경로의 Git 정보 캐시를 무효화."""
-        if path in self._git_cache:
-            del self._git_cache[path]
+        """지정 경로의 Git 스냅샷 캐시를 무효화."""
+        cwd = os.path.realpath(os.path.expanduser(path))
+        self._cache_epoch += 1
+        self._git_cache.pop(cwd, None)
+
+    async def close(self) -> None:
+        """장기 실행 git 워커 종료."""
+        await self._cat_file.close_all()
+
+    def attach_watcher(self, watcher: "GitChangeWatcher") -> None:
+        """파일시스템 변경 감시기 연결 (감시 중인 저장소는 TTL 없이 캐시)."""
+        self._watcher = watcher
+
+    def attach_ref_sync(self, scheduler: "RefSyncScheduler") -> None:
+        """백그라운드 원격 ref 동기화 스케줄러 연결 (브랜치 조회 저장소 등록)."""
+        self._ref_sync = scheduler
+
+    def invalidate_repo(self, repo_root: str) -> None:
+        """저장소(하위 경로 포함)의 모든 스냅샷 캐시를 무효화."""
+        self._cache_epoch += 1
+        stale = [
+            cwd
+            for cwd, (_, snapshot, _) in self._git_cache.items()
+            if snapshot.status.repo_root == repo_root
+        ]
+        for cwd in stale:
+            del self._git_cache[cwd]
+
+    def _is_snapshot_fresh(
+        self, entry: tuple[float, _GitSnapshot, float], ttl: float
+    ) -> bool:
+        """TTL 이내이거나, 감시 시작 이후 조회된 감시 중 저장소 스냅샷이면 유효."""
+        stored_at, snapshot, taken_at = entry
+        if time.monotonic() - stored_at < ttl:
+            return True
+        repo_root = snapshot.status.repo_root
+        if self._watcher is None or repo_root is None:
+            return False
+        since = self._watcher.watching_since(repo_root)
+        return since is not None and taken_at >= since
+
+    def get_metrics(self) -> dict:
+        """git 명령 실행 수 및 스냅샷 캐시 메트릭."""
+        return {
+            "git_commands_total": self._git_commands_total,
+            "snapshots_total": self._snapshots_total,
+            "snapshot_cache_hits": self._snapshot_cache_hits,
+            "snapshot_cache_size": len(self._git_cache),
+            "cache_mode": "watch" if self._watcher else "ttl",
+            "inprocess_diffs": self._inprocess_diffs,
+            "subprocess_diffs": self._subprocess_diffs,
+            "commit_count_hits": self._commit_count_hits,
+            "cat_file": self._cat_file.get_metrics(),
+            "runner": self._runner.get_metrics(),
+            "diff_cache": self._diff_cache.get_metrics(),
+            "layout_cache_size": len(self._layout_cache),
+            "branch_listings_total": self._branch_listings_total,
+            "branch_cache_hits": self._branch_cache_hits,
+            "branch_cache_size": len(self._branch_cache),
+        }
 
     # ── 파싱 유틸리티 (static) ──
 
     @staticmethod
-    def _parse_porcelain_status(output: str) -> tuple[bool, bool]:
-        """porcelain status 출력을 파싱하여 (is_dirty, has_untracked) 반환."""
-        is_dirty = False
-        has_untracked = False
-        for line in output.split("\n"):
-            if not line:
+    def _parse_porcelain_v2(
+        output: str,
+    ) -> tuple[dict[str, str], list[GitStatusFile]]:
+        """git status --porcelain=v2 --branch -z 출력을 (branch 헤더, 파일 목록)으로 파싱.
+
+        상태 코드는 기존 v1 표기("M", "??", "AM" 등)로 변환합니다 (v2의 '.' → 공백).
+        """
+        headers: dict[str, str] = {}
+        files: list[GitStatusFile] = []
+        fields = output.split("\x00")
+        i = 0
+        while i < len(fields):
+            entry = fields[i]
+            i += 1
+            if not entry:
+                continue
+            kind = entry[0]
+            if kind == "#":
+                # "# branch.oid <hash>", "# branch.ab +1 -2" 등
+                key, _, value = entry[2:].partition(" ")
+                headers[key] = value
                 continue
-            if line.startswith("?"):
-                has_untracked = True
+            if kind == "?":
+                xy, file_path = "??", entry[2:]
+            elif kind == "1":
+                parts = entry.split(" ", 8)
+                if len(parts) < 9:
+                    continue
+                xy, file_path = parts[1], parts[8]
+            elif kind == "2":
+                parts = entry.split(" ", 9)
+                if len(parts) < 10:
+                    continue
+                xy, file_path = parts[1], parts[9]
+                i += 1  # -z 모드: rename 원본 경로가 다음 필드로 옴
+            elif kind == "u":
+                parts = entry.split(" ", 10)
+                if len(parts) < 11:
+                    continue
+                xy, file_path = parts[1], parts[10]
             else:
-                is_dirty = True
-        return is_dirty, has_untracked
+                # "!" (ignored) 등
+                continue
+            x = " " if xy[0] == "." else xy[0]  # index status
+            y = " " if xy[1] == "." else xy[1]  # working tree status
+            files.append(
+                GitStatusFile(
+                    path=file_path,
+                    status=f"{x}{y}".strip(),
+                    is_staged=(x != " " and x != "?"),
+                    is_unstaged=(y != " " and y != "?"),
+                    is_untracked=(x == "?" and y == "?"),
+                )
+            )
+        return headers, files
 
     @staticmethod
     def _parse_commit_log(output: str) -> tuple[str | None, str | None, str | None]:
@@ -280,137 +469,236 @@ class GitService:
     async def _run_git_command(
         self, *args: str, cwd: str, timeout: float = 10.0
     ) -> tuple[int, str, str]:
-        """git 명령 실행 후 (returncode, stdout, stderr) 반환."""
+        """git 명령 실행 후 (returncode, stdout, stderr) 반환.
 
-        def _run() -> tuple[int, str, str]:
-            import subprocess
+        스레드를 점유하지 않는 asyncio 서브프로세스로 실행하며, 같은 저장소(cwd)
+        명령은 저장소별 동시 실행 한도 내에서 대기합니다.
+        """
+        self._git_commands_total += 1
+        return await self._runner.run(
+            ["git", *args], cwd=cwd, timeout=timeout, key=cwd
+        )
 
-            try:
-                result = subprocess.run(
-                    ["git", *args],
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-                return result.returncode, result.stdout.strip(), result.stderr.strip()
-            except subprocess.TimeoutExpired:
-                return -1, "", "timeout"
-            except FileNotFoundError:
-                return -1, "", "git not found"
+    async def get_git_info(self, path: str) -> GitInfo:
+        """Git 저장소 정보 조회 (스냅샷 캐시, 최대 100개).
 
-        return await asyncio.to_thread(_run)
+        변경 감시 중인 저장소는 파일시스템 변경 통지 전까지 캐시를 그대로
+        사용하고, git_cache_mode="ttl"이거나 감시되지 않는 저장소는 10초
+        TTL로 재조회합니다. get_git_status()와 동일한 스냅샷을 공유합니다.
+        """
+        cwd = self._resolve_cwd(path)
+        snapshot = await self._get_snapshot(cwd, ttl=self._git_cache_ttl)
+        return snapshot.info
 
-    async def get_git_info(self, path: str) -> GitInfo:
-        """Git 저장소 정보 조회 (OrderedDict LRU 캐시, 10초 TTL, 최대 100개).
+    async def _get_snapshot(self, cwd: str, *, ttl: float) -> _GitSnapshot:
+        """경로별 Git 스냅샷 조회 (OrderedDict LRU 캐시).
 
+        ttl=0이면 감시 중인 저장소의 스냅샷만 캐시에서 반환하고, 그 외에는
+        새로 조회하되 진행 중인 조회가 있으면 그 결과에 합류합니다.
         cache stampede 방지: 동일 경로 동시 요청 시 첫 번째만 fetch, 나머지는 대기.
         """
-        now = time.monotonic()
-        cached = self._git_cache.get(path)
-        if cached:
-            ts, data = cached
-            if (now - ts) < self._git_cache_ttl:
-                self._git_cache.move_to_end(path)  # LRU 업데이트
-                return data
-            else:
-                del self._git_cache[path]  # 만료된 캐시 제거
+        requested_at = time.monotonic()
+        cached = self._git_cache.get(cwd)
+        if cached and self._is_snapshot_fresh(cached, ttl):
+            self._git_cache.move_to_end(cwd)  # LRU 업데이트
+            self._snapshot_cache_hits += 1
+            return cached[1]
 
         # double-check: 이미 다른 코루틴이 fetch 중이면 대기
-        inflight = self._inflight_fetches.get(path)
+        inflight = self._inflight_fetches.get(cwd)
         if inflight is not None:
             await inflight.wait()
-            cached = self._git_cache.get(path)
-            if cached:
+            cached = self._git_cache.get(cwd)
+            # 대기 시작 이후 저장된 스냅샷만 사용 (fetch 실패 시 직접 조회)
+            if cached and cached[0] >= requested_at:
                 return cached[1]
 
         # 이 코루틴이 fetch를 수행
         event = asyncio.Event()
-        self._inflight_fetches[path] = event
+        self._inflight_fetches[cwd] = event
         try:
-            result = await self._fetch_git_info(path)
+            epoch = self._cache_epoch
+            taken_at = time.monotonic()
+            snapshot = await self._take_snapshot(cwd)
+            if self._cache_epoch != epoch:
+                # 조회 도중 변경 통지 → 변경 전 상태일 수 있으므로 TTL로만 유효
+                taken_at = float("-inf")
+            self._git_cache.pop(cwd, None)
             # 캐시 크기 제한: O(1) LRU 퇴거
             if len(self._git_cache) >= self._GIT_CACHE_MAX_SIZE:
                 self._git_cache.popitem(last=False)  # 가장 오래된 항목 제거
-            self._git_cache[path] = (time.monotonic(), result)
-            return result
+            self._git_cache[cwd] = (time.monotonic(), snapshot, taken_at)
+            return snapshot
         finally:
-            self._inflight_fetches.pop(path, None)
+            self._inflight_fetches.pop(cwd, None)
             event.set()
 
-    async def _fetch_git_info(self, path: str) -> GitInfo:
-        """Git 저장소 정보 실제 조회."""
-        cwd = self._resolve_cwd(path)
+    async def get_repo_layout(self, path: str) -> RepoLayout:
+        """경로가 속한 저장소 구조 조회 (캐시)."""
+        return await self._get_layout(self._resolve_cwd(path))
 
-        # Git 저장소 여부 확인
-        returncode, _, _ = await self._run_git_command(
-            "rev-parse", "--is-inside-work-tree", cwd=cwd
+    async def _get_layout(self, cwd: str) -> RepoLayout:
+        """저장소 구조 조회 (git 저장소 여부, toplevel, 워크트리 여부, remote URL).
+
+        저장소는 _LAYOUT_CACHE_TTL, 비저장소는 스냅샷 TTL 동안 캐시합니다.
+        """
+        cached = self._layout_cache.get(cwd)
+        if cached and time.monotonic() < cached[0]:
+            self._layout_cache.move_to_end(cwd)
+            return cached[1]
+
+        (rc, rev_out, _), (rc_remote, remote_out, _) = await asyncio.gather(
+            self._run_git_command(
+                "rev-parse",
+                "--show-toplevel",
+                "--git-dir",
+                "--git-common-dir",
+                cwd=cwd,
+            ),
+            self._run_git_command("remote", "get-url", "origin", cwd=cwd),
         )
-        if returncode != 0:
-            return GitInfo(is_git_repo=False)
+        lines = rev_out.split("\n") if rc == 0 else []
+        if len(lines) < 3:
+            layout = RepoLayout(is_git_repo=False)
+            ttl = self._git_cache_ttl
+        else:
+            repo_root, git_dir, git_common = lines[0], lines[1], lines[2]
+            # git-dir != git-common-dir 이면 linked worktree
+            norm_dir = os.path.normpath(os.path.join(cwd, git_dir))
+            norm_common = os.path.normpath(os.path.join(cwd, git_common))
+            layout = RepoLayout(
+                is_git_repo=True,
+                repo_root=repo_root,
+                git_dir=norm_dir,
+                common_dir=norm_common,
+                is_worktree=norm_dir != norm_common,
+                remote_url=remote_out if rc_remote == 0 and remote_out else None,
+            )
+            ttl = self._LAYOUT_CACHE_TTL
+
+        self._layout_cache.pop(cwd, None)
+        if len(self._layout_cache) >= self._GIT_CACHE_MAX_SIZE:
+            self._layout_cache.popitem(last=False)
+        self._layout_cache[cwd] = (time.monotonic() + ttl, layout)
+        return layout
+
+    async def _take_snapshot(self, cwd: str) -> _GitSnapshot:
+        """git status --porcelain=v2 --branch 1회로 GitInfo/GitStatusResponse 생성.
 
-        info = GitInfo(is_git_repo=True)
+        브랜치/upstream/ahead/behind/HEAD는 status의 branch 헤더에서 얻고,
+        최근 커밋 정보는 HEAD가 이전 스냅샷과 다를 때만 git log 1회로 조회합니다.
+        """
+        layout = await self._get_layout(cwd)
+        if not layout.is_git_repo:
+            return _GitSnapshot(
+                info=GitInfo(is_git_repo=False),
+                status=GitStatusResponse(is_git_repo=False),
+            )
+        if self._watcher is not None:
+            self._watcher.ensure_watching(layout)
 
-        # per-repo lock: get_git_status()와 동시 실행 시 index.lock 경합 방지
+        self._snapshots_total += 1
+        start = time.monotonic()
+        # per-repo lock: 쓰기 작업과 동시 실행 시 index.lock 경합 방지
+        # update-index --refresh 불필요: git status가 내부적으로 refresh_index() 호출
+        # --no-optional-locks: index.lock 경합 방지 (VS Code 등과 안전 공존)
         async with self._get_git_lock(cwd):
-            # 독립적인 Git 명령을 병렬 실행 (순차 -> 병렬로 약 7배 빠름)
-            # --no-optional-locks: index.lock 경합 방지
-            (
-                (rc_branch, branch_out, _),
-                (rc_status, status_out, _),
-                (rc_log, log_out, _),
-                (rc_remote, remote_out, _),
-                (rc_ahead, ahead_out, _),
-                (rc_dir, git_dir, _),
-                (rc_common, git_common, _),
-            ) = await asyncio.gather(
-                self._run_git_command("branch", "--show-current", cwd=cwd),
-                self._run_git_command(
-                    *self._GIT_CROSS_PLATFORM_OPTS,
-                    "--no-optional-locks",
-                    "status",
-                    "--porcelain",
-                    cwd=cwd,
-                    timeout=60.0,
-                ),
-                self._run_git_command("log", "-1", "--format=%H%n%s%n%aI", cwd=cwd),
-                self._run_git_command("remote", "get-url", "origin", cwd=cwd),
-                self._run_git_command(
-                    "rev-list", "--left-right", "--count", "HEAD...@{upstream}", cwd=cwd
+            rc, out, stderr = await self._run_git_command(
+                *self._GIT_CROSS_PLATFORM_OPTS,
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "-z",
+                cwd=cwd,
+                timeout=self._HEAVY_GIT_TIMEOUT,
+            )
+
+        info = GitInfo(
+            is_git_repo=True,
+            is_worktree=layout.is_worktree,
+            remote_url=layout.remote_url,
+        )
+
+        # git status 실패/타임아웃 시 에러 반환
+        if rc != 0:
+            error_msg = "timeout" if stderr == "timeout" else f"git error: {stderr}"
+            logger.error(
+                "git status 실패: path=%s, rc=%d, error=%s", cwd, rc, error_msg
+            )
+            return _GitSnapshot(
+                info=info,
+                status=GitStatusResponse(
+                    is_git_repo=True, repo_root=layout.repo_root, error=error_msg
                 ),
-                self._run_git_command("rev-parse", "--git-dir", cwd=cwd),
-                self._run_git_command("rev-parse", "--git-common-dir", cwd=cwd),
             )
 
-        # 브랜치명
-        if rc_branch == 0 and branch_out:
-            info.branch = branch_out
+        headers, files = self._parse_porcelain_v2(out)
 
-        # 상태 확인 (dirty / untracked)
-        if rc_status == 0 and status_out:
-            info.is_dirty, info.has_untracked = self._parse_porcelain_status(status_out)
+        # 브랜치명 (detached HEAD이면 None)
+        head = headers.get("branch.head")
+        if head and head != "(detached)":
+            info.branch = head
 
-        # 최근 커밋 정보
-        if rc_log == 0 and log_out:
-            info.last_commit_hash, info.last_commit_message, info.last_commit_date = (
-                self._parse_commit_log(log_out)
+        # ahead/behind (upstream 미설정 시 헤더 없음 → 0/0)
+        ab = headers.get("branch.ab")
+        if ab:
+            info.ahead, info.behind = self._parse_ahead_behind(
+                ab.replace("+", "").replace("-", "")
             )
 
-        # 리모트 URL (실패해도 무시)
-        if rc_remote == 0 and remote_out:
-            info.remote_url = remote_out
-
-        # ahead/behind (실패해도 0/0)
-        if rc_ahead == 0 and ahead_out:
-            info.ahead, info.behind = self._parse_ahead_behind(ahead_out)
+        # 상태 확인 (dirty / untracked)
+        for f in files:
+            if f.is_untracked:
+                info.has_untracked = True
+            else:
+                info.is_dirty = True
+
+        # 최근 커밋 정보: HEAD 불변이면 이전 스냅샷 재사용
+        oid = headers.get("branch.oid")
+        if oid and oid != "(initial)":
+            previous = self._git_cache.get(cwd)
+            if previous and previous[1].info.last_commit_hash == oid:
+                prev_info = previous[1].info
+                info.last_commit_hash = prev_info.last_commit_hash
+                info.last_commit_message = prev_info.last_commit_message
+                info.last_commit_date = prev_info.last_commit_date
+            else:
+                rc_log, log_out, _ = await self._run_git_command(
+                    "log", "-1", "--format=%H%n%s%n%aI", oid, cwd=cwd
+                )
+                if rc_log == 0 and log_out:
+                    (
+                        info.last_commit_hash,
+                        info.last_commit_message,
+                        info.last_commit_date,
+                    ) = self._parse_commit_log(log_out)
 
-        # 워크트리 여부 판별
-        if rc_dir == 0 and rc_common == 0 and git_dir and git_common:
-            norm_dir = os.path.normpath(os.path.join(cwd, git_dir))
-            norm_common = os.path.normpath(os.path.join(cwd, git_common))
-            info.is_worktree = norm_dir != norm_common
+        elapsed = time.monotonic() - start
+        if len(files) > 100 or elapsed > 5.0:
+            staged = sum(1 for f in files if f.is_staged)
+            unstaged = sum(1 for f in files if f.is_unstaged)
+            untracked = sum(1 for f in files if f.is_untracked)
+            logger.warning(
+                "git status 대형 결과: path=%s, total=%d "
+                "(staged=%d, unstaged=%d, untracked=%d), elapsed=%.1fs",
+                cwd,
+                len(files),
+                staged,
+                unstaged,
+                untracked,
+                elapsed,
+            )
 
-        return info
+        return _GitSnapshot(
+            info=info,
+            status=GitStatusResponse(
+                is_git_repo=True,
+                repo_root=layout.repo_root,
+                files=files,
+                total_count=len(files),
+            ),
+        )
 
     async def list_worktrees(self, path: str) -> WorktreeListResponse:
         """Git 워크트리 목록 조회."""
@@ -532,102 +820,265 @@ class GitService:
                     logger.info("원격 브랜치 삭제 완료: origin/%s", branch_name)
 
     async def get_git_status(self, path: str) -> GitStatusResponse:
-        """git status --porcelain=v1 결과를 파싱하여 변경 파일 목록 반환."""
+        """변경 파일 목록 반환 (git status --porcelain=v2 스냅샷).
+
+        파일 패널은 최신 상태가 필요하므로 TTL 캐시를 쓰지 않습니다. 변경 감시
+        중인 저장소는 변경 통지 전까지 캐시된 스냅샷을 반환하며, 새로 조회한
+        결과는 get_git_info()와 공유됩니다.
+        """
         cwd = self._resolve_cwd(path)
-        start = time.monotonic()
+        snapshot = await self._get_snapshot(cwd, ttl=0.0)
+        return snapshot.status
 
-        # git 저장소 여부 확인
-        rc, _, _ = await self._run_git_command(
-            "rev-parse", "--is-inside-work-tree", cwd=cwd
-        )
-        if rc != 0:
-            return GitStatusResponse(is_git_repo=False)
+    async def get_file_diff(self, repo_path: str, file_path: str) -> str:
+        """임의 경로 기준 특정 파일의 git diff 반환 (세션 비종속)."""
+        cwd = self._resolve_cwd(repo_path)
+        return await self.diff_worktree_file(cwd, file_path)
 
-        # per-repo lock: get_git_info()와 동시 실행 시 subprocess 경합 방지
-        async with self._get_git_lock(cwd):
-            # update-index --refresh 제거: 대형 레포(WSL2 9P)에서 타임아웃 위험
-            # git status가 내부적으로 refresh_index()를 호출하므로 별도 실행 불필요
-            # --no-optional-locks: index.lock 경합 방지 (VS Code 등과 안전 공존)
-            (
-                (rc_root, root_out, _),
-                (rc_status, status_out, stderr),
-            ) = await asyncio.gather(
-                self._run_git_command("rev-parse", "--show-toplevel", cwd=cwd),
-                self._run_git_command(
-                    *self._GIT_CROSS_PLATFORM_OPTS,
-                    "--no-optional-locks",
-                    "status",
-                    "--porcelain=v1",
-                    cwd=cwd,
-                    timeout=60.0,
-                ),
-            )
+    async def diff_worktree_file(self, cwd: str, file_path: str) -> str:
+        """작업 디렉토리(cwd) 기준 파일의 diff 반환. 경로 경계 검증은 호출자 책임.
 
-        repo_root = root_out if rc_root == 0 else None
+        우선순위: HEAD -> worktree, (동일하면) index -> worktree.
+        HEAD/index blob은 cat-file 워커로 읽고 diff는 GIT 실행기에서 계산하며,
+        대용량 파일, .gitattributes/core.autocrlf 변환(text/eol/filter 등)이
+        적용되는 파일, 워커 실패 시 git diff 서브프로세스로 폴백합니다.
+        결과는 (HEAD/index blob OID, 작업 트리 blob 해시) 키로 캐시됩니다.
+        """
+        abs_file = (Path(cwd) / file_path).resolve()
+        layout = await self._get_layout(cwd)
+        rel_path: str | None = None
+        if layout.is_git_repo and layout.repo_root:
+            rel = os.path.relpath(abs_file, layout.repo_root)
+            if not rel.startswith(".."):
+                rel_path = rel.replace(os.sep, "/")
+
+        work = await run_in_executor(
+            ExecutorKind.GIT, self._read_worktree_file, abs_file
+        )
+        head = index = None
+        if rel_path is not None:
+            try:
+                head, index = await self._read_objects(
+                    layout, [f"HEAD:{rel_path}", f":{rel_path}"]
+                )
+                attrs, autocrlf = await self._cat_file.check_attr(
+                    layout.repo_root,
+                    layout.common_dir or layout.git_dir,
+                    rel_path,
+                )
+            except CatFileError:
+                return await self._diff_file_subprocess(cwd, file_path)
+            if self._needs_conversion(attrs, autocrlf):
+                # 작업 트리 원본 바이트 ≠ blob 비교 대상 → git이 변환 후 비교
+                return await self._diff_file_subprocess(
+                    cwd, file_path, tracked=head is not None or index is not None
+                )
+        else:
+            rel_path = abs_file.name  # 저장소 밖 파일: untracked와 동일하게 표시
 
-        # git status 실패/타임아웃 시 에러 반환
-        if rc_status != 0:
-            error_msg = "timeout" if stderr == "timeout" else f"git error: {stderr}"
-            logger.error(
-                "git status 실패: path=%s, rc=%d, error=%s", path, rc_status, error_msg
+        new_mode = (
+            "100755" if work is not None and os.access(abs_file, os.X_OK) else "100644"
+        )
+        # 캐시 키: (경로, 모드, HEAD/index blob OID, 작업 트리 blob 해시)
+        known_oid = next((blob[0] for blob in (head, index) if blob), None)
+        hash_name = "sha256" if known_oid and len(known_oid) == 64 else "sha1"
+        large = work is not None and len(work) > self._INPROCESS_DIFF_MAX_BYTES
+        if work is None:
+            work_oid: str | None = "-"
+        elif large:
+            work_oid = await run_in_executor(
+                ExecutorKind.GIT, self._hash_worktree_file, abs_file, hash_name
             )
-            return GitStatusResponse(
-                is_git_repo=True, repo_root=repo_root, error=error_msg
+        else:
+            work_oid = self._blob_oid(work, hash_name)
+        cache_key = None
+        if work_oid is not None:
+            cache_key = "worktree:" + "\0".join(
+                [
+                    layout.repo_root or "",
+                    rel_path,
+                    new_mode,
+                    head[0] if head else "-",
+                    index[0] if index else "-",
+                    work_oid,
+                ]
             )
+            cached = await self._diff_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if large or any(
+            blob is not None and len(blob[1]) > self._INPROCESS_DIFF_MAX_BYTES
+            for blob in (head, index)
+        ):
+            result = await self._diff_file_subprocess(
+                cwd, file_path, tracked=head is not None or index is not None
+            )
+        else:
+            # difflib은 1MB 파일에서 수백 ms → 이벤트 루프 밖에서 계산
+            self._inprocess_diffs += 1
+            result = await run_in_executor(
+                ExecutorKind.GIT,
+                self._diff_blobs,
+                rel_path,
+                head,
+                index,
+                work,
+                new_mode,
+            )
+        if cache_key is not None:
+            await self._diff_cache.put(cache_key, result)
+        return result
 
-        files: list[GitStatusFile] = []
-
-        if status_out:
-            for line in status_out.split("\n"):
-                if len(line) < 3:
-                    continue
-                x = line[0]  # index status
-                y = line[1]  # working tree status
-                file_path = line[3:]
-                # rename: "old -> new" 형식에서 new만 사용
-                if " -> " in file_path:
-                    file_path = file_path.split(" -> ")[-1]
-                files.append(
-                    GitStatusFile(
-                        path=file_path.strip(),
-                        status=f"{x}{y}".strip(),
-                        is_staged=(x != " " and x != "?"),
-                        is_unstaged=(y != " " and y != "?"),
-                        is_untracked=(x == "?" and y == "?"),
-                    )
-                )
-
-        elapsed = time.monotonic() - start
-        if len(files) > 100 or elapsed > 5.0:
-            staged = sum(1 for f in files if f.is_staged)
-            unstaged = sum(1 for f in files if f.is_unstaged)
-            untracked = sum(1 for f in files if f.is_untracked)
-            logger.warning(
-                "git status 대형 결과: path=%s, total=%d "
-                "(staged=%d, unstaged=%d, untracked=%d), elapsed=%.1fs",
-                path,
-                len(files),
-                staged,
-                unstaged,
-                untracked,
-                elapsed,
+    def _diff_blobs(
+        self,
+        rel_path: str,
+        head: tuple[str, bytes] | None,
+        index: tuple[str, bytes] | None,
+        work: bytes | None,
+        new_mode: str,
+    ) -> str:
+        """HEAD -> worktree, (동일하면) index -> worktree diff를 프로세스 내에서 계산."""
+        head_content = head[1] if head else None
+        if head_content != work:
+            return self._format_file_diff(
+                rel_path,
+                head_content,
+                work,
+                head[0] if head else None,
+                new_mode,
             )
+        index_content = index[1] if index else None
+        if index_content != work:
+            return self._format_file_diff(
+                rel_path,
+                index_content,
+                work,
+                index[0] if index else None,
+                new_mode,
+            )
+        return ""
 
-        return GitStatusResponse(
-            is_git_repo=True,
-            repo_root=repo_root,
-            files=files,
-            total_count=len(files),
-        )
+    @staticmethod
+    def _needs_conversion(attrs: dict[str, str], autocrlf: str | None) -> bool:
+        """작업 트리 파일이 blob과 비교되기 전 git 변환(clean/eol/인코딩)을 거치는지."""
+        for name in ("filter", "eol", "crlf", "ident", "working-tree-encoding"):
+            if attrs.get(name, "unspecified") not in ("unspecified", "unset"):
+                return True
+        text = attrs.get("text", "unspecified")
+        if text == "unset":
+            return False
+        if text != "unspecified":
+            return True  # text / text=auto
+        return autocrlf in ("true", "input")
+
+    async def _read_objects(
+        self, layout: RepoLayout, specs: list[str]
+    ) -> list[tuple[str, bytes] | None]:
+        """저장소 cat-file 워커로 객체 조회 (index 변경 감지용 경로 포함)."""
+        index_path = os.path.join(layout.git_dir, "index") if layout.git_dir else None
+        return await self._cat_file.read(layout.repo_root, index_path, specs)
+
+    def _read_worktree_file(self, path: Path) -> bytes | None:
+        """작업 트리 파일 내용 (없거나 일반 파일이 아니면 None, 대용량이면 잘라서 반환)."""
+        try:
+            if not path.is_file():
+                return None
+            with path.open("rb") as f:
+                # 한도 초과 여부만 판단하면 되므로 한도+1 바이트까지만 읽음
+                return f.read(self._INPROCESS_DIFF_MAX_BYTES + 1)
+        except OSError:
+            return None
 
-    async def get_file_diff(self, repo_path: str, file_path: str) -> str:
-        """임의 경로 기준 특정 파일의 git diff 반환 (세션 비종속).
+    @staticmethod
+    def _blob_oid(content: bytes, hash_name: str = "sha1") -> str:
+        """git blob 객체 ID (git hash-object와 동일)."""
+        h = hashlib.new(hash_name)
+        h.update(b"blob %d\x00" % len(content))
+        h.update(content)
+        return h.hexdigest()
 
-        우선순위: HEAD diff -> unstaged diff -> staged diff -> untracked
-        """
-        cwd = self._resolve_cwd(repo_path)
+    @staticmethod
+    def _hash_worktree_file(path: Path, hash_name: str) -> str | None:
+        """대용량 작업 트리 파일의 blob 객체 ID (청크 단위 해시, 읽기 실패 시 None)."""
+        try:
+            with path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                h = hashlib.new(hash_name)
+                h.update(b"blob %d\x00" % size)
+                while chunk := f.read(1024 * 1024):
+                    h.update(chunk)
+        except OSError:
+            return None
+        return h.hexdigest()
 
-        # 4단계 폴백
+    @staticmethod
+    def _format_file_diff(
+        rel_path: str,
+        old: bytes | None,
+        new: bytes | None,
+        old_oid: str | None,
+        new_mode: str,
+    ) -> str:
+        """git diff 형식의 단일 파일 unified diff 생성 (difflib)."""
+        if old is None and new is None:
+            return ""
+        oid_len = len(old_oid) if old_oid else 40
+        hash_name = "sha256" if oid_len == 64 else "sha1"
+
+        def blob_oid(content: bytes | None) -> str:
+            if content is None:
+                return "0" * oid_len
+            return GitService._blob_oid(content, hash_name)
+
+        a_oid = old_oid or blob_oid(old)
+        b_oid = blob_oid(new)
+        lines = [f"diff --git a/{rel_path} b/{rel_path}"]
+        if old is None:
+            lines.append(f"new file mode {new_mode}")
+            lines.append(f"index {a_oid[:7]}..{b_oid[:7]}")
+        elif new is None:
+            lines.append("deleted file mode 100644")
+            lines.append(f"index {a_oid[:7]}..{b_oid[:7]}")
+        else:
+            lines.append(f"index {a_oid[:7]}..{b_oid[:7]} {new_mode}")
+        from_file = f"a/{rel_path}" if old is not None else "/dev/null"
+        to_file = f"b/{rel_path}" if new is not None else "/dev/null"
+
+        # git과 동일한 바이너리 판정: 앞 8000바이트에 NUL 포함
+        if any(c is not None and b"\x00" in c[:8000] for c in (old, new)):
+            lines.append(f"Binary files {from_file} and {to_file} differ")
+            return "\n".join(lines) + "\n"
+
+        def split(content: bytes | None) -> list[str]:
+            if not content:
+                return []
+            text = content.decode(errors="replace")
+            parts = [line + "\n" for line in text.split("\n")]
+            parts[-1] = parts[-1][:-1]
+            if not parts[-1]:
+                parts.pop()
+            return parts
+
+        out = ["\n".join(lines), "\n"]
+        for line in difflib.unified_diff(
+            split(old), split(new), fromfile=from_file, tofile=to_file
+        ):
+            out.append(line)
+            if not line.endswith("\n"):
+                out.append("\n\\ No newline at end of file\n")
+        return "".join(out)
+
+    async def _diff_file_subprocess(
+        self, cwd: str, file_path: str, *, tracked: bool | None = None
+    ) -> str:
+        """git diff 서브프로세스 폴백.
+
+        우선순위: HEAD diff -> unstaged diff -> staged diff -> untracked.
+        tracked=True(HEAD/index에 있음)이면 변경 없는 파일을 새 파일로 표시하지
+        않도록 untracked diff를 건너뜁니다.
+        """
+        self._subprocess_diffs += 1
         for git_args in [
             ["diff", "HEAD", "--", file_path],
             ["diff", "--", file_path],
@@ -639,7 +1090,7 @@ class GitService:
 
         # untracked 파일
         abs_file = (Path(cwd) / file_path).resolve()
-        if abs_file.is_file():
+        if not tracked and abs_file.is_file():
             rc, out, _ = await self._run_git_command(
                 "diff", "--no-index", "--", "/dev/null", file_path, cwd=cwd
             )
@@ -663,8 +1114,6 @@ class GitService:
         """커밋 히스토리 조회."""
         cwd = self._resolve_cwd(path)
 
-        # 전체 커밋 수 + 로그를 병렬 실행
-        count_args = ["rev-list", "--count", "HEAD"]
         log_args = [
             *self._GIT_CROSS_PLATFORM_OPTS,
             "--no-optional-locks",
@@ -683,19 +1132,13 @@ class GitService:
             log_args.append(f"--grep={search}")
             log_args.append("-i")
 
+        # 전체 커밋 수(HEAD별 캐시) + 로그를 병렬 실행
         async with self._get_git_lock(cwd):
-            (rc_count, count_out, _), (rc_log, log_out, log_err) = await asyncio.gather(
-                self._run_git_command(*count_args, cwd=cwd),
+            total_count, (rc_log, log_out, log_err) = await asyncio.gather(
+                self._count_commits(cwd),
                 self._run_git_command(*log_args, cwd=cwd, timeout=30.0),
             )
 
-        total_count = 0
-        if rc_count == 0 and count_out:
-            try:
-                total_count = int(count_out)
-            except ValueError:
-                pass
-
         if rc_log != 0:
             error_msg = "timeout" if log_err == "timeout" else f"git error: {log_err}"
             return GitLogResponse(error=error_msg)
@@ -708,34 +1151,116 @@ class GitService:
             has_more=has_more,
         )
 
+    async def _count_commits(self, cwd: str) -> int:
+        """HEAD까지의 커밋 수 (HEAD oid별 캐시, HEAD 해석은 cat-file 워커)."""
+        head_oid: str | None = None
+        layout = await self._get_layout(cwd)
+        if layout.is_git_repo and layout.repo_root:
+            try:
+                (head,) = await self._read_objects(layout, ["HEAD"])
+                head_oid = head[0] if head else None
+            except CatFileError:
+                pass
+        if head_oid is not None:
+            cached = self._commit_counts.get((cwd, head_oid))
+            if cached is not None:
+                self._commit_counts.move_to_end((cwd, head_oid))
+                self._commit_count_hits += 1
+                return cached
+
+        rc, out, _ = await self._run_git_command(
+            "rev-list", "--count", head_oid or "HEAD", cwd=cwd
+        )
+        try:
+            count = int(out) if rc == 0 and out else 0
+        except ValueError:
+            return 0
+        if head_oid is not None:
+            if len(self._commit_counts) >= self._GIT_CACHE_MAX_SIZE:
+                self._commit_counts.popitem(last=False)
+            self._commit_counts[(cwd, head_oid)] = count
+        return count
+
     async def get_commit_diff(self, path: str, commit_hash: str) -> str:
         """특정 커밋의 diff 반환."""
+        chunks = await self.stream_commit_diff(path, commit_hash)
+        return b"".join([chunk async for chunk in chunks]).decode(errors="replace")
+
+    async def stream_commit_diff(
+        self, path: str, commit_hash: str
+    ) -> AsyncIterator[bytes]:
+        """특정 커밋의 diff를 청크 단위로 반환.
+
+        커밋 해시를 전체 OID로 해석한 뒤 검증하므로, 반환 이후의 스트림은
+        캐시(커밋 OID 키) 또는 `git show` 출력을 그대로 전달합니다.
+        """
         cwd = self._resolve_cwd(path)
+        if not _COMMIT_HASH_RE.fullmatch(commit_hash):
+            raise ValidationError(f"유효하지 않은 커밋 해시: {commit_hash}")
+        layout = await self._get_layout(cwd)
+        if not layout.is_git_repo or not layout.repo_root:
+            raise ValidationError("커밋 diff 조회 실패: Git 저장소가 아닙니다")
+        try:
+            (commit,) = await self._read_objects(
+                layout, [f"{commit_hash}^{{commit}}"]
+            )
+        except CatFileError:
+            rc, out, _ = await self._run_git_command(
+                "rev-parse", "--verify", "--quiet", f"{commit_hash}^{{commit}}", cwd=cwd
+            )
+            commit = (out.strip(), b"") if rc == 0 and out.strip() else None
+        if commit is None:
+            raise ValidationError(
+                f"커밋 diff 조회 실패: 커밋을 찾을 수 없습니다 ({commit_hash})"
+            )
+        oid = commit[0]
 
-        rc, out, err = await self._run_git_command(
-            "show", "--format=", "--patch", commit_hash, cwd=cwd, timeout=30.0
+        # 같은 커밋의 diff는 불변 → 저장소와 무관하게 커밋 OID로 캐시
+        return self._diff_cache.stream(
+            f"commit:{oid}",
+            lambda: self._stream_git_output(
+                ["show", "--format=", "--patch", oid], cwd=cwd, timeout=30.0
+            ),
         )
-        if rc != 0:
-            raise ValidationError(f"커밋 diff 조회 실패: {err}")
-        return out
+
+    async def _stream_git_output(
+        self, args: list[str], *, cwd: str, timeout: float
+    ) -> AsyncIterator[bytes]:
+        """git 명령 stdout을 청크 단위로 전달 (실패/시간 초과 시 ValidationError)."""
+        self._git_commands_total += 1
+        try:
+            async for chunk in self._runner.stream(
+                ["git", *args], cwd=cwd, timeout=timeout, key=cwd
+            ):
+                yield chunk
+        except SubprocessRunError as e:
+            raise ValidationError(f"git {args[0]} 실패: {e.stderr}") from e
 
     # ─── 브랜치 관련 ───
 
     async def list_branches(
-        self, repo_path: str, *, fetch: bool = True
+        self, repo_path: str, *, fetch: bool = False
     ) -> tuple[list[str], str | None, str | None]:
         """로컬 + 원격 브랜치 목록과 현재/기본 브랜치 반환.
 
-        브랜치는 최근 커밋 날짜 순으로 정렬됩니다.
+        브랜치는 최근 커밋 날짜 순으로 정렬됩니다. 원격 ref는 백그라운드
+        동기화(RefSyncScheduler)가 갱신하므로 기본적으로 fetch하지 않으며,
+        결과는 refs 파일 stat이 바뀔 때까지 캐시됩니다.
 
         Args:
             repo_path: Git 저장소 경로
-            fetch: True이면 목록 조회 전 git fetch --prune 실행
+            fetch: True이면 목록 조회 전 git fetch --prune 실행 (수동 새로고침)
 
         Returns:
             (branches, current_branch, default_branch)
         """
         cwd = self._resolve_cwd(repo_path)
+        layout = await self._get_layout(cwd)
+        if not layout.is_git_repo or not layout.git_dir or not layout.common_dir:
+            return [], None, None
+        self._branch_listings_total += 1
+        if self._ref_sync is not None and layout.repo_root:
+            self._ref_sync.touch(layout.repo_root)
 
         # 원격 ref 갱신 (새 브랜치 감지)
         if fetch:
@@ -743,53 +1268,72 @@ class GitService:
                 "fetch", "--prune", "--quiet", cwd=cwd, timeout=30.0
             )
 
-        # 로컬 브랜치 (최근 커밋 순), 원격 브랜치, 현재 브랜치, 기본 브랜치 병렬 조회
-        (
-            (rc_local, local_out, _),
-            (rc_remote, remote_out, _),
-            (rc_cur, cur_out, _),
-            (rc_default, default_out, _),
-        ) = await asyncio.gather(
-            self._run_git_command(
-                "branch",
-                "--list",
-                "--sort=-committerdate",
-                "--format=%(refname:short)",
-                cwd=cwd,
-            ),
-            self._run_git_command(
-                "branch",
-                "-r",
-                "--sort=-committerdate",
-                "--format=%(refname:short)",
-                cwd=cwd,
-            ),
-            self._run_git_command("branch", "--show-current", cwd=cwd),
-            self._run_git_command(
-                "symbolic-ref",
-                "refs/remotes/origin/HEAD",
-                "--short",
-                cwd=cwd,
-            ),
+        stamp = await run_in_executor(
+            ExecutorKind.GIT, self._refs_stamp, layout.git_dir, layout.common_dir
         )
-
+        cached = self._branch_cache.get(layout.git_dir)
+        if cached and cached[0] == stamp:
+            self._branch_cache.move_to_end(layout.git_dir)
+            self._branch_cache_hits += 1
+            branches, current, default_branch = cached[1]
+            return list(branches), current, default_branch
+
+        # 로컬/원격 브랜치, 현재 브랜치, 기본 브랜치를 한 번의 for-each-ref로 조회
+        rc, out, _ = await self._run_git_command(
+            "for-each-ref",
+            "--sort=-committerdate",
+            "--format=%(HEAD)%00%(refname)%00%(symref)",
+            "refs/heads",
+            "refs/remotes",
+            cwd=cwd,
+        )
+        result = self._parse_branch_refs(out if rc == 0 else "")
+
+        self._branch_cache.pop(layout.git_dir, None)
+        if len(self._branch_cache) >= self._GIT_CACHE_MAX_SIZE:
+            self._branch_cache.popitem(last=False)
+        self._branch_cache[layout.git_dir] = (stamp, result)
+        branches, current, default_branch = result
+        return list(branches), current, default_branch
+
+    @classmethod
+    def _parse_branch_refs(
+        cls, output: str
+    ) -> tuple[list[str], str | None, str | None]:
+        """for-each-ref (%(HEAD)\\0%(refname)\\0%(symref)) 출력 파싱."""
         local_branches: list[str] = []
-        if rc_local == 0 and local_out:
-            local_branches = [b.strip() for b in local_out.split("\n") if b.strip()]
+        remote_branches: list[str] = []
+        current: str | None = None
+        default_branch: str | None = None
+        for line in output.split("\n"):
+            parts = line.split("\0")
+            if len(parts) != 3:
+                continue
+            head, refname, symref = parts
+            if refname.startswith(cls._REFS_HEADS_PREFIX):
+                name = refname[len(cls._REFS_HEADS_PREFIX) :]
+                local_branches.append(name)
+                if head == "*":
+                    current = name
+            elif refname.startswith("refs/remotes/"):
+                name = refname[len("refs/remotes/") :]
+                if refname == "refs/remotes/origin/HEAD" and symref:
+                    # 기본 브랜치: refs/remotes/origin/main → main
+                    ref = symref.removeprefix("refs/remotes/")
+                    default_branch = ref.split("/", 1)[1] if "/" in ref else ref
+                if not name or "/HEAD" in name:
+                    continue
+                remote_branches.append(name)
 
         # 원격 전용 브랜치 (로컬에 없는 것만, 순서 유지)
         local_set = set(local_branches)
         remote_only: list[str] = []
-        if rc_remote == 0 and remote_out:
-            for raw in remote_out.split("\n"):
-                name = raw.strip()
-                if not name or "/HEAD" in name:
-                    continue
-                # origin/feature-x → feature-x (리모트 접두사 제거)
-                short = name.split("/", 1)[1] if "/" in name else name
-                if short and short not in local_set:
-                    remote_only.append(short)
-                    local_set.add(short)  # 중복 방지
+        for name in remote_branches:
+            # origin/feature-x → feature-x (리모트 접두사 제거)
+            short = name.split("/", 1)[1] if "/" in name else name
+            if short and short not in local_set:
+                remote_only.append(short)
+                local_set.add(short)  # 중복 방지
 
         # 최종 목록 (origin/ 접두사 방어적 필터)
         branches = [
@@ -797,15 +1341,34 @@ class GitService:
             for b in (local_branches + remote_only)
             if not b.startswith("origin/") and b not in ("origin", "HEAD")
         ]
-        current = cur_out.strip() if rc_cur == 0 and cur_out else None
+        return branches, current, default_branch
 
-        # 기본 브랜치: origin/main → main
-        default_branch: str | None = None
-        if rc_default == 0 and default_out:
-            ref = default_out.strip()
-            default_branch = ref.split("/", 1)[1] if "/" in ref else ref
+    @staticmethod
+    def _refs_stamp(git_dir: str, common_dir: str) -> tuple:
+        """ref 변경 감지용 스탬프 (HEAD, packed-refs, loose ref 파일/디렉토리 stat).
 
-        return branches, current, default_branch
+        ref 갱신은 lock 파일 rename으로 이루어지므로 inode/mtime이 바뀝니다.
+        """
+
+        def stat_key(path: str) -> tuple[int, int, int] | None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        entries: list[tuple] = [
+            ("HEAD", stat_key(os.path.join(git_dir, "HEAD"))),
+            ("packed-refs", stat_key(os.path.join(common_dir, "packed-refs"))),
+        ]
+        for sub in ("refs/heads", "refs/remotes"):
+            top = os.path.join(common_dir, sub)
+            for dirpath, _, filenames in os.walk(top):
+                entries.append((dirpath, stat_key(dirpath)))
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    entries.append((path, stat_key(path)))
+        return tuple(entries)
 
     async def checkout_branch(self, repo_path: str, branch: str) -> tuple[bool, str]:
         """브랜치 체크아웃.
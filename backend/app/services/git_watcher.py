@@ -0,0 +1,260 @@
+"""Git 저장소 파일시스템 변경 감시.
+
+.git/index, HEAD, refs 및 워크트리 변경을 watchfiles(inotify 등 OS 알림)로
+감시하여 변경이 있을 때만 GitService 스냅샷을 무효화하고, 구독 중인
+WebSocket 세션에 git_status_changed 이벤트를 push합니다.
+변경이 없는 저장소는 캐시된 스냅샷을 계속 사용합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.exceptions import ValidationError
+from app.models.event_types import WsEventType
+from app.services.git_service import GitService, RepoLayout
+from app.services.websocket_manager import WebSocketManager
+
+try:
+    # uvicorn[standard] 의존성으로 설치됨. 없으면 TTL 캐시로 동작
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+# git 상태에 영향을 주지 않는 (대부분 .gitignore 대상) 디렉토리
+_IGNORED_DIRS = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".hypothesis",
+        ".idea",
+        ".next",
+    }
+)
+# git 디렉토리 내에서 status/브랜치 정보에 영향을 주는 파일
+_GIT_STATE_FILES = frozenset({"index", "HEAD", "packed-refs"})
+
+# 감시 시작 직후 이벤트 누락 가능 구간 (이 시점 이전 스냅샷은 TTL로만 유효)
+_WATCH_STARTUP_GRACE = 0.5
+# 감시 실패(inotify 한도 초과 등) 후 재시도 대기 (초)
+_RETRY_AFTER_FAILURE = 300.0
+
+
+class _RepoChangeFilter:
+    """watchfiles 필터: git 상태에 영향을 주는 변경만 통과."""
+
+    def __init__(self, repo_root: str, git_dirs: tuple[str, ...]):
+        self._root = repo_root
+        # linked worktree의 git_dir(<common>/worktrees/<name>)이 common_dir보다
+        # 먼저 매칭되도록 긴 경로 우선
+        self._git_dirs = sorted(set(git_dirs), key=len, reverse=True)
+
+    def __call__(self, change, path: str) -> bool:
+        for git_dir in self._git_dirs:
+            if path.startswith(git_dir + os.sep):
+                rel = path[len(git_dir) + 1 :]
+                if rel.endswith(".lock"):
+                    return False
+                return rel in _GIT_STATE_FILES or rel.startswith("refs" + os.sep)
+        rel = os.path.relpath(path, self._root)
+        return not any(part in _IGNORED_DIRS for part in rel.split(os.sep))
+
+
+@dataclass
+class _RepoWatch:
+    """저장소별 감시 태스크 상태."""
+
+    task: asyncio.Task
+    stop_event: asyncio.Event
+    since: float
+
+
+class GitChangeWatcher:
+    """저장소별 변경 감시 → 스냅샷 무효화 + git_status_changed push.
+
+    GitService가 스냅샷을 만들 때 ensure_watching()으로 감시를 시작하며,
+    감시 저장소 수는 max_repos로 제한됩니다 (구독자 없는 가장 오래된 것부터 해제).
+    해제되거나 감시에 실패한 저장소는 GitService의 TTL 캐시로 동작합니다.
+    """
+
+    def __init__(
+        self,
+        git_service: GitService,
+        ws_manager: WebSocketManager,
+        *,
+        max_repos: int = 32,
+        debounce_ms: int = 300,
+    ):
+        self._git = git_service
+        self._ws = ws_manager
+        self._max_repos = max_repos
+        self._debounce_ms = debounce_ms
+        self._watches: OrderedDict[str, _RepoWatch] = OrderedDict()
+        self._failed_at: dict[str, float] = {}
+        # repo_root -> 구독 세션, session_id -> repo_root
+        self._subscribers: dict[str, set[str]] = {}
+        self._session_repos: dict[str, str] = {}
+        # 메트릭
+        self._changes_total = 0
+        self._events_pushed = 0
+        self._watch_failures = 0
+        git_service.attach_watcher(self)
+
+    @staticmethod
+    def is_available() -> bool:
+        """watchfiles 사용 가능 여부."""
+        return awatch is not None
+
+    def watching_since(self, repo_root: str) -> float | None:
+        """감시 중이면 변경 누락이 없는 시작 시각, 아니면 None."""
+        watch = self._watches.get(repo_root)
+        if watch is None or watch.task.done():
+            return None
+        return watch.since
+
+    def ensure_watching(self, layout: RepoLayout) -> None:
+        """저장소 감시 시작 (이미 감시 중이면 LRU 갱신만)."""
+        repo_root = layout.repo_root
+        if awatch is None or not layout.is_git_repo or not repo_root:
+            return
+        watch = self._watches.get(repo_root)
+        if watch is not None and not watch.task.done():
+            self._watches.move_to_end(repo_root)
+            return
+        failed_at = self._failed_at.get(repo_root)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < _RETRY_AFTER_FAILURE:
+                return
+            del self._failed_at[repo_root]
+
+        git_dirs = tuple(d for d in (layout.git_dir, layout.common_dir) if d)
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(
+            self._watch_loop(repo_root, git_dirs, stop_event),
+            name=f"git-watch-{os.path.basename(repo_root)}",
+        )
+        self._watches.pop(repo_root, None)
+        self._watches[repo_root] = _RepoWatch(
+            task=task,
+            stop_event=stop_event,
+            since=time.monotonic() + _WATCH_STARTUP_GRACE,
+        )
+        logger.info("Git 변경 감시 시작: repo=%s", repo_root)
+        self._evict()
+
+    def _evict(self) -> None:
+        """감시 수 제한 초과 시 구독자 없는 가장 오래된 감시부터 해제."""
+        excess = len(self._watches) - self._max_repos
+        if excess <= 0:
+            return
+        for repo_root in list(self._watches):
+            if excess <= 0:
+                break
+            if self._subscribers.get(repo_root):
+                continue
+            self._stop(repo_root)
+            excess -= 1
+
+    def _stop(self, repo_root: str) -> None:
+        watch = self._watches.pop(repo_root, None)
+        if watch is not None:
+            watch.stop_event.set()
+            watch.task.cancel()
+
+    async def _watch_loop(
+        self, repo_root: str, git_dirs: tuple[str, ...], stop_event: asyncio.Event
+    ) -> None:
+        # worktree 바깥의 git 디렉토리 (linked worktree의 common_dir 등)도 감시
+        paths = [repo_root]
+        for git_dir in git_dirs:
+            if not git_dir.startswith(repo_root + os.sep) and git_dir not in paths:
+                paths.append(git_dir)
+        try:
+            async for _changes in awatch(
+                *paths,
+                watch_filter=_RepoChangeFilter(repo_root, git_dirs),
+                debounce=self._debounce_ms,
+                stop_event=stop_event,
+                ignore_permission_denied=True,
+            ):
+                self._changes_total += 1
+                self._git.invalidate_repo(repo_root)
+                await self._notify(repo_root)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # inotify watch 한도 초과, 경로 삭제 등 → TTL 캐시로 대체
+            self._watch_failures += 1
+            self._failed_at[repo_root] = time.monotonic()
+            logger.warning(
+                "Git 변경 감시 실패, TTL 캐시로 대체: repo=%s, error=%s", repo_root, e
+            )
+        finally:
+            # 감시가 끝난 뒤의 변경은 감지할 수 없으므로 캐시 무효화
+            self._git.invalidate_repo(repo_root)
+            watch = self._watches.get(repo_root)
+            if watch is not None and watch.stop_event is stop_event:
+                del self._watches[repo_root]
+
+    async def _notify(self, repo_root: str) -> None:
+        """저장소를 구독 중인 세션에 git_status_changed 전송."""
+        message = {"type": WsEventType.GIT_STATUS_CHANGED, "repo_root": repo_root}
+        for session_id in list(self._subscribers.get(repo_root, ())):
+            await self._ws.broadcast(session_id, message)
+            self._events_pushed += 1
+
+    async def subscribe(self, session_id: str, work_dir: str) -> None:
+        """세션의 작업 디렉토리가 속한 저장소 변경 알림 구독."""
+        try:
+            layout = await self._git.get_repo_layout(work_dir)
+        except ValidationError:
+            return
+        if not layout.is_git_repo or not layout.repo_root:
+            return
+        self.unsubscribe(session_id)
+        self._subscribers.setdefault(layout.repo_root, set()).add(session_id)
+        self._session_repos[session_id] = layout.repo_root
+        self.ensure_watching(layout)
+
+    def unsubscribe(self, session_id: str) -> None:
+        """세션 구독 해제 (감시는 LRU 퇴거 시까지 유지)."""
+        repo_root = self._session_repos.pop(session_id, None)
+        if repo_root is None:
+            return
+        sessions = self._subscribers.get(repo_root)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._subscribers[repo_root]
+
+    async def stop_all(self) -> None:
+        """모든 감시 종료."""
+        watches = list(self._watches.values())
+        for repo_root in list(self._watches):
+            self._stop(repo_root)
+        for watch in watches:
+            try:
+                await watch.task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def get_metrics(self) -> dict:
+        """감시 저장소 수 및 변경/통지 메트릭."""
+        return {
+            "watched_repos": len(self._watches),
+            "subscribed_sessions": len(self._session_repos),
+            "changes_total": self._changes_total,
+            "events_pushed": self._events_pushed,
+            "watch_failures": self._watch_failures,
+        }
@@ -0,0 +1,186 @@
+"""GitHub PR 메타데이터 캐시 (stale-while-revalidate + 동시 요청 통합).
+
+gh CLI 호출은 네트워크 왕복(수백 ms~수 초)이므로, PR 목록/상세는
+fresh_ttl 동안 그대로, stale_ttl 동안은 캐시를 즉시 반환하면서
+백그라운드에서 갱신합니다. 같은 키의 동시 요청은 하나의 gh 호출로
+통합합니다(SingleFlight).
+
+PR 목록 응답의 (updatedAt, headRefOid)는 상세 캐시의 검증자(ETag 역할)로
+사용됩니다. 목록을 새로 받으면 값이 같은 상세 항목은 재조회 없이 fresh로
+연장하고, 다른 항목은 폐기합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """같은 키의 동시 비동기 호출을 하나로 통합.
+
+    대기 중인 호출자 하나가 취소되어도 공유 작업은 계속 실행됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.deduped = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def start(
+        self, key: Hashable, fetch: Callable[[], Awaitable[T]]
+    ) -> "asyncio.Task[T]":
+        """진행 중인 작업이 있으면 그 작업을, 없으면 새 작업을 반환."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.deduped += 1
+            return task
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        return await asyncio.shield(self.start(key, fetch))
+
+    async def close(self) -> None:
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    fetched_at: float
+    validator: Any = None
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """fresh → 즉시 반환, stale → 즉시 반환 + 백그라운드 갱신, 만료 → 조회 대기.
+
+    cacheable(value)가 False인 결과(오류 응답 등)는 저장하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        fresh_ttl: float = 30.0,
+        stale_ttl: float = 600.0,
+        max_entries: int = 256,
+        cacheable: Callable[[T], bool] = lambda _: True,
+        validator: Callable[[T], Any] = lambda _: None,
+    ):
+        self.name = name
+        self._fresh_ttl = fresh_ttl
+        self._stale_ttl = stale_ttl
+        self._max_entries = max_entries
+        self._cacheable = cacheable
+        self._validator = validator
+        self._entries: OrderedDict[Hashable, _Entry[T]] = OrderedDict()
+        self._flight = SingleFlight()
+        # 메트릭
+        self._fresh_hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._background_refreshes = 0
+        self._refresh_failures = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self._fresh_ttl:
+                self._entries.move_to_end(key)
+                self._fresh_hits += 1
+                return entry.value
+            if age < self._stale_ttl:
+                self._entries.move_to_end(key)
+                self._stale_hits += 1
+                if key not in self._flight:
+                    self._background_refreshes += 1
+                    task = self._flight.start(key, lambda: self._load(key, fetch))
+                    task.add_done_callback(self._log_refresh_failure)
+                return entry.value
+        self._misses += 1
+        return await self._flight.do(key, lambda: self._load(key, fetch))
+
+    async def _load(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        value = await fetch()
+        if self._cacheable(value):
+            self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: T) -> None:
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            self._entries.popitem(last=False)
+        self._entries[key] = _Entry(value, time.monotonic(), self._validator(value))
+
+    def _log_refresh_failure(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._refresh_failures += 1
+            logger.warning("%s 백그라운드 갱신 실패: %s", self.name, exc)
+
+    def revalidate(self, key: Hashable, validator: Any) -> bool:
+        """검증자가 같으면 fresh로 연장(True), 다르면 항목 폐기(False)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry.validator is not None and entry.validator == validator:
+            entry.fetched_at = time.monotonic()
+            self._revalidated += 1
+            return True
+        del self._entries[key]
+        return False
+
+    def peek(self, key: Hashable) -> T | None:
+        """신선도와 무관하게 캐시 값 반환 (없으면 None)."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        await self._flight.close()
+
+    def get_metrics(self) -> dict:
+        """적중(fresh/stale)/미스, 검증자 재검증, 백그라운드 갱신 수."""
+        lookups = self._fresh_hits + self._stale_hits + self._misses
+        hits = self._fresh_hits + self._stale_hits
+        return {
+            "entries": len(self._entries),
+            "fresh_hits": self._fresh_hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "revalidated": self._revalidated,
+            "deduped": self._flight.deduped,
+            "inflight": len(self._flight),
+            "background_refreshes": self._background_refreshes,
+            "refresh_failures": self._refresh_failures,
+        }
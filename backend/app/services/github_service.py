@@ -1,16 +1,14 @@
 """GitHub CLI 연동 서비스.
 
-gh CLI를 통한 PR 조회, 리뷰 생성, 코멘트 게시 등을 담당합니다.
+gh CLI를 통한 PR 조회, 리뷰 코멘트 게시 등을 담당합니다.
+리뷰 생성은 PRReviewService(작업 큐)가 담당합니다.
 GitService에 의존하여 경로 유효성 검사와 Git 명령 실행을 위임합니다.
+PR 목록/상세는 stale-while-revalidate로 캐시하고, PR diff는 head SHA를
+키로 diff 캐시에 저장합니다.
 """
 
-import asyncio
 import json
 import logging
-import subprocess
-import time
-import uuid
-from dataclasses import dataclass, field
 
 from app.schemas.filesystem import (
     GitHubCLIStatus,
@@ -19,59 +17,67 @@ from app.schemas.filesystem import (
     GitHubPREntry,
     GitHubPRListResponse,
     GitHubPRReview,
-    PRReviewJobResponse,
-    PRReviewResponse,
-    PRReviewStatusResponse,
     PRReviewSubmitResponse,
 )
+from app.services.diff_cache import DiffCache
 from app.services.git_service import GitService
+from app.services.github_pr_cache import SingleFlight, StaleWhileRevalidateCache
+from app.services.subprocess_runner import SubprocessRunner
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class _ReviewJob:
-    """PR 리뷰 백그라운드 작업 상태."""
-
-    status: str = "pending"  # "pending" | "completed" | "error"
-    review_text: str = ""
-    error: str = ""
-    created_at: float = field(default_factory=time.time)
-
-
 class GitHubService:
     """GitHub CLI (gh) 연동 서비스.
 
-    PR 목록/상세 조회, Claude Code를 이용한 PR 리뷰 생성,
-    리뷰 코멘트 게시 등을 담당합니다.
+    PR 목록/상세/diff 조회, 리뷰 코멘트 게시 등을 담당합니다.
     """
 
-    def __init__(self, git_service: GitService):
+    def __init__(
+        self,
+        git_service: GitService,
+        *,
+        diff_cache: DiffCache | None = None,
+        pr_fresh_ttl: float = 30.0,
+        pr_stale_ttl: float = 600.0,
+    ):
         self._git = git_service
-        # PR 리뷰 비동기 작업 저장소
-        self._review_jobs: dict[str, _ReviewJob] = {}
+        # (cwd, state, limit) -> PR 목록
+        self._pr_lists: StaleWhileRevalidateCache[GitHubPRListResponse] = (
+            StaleWhileRevalidateCache(
+                "PR 목록",
+                fresh_ttl=pr_fresh_ttl,
+                stale_ttl=pr_stale_ttl,
+                cacheable=lambda r: not r.error,
+            )
+        )
+        # (cwd, PR 번호) -> PR 상세. 검증자: (updated_at, head_sha)
+        self._pr_details: StaleWhileRevalidateCache[GitHubPRDetail] = (
+            StaleWhileRevalidateCache(
+                "PR 상세",
+                fresh_ttl=pr_fresh_ttl,
+                stale_ttl=pr_stale_ttl,
+                cacheable=lambda d: not d.error,
+                validator=lambda d: (d.updated_at, d.head_sha),
+            )
+        )
+        # PR diff (head SHA 키, 메모리 + 디스크). 동일 diff 동시 조회 통합
+        self._diff_cache = diff_cache or DiffCache()
+        self._diff_flight = SingleFlight()
+        self._pr_diff_hits = 0
+        self._pr_diff_misses = 0
+        # gh CLI (GitHub API 호출, 저장소별 동시 실행 제한)
+        self._gh_runner = SubprocessRunner(
+            "gh CLI", max_concurrency=4, per_key_concurrency=2
+        )
 
     async def _run_gh_command(
         self, *args: str, cwd: str, timeout: float = 30.0
     ) -> tuple[int, str, str]:
         """gh CLI 명령 실행 후 (returncode, stdout, stderr) 반환."""
-
-        def _run() -> tuple[int, str, str]:
-            try:
-                result = subprocess.run(
-                    ["gh", *args],
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-                return result.returncode, result.stdout.strip(), result.stderr.strip()
-            except subprocess.TimeoutExpired:
-                return -1, "", "timeout"
-            except FileNotFoundError:
-                return -1, "", "gh CLI not found"
-
-        return await asyncio.to_thread(_run)
+        return await self._gh_runner.run(
+            ["gh", *args], cwd=cwd, timeout=timeout, key=cwd
+        )
 
     async def check_gh_status(self, path: str) -> GitHubCLIStatus:
         """gh CLI 설치/인증 상태 체크."""
@@ -108,19 +114,26 @@ class GitHubService:
         state: str = "open",
         limit: int = 20,
     ) -> GitHubPRListResponse:
-        """GitHub PR 목록 조회."""
+        """GitHub PR 목록 조회 (캐시)."""
         validated_path = self._git._validate_path(path)
         if not self._git._is_within_root(validated_path):
             raise ValueError(f"접근할 수 없는 경로입니다: {path}")
         cwd = str(validated_path)
+        return await self._pr_lists.get(
+            (cwd, state, limit), lambda: self._fetch_prs(cwd, state, limit)
+        )
 
+    async def _fetch_prs(
+        self, cwd: str, state: str, limit: int
+    ) -> GitHubPRListResponse:
+        """gh pr list 실행 + 상세 캐시 재검증."""
         rc, out, err = await self._run_gh_command(
             "pr",
             "list",
             f"--state={state}",
             f"--limit={limit}",
             "--json",
-            "number,title,state,author,headRefName,baseRefName,createdAt,updatedAt,url,labels,isDraft,additions,deletions",
+            "number,title,state,author,headRefName,baseRefName,createdAt,updatedAt,url,labels,isDraft,additions,deletions,headRefOid",
             cwd=cwd,
             timeout=30.0,
         )
@@ -158,24 +171,36 @@ class GitHubService:
                     draft=item.get("isDraft", False),
                     additions=item.get("additions", 0),
                     deletions=item.get("deletions", 0),
+                    head_sha=item.get("headRefOid", ""),
                 )
             )
 
+        # 목록의 (updated_at, head_sha)가 같은 상세는 재조회 없이 유지
+        for pr in prs:
+            self._pr_details.revalidate(
+                (cwd, pr.number), (pr.updated_at, pr.head_sha)
+            )
+
         return GitHubPRListResponse(prs=prs, total_count=len(prs))
 
     async def get_github_pr_detail(self, path: str, pr_number: int) -> GitHubPRDetail:
-        """GitHub PR 상세 조회."""
+        """GitHub PR 상세 조회 (캐시)."""
         validated_path = self._git._validate_path(path)
         if not self._git._is_within_root(validated_path):
             raise ValueError(f"접근할 수 없는 경로입니다: {path}")
         cwd = str(validated_path)
+        return await self._pr_details.get(
+            (cwd, pr_number), lambda: self._fetch_pr_detail(cwd, pr_number)
+        )
 
+    async def _fetch_pr_detail(self, cwd: str, pr_number: int) -> GitHubPRDetail:
+        """gh pr view 실행."""
         rc, out, err = await self._run_gh_command(
             "pr",
             "view",
             str(pr_number),
             "--json",
-            "number,title,body,state,author,headRefName,baseRefName,createdAt,updatedAt,url,labels,additions,deletions,changedFiles,commits,reviews,comments,mergeable",
+            "number,title,body,state,author,headRefName,baseRefName,createdAt,updatedAt,url,labels,additions,deletions,changedFiles,commits,reviews,comments,mergeable,headRefOid",
             cwd=cwd,
             timeout=30.0,
         )
@@ -273,145 +298,63 @@ class GitHubService:
             reviews=reviews,
             comments=comments,
             mergeable=data.get("mergeable"),
+            head_sha=data.get("headRefOid", ""),
         )
 
     async def get_github_pr_diff(self, path: str, pr_number: int) -> str:
-        """GitHub PR diff 조회."""
+        """GitHub PR diff 조회 (head SHA가 같으면 캐시 사용)."""
         validated_path = self._git._validate_path(path)
         if not self._git._is_within_root(validated_path):
             raise ValueError(f"접근할 수 없는 경로입니다: {path}")
         cwd = str(validated_path)
 
-        rc, out, err = await self._run_gh_command(
-            "pr", "diff", str(pr_number), cwd=cwd, timeout=30.0
-        )
-        if rc != 0:
-            raise ValueError(f"PR diff 조회 실패: {err}")
-        return out
-
-    async def generate_pr_review(self, path: str, pr_number: int) -> PRReviewResponse:
-        """Claude Code CLI로 PR 리뷰 생성."""
-        validated_path = self._git._validate_path(path)
-        if not self._git._is_within_root(validated_path):
-            raise ValueError(f"접근할 수 없는 경로입니다: {path}")
-        cwd = str(validated_path)
-
-        # 1. PR 상세 정보 가져오기
-        pr_detail = await self.get_github_pr_detail(path, pr_number)
-        if pr_detail.error:
-            return PRReviewResponse(error=f"PR 정보 조회 실패: {pr_detail.error}")
-
-        # 2. PR diff 가져오기
-        try:
-            diff_text = await self.get_github_pr_diff(path, pr_number)
-        except ValueError as e:
-            return PRReviewResponse(error=str(e))
-
-        # diff가 너무 길면 잘라냄 (Claude 토큰 제한 고려)
-        max_diff_chars = 50000
-        if len(diff_text) > max_diff_chars:
-            diff_text = (
-                diff_text[:max_diff_chars] + "\n\n... (diff가 너무 길어 잘렸습니다)"
-            )
+        detail = await self.get_github_pr_detail(path, pr_number)
+        if detail.error or not detail.head_sha:
+            return await self._fetch_pr_diff(cwd, pr_number)
 
-        # 3. Claude Code CLI로 리뷰 생성
-        prompt = (
-            f"다음은 GitHub Pull Request #{pr_number}의 정보와 diff입니다.\n"
-            f"이 PR을 코드 리뷰해주세요.\n\n"
-            f"## PR 정보\n"
-            f"- 제목: {pr_detail.title}\n"
-            f"- 작성자: {pr_detail.author}\n"
-            f"- 브랜치: {pr_detail.branch} -> {pr_detail.base}\n"
-            f"- 변경: +{pr_detail.additions} -{pr_detail.deletions}, "
-            f"{pr_detail.changed_files}개 파일\n\n"
-            f"## PR 설명\n{pr_detail.body or '(없음)'}\n\n"
-            f"## Diff\n```diff\n{diff_text}\n```\n\n"
-            f"## 리뷰 요청\n"
-            f"위 PR의 코드 변경사항을 리뷰해주세요. 다음 항목을 포함해주세요:\n"
-            f"1. **요약**: 변경사항의 전체적인 요약\n"
-            f"2. **좋은 점**: 잘 작성된 부분\n"
-            f"3. **개선 제안**: 개선이 필요한 부분 (파일명, 라인 번호 포함)\n"
-            f"4. **잠재적 이슈**: 버그, 보안, 성능 관련 우려사항\n\n"
-            f"마크다운 형식으로 작성해주세요."
+        key = "\0".join(
+            ["github-pr", cwd, str(pr_number), detail.head_sha, detail.base]
         )
+        cached = await self._diff_cache.get(key)
+        if cached is not None:
+            self._pr_diff_hits += 1
+            return cached
+        self._pr_diff_misses += 1
 
-        def _run_claude() -> tuple[int, str, str]:
-            try:
-                result = subprocess.run(
-                    ["claude", "-p", prompt, "--output-format", "text"],
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                )
-                return result.returncode, result.stdout.strip(), result.stderr.strip()
-            except subprocess.TimeoutExpired:
-                return -1, "", "Claude Code 실행 시간 초과 (120초)"
-            except FileNotFoundError:
-                return -1, "", "Claude Code CLI를 찾을 수 없습니다"
+        async def _load() -> str:
+            diff_text = await self._fetch_pr_diff(cwd, pr_number)
+            await self._diff_cache.put(key, diff_text)
+            return diff_text
 
-        rc, stdout, stderr = await asyncio.to_thread(_run_claude)
+        return await self._diff_flight.do(key, _load)
 
-        if rc != 0:
-            return PRReviewResponse(
-                error=stderr or f"Claude Code 실행 실패 (exit code: {rc})"
-            )
-
-        return PRReviewResponse(review_text=stdout)
-
-    async def request_pr_review(self, path: str, pr_number: int) -> PRReviewJobResponse:
-        """PR 리뷰 비동기 작업 생성 + 백그라운드 실행 시작."""
-        self._cleanup_old_review_jobs()
-        job_id = str(uuid.uuid4())
-        self._review_jobs[job_id] = _ReviewJob()
-        task = asyncio.create_task(self._run_pr_review(job_id, path, pr_number))
-
-        def _on_review_done(t: asyncio.Task) -> None:
-            if not t.cancelled():
-                exc = t.exception()
-                if exc:
-                    logger.error("PR 리뷰 백그라운드 실패 (job %s): %s", job_id, exc)
-
-        task.add_done_callback(_on_review_done)
-        return PRReviewJobResponse(job_id=job_id, status="pending")
-
-    def get_pr_review_status(self, job_id: str) -> PRReviewStatusResponse:
-        """PR 리뷰 작업 상태 조회."""
-        job = self._review_jobs.get(job_id)
-        if not job:
-            raise ValueError(f"리뷰 작업을 찾을 수 없습니다: {job_id}")
-        return PRReviewStatusResponse(
-            job_id=job_id,
-            status=job.status,
-            review_text=job.review_text,
-            error=job.error,
+    async def _fetch_pr_diff(self, cwd: str, pr_number: int) -> str:
+        """gh pr diff 실행."""
+        rc, out, err = await self._run_gh_command(
+            "pr", "diff", str(pr_number), cwd=cwd, timeout=30.0
         )
+        if rc != 0:
+            raise ValueError(f"PR diff 조회 실패: {err}")
+        return out
 
-    async def _run_pr_review(self, job_id: str, path: str, pr_number: int) -> None:
-        """백그라운드에서 실제 리뷰 생성 (기존 generate_pr_review 활용)."""
-        try:
-            result = await self.generate_pr_review(path, pr_number)
-            job = self._review_jobs.get(job_id)
-            if job is None:
-                return
-            if result.error:
-                job.status = "error"
-                job.error = result.error
-            else:
-                job.status = "completed"
-                job.review_text = result.review_text
-        except Exception as e:
-            job = self._review_jobs.get(job_id)
-            if job is not None:
-                job.status = "error"
-                job.error = str(e)
-
-    def _cleanup_old_review_jobs(self) -> None:
-        """1시간 이상 된 완료/에러 작업 정리."""
-        cutoff = time.time() - 3600
-        expired = [jid for jid, j in self._review_jobs.items() if j.created_at < cutoff]
-        for jid in expired:
-            del self._review_jobs[jid]
+    async def close(self) -> None:
+        """진행 중인 PR 캐시 갱신/diff 조회 취소."""
+        await self._pr_lists.close()
+        await self._pr_details.close()
+        await self._diff_flight.close()
+
+    def get_metrics(self) -> dict:
+        """gh 실행기 및 PR 캐시 메트릭."""
+        return {
+            "pr_lists": self._pr_lists.get_metrics(),
+            "pr_details": self._pr_details.get_metrics(),
+            "pr_diffs": {
+                "hits": self._pr_diff_hits,
+                "misses": self._pr_diff_misses,
+                "deduped": self._diff_flight.deduped,
+            },
+            "gh_runner": self._gh_runner.get_metrics(),
+        }
 
     async def submit_pr_review_comment(
         self, path: str, pr_number: int, body: str
@@ -438,4 +381,6 @@ class GitHubService:
                 error=err or "코멘트 게시 실패",
             )
 
+        # 코멘트 목록이 바뀌었으므로 상세 캐시 폐기
+        self._pr_details.invalidate((cwd, pr_number))
         return PRReviewSubmitResponse(success=True)
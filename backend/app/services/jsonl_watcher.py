@@ -9,6 +9,7 @@ import json
 import logging
 from pathlib import Path
 
+from app.core.executors import ExecutorKind, run_in_executor
 from app.core.utils import utc_now, utc_now_iso
 from app.models.event_types import WsEventType
 from app.models.session import SessionStatus
@@ -182,8 +183,8 @@ class JsonlWatcher:
                         activated_running = True
 
                     # 새 데이터 있음
-                    new_lines = await asyncio.to_thread(
-                        self._read_new_lines, path, file_size
+                    new_lines = await run_in_executor(
+                        ExecutorKind.PIPE, self._read_new_lines, path, file_size
                     )
                     file_size = current_size
                     last_activity = asyncio.get_event_loop().time()
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from app.core.executors import ExecutorKind, run_cpu_bound, run_in_executor
 from app.core.utils import utc_now
 from app.repositories.message_repo import MessageRepository
 from app.repositories.session_repo import SessionRepository
@@ -67,16 +68,21 @@ class LocalSessionScanner(DBService):
             dirs = [d for d in base.iterdir() if d.is_dir()]
 
         # 1단계: 모든 JSONL에서 메타데이터 + parent_session_id 수집
-        # asyncio.gather()로 병렬 실행 + Semaphore로 동시 스레드 수 제한
+        # CPU 프로세스 풀에서 병렬 파싱 (GIL 경합으로 이벤트 루프/파이프 읽기
+        # 스레드가 지연되지 않도록) + Semaphore로 제출 수 제한
         _sem = asyncio.Semaphore(10)
 
         async def _extract_with_limit(
             jsonl_file: Path, dir_name: str
         ) -> tuple[LocalSessionMeta, str | None] | None:
             async with _sem:
-                return await asyncio.to_thread(
-                    self._extract_metadata, jsonl_file, dir_name, imported_ids
+                result = await run_cpu_bound(
+                    LocalSessionScanner._extract_metadata, jsonl_file, dir_name, set()
                 )
+            if result:
+                # import 여부는 부모 프로세스에서 판정 (ID 집합 전달 비용 회피)
+                result[0].already_imported = result[0].session_id in imported_ids
+            return result
 
         tasks: list[asyncio.Task] = []
         for d in dirs:
@@ -179,10 +185,11 @@ class LocalSessionScanner(DBService):
         async with self._session_scope(SessionRepository) as (session, repo):
             return await repo.get_all_claude_session_ids()
 
+    @staticmethod
     def _extract_metadata(
-        self, jsonl_path: Path, project_dir: str, imported_ids: set[str]
+        jsonl_path: Path, project_dir: str, imported_ids: set[str]
     ) -> tuple[LocalSessionMeta, str | None] | None:
-        """JSONL 파일에서 메타데이터 추출.
+        """JSONL 파일에서 메타데이터 추출 (프로세스 풀에서 실행되므로 pickle 가능해야 함).
 
         Returns:
             (meta, parent_session_id) 튜플.
@@ -303,16 +310,19 @@ class LocalSessionScanner(DBService):
             raise FileNotFoundError(f"JSONL 파일을 찾을 수 없습니다: {jsonl_path}")
 
         # 메타데이터 추출
-        result = await asyncio.to_thread(
-            self._extract_metadata, jsonl_path, project_dir, set()
+        result = await run_cpu_bound(
+            LocalSessionScanner._extract_metadata, jsonl_path, project_dir, set()
         )
         if not result:
             raise ValueError("JSONL 메타데이터 추출 실패")
         meta, _ = result
 
         # continuation 체인 탐색
-        continuation_chain = await asyncio.to_thread(
-            self._find_continuation_chain, base / project_dir, session_id
+        continuation_chain = await run_in_executor(
+            ExecutorKind.FS_SCAN,
+            self._find_continuation_chain,
+            base / project_dir,
+            session_id,
         )
 
         # 대시보드 세션 생성
@@ -329,6 +339,7 @@ class LocalSessionScanner(DBService):
         async with self._session_scope(SessionRepository) as (db_session, repo):
             await repo.update_jsonl_path(dashboard_id, str(jsonl_path))
             await db_session.commit()
+        session_manager.invalidate_cache(dashboard_id)
 
         # root JSONL + continuation JSONL 순서대로 메시지 파싱
         all_jsonl_paths = [jsonl_path]
@@ -339,7 +350,9 @@ class LocalSessionScanner(DBService):
 
         all_messages: list[dict] = []
         for path in all_jsonl_paths:
-            messages = await asyncio.to_thread(self._parse_messages, path)
+            messages = await run_in_executor(
+                ExecutorKind.FS_SCAN, self._parse_messages, path
+            )
             all_messages.extend(messages)
 
         if all_messages:
@@ -0,0 +1,124 @@
+"""내용 주소(content-addressed) MCP config 파일 저장소.
+
+턴마다 mcp-<session_id>.json을 새로 쓰고 지우는 대신, config JSON의 해시를
+파일 이름으로 써서 내용이 같으면 같은 파일을 재사용합니다. 동시에 실행 중인
+턴이 같은 파일을 참조할 수 있으므로 참조 수를 세고, 참조가 없는 파일은
+최근 것 max_idle개까지 남겨 두었다가(다음 턴, warm/상주 프로세스 재사용 판정)
+초과분부터 삭제합니다. MCP 서버 env에 토큰이 들어갈 수 있으므로 소유자만
+읽을 수 있게 기록합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = "mcp-"
+# 시작 시 이 시간보다 오래된 파일은 이전 실행의 잔여물로 보고 삭제
+_STALE_SECONDS = 3600.0
+
+
+class McpConfigStore:
+    """config dict → 해시 경로 파일 (참조 수 관리)."""
+
+    def __init__(self, root: str | Path, *, max_idle: int = 64):
+        self._root = Path(root)
+        self._max_idle = max_idle
+        self._refs: dict[str, int] = {}
+        self._idle: OrderedDict[str, None] = OrderedDict()
+        # 메트릭
+        self._writes = 0
+        self._reuses = 0
+        self._removed = 0
+        self._cleanup_stale()
+
+    def _cleanup_stale(self) -> None:
+        """이전 실행에서 남은 오래된 파일 정리."""
+        cutoff = time.time() - _STALE_SECONDS
+        try:
+            self._root.mkdir(mode=0o700, parents=True, exist_ok=True)
+            for path in self._root.glob(f"{_PREFIX}*"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            logger.warning(
+                "MCP config 디렉토리 정리 실패: %s", self._root, exc_info=True
+            )
+
+    @staticmethod
+    def digest(config: dict) -> str:
+        """정규화된 JSON의 SHA-256 (키 순서 무관)."""
+        data = json.dumps(config, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+    def acquire(self, config: dict) -> Path:
+        """config 파일 경로 반환 (없으면 기록). release()로 반납해야 함."""
+        digest = self.digest(config)
+        path = self._root / f"{_PREFIX}{digest}.json"
+        known = digest in self._refs or digest in self._idle
+        if known and path.exists():
+            self._reuses += 1
+        else:
+            self._write(path, config)
+        self._idle.pop(digest, None)
+        self._refs[digest] = self._refs.get(digest, 0) + 1
+        return path
+
+    def _write(self, path: Path, config: dict) -> None:
+        # 원자적 교체: 동시에 파일을 여는 CLI가 부분 기록을 읽지 않도록
+        self._root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        os.replace(tmp, path)
+        self._writes += 1
+
+    def release(self, path: Path | None) -> None:
+        """acquire한 경로 반납. 참조가 없으면 유휴 목록으로 이동."""
+        if path is None:
+            return
+        digest = path.stem[len(_PREFIX) :]
+        count = self._refs.get(digest)
+        if count is None:
+            return
+        if count > 1:
+            self._refs[digest] = count - 1
+            return
+        del self._refs[digest]
+        self._idle[digest] = None
+        while len(self._idle) > self._max_idle:
+            oldest, _ = self._idle.popitem(last=False)
+            self._remove(oldest)
+
+    def _remove(self, digest: str) -> None:
+        try:
+            (self._root / f"{_PREFIX}{digest}.json").unlink(missing_ok=True)
+            self._removed += 1
+        except OSError:
+            logger.debug("MCP config 정리 실패: %s", digest, exc_info=True)
+
+    def close(self) -> None:
+        """앱 종료 시 모든 파일 삭제."""
+        for digest in [*self._idle, *self._refs]:
+            self._remove(digest)
+        self._idle.clear()
+        self._refs.clear()
+
+    def get_metrics(self) -> dict:
+        """파일 수, 기록/재사용 횟수."""
+        acquires = self._writes + self._reuses
+        return {
+            "in_use": len(self._refs),
+            "references": sum(self._refs.values()),
+            "idle": len(self._idle),
+            "writes": self._writes,
+            "reuses": self._reuses,
+            "reuse_rate": round(self._reuses / acquires, 3) if acquires else 0.0,
+            "removed": self._removed,
+        }
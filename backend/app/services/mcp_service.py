@@ -7,6 +7,7 @@ import re
 import uuid
 from pathlib import Path
 
+from app.core.database import Database
 from app.core.exceptions import NotFoundError
 from app.core.utils import utc_now
 from app.models.mcp_server import McpServer
@@ -48,6 +49,17 @@ def _resolve_url_for_docker_service(url: str, service_name: str) -> str:
 class McpService(DBService):
     """글로벌 MCP 서버 풀 관리 및 MCP config 빌드."""
 
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        # 턴마다 빌드되는 서버 항목 → server_ids별 캐시 (서버 변경 시 전체 무효화)
+        self._config_cache: dict[tuple[str, ...], dict[str, dict]] = {}
+        self._config_epoch: int = 0
+
+    def invalidate_config_cache(self) -> None:
+        """MCP config 캐시 무효화 (서버 생성/수정/삭제 시)."""
+        self._config_epoch += 1
+        self._config_cache.clear()
+
     # ── CRUD ─────────────────────────────────────────────────
 
     async def list_servers(self) -> list[McpServerInfo]:
@@ -93,6 +105,7 @@ class McpService(DBService):
             )
             await repo.add(server)
             await session.commit()
+            self.invalidate_config_cache()
             return McpServerInfo.model_validate(server)
 
     async def update_server(
@@ -133,6 +146,7 @@ class McpService(DBService):
             if not server:
                 raise NotFoundError(f"MCP 서버를 찾을 수 없습니다: {server_id}")
             await session.commit()
+            self.invalidate_config_cache()
             return McpServerInfo.model_validate(server)
 
     async def delete_server(self, server_id: str) -> bool:
@@ -141,6 +155,7 @@ class McpService(DBService):
             if not deleted:
                 raise NotFoundError(f"MCP 서버를 찾을 수 없습니다: {server_id}")
             await session.commit()
+            self.invalidate_config_cache()
             return True
 
     # ── 시스템 MCP 서버 (~/.claude/settings.json) ──────────
@@ -217,9 +232,26 @@ class McpService(DBService):
     ) -> dict:
         """선택된 MCP 서버 + Permission MCP를 병합한 config dict 반환.
 
+        서버 항목은 server_ids별로 캐시되어 같은 구성의 턴은 DB를 조회하지 않습니다.
+
         Returns:
             {"mcpServers": {"name1": {...}, "permission": {...}}} 형태의 dict
         """
+        key = tuple(server_ids)
+        cached = self._config_cache.get(key)
+        if cached is None:
+            epoch = self._config_epoch
+            cached = await self._load_server_entries(server_ids)
+            if epoch == self._config_epoch:
+                self._config_cache[key] = cached
+        mcp_servers = dict(cached)
+
+        if permission_mcp_dict:
+            mcp_servers.update(permission_mcp_dict)
+
+        return {"mcpServers": mcp_servers}
+
+    async def _load_server_entries(self, server_ids: list[str]) -> dict[str, dict]:
         mcp_servers: dict[str, dict] = {}
 
         if server_ids:
@@ -250,7 +282,4 @@ class McpService(DBService):
                         entry["env"] = info.env
                     mcp_servers[info.name] = entry
 
-        if permission_mcp_dict:
-            mcp_servers.update(permission_mcp_dict)
-
-        return {"mcpServers": mcp_servers}
+        return mcp_servers
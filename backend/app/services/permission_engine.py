@@ -0,0 +1,459 @@
+"""Permission 신뢰 규칙 엔진.
+
+도구 권한 요청마다 글로벌 설정을 DB에서 읽지 않도록 세션/워크스페이스/글로벌
+신뢰 규칙을 메모리에 컴파일해 두고 판정합니다. 글로벌 규칙은 설정 변경 시
+(SettingsService.invalidate_cache) 무효화되고, 워크스페이스 규칙은 처음 조회할
+때 한 번 읽어 갱신 시 교체합니다.
+
+규칙 형식 (globally_trusted_tools / workspaces.trusted_tools 항목):
+
+- "Read"                 도구 이름 일치 (기존 형식)
+- "mcp__github__*"       도구 이름 glob
+- "Bash(git status*)"    도구 입력의 대표 필드(Bash는 command)에 대한 glob
+- "Edit(re:^src/.*\\.py$)" 대표 필드에 대한 정규식 (re.search)
+
+사용자 응답을 기다리는 요청은 permission_requests 테이블에 기록하여, 서버
+재시작 후에도 프론트엔드 프롬프트를 복원하고 재시작 전에 받은 응답을 같은
+요청(세션, 도구, 입력 일치)에 적용합니다.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.core.database import Database
+    from app.services.settings_service import SettingsService
+
+logger = logging.getLogger(__name__)
+
+# session_id → workspace_id (없으면 None)
+WorkspaceResolver = Callable[[str], Awaitable[str | None]]
+
+# 규칙 입력 패턴을 적용할 도구별 대표 입력 필드 (없으면 입력 전체 JSON)
+_INPUT_FIELDS = {
+    "Bash": "command",
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "MultiEdit": "file_path",
+    "NotebookEdit": "notebook_path",
+    "WebFetch": "url",
+    "WebSearch": "query",
+    "Glob": "pattern",
+    "Grep": "pattern",
+}
+_GLOB_CHARS = frozenset("*?[")
+_RULE_RE = re.compile(r"^([^()\s]+)(?:\((.*)\))?$", re.DOTALL)
+
+
+def input_subject(tool_name: str, tool_input: dict) -> str:
+    """규칙의 입력 패턴과 비교할 문자열."""
+    key = _INPUT_FIELDS.get(tool_name)
+    if key is not None and isinstance(tool_input.get(key), str):
+        return tool_input[key]
+    return json.dumps(tool_input, sort_keys=True, ensure_ascii=False)
+
+
+def request_fingerprint(session_id: str, tool_name: str, tool_input: dict) -> str:
+    """재시작 후 같은 요청인지 판정하는 키."""
+    return json.dumps(
+        [session_id, tool_name, tool_input], sort_keys=True, ensure_ascii=False
+    )
+
+
+@dataclass(frozen=True)
+class TrustRule:
+    """컴파일된 신뢰 규칙 1개."""
+
+    spec: str
+    tool: str
+    tool_glob: bool
+    pattern: re.Pattern | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> TrustRule:
+        """규칙 문자열 → TrustRule. 형식 오류 시 ValueError."""
+        match = _RULE_RE.match(spec.strip())
+        if not match:
+            raise ValueError(f"잘못된 신뢰 규칙: {spec!r}")
+        tool, body = match.groups()
+        pattern = None
+        if body is not None:
+            if body.startswith("re:"):
+                try:
+                    pattern = re.compile(body[3:])
+                except re.error as e:
+                    raise ValueError(f"잘못된 신뢰 규칙 정규식: {spec!r} ({e})") from e
+            elif body:
+                # glob은 전체 일치 (translate 결과는 끝만 고정됨)
+                pattern = re.compile("^" + fnmatch.translate(body))
+        return cls(spec, tool, bool(_GLOB_CHARS & set(tool)), pattern)
+
+    def matches(self, tool_name: str, tool_input: dict) -> bool:
+        if self.tool_glob:
+            if not fnmatch.fnmatchcase(tool_name, self.tool):
+                return False
+        elif tool_name != self.tool:
+            return False
+        if self.pattern is None:
+            return True
+        return self.pattern.search(input_subject(tool_name, tool_input)) is not None
+
+
+class RuleSet:
+    """한 범위(세션/워크스페이스/글로벌)의 규칙 묶음.
+
+    입력 패턴 없는 도구 이름 규칙은 set 조회로, 나머지는 도구별 목록과
+    도구 이름 glob 목록만 순회합니다. 형식이 잘못된 규칙은 경고 후 무시합니다.
+    """
+
+    def __init__(self, specs: Iterable[str] = ()):
+        self.specs: list[str] = []
+        self._names: set[str] = set()
+        self._by_tool: dict[str, list[TrustRule]] = {}
+        self._globs: list[TrustRule] = []
+        for spec in specs:
+            self.add(spec)
+
+    def add(self, spec: str) -> bool:
+        """규칙 추가. 이미 있거나 형식 오류면 False."""
+        if not isinstance(spec, str) or spec in self.specs:
+            return False
+        try:
+            rule = TrustRule.parse(spec)
+        except ValueError as e:
+            logger.warning("%s", e)
+            return False
+        self.specs.append(spec)
+        if rule.tool_glob:
+            self._globs.append(rule)
+        elif rule.pattern is None:
+            self._names.add(rule.tool)
+        else:
+            self._by_tool.setdefault(rule.tool, []).append(rule)
+        return True
+
+    def match(self, tool_name: str, tool_input: dict) -> str | None:
+        """일치하는 첫 규칙 문자열 (없으면 None)."""
+        if tool_name in self._names:
+            return tool_name
+        for rule in self._by_tool.get(tool_name, ()):
+            if rule.matches(tool_name, tool_input):
+                return rule.spec
+        for rule in self._globs:
+            if rule.matches(tool_name, tool_input):
+                return rule.spec
+        return None
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+
+@dataclass
+class _LatencyStats:
+    samples: deque = field(default_factory=lambda: deque(maxlen=512))
+    count: int = 0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.samples.append(elapsed)
+        self.count += 1
+        self.max = max(self.max, elapsed)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        p50 = ordered[len(ordered) // 2] if ordered else 0.0
+        p95 = ordered[int(len(ordered) * 0.95)] if ordered else 0.0
+        return {
+            "count": self.count,
+            "p50_ms": round(p50 * 1000, 3),
+            "p95_ms": round(p95 * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PermissionEngine:
+    """세션/워크스페이스/글로벌 신뢰 규칙 판정 + 대기 요청 영속화."""
+
+    def __init__(self, *, max_sessions: int = 200):
+        self._db: Database | None = None
+        self._settings: SettingsService | None = None
+        self._workspace_of: WorkspaceResolver | None = None
+        self._max_sessions = max_sessions
+        self._session_rules: OrderedDict[str, RuleSet] = OrderedDict()
+        self._workspace_rules: dict[str, RuleSet] = {}
+        self._global_rules: RuleSet | None = None
+        self._global_epoch = 0
+        self._latency: dict[str, _LatencyStats] = {}
+        self._global_loads = 0
+        self._persist_failures = 0
+
+    def attach(
+        self,
+        db: Database | None,
+        settings_service: SettingsService,
+        workspace_of: WorkspaceResolver | None = None,
+    ) -> None:
+        """앱 시작 시 DB/설정 서비스 연결. 설정 변경 시 글로벌 규칙 무효화."""
+        self._db = db
+        self._settings = settings_service
+        self._workspace_of = workspace_of
+        self.invalidate_global()
+        settings_service.subscribe(self.invalidate_global)
+
+    # ── 규칙 판정 ──────────────────────────────────────────
+
+    async def evaluate(
+        self, session_id: str, tool_name: str, tool_input: dict
+    ) -> tuple[str, str] | None:
+        """신뢰 규칙 판정 → (출처, 일치 규칙) 또는 None(사용자 확인 필요).
+
+        규칙이 이미 메모리에 있으면 DB를 조회하지 않습니다.
+        """
+        rules = self._session_rules.get(session_id)
+        if rules is not None:
+            self._session_rules.move_to_end(session_id)
+            matched = rules.match(tool_name, tool_input)
+            if matched:
+                return "session", matched
+        workspace_id = await self.workspace_of(session_id)
+        if workspace_id:
+            matched = (await self._workspace(workspace_id)).match(
+                tool_name, tool_input
+            )
+            if matched:
+                return "workspace", matched
+        matched = (await self._global()).match(tool_name, tool_input)
+        if matched:
+            return "global", matched
+        return None
+
+    async def workspace_of(self, session_id: str) -> str | None:
+        if self._workspace_of is None:
+            return None
+        try:
+            return await self._workspace_of(session_id)
+        except Exception:
+            return None
+
+    async def _global(self) -> RuleSet:
+        rules = self._global_rules
+        if rules is not None:
+            return rules
+        if self._settings is None:
+            return RuleSet()
+        epoch = self._global_epoch
+        try:
+            current = await self._settings.get()
+        except Exception:
+            logger.warning("글로벌 신뢰 규칙 로드 실패", exc_info=True)
+            return RuleSet()
+        rules = RuleSet(current.get("globally_trusted_tools") or [])
+        self._global_loads += 1
+        if epoch == self._global_epoch:
+            self._global_rules = rules
+        return rules
+
+    def invalidate_global(self) -> None:
+        """글로벌 규칙 무효화 (다음 판정 시 재컴파일)."""
+        self._global_epoch += 1
+        self._global_rules = None
+
+    async def _workspace(self, workspace_id: str) -> RuleSet:
+        rules = self._workspace_rules.get(workspace_id)
+        if rules is not None:
+            return rules
+        specs: list = []
+        if self._db is not None:
+            from app.repositories.workspace_repo import WorkspaceRepository
+
+            try:
+                async with self._db.session() as session:
+                    entity = await WorkspaceRepository(session).get_by_id(
+                        workspace_id
+                    )
+                    specs = (entity.trusted_tools if entity else None) or []
+            except Exception:
+                logger.warning(
+                    "워크스페이스 신뢰 규칙 로드 실패: %s", workspace_id, exc_info=True
+                )
+                return RuleSet()
+        rules = RuleSet(specs)
+        self._workspace_rules[workspace_id] = rules
+        return rules
+
+    # ── 규칙 등록 ──────────────────────────────────────────
+
+    def trust_session(self, session_id: str, spec: str) -> bool:
+        """세션 규칙 추가 (인메모리, 최근 사용 max_sessions개 세션 유지)."""
+        rules = self._session_rules.get(session_id)
+        if rules is None:
+            rules = self._session_rules[session_id] = RuleSet()
+        self._session_rules.move_to_end(session_id)
+        while len(self._session_rules) > self._max_sessions:
+            self._session_rules.popitem(last=False)
+        return rules.add(spec)
+
+    def session_rules(self, session_id: str) -> list[str]:
+        rules = self._session_rules.get(session_id)
+        return list(rules.specs) if rules is not None else []
+
+    def clear_session(self, session_id: str) -> None:
+        self._session_rules.pop(session_id, None)
+
+    async def trust_workspace(self, workspace_id: str, spec: str) -> bool:
+        """워크스페이스 규칙 추가 (workspaces.trusted_tools 저장 후 캐시 교체)."""
+        if self._db is None:
+            return False
+        TrustRule.parse(spec)
+        from app.models.workspace import Workspace
+        from app.repositories.workspace_repo import WorkspaceRepository
+
+        async with self._db.session() as session:
+            repo = WorkspaceRepository(session)
+            entity = await session.get(Workspace, workspace_id, with_for_update=True)
+            if entity is None:
+                return False
+            specs = list(entity.trusted_tools or [])
+            if spec not in specs:
+                specs.append(spec)
+                await repo.update_by_id(workspace_id, trusted_tools=specs)
+                await session.commit()
+        self._workspace_rules[workspace_id] = RuleSet(specs)
+        return True
+
+    async def trust_global(self, spec: str) -> bool:
+        """글로벌 규칙 추가 (globally_trusted_tools 저장 → 설정 캐시와 함께 무효화)."""
+        if self._settings is None:
+            return False
+        TrustRule.parse(spec)
+        current = await self._settings.get()
+        existing = current.get("globally_trusted_tools") or []
+        if spec not in existing:
+            await self._settings.update(globally_trusted_tools=[*existing, spec])
+        return True
+
+    # ── 대기 요청 영속화 ────────────────────────────────────
+
+    async def persist_pending(
+        self, permission_id: str, session_id: str, tool_name: str, tool_input: dict
+    ) -> None:
+        """사용자 응답 대기 요청 기록 (실패해도 요청 흐름은 계속)."""
+        if self._db is None:
+            return
+        from app.models.permission_request import PermissionRequestRecord
+        from app.repositories.permission_request_repo import (
+            PermissionRequestRepository,
+        )
+
+        try:
+            async with self._db.session() as session:
+                await PermissionRequestRepository(session).add(
+                    PermissionRequestRecord(
+                        id=permission_id,
+                        session_id=session_id,
+                        tool_name=tool_name,
+                        tool_input=tool_input,
+                        status="pending",
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+                await session.commit()
+        except Exception:
+            self._persist_failures += 1
+            logger.warning("Permission 요청 기록 실패: %s", permission_id, exc_info=True)
+
+    async def persist_decision(self, permission_id: str, status: str) -> None:
+        """대기 요청의 결과 기록 (allow | deny | expired)."""
+        if self._db is None:
+            return
+        from app.repositories.permission_request_repo import (
+            PermissionRequestRepository,
+        )
+
+        try:
+            async with self._db.session() as session:
+                await PermissionRequestRepository(session).set_status(
+                    permission_id, status, datetime.now(timezone.utc)
+                )
+                await session.commit()
+        except Exception:
+            self._persist_failures += 1
+            logger.warning("Permission 결과 기록 실패: %s", permission_id, exc_info=True)
+
+    async def recover(
+        self, *, timeout: float, retention_days: int = 7
+    ) -> list[dict]:
+        """서버 시작 시 대기 요청 복원.
+
+        timeout보다 오래된 대기 요청은 expired로 전환하고, retention_days가 지난
+        처리 완료 기록은 삭제합니다. 나머지 대기 요청을 생성 순으로 반환합니다.
+        """
+        if self._db is None:
+            return []
+        from app.repositories.permission_request_repo import (
+            PermissionRequestRepository,
+        )
+
+        now = datetime.now(timezone.utc)
+        async with self._db.session() as session:
+            repo = PermissionRequestRepository(session)
+            expired = await repo.expire_pending_before(
+                now - timedelta(seconds=timeout), now
+            )
+            purged = await repo.delete_decided_before(
+                now - timedelta(days=retention_days)
+            )
+            rows = await repo.list_pending()
+            await session.commit()
+        if expired or purged or rows:
+            logger.info(
+                "Permission 요청 복원: 대기 %d건, 만료 %d건, 정리 %d건",
+                len(rows),
+                expired,
+                purged,
+            )
+        return [
+            {
+                "permission_id": row.id,
+                "session_id": row.session_id,
+                "tool_name": row.tool_name,
+                "tool_input": row.tool_input or {},
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ]
+
+    # ── 메트릭 ────────────────────────────────────────────
+
+    def record(self, source: str, started: float) -> None:
+        """판정 지연 기록. source: 규칙 출처 | user | timeout | evicted | recovered."""
+        stats = self._latency.get(source)
+        if stats is None:
+            stats = self._latency[source] = _LatencyStats()
+        stats.add(time.perf_counter() - started)
+
+    def get_metrics(self) -> dict:
+        """출처별 판정 수/지연, 컴파일된 규칙 수."""
+        return {
+            "decisions": {
+                source: stats.summary() for source, stats in self._latency.items()
+            },
+            "session_rule_sets": len(self._session_rules),
+            "workspace_rule_sets": len(self._workspace_rules),
+            "global_rules": (
+                len(self._global_rules) if self._global_rules is not None else None
+            ),
+            "global_loads": self._global_loads,
+            "persist_failures": self._persist_failures,
+        }
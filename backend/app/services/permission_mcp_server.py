@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Permission MCP Server - Claude CLI의 --permission-prompt-tool 용 stdio MCP 서버.
 
-외부 의존성 없이 stdlib만 사용합니다.
+외부 의존성 없이 stdlib만 사용합니다. 기본 구성은 백엔드가 직접 호스팅하는
+HTTP MCP 엔드포인트(/api/permissions/{session_id}/mcp)이며, 이 스크립트는
+permission_mcp_transport="stdio" 설정(HTTP MCP 미지원 CLI)에서만 사용됩니다.
+도구 정의/응답 형식은 HTTP 엔드포인트와 공유합니다.
 환경변수:
   PERMISSION_SESSION_ID: 현재 세션 ID
   PERMISSION_API_BASE: Backend API base URL (예: http://localhost:8101)
@@ -16,14 +19,45 @@ import threading
 import urllib.error
 import urllib.request
 
-# stderr로 로깅 (stdout은 MCP stdio 프로토콜에 사용됨)
-logging.basicConfig(
-    stream=sys.stderr,
-    level=logging.DEBUG,
-    format="[PermissionMCP] %(levelname)s %(message)s",
-)
 logger = logging.getLogger("permission_mcp")
 
+PROTOCOL_VERSION = "2024-11-05"
+SERVER_INFO = {"name": "permission-prompt", "version": "1.0.0"}
+HANDLE_REQUEST_TOOL = {
+    "name": "handle_request",
+    "description": "Handle a permission prompt request from Claude CLI",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "tool_name": {
+                "type": "string",
+                "description": "Name of the tool requesting permission",
+            },
+            "input": {
+                "type": "object",
+                "description": "Tool input parameters",
+            },
+        },
+        "required": ["tool_name", "input"],
+    },
+}
+
+
+def tool_result(msg_id, behavior: str) -> dict:
+    """handle_request 도구 호출의 JSON-RPC 응답 (behavior: allow/deny)."""
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {
+            "content": [
+                {
+                    "type": "text",
+                    "text": json.dumps({"behavior": behavior}),
+                }
+            ],
+        },
+    }
+
 
 def read_message() -> dict | None:
     """stdin에서 JSON-RPC 메시지를 한 줄씩 읽습니다."""
@@ -64,12 +98,9 @@ def handle_initialize(msg: dict):
             "jsonrpc": "2.0",
             "id": msg.get("id"),
             "result": {
-                "protocolVersion": "2024-11-05",
+                "protocolVersion": PROTOCOL_VERSION,
                 "capabilities": {"tools": {}},
-                "serverInfo": {
-                    "name": "permission-prompt",
-                    "version": "1.0.0",
-                },
+                "serverInfo": SERVER_INFO,
             },
         }
     )
@@ -81,46 +112,14 @@ def handle_tools_list(msg: dict):
         {
             "jsonrpc": "2.0",
             "id": msg.get("id"),
-            "result": {
-                "tools": [
-                    {
-                        "name": "handle_request",
-                        "description": "Handle a permission prompt request from Claude CLI",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "tool_name": {
-                                    "type": "string",
-                                    "description": "Name of the tool requesting permission",
-                                },
-                                "input": {
-                                    "type": "object",
-                                    "description": "Tool input parameters",
-                                },
-                            },
-                            "required": ["tool_name", "input"],
-                        },
-                    }
-                ]
-            },
+            "result": {"tools": [HANDLE_REQUEST_TOOL]},
         }
     )
 
 
 def _make_deny_response(msg_id) -> dict:
     """deny 동작의 JSON-RPC 응답을 생성합니다."""
-    return {
-        "jsonrpc": "2.0",
-        "id": msg_id,
-        "result": {
-            "content": [
-                {
-                    "type": "text",
-                    "text": json.dumps({"behavior": "deny"}),
-                }
-            ],
-        },
-    }
+    return tool_result(msg_id, "deny")
 
 
 def _do_http_request(url: str, payload: bytes, timeout: int) -> dict | None:
@@ -208,24 +207,18 @@ def handle_tool_call(msg: dict):
     behavior = result.get("behavior", "deny")
     logger.info("Permission 응답: behavior=%s", behavior)
 
-    write_message(
-        {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({"behavior": behavior}),
-                    }
-                ],
-            },
-        }
-    )
+    write_message(tool_result(msg_id, behavior))
 
 
 def main():
     """MCP 서버 메인 루프 (stdio JSON-RPC)."""
+    # stderr로 로깅 (stdout은 MCP stdio 프로토콜에 사용됨). 백엔드에서 모듈로
+    # import될 때는 로깅 설정을 건드리지 않도록 main에서만 구성
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.DEBUG,
+        format="[PermissionMCP] %(levelname)s %(message)s",
+    )
     logger.info("Permission MCP 서버 시작")
     while True:
         msg = read_message()
@@ -0,0 +1,572 @@
+"""PR 리뷰 작업 큐.
+
+고정 크기 워커 풀이 DB(pr_review_jobs)에 저장된 리뷰 작업을 순서대로
+처리합니다. Claude Code CLI의 stream-json 출력을 줄 단위로 파싱하여
+생성 중인 텍스트를 /ws/pr-reviews/{job_id} 구독자에게 즉시 전송하고,
+diff가 chunk_chars를 넘으면 파일/hunk 경계로 분할해 부분 리뷰(map) 후
+하나의 리뷰로 통합(reduce)합니다. 서버 재시작 시 미완료 작업은 다시
+대기열에 등록됩니다.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import uuid
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from app.core.database import Database
+from app.core.exceptions import ConflictError, NotFoundError
+from app.core.utils import utc_now
+from app.models.event_types import CliEventType, WsEventType
+from app.models.pr_review_job import PRReviewJob
+from app.repositories.pr_review_job_repo import PRReviewJobRepository
+from app.schemas.filesystem import (
+    GitHubPRDetail,
+    PRReviewJobResponse,
+    PRReviewStatusResponse,
+)
+from app.services.base import DBService
+from app.services.github_service import GitHubService
+from app.services.subprocess_runner import SubprocessRunError, SubprocessRunner
+from app.services.turn_scheduler import TurnPriority, TurnScheduler
+from app.services.websocket_manager import WebSocketManager
+
+logger = logging.getLogger(__name__)
+
+_FILE_SPLIT_RE = re.compile(r"(?m)^(?=diff --git )")
+_HUNK_SPLIT_RE = re.compile(r"(?m)^(?=@@ )")
+
+
+def pr_review_channel(job_id: str) -> str:
+    """리뷰 작업 WebSocket 채널 키 (WebSocketManager 연결 키)."""
+    return f"pr-review:{job_id}"
+
+
+class _ReviewError(Exception):
+    """사용자에게 그대로 표시할 리뷰 실패 사유."""
+
+
+@dataclass
+class _LiveJob:
+    """처리 대기/진행 중인 작업의 메모리 상태 (생성 중 텍스트 포함)."""
+
+    job_id: str
+    repo_path: str
+    pr_number: int
+    phase: str = "queued"  # queued | reviewing | merging
+    head_sha: str | None = None
+    parts: list[str] = field(default_factory=list)
+    text_len: int = 0
+    chunks_total: int = 0
+    chunks_done: int = 0
+
+
+class PRReviewService(DBService):
+    """PR 리뷰 작업 생성/조회 + 워커 풀 실행."""
+
+    def __init__(
+        self,
+        db: Database,
+        github_service: GitHubService,
+        ws_manager: WebSocketManager,
+        *,
+        workers: int = 2,
+        queue_size: int = 32,
+        claude_concurrency: int = 4,
+        chunk_chars: int = 50000,
+        max_chunks: int = 12,
+        timeout: float = 600.0,
+        retention_days: int = 7,
+        scheduler: TurnScheduler | None = None,
+    ):
+        super().__init__(db)
+        self._github = github_service
+        self._ws = ws_manager
+        self._num_workers = workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._chunk_chars = chunk_chars
+        self._max_chunks = max_chunks
+        self._timeout = timeout
+        self._retention = timedelta(days=retention_days)
+        # claude -p 프로세스 (분할 리뷰의 부분 리뷰는 병렬 실행)
+        self._claude = SubprocessRunner(
+            "Claude Code CLI", max_concurrency=claude_concurrency
+        )
+        # 세션 턴과 전역 동시 실행 한도 공유 (BACKGROUND 우선순위)
+        self._scheduler = scheduler
+        self._live: dict[str, _LiveJob] = {}
+        self._workers: list[asyncio.Task] = []
+        # 메트릭
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._recovered = 0
+
+    # ── 생명주기 ──
+
+    async def start(self) -> None:
+        """오래된 작업 정리 + 미완료 작업 재등록 + 워커 시작."""
+        async with self._session_scope(PRReviewJobRepository) as (session, repo):
+            await repo.delete_older_than(utc_now() - self._retention)
+            unfinished = await repo.list_unfinished()
+            await session.commit()
+        for job in unfinished:
+            self._live[job.id] = _LiveJob(job.id, job.repo_path, job.pr_number)
+            try:
+                self._queue.put_nowait(job.id)
+                self._recovered += 1
+            except asyncio.QueueFull:
+                await self._finish(job.id, error="서버 재시작 후 대기열 초과로 취소됨")
+        if self._recovered:
+            logger.info("미완료 PR 리뷰 작업 %d건 재등록", self._recovered)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._num_workers)
+        ]
+
+    async def stop(self) -> None:
+        """워커 종료 (진행 중 작업은 DB에 pending으로 남아 재시작 시 재실행)."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ── 작업 생성/조회 ──
+
+    async def submit(self, path: str, pr_number: int) -> PRReviewJobResponse:
+        """리뷰 작업 생성 후 대기열 등록 (대기열이 가득 차면 ConflictError)."""
+        git = self._github._git
+        validated_path = git._validate_path(path)
+        if not git._is_within_root(validated_path):
+            raise ValueError(f"접근할 수 없는 경로입니다: {path}")
+        if self._queue.full():
+            self._rejected += 1
+            raise ConflictError(
+                "PR 리뷰 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요"
+            )
+
+        job_id = str(uuid.uuid4())
+        async with self._session_scope(PRReviewJobRepository) as (session, repo):
+            await repo.add(
+                PRReviewJob(
+                    id=job_id,
+                    repo_path=path,
+                    pr_number=pr_number,
+                    status="pending",
+                    review_text="",
+                    chunks_total=0,
+                    chunks_done=0,
+                    created_at=utc_now(),
+                )
+            )
+            await session.commit()
+        self._live[job_id] = _LiveJob(job_id, path, pr_number)
+        self._queue.put_nowait(job_id)
+        self._submitted += 1
+        return PRReviewJobResponse(job_id=job_id, status="pending")
+
+    async def get_status(self, job_id: str) -> PRReviewStatusResponse:
+        """작업 상태 (진행 중이면 생성 중인 부분 텍스트 포함)."""
+        live = self._live.get(job_id)
+        if live is not None:
+            return self._live_status(live)
+        async with self._session_scope(PRReviewJobRepository) as (_, repo):
+            job = await repo.get_by_id(job_id)
+        if job is None:
+            raise NotFoundError(f"리뷰 작업을 찾을 수 없습니다: {job_id}")
+        return PRReviewStatusResponse(
+            job_id=job.id,
+            status=job.status,
+            pr_number=job.pr_number,
+            head_sha=job.head_sha,
+            review_text=job.review_text,
+            chunks_total=job.chunks_total,
+            chunks_done=job.chunks_done,
+            error=job.error,
+        )
+
+    @staticmethod
+    def _live_status(live: _LiveJob) -> PRReviewStatusResponse:
+        return PRReviewStatusResponse(
+            job_id=live.job_id,
+            status="pending",
+            phase=live.phase,
+            pr_number=live.pr_number,
+            head_sha=live.head_sha,
+            review_text="".join(live.parts),
+            chunks_total=live.chunks_total,
+            chunks_done=live.chunks_done,
+        )
+
+    # ── 실행 ──
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not isinstance(e, _ReviewError):
+                    logger.error(
+                        "PR 리뷰 작업 실패 (job %s): %s", job_id, e, exc_info=True
+                    )
+                try:
+                    await self._finish(job_id, error=str(e))
+                except Exception as save_error:
+                    logger.error(
+                        "PR 리뷰 결과 저장 실패 (job %s): %s", job_id, save_error
+                    )
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str) -> None:
+        live = self._live.get(job_id)
+        if live is None:
+            return
+        cwd = str(self._github._git._validate_path(live.repo_path))
+        live.phase = "reviewing"
+        await self._broadcast_status(live)
+
+        # PR 상세/diff는 GitHubService 캐시 사용 (같은 head SHA 재리뷰 시 네트워크 없음)
+        detail = await self._github.get_github_pr_detail(
+            live.repo_path, live.pr_number
+        )
+        if detail.error:
+            raise _ReviewError(f"PR 정보 조회 실패: {detail.error}")
+        try:
+            diff_text = await self._github.get_github_pr_diff(
+                live.repo_path, live.pr_number
+            )
+        except ValueError as e:
+            raise _ReviewError(str(e)) from e
+
+        chunks = self._split_diff(diff_text, self._chunk_chars)
+        omitted = max(len(chunks) - self._max_chunks, 0)
+        chunks = chunks[: self._max_chunks]
+        live.head_sha = detail.head_sha or None
+        live.chunks_total = len(chunks)
+        async with self._session_scope(PRReviewJobRepository) as (session, repo):
+            await repo.update_fields(
+                job_id,
+                head_sha=live.head_sha,
+                chunks_total=live.chunks_total,
+                started_at=utc_now(),
+            )
+            await session.commit()
+        await self._broadcast_status(live)
+
+        if len(chunks) == 1 and not omitted:
+            review = await self._run_claude(
+                cwd, self._review_prompt(detail, chunks[0]), live
+            )
+            live.chunks_done = 1
+        else:
+            # map: 부분 리뷰 병렬 생성 → reduce: 하나의 리뷰로 통합 (스트리밍)
+            partials = await asyncio.gather(
+                *[
+                    self._review_chunk(cwd, detail, chunk, i, live)
+                    for i, chunk in enumerate(chunks, 1)
+                ]
+            )
+            live.phase = "merging"
+            await self._broadcast_status(live)
+            review = await self._run_claude(
+                cwd, self._merge_prompt(detail, partials, omitted), live
+            )
+        await self._finish(job_id, review_text=review)
+
+    async def _review_chunk(
+        self, cwd: str, detail: GitHubPRDetail, chunk: str, index: int, live: _LiveJob
+    ) -> str:
+        prompt = self._chunk_prompt(detail, chunk, index, live.chunks_total)
+        partial = await self._run_claude(cwd, prompt, None)
+        live.chunks_done += 1
+        async with self._session_scope(PRReviewJobRepository) as (session, repo):
+            await repo.update_fields(live.job_id, chunks_done=live.chunks_done)
+            await session.commit()
+        await self._broadcast_status(live)
+        return partial
+
+    async def _run_claude(self, cwd: str, prompt: str, live: _LiveJob | None) -> str:
+        """claude -p를 stream-json으로 실행. live가 있으면 텍스트 델타를 전송."""
+        cmd = [
+            "claude",
+            "-p",
+            prompt,
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--include-partial-messages",
+        ]
+        streamed: list[str] = []
+        assistant_text: list[str] = []
+        result: str | None = None
+        pending = b""
+
+        async def _handle(line: bytes) -> None:
+            nonlocal result
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                return
+            event_type = event.get("type")
+            if event_type == CliEventType.STREAM_EVENT:
+                inner = event.get("event") or {}
+                delta = inner.get("delta") or {}
+                if (
+                    inner.get("type") == "content_block_delta"
+                    and delta.get("type") == "text_delta"
+                ):
+                    streamed.append(delta.get("text", ""))
+                    if live is not None:
+                        await self._emit_delta(live, delta.get("text", ""))
+            elif event_type == CliEventType.ASSISTANT:
+                for block in (event.get("message") or {}).get("content") or []:
+                    if block.get("type") == "text":
+                        assistant_text.append(block.get("text", ""))
+            elif event_type == CliEventType.RESULT:
+                if event.get("is_error"):
+                    raise _ReviewError(event.get("result") or "리뷰 생성 실패")
+                result = event.get("result")
+
+        slot = (
+            self._scheduler.slot(
+                f"pr-review:{live.job_id if live else cwd}",
+                workspace=cwd,
+                priority=TurnPriority.BACKGROUND,
+            )
+            if self._scheduler is not None
+            else nullcontext()
+        )
+        try:
+            async with slot:
+                async for chunk in self._claude.stream(
+                    cmd, cwd=cwd, timeout=self._timeout
+                ):
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        if line.strip():
+                            await _handle(line)
+                if pending.strip():
+                    await _handle(pending)
+        except SubprocessRunError as e:
+            if e.returncode == -1 and e.stderr.startswith("timeout"):
+                message = f"Claude Code 실행 시간 초과 ({self._timeout:.0f}초)"
+            elif e.returncode == -1 and e.stderr.endswith("not found"):
+                message = "Claude Code CLI를 찾을 수 없습니다"
+            else:
+                message = (
+                    e.stderr or f"Claude Code 실행 실패 (exit code: {e.returncode})"
+                )
+            raise _ReviewError(message) from e
+
+        text = result if result is not None else "".join(streamed)
+        if not text:
+            text = "\n".join(assistant_text)
+        if live is not None and not streamed and text:
+            # 부분 메시지 미지원 CLI: 최종 텍스트를 한 번에 전송
+            await self._emit_delta(live, text)
+        return text
+
+    async def _emit_delta(self, live: _LiveJob, text: str) -> None:
+        if not text:
+            return
+        offset = live.text_len
+        live.parts.append(text)
+        live.text_len += len(text)
+        await self._ws.broadcast(
+            pr_review_channel(live.job_id),
+            {
+                "type": WsEventType.PR_REVIEW_DELTA,
+                "job_id": live.job_id,
+                "offset": offset,
+                "text": text,
+            },
+        )
+
+    async def _broadcast_status(
+        self, live: _LiveJob, status: PRReviewStatusResponse | None = None
+    ) -> None:
+        payload = status or self._live_status(live)
+        # 진행 중 상태 이벤트에는 누적 텍스트 제외 (델타로 전송됨)
+        data = payload.model_dump(exclude={"review_text"} if status is None else None)
+        await self._ws.broadcast(
+            pr_review_channel(live.job_id),
+            {"type": WsEventType.PR_REVIEW_STATUS, **data},
+        )
+
+    async def _finish(
+        self, job_id: str, *, review_text: str = "", error: str | None = None
+    ) -> None:
+        """결과 저장 + 최종 상태 전송."""
+        status = "error" if error else "completed"
+        live = self._live.get(job_id)
+        values: dict = {
+            "status": status,
+            "review_text": review_text,
+            "error": error,
+            "completed_at": utc_now(),
+        }
+        if live is not None:
+            values["chunks_done"] = live.chunks_done
+        try:
+            async with self._session_scope(PRReviewJobRepository) as (session, repo):
+                await repo.update_fields(job_id, **values)
+                await session.commit()
+        finally:
+            self._live.pop(job_id, None)
+        if error:
+            self._failed += 1
+        else:
+            self._completed += 1
+        if live is not None:
+            await self._broadcast_status(
+                live,
+                PRReviewStatusResponse(
+                    job_id=job_id,
+                    status=status,
+                    pr_number=live.pr_number,
+                    head_sha=live.head_sha,
+                    review_text=review_text,
+                    chunks_total=live.chunks_total,
+                    chunks_done=live.chunks_done,
+                    error=error,
+                ),
+            )
+
+    # ── diff 분할 / 프롬프트 ──
+
+    @staticmethod
+    def _split_diff(diff_text: str, max_chars: int) -> list[str]:
+        """파일 경계(diff --git)로 나눈 뒤 max_chars 이하 청크로 묶음.
+
+        max_chars를 넘는 파일은 hunk 경계로, 그래도 넘는 hunk는 줄 경계로
+        자릅니다. 분할된 조각 앞에는 파일 헤더 줄을 붙여 파일을 식별합니다.
+        """
+
+        def pack(pieces: list[str], limit: int) -> list[str]:
+            packed: list[str] = []
+            current = ""
+            for piece in pieces:
+                if current and len(current) + len(piece) > limit:
+                    packed.append(current)
+                    current = ""
+                current += piece
+            if current:
+                packed.append(current)
+            return packed
+
+        pieces: list[str] = []
+        for section in _FILE_SPLIT_RE.split(diff_text):
+            if not section:
+                continue
+            if len(section) <= max_chars:
+                pieces.append(section)
+                continue
+            header = section.split("\n", 1)[0] + "\n"
+            limit = max(max_chars - len(header), 1)
+            for i, hunk in enumerate(_HUNK_SPLIT_RE.split(section)):
+                lines: list[str] = []
+                for line in hunk.splitlines(keepends=True):
+                    # 한 줄이 limit을 넘으면 길이로 자름
+                    lines.extend(
+                        line[start : start + limit]
+                        for start in range(0, len(line), limit)
+                    )
+                for j, part in enumerate(pack(lines, limit)):
+                    pieces.append(part if i == 0 and j == 0 else header + part)
+
+        return pack(pieces, max_chars) or [""]
+
+    @staticmethod
+    def _pr_info(detail: GitHubPRDetail) -> str:
+        return (
+            f"## PR 정보\n"
+            f"- 제목: {detail.title}\n"
+            f"- 작성자: {detail.author}\n"
+            f"- 브랜치: {detail.branch} -> {detail.base}\n"
+            f"- 변경: +{detail.additions} -{detail.deletions}, "
+            f"{detail.changed_files}개 파일\n\n"
+            f"## PR 설명\n{detail.body or '(없음)'}\n\n"
+        )
+
+    _REVIEW_REQUEST = (
+        "1. **요약**: 변경사항의 전체적인 요약\n"
+        "2. **좋은 점**: 잘 작성된 부분\n"
+        "3. **개선 제안**: 개선이 필요한 부분 (파일명, 라인 번호 포함)\n"
+        "4. **잠재적 이슈**: 버그, 보안, 성능 관련 우려사항\n\n"
+        "마크다운 형식으로 작성해주세요."
+    )
+
+    @classmethod
+    def _review_prompt(cls, detail: GitHubPRDetail, diff_text: str) -> str:
+        return (
+            f"다음은 GitHub Pull Request #{detail.number}의 정보와 diff입니다.\n"
+            f"이 PR을 코드 리뷰해주세요.\n\n"
+            f"{cls._pr_info(detail)}"
+            f"## Diff\n```diff\n{diff_text}\n```\n\n"
+            f"## 리뷰 요청\n"
+            f"위 PR의 코드 변경사항을 리뷰해주세요. 다음 항목을 포함해주세요:\n"
+            f"{cls._REVIEW_REQUEST}"
+        )
+
+    @classmethod
+    def _chunk_prompt(
+        cls, detail: GitHubPRDetail, diff_text: str, index: int, total: int
+    ) -> str:
+        return (
+            f"다음은 GitHub Pull Request #{detail.number} diff의 일부"
+            f"({index}/{total})입니다.\n\n"
+            f"{cls._pr_info(detail)}"
+            f"## Diff ({index}/{total})\n```diff\n{diff_text}\n```\n\n"
+            f"## 요청\n"
+            f"이 부분의 변경사항만 검토하여 개선 제안과 잠재적 이슈(버그, 보안, 성능)를 "
+            f"파일명/라인 번호와 함께 간결한 목록으로 정리해주세요. "
+            f"잘 작성된 부분이 있으면 한두 줄로 덧붙여주세요."
+        )
+
+    def _merge_prompt(
+        self, detail: GitHubPRDetail, partials: list[str], omitted: int
+    ) -> str:
+        # 통합 프롬프트도 chunk_chars 이내로 유지
+        per_partial = max(self._chunk_chars // max(len(partials), 1), 2000)
+        sections = "\n\n".join(
+            f"### 부분 리뷰 {i}/{len(partials)}\n{partial[:per_partial]}"
+            for i, partial in enumerate(partials, 1)
+        )
+        note = (
+            f"\n(diff가 너무 커서 마지막 {omitted}개 부분은 검토하지 못했습니다. "
+            f"리뷰에 이 사실을 명시해주세요.)\n"
+            if omitted
+            else ""
+        )
+        return (
+            f"다음은 GitHub Pull Request #{detail.number}의 정보와, diff를 나누어 "
+            f"작성한 부분 리뷰입니다.\n\n"
+            f"{self._pr_info(detail)}"
+            f"## 부분 리뷰\n{sections}\n{note}\n"
+            f"## 리뷰 요청\n"
+            f"부분 리뷰를 중복 없이 통합하여 하나의 PR 리뷰를 작성해주세요. "
+            f"다음 항목을 포함해주세요:\n"
+            f"{self._REVIEW_REQUEST}"
+        )
+
+    def get_metrics(self) -> dict:
+        """대기/실행 중 작업 수, 처리 결과, claude 실행기."""
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize(),
+            "running": sum(1 for j in self._live.values() if j.phase != "queued"),
+            "submitted_total": self._submitted,
+            "completed_total": self._completed,
+            "failed_total": self._failed,
+            "rejected_total": self._rejected,
+            "recovered_total": self._recovered,
+            "claude_runner": self._claude.get_metrics(),
+        }
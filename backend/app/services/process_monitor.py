@@ -0,0 +1,440 @@
+"""Claude CLI 프로세스 트리 자원 샘플러 + stall 감지 + 메모리 압박 기반 한도 조정.
+
+claude 프로세스는 Node 런타임과 MCP 서버 자식 프로세스를 포함해 수백 MB를
+사용하므로, 고정된 max_concurrent_sessions만으로는 스왑 폭주를 막을 수
+없습니다. ProcessMonitor는 주기마다 /proc/*/stat을 한 번 훑어:
+
+- 추적 중인 세션별 프로세스 트리(자식 포함) RSS/CPU 사용률과 마지막 CPU
+  활동 시각을 갱신하고, 등록된 stall 감시를 같은 틱에서 판정하며(세션별
+  폴링 태스크/스레드 없이 O(1) 조회)
+- /proc/pressure/memory(PSI)와 MemAvailable로 메모리 압박을 판단하여
+- TurnScheduler 동시 실행 한도를 AIMD로 조정합니다. 압박 시 실행 중인
+  턴 수의 3/4로 줄이고(새 턴은 대기), 압박이 해소되면 1씩 늘리되 턴당
+  평균 RSS로 계산한 메모리 예산을 넘지 않습니다.
+
+턴을 실행하지 않는 유휴 프로세스(warm 풀)는 track_idle로 등록합니다. RSS는
+메트릭에 합산하되 턴당 평균에서는 제외하고, 압박 시에는 한도를 줄이기 전에
+회수 콜백으로 먼저 종료합니다.
+
+/proc이 없는 플랫폼에서는 샘플링하지 않습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from app.core.executors import ExecutorKind, run_in_executor
+from app.services.turn_scheduler import TurnScheduler
+
+logger = logging.getLogger(__name__)
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# PSI avg10 창 — 한도 감소 후 이 시간 동안은 추가 감소하지 않음
+_DECREASE_COOLDOWN = 10.0
+# CPU 사용률 이동 평균 창 (초)
+_CPU_WINDOW = 10.0
+
+# stall 콜백: (무출력 경과 초, 하드 타임아웃 여부)
+StallCallback = Callable[[float, bool], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class ProcessUsage:
+    pid: int
+    processes: int  # 트리 내 프로세스 수 (자신 포함)
+    rss_bytes: int
+    cpu_ticks: int  # utime+stime (+ 회수된 자식의 cutime+cstime)
+    cpu_percent: float  # 최근 _CPU_WINDOW 동안 평균
+    sampled_at: float
+    active_at: float  # CPU 시간이 마지막으로 증가한 샘플 시각
+    history: deque = field(default_factory=lambda: deque(maxlen=32))
+
+
+@dataclass(slots=True)
+class _StallWatch:
+    last_output: Callable[[], float]  # 마지막 stdout 이벤트 시각 (monotonic)
+    timeout: float
+    on_stall: StallCallback
+    graced: bool = False
+    fired: bool = False
+
+
+def _read_proc_table(proc_root: str) -> dict[int, tuple[int, int, int]]:
+    """/proc/*/stat 1회 순회 → {pid: (ppid, cpu_ticks, rss_pages)}."""
+    table: dict[int, tuple[int, int, int]] = {}
+    try:
+        names = os.listdir(proc_root)
+    except OSError:
+        return table
+    for name in names:
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"{proc_root}/{name}/stat", "rb") as f:
+                data = f.read()
+        except OSError:
+            continue  # 순회 중 종료된 프로세스
+        # comm에 공백/괄호가 포함될 수 있으므로 마지막 ')' 이후만 분할
+        fields = data.rsplit(b")", 1)[-1].split()
+        try:
+            ticks = sum(int(v) for v in fields[11:15])
+            table[int(name)] = (int(fields[1]), ticks, int(fields[21]))
+        except (IndexError, ValueError):
+            continue
+    return table
+
+
+def _read_memory_state(proc_root: str) -> tuple[float | None, int | None]:
+    """(PSI some avg10 %, MemAvailable bytes). 미지원 항목은 None."""
+    pressure: float | None = None
+    available: int | None = None
+    try:
+        with open(f"{proc_root}/pressure/memory", "rb") as f:
+            for line in f:
+                if line.startswith(b"some "):
+                    for part in line.split()[1:]:
+                        if part.startswith(b"avg10="):
+                            pressure = float(part[6:])
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(f"{proc_root}/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    return pressure, available
+
+
+def _tree_usage(
+    root: int, table: dict[int, tuple[int, int, int]], children: dict[int, list[int]]
+) -> tuple[int, int, int] | None:
+    """root 이하 프로세스 트리 → (프로세스 수, cpu_ticks, rss_pages)."""
+    if root not in table:
+        return None
+    count = ticks = rss = 0
+    stack = [root]
+    while stack:
+        pid = stack.pop()
+        _ppid, cpu, pages = table[pid]
+        count += 1
+        ticks += cpu
+        rss += pages
+        stack.extend(children.get(pid, ()))
+    return count, ticks, rss
+
+
+class ProcessMonitor:
+    """세션별 claude 프로세스 트리 자원 사용량 추적 + 동시 실행 한도 조정."""
+
+    def __init__(
+        self,
+        *,
+        interval: float = 2.0,
+        scheduler: TurnScheduler | None = None,
+        max_limit: int = 50,
+        min_limit: int = 2,
+        pressure_high: float = 10.0,
+        pressure_low: float = 1.0,
+        memory_reserve_mb: int = 1024,
+        proc_root: str = "/proc",
+    ):
+        self._interval = interval
+        self._scheduler = scheduler
+        self._max_limit = max_limit
+        self._min_limit = max(1, min(min_limit, max_limit))
+        self._pressure_high = pressure_high
+        self._pressure_low = pressure_low
+        self._reserve = memory_reserve_mb * 1024 * 1024
+        self._proc_root = proc_root
+        self._tracked: dict[str, int] = {}
+        self._usage: dict[str, ProcessUsage] = {}
+        self._idle: dict[str, Callable[[], None]] = {}
+        self._stall_watches: dict[str, _StallWatch] = {}
+        self._stall_tasks: set[asyncio.Task] = set()
+        self._running = False
+        self._pressure: float | None = None
+        self._available: int | None = None
+        self._last_decrease = float("-inf")
+        # 메트릭
+        self._samples = 0
+        self._sample_ms = 0.0
+        self._decreases = 0
+        self._increases = 0
+        self._reclaimed = 0
+        self._stalls_soft = 0
+        self._stalls_hard = 0
+        self._stalls_graced = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._interval > 0 and os.path.isdir(f"{self._proc_root}/self")
+
+    @property
+    def running(self) -> bool:
+        """샘플링 루프 실행 중 여부 (stall 감시 등록 가능 여부)."""
+        return self._running
+
+    def track(self, key: str, pid: int | None) -> None:
+        if pid is not None:
+            self._tracked[key] = pid
+
+    def track_idle(
+        self, key: str, pid: int | None, reclaim: Callable[[], None]
+    ) -> None:
+        """턴 대기 중인 유휴 프로세스 추적. 메모리 압박 시 reclaim 호출."""
+        if pid is not None:
+            self._tracked[key] = pid
+            self._idle[key] = reclaim
+
+    def untrack(self, key: str) -> None:
+        self._tracked.pop(key, None)
+        self._usage.pop(key, None)
+        self._idle.pop(key, None)
+        self._stall_watches.pop(key, None)
+
+    def usage(self, key: str) -> ProcessUsage | None:
+        return self._usage.get(key)
+
+    def watch_stall(
+        self,
+        key: str,
+        *,
+        last_output: Callable[[], float],
+        timeout: float,
+        on_stall: StallCallback,
+    ) -> None:
+        """샘플링 틱마다 stall 판정 (untrack 시 해제).
+
+        무출력 timeout 초과 + 프로세스 트리 비활동 → 소프트 stall,
+        무출력 timeout×3 초과 → 활동 여부와 무관하게 하드 stall.
+        on_stall은 감시당 최대 1회 호출됩니다.
+        """
+        self._stall_watches[key] = _StallWatch(last_output, timeout, on_stall)
+
+    def is_active(self, key: str, within: float | None = None) -> bool | None:
+        """최근 within초(기본 샘플 2회 간격) 내 CPU 활동 여부. 정보 없으면 None."""
+        usage = self._usage.get(key)
+        if usage is None:
+            return None
+        if within is None:
+            within = self._interval * 2
+        return usage.sampled_at - usage.active_at <= within
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """샘플링 루프 (shutdown_event가 set될 때까지)."""
+        if not self.enabled:
+            return
+        self._running = True
+        try:
+            while not shutdown_event.is_set():
+                try:
+                    await self.sample()
+                except Exception as e:
+                    logger.warning("프로세스 자원 샘플링 실패: %s", e)
+                try:
+                    await asyncio.wait_for(
+                        shutdown_event.wait(), timeout=self._interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            for task in list(self._stall_tasks):
+                task.cancel()
+            await asyncio.gather(*self._stall_tasks, return_exceptions=True)
+
+    async def sample(self) -> None:
+        """추적 중인 프로세스 트리 + 메모리 압박 1회 샘플링 후 한도 조정."""
+        started = time.monotonic()
+        tracked = dict(self._tracked)
+        table, (pressure, available) = await run_in_executor(
+            ExecutorKind.PIPE, self._read_all
+        )
+        now = time.monotonic()
+
+        children: dict[int, list[int]] = {}
+        for pid, (ppid, _ticks, _rss) in table.items():
+            children.setdefault(ppid, []).append(pid)
+
+        for key, pid in tracked.items():
+            tree = _tree_usage(pid, table, children)
+            if tree is None or key not in self._tracked:
+                self._usage.pop(key, None)
+                continue
+            count, ticks, pages = tree
+            usage = self._usage.get(key)
+            if usage is None or usage.pid != pid:
+                # 첫 샘플은 활동 중으로 간주
+                usage = ProcessUsage(pid, count, 0, ticks, 0.0, now, now)
+                self._usage[key] = usage
+            elif ticks > usage.cpu_ticks:
+                usage.active_at = now
+            usage.processes = count
+            usage.rss_bytes = pages * _PAGE_SIZE
+            usage.cpu_ticks = ticks
+            usage.sampled_at = now
+            usage.history.append((now, ticks))
+            while len(usage.history) > 2 and now - usage.history[1][0] >= _CPU_WINDOW:
+                usage.history.popleft()
+            first_at, first_ticks = usage.history[0]
+            if now > first_at:
+                cpu = (ticks - first_ticks) / _CLK_TCK / (now - first_at)
+                usage.cpu_percent = round(max(cpu, 0.0) * 100, 1)
+
+        self._pressure = pressure
+        self._available = available
+        self._samples += 1
+        self._sample_ms = round((time.monotonic() - started) * 1000, 2)
+        self._check_stalls()
+        self._adjust_limit(now)
+
+    def _check_stalls(self) -> None:
+        now = time.monotonic()
+        for key, watch in list(self._stall_watches.items()):
+            if watch.fired:
+                continue
+            elapsed = now - watch.last_output()
+            if elapsed < watch.timeout:
+                watch.graced = False
+                continue
+            hard = elapsed >= watch.timeout * 3
+            if not hard and self.is_active(key) is not False:
+                # 프로세스 트리가 CPU를 사용 중(또는 정보 없음) → 유예
+                if not watch.graced:
+                    watch.graced = True
+                    self._stalls_graced += 1
+                    logger.info(
+                        "%s: stdout %d초 무출력이나 프로세스 활동 중 — stall 유예",
+                        key,
+                        int(elapsed),
+                    )
+                continue
+            watch.fired = True
+            if hard:
+                self._stalls_hard += 1
+            else:
+                self._stalls_soft += 1
+            task = asyncio.create_task(watch.on_stall(elapsed, hard))
+            self._stall_tasks.add(task)
+            task.add_done_callback(self._on_stall_done)
+
+    def _on_stall_done(self, task: asyncio.Task) -> None:
+        self._stall_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("stall 처리 실패: %s", task.exception())
+
+    def _read_all(self):
+        return _read_proc_table(self._proc_root), _read_memory_state(self._proc_root)
+
+    def _avg_turn_rss(self) -> int | None:
+        turns = [u.rss_bytes for k, u in self._usage.items() if k not in self._idle]
+        if not turns:
+            return None
+        return sum(turns) // len(turns)
+
+    def _reclaim_idle(self) -> int:
+        """유휴 프로세스 회수 (콜백이 untrack 호출) → 회수 수."""
+        reclaimed = 0
+        for key, reclaim in list(self._idle.items()):
+            try:
+                reclaim()
+            except Exception as e:
+                logger.warning("%s: 유휴 프로세스 회수 실패: %s", key, e)
+            self.untrack(key)
+            reclaimed += 1
+        self._reclaimed += reclaimed
+        return reclaimed
+
+    def _adjust_limit(self, now: float) -> None:
+        """메모리 압박 시 곱셈 감소, 해소 시 메모리 예산 내에서 1씩 증가."""
+        scheduler = self._scheduler
+        if scheduler is None:
+            return
+        current = scheduler.limit
+        starved = self._available is not None and self._available < self._reserve
+        pressured = (
+            self._pressure is not None and self._pressure >= self._pressure_high
+        )
+        if starved or pressured:
+            if now - self._last_decrease < _DECREASE_COOLDOWN:
+                return
+            reclaimed = self._reclaim_idle()
+            if reclaimed:
+                # 유휴 프로세스 종료가 먼저 — 효과는 다음 창에서 판단
+                self._last_decrease = now
+                logger.warning(
+                    "메모리 압박 — 유휴 프로세스 %d개 회수 (PSI=%s, 가용=%sMB)",
+                    reclaimed,
+                    self._pressure,
+                    self._available // (1024 * 1024) if self._available else None,
+                )
+                return
+            target = max(self._min_limit, min(current - 1, scheduler.running * 3 // 4))
+            if target < current:
+                self._last_decrease = now
+                self._decreases += 1
+                scheduler.set_limit(target)
+                logger.warning(
+                    "메모리 압박 — 동시 실행 한도 %d → %d (PSI=%s, 가용=%sMB)",
+                    current,
+                    target,
+                    self._pressure,
+                    self._available // (1024 * 1024) if self._available else None,
+                )
+            return
+
+        if current >= self._max_limit:
+            return
+        if self._pressure is not None and self._pressure > self._pressure_low:
+            return
+        target = current + 1
+        per_turn = self._avg_turn_rss()
+        if per_turn and self._available is not None:
+            budget = scheduler.running + (self._available - self._reserve) // per_turn
+            target = min(target, max(self._min_limit, int(budget)))
+        if target > current:
+            self._increases += 1
+            scheduler.set_limit(target)
+
+    def get_metrics(self) -> dict:
+        """메모리 압박, 동시 실행 한도 조정 횟수, 세션별 프로세스 트리 사용량."""
+        total_rss = sum(u.rss_bytes for u in self._usage.values())
+        idle_rss = sum(u.rss_bytes for k, u in self._usage.items() if k in self._idle)
+        return {
+            "enabled": self.enabled,
+            "samples": self._samples,
+            "last_sample_ms": self._sample_ms,
+            "memory_pressure_avg10": self._pressure,
+            "memory_available_mb": (
+                self._available // (1024 * 1024) if self._available else None
+            ),
+            "limit_decreases": self._decreases,
+            "limit_increases": self._increases,
+            "idle_reclaimed": self._reclaimed,
+            "tracked": len(self._tracked),
+            "stall_watches": len(self._stall_watches),
+            "stalls_soft": self._stalls_soft,
+            "stalls_hard": self._stalls_hard,
+            "stalls_graced": self._stalls_graced,
+            "total_rss_mb": round(total_rss / (1024 * 1024), 1),
+            "idle_tracked": len(self._idle),
+            "idle_rss_mb": round(idle_rss / (1024 * 1024), 1),
+            "sessions": {
+                key: {
+                    "pid": u.pid,
+                    "processes": u.processes,
+                    "rss_mb": round(u.rss_bytes / (1024 * 1024), 1),
+                    "cpu_percent": u.cpu_percent,
+                    "idle_seconds": round(u.sampled_at - u.active_at, 1),
+                }
+                for key, u in self._usage.items()
+            },
+        }
@@ -1,5 +1,11 @@
 """세션 검색/필터 서비스."""
 
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.core.exceptions import ValidationError
 from app.repositories.search_repo import SearchRepository
 from app.repositories.tag_repo import TagRepository
 from app.schemas.session import SessionInfo
@@ -7,6 +13,21 @@ from app.schemas.tag import TagInfo
 from app.services.base import DBService
 
 
+def _encode_cursor(key: tuple[datetime, str]) -> str:
+    """keyset (created_at, id) → 불투명 커서 문자열."""
+    raw = json.dumps([key[0].isoformat(), key[1]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(session_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValidationError("유효하지 않은 cursor입니다") from e
+
+
 class SearchService(DBService):
     """PostgreSQL tsvector 기반 세션 검색/필터/정렬/페이징 처리."""
 
@@ -26,13 +47,23 @@ class SearchService(DBService):
         limit: int = 50,
         offset: int = 0,
         include_tags: bool = False,
+        cursor: str | None = None,
+        total_mode: str = "exact",
     ) -> dict:
+        after = None
+        if cursor:
+            if sort != "created_at":
+                raise ValidationError("cursor는 created_at 정렬에서만 사용할 수 있습니다")
+            after = _decode_cursor(cursor)
+            offset = 0
+        estimate_total = total_mode == "estimated"
+
         async with self._session_scope(SearchRepository, TagRepository) as (
             session,
             search_repo,
             tag_repo,
         ):
-            items_raw, total = await search_repo.search_sessions(
+            items_raw, total, next_key = await search_repo.search_sessions(
                 q=q,
                 fts_query=fts_query,
                 status=status,
@@ -45,6 +76,8 @@ class SearchService(DBService):
                 order=order,
                 limit=limit,
                 offset=offset,
+                after=after,
+                estimate_total=estimate_total,
             )
 
             # 태그 포함
@@ -67,4 +100,6 @@ class SearchService(DBService):
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": _encode_cursor(next_key) if next_key else None,
+            "total_estimated": estimate_total,
         }
@@ -6,15 +6,19 @@ SessionManager는 파사드로서 내부 서브 서비스에 위임합니다:
 """
 
 import asyncio
+import copy
+import json
 import shutil
+import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 import structlog
 from datetime import datetime
 from pathlib import Path
 
 from app.core.exceptions import NotFoundError
+from app.core.executors import ExecutorKind, run_in_executor
 from app.core.utils import utc_now
 from app.models.session import Session, SessionStatus
 from app.repositories.event_repo import EventRepository
@@ -25,12 +29,29 @@ from app.repositories.token_snapshot_repo import TokenSnapshotRepository
 from app.schemas.session import SessionInfo
 from app.services.base import DBService
 from app.services.session_process_manager import SessionProcessManager
+from app.services.spill_journal import SpillJournal
 
 logger = structlog.get_logger(__name__)
 
 
 _UNSET = object()  # 센티넬: "전달되지 않음" vs "명시적 None" 구분
 
+# 세션 매니저를 거치지 않고 갱신되는 컬럼 (리포지토리 카운터 증감, clear_history,
+# pending_questions) → 상태 캐시에 두면 TTL 동안 stale하므로 캐시 행에서 제외
+_UNCACHED_COLUMNS = ("message_count", "file_changes_count", "pending_question")
+
+
+def _cacheable_row(row: dict) -> dict:
+    return {k: v for k, v in row.items() if k not in _UNCACHED_COLUMNS}
+
+
+def _copy_row(row: dict) -> dict:
+    """캐시 행 사본 (JSONB list/dict 값까지 복사해 호출자 수정이 캐시에 번지지 않도록)."""
+    return {
+        k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v
+        for k, v in row.items()
+    }
+
 
 class SessionManager(DBService):
     """PostgreSQL 기반 세션 저장소 및 관리 (파사드).
@@ -38,10 +59,28 @@ class SessionManager(DBService):
     프로세스 관리는 SessionProcessManager에 위임합니다.
     """
 
-    def __init__(self, db, upload_dir: str = ""):
+    def __init__(
+        self,
+        db,
+        upload_dir: str = "",
+        spill_journal: SpillJournal | None = None,
+        cache_ttl: float = 300.0,
+        cache_max_entries: int = 1000,
+    ):
         super().__init__(db)
         self._upload_dir = upload_dir
         self._process_manager = SessionProcessManager()
+        # 세션 상태 캐시 (LRU, write-through): session_id → (만료 시각, dict)
+        # SessionManager 경유 쓰기는 캐시에 즉시 반영되므로 활성 세션은 DB 재조회 불필요.
+        # 우회 쓰기(워크스페이스 삭제 시 FK SET NULL 등)는 TTL로 흡수
+        self._row_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._row_cache_ttl = cache_ttl
+        self._row_cache_max = cache_max_entries
+        # 쓰기 세대: 조회 중 쓰기가 일어나면 조회 결과(stale)를 캐시하지 않음
+        self._row_cache_epoch: int = 0
+        self._row_cache_hits: int = 0
+        self._row_cache_misses: int = 0
+        self._row_cache_writes: int = 0
         # 메시지 배치 큐 + 배치 라이터
         self._message_queue: asyncio.Queue | None = None
         self._message_flush_task: asyncio.Task | None = None
@@ -50,6 +89,10 @@ class SessionManager(DBService):
         # 파일 변경 배치 큐
         self._file_change_queue: asyncio.Queue | None = None
         self._file_change_flush_task: asyncio.Task | None = None
+        # DB 장애 시 메시지/파일 변경 배치를 흡수하는 spill 저널
+        self._spill_journal = spill_journal
+        self._spill_replay_failures: int = 0
+        self._messages_dropped: int = 0
 
     def start_message_batch_writer(
         self, maxsize: int = 50000, flush_interval: float = 0.15
@@ -82,6 +125,12 @@ class SessionManager(DBService):
             except asyncio.CancelledError:
                 pass
         await self._flush_file_changes()
+        # 종료 시점에도 저장 못한 재시도 메시지는 저널로 이관 (재시작 후 replay)
+        if self._message_retry_batch and self._spill_journal:
+            await self._spill_records("message", self._message_retry_batch)
+            self._message_retry_batch = []
+        if self._spill_journal:
+            await self._spill_journal.close()
 
     async def _message_batch_writer_loop(self) -> None:
         """주기적으로 큐의 메시지를 배치 DB 저장."""
@@ -111,6 +160,11 @@ class SessionManager(DBService):
                 batch.append(msg)
             except asyncio.QueueEmpty:
                 break
+        # spill 저널 replay (DB 미복구 시 새 배치도 저널 뒤에 이어 기록 — 순서 보장)
+        if self._spill_journal and self._spill_journal.pending:
+            if not await self._replay_spilled():
+                await self._spill_records("message", batch)
+                return
         if not batch:
             return
 
@@ -161,6 +215,7 @@ class SessionManager(DBService):
             by_session[m.get("session_id", "")].append(m)
 
         retryable: list[dict] = []
+        exhausted: list[dict] = []
         for sid, msgs in by_session.items():
             try:
                 clean = [
@@ -175,14 +230,18 @@ class SessionManager(DBService):
                     if m["_retry_count"] <= self._MAX_MSG_RETRIES:
                         retryable.append(m)
                     else:
+                        exhausted.append(m)
                         logger.error(
-                            "메시지 드롭 (재시도 %d회 초과)",
+                            "메시지 재시도 %d회 초과 — spill 저널로 이관",
                             self._MAX_MSG_RETRIES,
                             session_id=sid,
                             message_type=m.get("message_type"),
                             exc_info=True,
                         )
 
+        if exhausted:
+            await self._spill_records("message", exhausted)
+
         if retryable:
             session_ids = list({m.get("session_id", "?") for m in retryable})
             logger.warning(
@@ -227,14 +286,114 @@ class SessionManager(DBService):
                 break
         if not batch:
             return
+        # 저널 미전달분이 있으면 순서 보장을 위해 저널 뒤에 이어 기록 (replay는 메시지 라이터 담당)
+        if self._spill_journal and self._spill_journal.pending:
+            await self._spill_records("file_change", batch)
+            return
         try:
             async with self._session_scope(FileChangeRepository) as (session, repo):
                 await repo.add_batch(batch)
                 await session.commit()
         except Exception:
             logger.warning(
-                "파일 변경 배치 저장 실패 (%d건 드롭)", len(batch), exc_info=True
+                "파일 변경 배치 저장 실패 (%d건 spill)", len(batch), exc_info=True
+            )
+            await self._spill_records("file_change", batch)
+
+    # --- spill 저널 (DB 장애 시 메시지/파일 변경 보존) ---
+
+    @staticmethod
+    def _encode_spill_record(kind: str, record: dict) -> bytes:
+        """메시지/파일 변경 dict → 저널 바이트 (내부 _ 키 제외, datetime은 ISO 문자열)."""
+        data = {k: v for k, v in record.items() if not k.startswith("_")}
+        ts = data.get("timestamp")
+        if isinstance(ts, datetime):
+            data["timestamp"] = ts.isoformat()
+        return json.dumps({"kind": kind, "data": data}, ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    @staticmethod
+    def _decode_spill_record(raw: bytes) -> tuple[str, dict]:
+        record = json.loads(raw)
+        data = record["data"]
+        if isinstance(data.get("timestamp"), str):
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return record["kind"], data
+
+    async def _spill_records(self, kind: str, batch: list[dict]) -> None:
+        """전달 불가 배치를 spill 저널에 기록. 저널이 없거나 거부되면 드롭 집계."""
+        if not batch:
+            return
+        if not self._spill_journal:
+            logger.error("spill 저널 미설정 — %s %d건 드롭", kind, len(batch))
+            self._messages_dropped += len(batch)
+            return
+        try:
+            accepted = await self._spill_journal.append(
+                [self._encode_spill_record(kind, r) for r in batch]
+            )
+        except Exception:
+            logger.error("spill 저널 기록 실패 — %s %d건 드롭", kind, len(batch), exc_info=True)
+            accepted = 0
+        self._messages_dropped += len(batch) - accepted
+
+    async def _deliver_spilled(self, records: list[bytes]) -> None:
+        """저널 레코드를 단일 트랜잭션으로 저장 (삭제된 세션 레코드는 제외)."""
+        decoded = [self._decode_spill_record(r) for r in records]
+        session_ids = {data.get("session_id") for _, data in decoded}
+        async with self._session_scope(
+            SessionRepository, MessageRepository, FileChangeRepository
+        ) as (session, sess_repo, msg_repo, fc_repo):
+            existing = await sess_repo.existing_ids(session_ids)
+            messages = [
+                d for k, d in decoded if k == "message" and d.get("session_id") in existing
+            ]
+            file_changes = [
+                d
+                for k, d in decoded
+                if k == "file_change" and d.get("session_id") in existing
+            ]
+            await msg_repo.add_batch(messages)
+            await fc_repo.add_batch(file_changes)
+            await session.commit()
+
+    async def _replay_spilled(self) -> bool:
+        """spill 저널 replay. 저널이 완전히 비워지면 True."""
+        try:
+            await self._spill_journal.replay(self._deliver_spilled)
+            self._spill_replay_failures = 0
+            return True
+        except Exception as e:
+            self._spill_replay_failures += 1
+            logger.warning(
+                "spill 메시지 replay 실패 (%d회, 잔여 %d건): %s",
+                self._spill_replay_failures,
+                self._spill_journal.pending,
+                e,
             )
+            # DB는 정상인데 반복 실패 → head 배치가 불량(poison)이므로 폐기
+            if (
+                self._spill_replay_failures > self._MAX_MSG_RETRIES
+                and await self._db.ping()
+            ):
+                discarded = await self._spill_journal.discard_head()
+                logger.error("spill 메시지 replay 반복 실패 — head %d건 폐기", discarded)
+                self._messages_dropped += discarded
+                self._spill_replay_failures = 0
+            return False
+
+    def get_batch_metrics(self) -> dict:
+        """메시지 배치 큐 + spill 저널 메트릭."""
+        return {
+            "size": self._message_queue.qsize() if self._message_queue else 0,
+            "maxsize": self._message_queue.maxsize if self._message_queue else 0,
+            "retry_batch_size": len(self._message_retry_batch),
+            "dropped": self._messages_dropped,
+            "spill": (
+                self._spill_journal.get_metrics() if self._spill_journal else None
+            ),
+        }
 
     def queue_file_change(
         self, session_id: str, tool: str, file: str, timestamp: "str | datetime"
@@ -316,14 +475,73 @@ class SessionManager(DBService):
             workspace_id=workspace_id,
             workflow_enabled=True,
         )
+        self._cache_put(sid, result)
         return result
 
     async def get(self, session_id: str) -> dict:
+        """세션 행 조회 (상태 캐시 우선). 호출자가 수정해도 되도록 사본 반환.
+
+        매니저를 거치지 않고 갱신되는 컬럼(_UNCACHED_COLUMNS)은 포함하지 않습니다.
+        개수는 get_with_counts(), 대기 질문은 pending_questions를 사용하세요.
+        """
+        cached = self._row_cache.get(session_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self._row_cache.move_to_end(session_id)
+            self._row_cache_hits += 1
+            return _copy_row(cached[1])
+        self._row_cache_misses += 1
+        epoch = self._row_cache_epoch
         async with self._session_scope(SessionRepository) as (session, repo):
             entity = await repo.get_by_id(session_id)
             if not entity:
                 raise NotFoundError(f"세션을 찾을 수 없습니다: {session_id}")
-            return _session_to_dict(entity)
+            row = _cacheable_row(_session_to_dict(entity))
+        if epoch == self._row_cache_epoch:
+            self._cache_store(session_id, row)
+        return _copy_row(row)
+
+    def _cache_store(self, session_id: str, row: dict) -> None:
+        if self._row_cache_ttl <= 0:
+            return
+        self._row_cache[session_id] = (time.monotonic() + self._row_cache_ttl, row)
+        self._row_cache.move_to_end(session_id)
+        while len(self._row_cache) > self._row_cache_max:
+            self._row_cache.popitem(last=False)
+
+    def _cache_put(self, session_id: str, row: dict) -> None:
+        """DB 커밋 완료된 최신 행으로 캐시 교체 (write-through)."""
+        self._row_cache_epoch += 1
+        self._row_cache_writes += 1
+        self._cache_store(session_id, _copy_row(_cacheable_row(row)))
+
+    def _cache_patch(self, session_id: str, **fields) -> None:
+        """캐시된 행의 일부 필드만 갱신 (write-through). 미캐시 세션은 무시."""
+        self._row_cache_epoch += 1
+        cached = self._row_cache.get(session_id)
+        if cached is None:
+            return
+        self._row_cache_writes += 1
+        self._cache_store(session_id, {**cached[1], **_copy_row(fields)})
+
+    def invalidate_cache(self, session_id: str | None = None) -> None:
+        """세션 상태 캐시 무효화. session_id=None이면 전체."""
+        self._row_cache_epoch += 1
+        if session_id is None:
+            self._row_cache.clear()
+        else:
+            self._row_cache.pop(session_id, None)
+
+    def get_cache_metrics(self) -> dict:
+        """세션 상태 캐시 hit/miss 메트릭."""
+        lookups = self._row_cache_hits + self._row_cache_misses
+        return {
+            "size": len(self._row_cache),
+            "max_entries": self._row_cache_max,
+            "hits": self._row_cache_hits,
+            "misses": self._row_cache_misses,
+            "hit_rate": round(self._row_cache_hits / lookups, 4) if lookups else 0.0,
+            "write_through": self._row_cache_writes,
+        }
 
     async def exists(self, session_id: str) -> bool:
         """세션 존재 여부만 확인 (경량 쿼리)."""
@@ -362,6 +580,8 @@ class SessionManager(DBService):
                 for sid in stale_ids:
                     await repo.update_status(sid, SessionStatus.IDLE)
                 await session.commit()
+        for sid in stale_ids:
+            self._cache_patch(sid, status=SessionStatus.IDLE.value)
 
         for sid in stale_ids:
             logger.warning(
@@ -435,6 +655,7 @@ class SessionManager(DBService):
         async with self._session_scope(SessionRepository) as (session, repo):
             deleted = await repo.delete_by_id(session_id)
             await session.commit()
+        self.invalidate_cache(session_id)
         if not deleted:
             raise NotFoundError(f"세션을 찾을 수 없습니다: {session_id}")
         # 검증 재시도 카운터 정리
@@ -446,7 +667,9 @@ class SessionManager(DBService):
             upload_path = Path(self._upload_dir) / session_id
             if upload_path.exists():
                 try:
-                    await asyncio.to_thread(shutil.rmtree, upload_path)
+                    await run_in_executor(
+                        ExecutorKind.FS_SCAN, shutil.rmtree, upload_path
+                    )
                     logger.info("업로드 디렉토리 삭제: %s", upload_path)
                 except OSError as e:
                     logger.warning("업로드 디렉토리 삭제 실패: %s - %s", upload_path, e)
@@ -488,6 +711,10 @@ class SessionManager(DBService):
                 raise NotFoundError(f"세션을 찾을 수 없습니다: {session_id}")
             await repo.update_status(session_id, status)
             await session.commit()
+        self._cache_patch(
+            session_id,
+            status=status.value if isinstance(status, SessionStatus) else status,
+        )
         logger.info(
             "세션 상태 변경",
             component="session",
@@ -499,6 +726,7 @@ class SessionManager(DBService):
         async with self._session_scope(SessionRepository) as (session, repo):
             await repo.update_claude_session_id(session_id, claude_session_id)
             await session.commit()
+        self._cache_patch(session_id, claude_session_id=claude_session_id)
 
     async def find_by_claude_session_id(self, claude_session_id: str) -> dict | None:
         """claude_session_id로 세션 조회."""
@@ -681,7 +909,9 @@ class SessionManager(DBService):
             if not entity:
                 raise NotFoundError(f"세션을 찾을 수 없습니다: {session_id}")
             await session.commit()
-            return _session_to_dict(entity)
+            result = _session_to_dict(entity)
+        self._cache_put(session_id, result)
+        return result
 
     @staticmethod
     def to_info(session: dict) -> SessionInfo:
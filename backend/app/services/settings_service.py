@@ -1,18 +1,62 @@
 """글로벌 설정 관리 서비스."""
 
+import copy
 import logging
+import time
+from collections.abc import Callable
 
+from app.core.database import Database
 from app.repositories.settings_repo import SettingsRepository
 from app.services.base import DBService
 
 logger = logging.getLogger(__name__)
 
 
+def _copy_settings(row: dict) -> dict:
+    """설정 사본 (JSONB list/dict 값까지 복사해 호출자 수정이 캐시에 번지지 않도록)."""
+    return {
+        k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v
+        for k, v in row.items()
+    }
+
+
 class SettingsService(DBService):
     """글로벌 기본 설정 조회/수정 서비스."""
 
+    def __init__(self, db: Database, cache_ttl: float = 5.0) -> None:
+        super().__init__(db)
+        # 프롬프트마다 조회되는 단일 행 → read-through 캐시 (update 시 무효화)
+        self._cache: tuple[float, dict] | None = None
+        self._cache_ttl = cache_ttl
+        self._cache_epoch: int = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        """설정 변경(캐시 무효화) 시 호출할 콜백 등록 (파생 캐시 무효화용)."""
+        self._listeners.append(callback)
+
+    def invalidate_cache(self) -> None:
+        """글로벌 설정 캐시 무효화."""
+        self._cache_epoch += 1
+        self._cache = None
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception:
+                logger.warning("설정 변경 콜백 실패", exc_info=True)
+
     async def get(self) -> dict:
         """글로벌 설정을 딕셔너리로 반환. JSONB 필드는 이미 Python 객체."""
+        cached = self._cache
+        if cached is not None and cached[0] > time.monotonic():
+            return _copy_settings(cached[1])
+        epoch = self._cache_epoch
+        result = await self._load()
+        if result and epoch == self._cache_epoch and self._cache_ttl > 0:
+            self._cache = (time.monotonic() + self._cache_ttl, _copy_settings(result))
+        return result
+
+    async def _load(self) -> dict:
         async with self._session_scope(SettingsRepository) as (session, repo):
             entity = await repo.get_default()
             if not entity:
@@ -91,6 +135,7 @@ class SettingsService(DBService):
         async with self._session_scope(SettingsRepository) as (session, repo):
             entity = await repo.update_settings(**kwargs)
             await session.commit()
+            self.invalidate_cache()
             if not entity:
                 return {}
             return {
@@ -3,10 +3,10 @@
 .claude/commands/*.md 파일을 스캔하여 사용 가능한 Skills 목록을 반환합니다.
 """
 
-import asyncio
 import logging
 from pathlib import Path
 
+from app.core.executors import ExecutorKind, run_in_executor
 from app.schemas.filesystem import (
     SkillInfo,
     SkillListResponse,
@@ -73,7 +73,7 @@ class SkillsService:
 
             return results
 
-        skills = await asyncio.to_thread(_scan_skills, path)
+        skills = await run_in_executor(ExecutorKind.FS_SCAN, _scan_skills, path)
         return SkillListResponse(skills=skills)
 
 
@@ -0,0 +1,360 @@
+"""DB 배치 저장 실패 시 레코드를 흡수하는 로컬 append-only spill 저널.
+
+Postgres 장애(failover 등) 동안 전달할 수 없는 배치를 버리지 않고
+세그먼트 파일에 기록했다가, DB 복구 후 기록 순서대로 replay합니다.
+
+- 레코드 포맷: 4바이트 big-endian 길이 + 직렬화된 바이트 (length-prefixed)
+- 세그먼트: ``{index:010d}.seg`` — segment_max_bytes 초과 시 새 세그먼트로 롤오버
+- 커서: ``cursor.json`` — replay 완료 위치 (재시작 시 이어서 replay)
+- 디스크 쿼터: max_bytes 초과분은 거부 (호출자가 드롭으로 집계)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_LEN = struct.Struct(">I")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor.json"
+# replay 속도 계산 윈도우 (초)
+_RATE_WINDOW = 60.0
+
+
+class SpillJournal:
+    """세그먼트 파일 기반 write-ahead spill 저널.
+
+    단일 이벤트 루프에서 사용하며, 파일 I/O는 asyncio.to_thread로 오프로드합니다.
+    replay는 at-least-once: 커서 기록 전 크래시 시 마지막 배치가 재전달될 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        name: str = "",
+    ):
+        self._dir = Path(directory)
+        self._max_bytes = max_bytes
+        self._segment_max_bytes = segment_max_bytes
+        self._name = name or self._dir.name
+        self._lock = asyncio.Lock()
+        # 세그먼트 인덱스 (오래된 순)
+        self._segments: deque[int] = deque()
+        self._segment_sizes: dict[int, int] = {}
+        # replay 커서: (세그먼트 인덱스, 바이트 오프셋)
+        self._cursor_segment: int = 0
+        self._cursor_offset: int = 0
+        self._writer = None
+        self._writer_segment: int | None = None
+        # 관측성 카운터
+        self._pending_records: int = 0
+        self._pending_bytes: int = 0
+        self._appended_total: int = 0
+        self._replayed_total: int = 0
+        self._rejected_total: int = 0
+        self._discarded_total: int = 0
+        self._replay_samples: deque[tuple[float, int]] = deque()
+        self._opened = False
+
+    # ── 라이프사이클 ──
+
+    async def open(self) -> None:
+        """디렉토리 준비 + 기존 세그먼트/커서 복원 (이전 프로세스 잔여분 replay 대상)."""
+        async with self._lock:
+            await asyncio.to_thread(self._open_sync)
+        if self._pending_records:
+            logger.warning(
+                "spill 저널 '%s': 미전달 레코드 %d건 복원 (%d bytes)",
+                self._name,
+                self._pending_records,
+                self._pending_bytes,
+            )
+
+    def _open_sync(self) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        cursor_segment, cursor_offset = self._load_cursor()
+        indices = sorted(
+            int(p.stem)
+            for p in self._dir.glob(f"*{_SEGMENT_SUFFIX}")
+            if p.stem.isdigit()
+        )
+        for idx in indices:
+            path = self._segment_path(idx)
+            # 커서 이전 세그먼트는 이미 전달 완료 → 삭제
+            if idx < cursor_segment:
+                path.unlink(missing_ok=True)
+                continue
+            start = cursor_offset if idx == cursor_segment else 0
+            count, valid_size = self._scan_segment(path, start)
+            self._segments.append(idx)
+            self._segment_sizes[idx] = valid_size
+            self._pending_records += count
+            self._pending_bytes += max(valid_size - start, 0)
+        if self._segments and self._segments[0] == cursor_segment:
+            self._cursor_segment, self._cursor_offset = cursor_segment, cursor_offset
+        elif self._segments:
+            self._cursor_segment, self._cursor_offset = self._segments[0], 0
+        self._opened = True
+
+    def _scan_segment(self, path: Path, start: int) -> tuple[int, int]:
+        """세그먼트의 (start 이후 레코드 수, 유효 크기) 반환. 잘린 꼬리 레코드는 절단."""
+        count = 0
+        with path.open("rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + _LEN.size <= len(data):
+            (length,) = _LEN.unpack_from(data, offset)
+            end = offset + _LEN.size + length
+            if end > len(data):
+                break
+            if offset >= start:
+                count += 1
+            offset = end
+        if offset < len(data):
+            # 크래시로 인한 부분 기록 → 유효 경계까지 truncate
+            logger.warning(
+                "spill 저널 '%s': 손상된 꼬리 레코드 절단 (%s, %d bytes)",
+                self._name,
+                path.name,
+                len(data) - offset,
+            )
+            with path.open("r+b") as f:
+                f.truncate(offset)
+        return count, offset
+
+    async def close(self) -> None:
+        """열린 세그먼트 파일 닫기."""
+        async with self._lock:
+            await asyncio.to_thread(self._close_writer)
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except OSError:
+                logger.debug("spill 세그먼트 닫기 실패", exc_info=True)
+            self._writer = None
+            self._writer_segment = None
+
+    # ── 상태 ──
+
+    @property
+    def pending(self) -> int:
+        """replay 대기 중인 레코드 수."""
+        return self._pending_records
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def _segment_path(self, idx: int) -> Path:
+        return self._dir / f"{idx:010d}{_SEGMENT_SUFFIX}"
+
+    def _load_cursor(self) -> tuple[int, int]:
+        path = self._dir / _CURSOR_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return int(data["segment"]), int(data["offset"])
+        except FileNotFoundError:
+            return 0, 0
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("spill 저널 '%s': 커서 파일 손상 — 처음부터 replay", self._name)
+            return 0, 0
+
+    def _save_cursor(self) -> None:
+        path = self._dir / _CURSOR_FILE
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"segment": self._cursor_segment, "offset": self._cursor_offset}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+
+    # ── 기록 ──
+
+    async def append(self, records: list[bytes]) -> int:
+        """레코드를 순서대로 기록하고 수용된 개수 반환. 쿼터 초과분은 거부."""
+        if not records:
+            return 0
+        async with self._lock:
+            accepted = await asyncio.to_thread(self._append_sync, records)
+        rejected = len(records) - accepted
+        if rejected:
+            self._rejected_total += rejected
+            logger.error(
+                "spill 저널 '%s' 디스크 쿼터 초과 — %d건 거부 (pending %d bytes / max %d)",
+                self._name,
+                rejected,
+                self._pending_bytes,
+                self._max_bytes,
+            )
+        return accepted
+
+    def _append_sync(self, records: list[bytes]) -> int:
+        if not self._opened:
+            self._open_sync()
+        accepted = 0
+        try:
+            for data in records:
+                size = _LEN.size + len(data)
+                if self._pending_bytes + size > self._max_bytes:
+                    break
+                writer = self._ensure_writer(size)
+                writer.write(_LEN.pack(len(data)))
+                writer.write(data)
+                self._segment_sizes[self._writer_segment] += size
+                self._pending_bytes += size
+                self._pending_records += 1
+                accepted += 1
+        finally:
+            if self._writer is not None:
+                self._writer.flush()
+                os.fsync(self._writer.fileno())
+        self._appended_total += accepted
+        return accepted
+
+    def _ensure_writer(self, next_size: int):
+        """활성 세그먼트 writer 반환. 크기 초과 시 새 세그먼트로 롤오버."""
+        if self._writer is not None and self._writer_segment is not None:
+            current = self._segment_sizes.get(self._writer_segment, 0)
+            if current + next_size <= self._segment_max_bytes or current == 0:
+                return self._writer
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._close_writer()
+
+        idx = self._segments[-1] + 1 if self._segments else self._cursor_segment
+        if self._segments and self._writer is None:
+            # 재시작 직후: 마지막 세그먼트에 여유가 있으면 이어쓰기
+            last = self._segments[-1]
+            if self._segment_sizes.get(last, 0) + next_size <= self._segment_max_bytes:
+                idx = last
+        if idx not in self._segment_sizes:
+            self._segments.append(idx)
+            self._segment_sizes[idx] = 0
+            if len(self._segments) == 1:
+                self._cursor_segment, self._cursor_offset = idx, 0
+        self._writer = self._segment_path(idx).open("ab")
+        self._writer_segment = idx
+        return self._writer
+
+    # ── replay ──
+
+    def _read_head_sync(self, max_records: int) -> tuple[list[bytes], int]:
+        """커서 위치에서 최대 max_records개 읽기. (records, 새 오프셋) 반환."""
+        if not self._segments:
+            return [], 0
+        idx = self._cursor_segment
+        size = self._segment_sizes.get(idx, 0)
+        records: list[bytes] = []
+        offset = self._cursor_offset
+        if offset >= size:
+            return records, offset
+        with self._segment_path(idx).open("rb") as f:
+            f.seek(offset)
+            buf = f.read(size - offset)
+        pos = 0
+        view = memoryview(buf)
+        while pos + _LEN.size <= len(buf) and len(records) < max_records:
+            (length,) = _LEN.unpack_from(buf, pos)
+            start = pos + _LEN.size
+            records.append(bytes(view[start : start + length]))
+            pos = start + length
+        return records, offset + pos
+
+    def _advance_sync(self, new_offset: int, count: int) -> None:
+        """커서를 전진시키고 완전히 소비된 세그먼트를 삭제."""
+        consumed = new_offset - self._cursor_offset
+        self._cursor_offset = new_offset
+        self._pending_records -= count
+        self._pending_bytes -= consumed
+        idx = self._cursor_segment
+        if new_offset >= self._segment_sizes.get(idx, 0):
+            if self._writer_segment == idx:
+                self._close_writer()
+            self._segment_path(idx).unlink(missing_ok=True)
+            self._segment_sizes.pop(idx, None)
+            if self._segments and self._segments[0] == idx:
+                self._segments.popleft()
+            if self._segments:
+                self._cursor_segment, self._cursor_offset = self._segments[0], 0
+            else:
+                # 저널이 비었음 → 다음 세그먼트 인덱스부터 재시작
+                self._cursor_segment, self._cursor_offset = idx + 1, 0
+        self._save_cursor()
+
+    async def replay(
+        self,
+        deliver: Callable[[list[bytes]], Awaitable[None]],
+        *,
+        batch_size: int = 1000,
+    ) -> int:
+        """미전달 레코드를 기록 순서대로 deliver에 전달하고 전달 건수 반환.
+
+        deliver가 예외를 던지면 커서를 유지한 채 예외를 전파합니다 (다음 호출에서 재시도).
+        """
+        replayed = 0
+        async with self._lock:
+            while self._pending_records > 0:
+                records, new_offset = await asyncio.to_thread(
+                    self._read_head_sync, batch_size
+                )
+                if not records:
+                    # 빈 세그먼트 (롤오버 직후 등) → 다음 세그먼트로
+                    await asyncio.to_thread(self._advance_sync, new_offset, 0)
+                    if not self._segments:
+                        break
+                    continue
+                await deliver(records)
+                await asyncio.to_thread(self._advance_sync, new_offset, len(records))
+                replayed += len(records)
+                self._replayed_total += len(records)
+                self._replay_samples.append((time.monotonic(), len(records)))
+        if replayed:
+            logger.info("spill 저널 '%s': %d건 replay 완료", self._name, replayed)
+        return replayed
+
+    async def discard_head(self, max_records: int = 1000) -> int:
+        """replay가 반복 실패하는 head 배치(poison)를 폐기하고 폐기 건수 반환."""
+        async with self._lock:
+            records, new_offset = await asyncio.to_thread(
+                self._read_head_sync, max_records
+            )
+            await asyncio.to_thread(self._advance_sync, new_offset, len(records))
+        self._discarded_total += len(records)
+        return len(records)
+
+    # ── 메트릭 ──
+
+    def _replay_rate(self) -> float:
+        now = time.monotonic()
+        while self._replay_samples and now - self._replay_samples[0][0] > _RATE_WINDOW:
+            self._replay_samples.popleft()
+        total = sum(n for _, n in self._replay_samples)
+        return round(total / _RATE_WINDOW, 2)
+
+    def get_metrics(self) -> dict:
+        """spill 깊이 + replay 속도 메트릭 반환."""
+        return {
+            "pending_records": self._pending_records,
+            "pending_bytes": self._pending_bytes,
+            "max_bytes": self._max_bytes,
+            "segments": len(self._segments),
+            "appended_total": self._appended_total,
+            "replayed_total": self._replayed_total,
+            "replay_rate_per_sec": self._replay_rate(),
+            "rejected_total": self._rejected_total,
+            "discarded_total": self._discarded_total,
+        }
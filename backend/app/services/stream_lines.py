@@ -0,0 +1,107 @@
+"""CLI stdout 줄 분할 (청크 단위 읽기 + 줄 묶음 반환).
+
+readline()을 줄마다 호출하면 이벤트마다 await/디코딩/strip 복사가 반복되고,
+`buffer += chunk` 후 줄을 잘라내는 방식은 긴 줄(대용량 tool_result)에서
+남은 버퍼를 매번 다시 복사해 O(n²)이 됩니다. LineSplitter는 청크를
+memoryview 오프셋으로 분할하여 줄마다 한 번만 복사하고, 줄바꿈이 오지 않은
+꼬리만 bytearray에 이어 붙입니다. LineReader는 큰 청크를 읽어 그 안의 완전한
+줄들을 한 번에 반환합니다.
+"""
+
+from collections.abc import Awaitable, Callable
+
+# 한 번에 읽을 최대 바이트
+CHUNK_SIZE = 1024 * 1024
+# 한 줄 최대 크기. 초과한 줄은 버리고 dropped_lines에 기록 (메모리 상한)
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+class LineSplitter:
+    """바이트 청크 → 완전한 줄 목록 (줄바꿈 제외)."""
+
+    def __init__(self, max_line: int = MAX_LINE_BYTES):
+        self._max_line = max_line
+        self._tail = bytearray()
+        self._skipping = False
+        self.dropped_lines = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        lines: list[bytes] = []
+        view = memoryview(chunk)
+        start = 0
+        end = chunk.find(b"\n")
+        if end < 0:
+            self._append(view)
+            return lines
+        if self._tail or self._skipping:
+            # 이전 청크에서 이어지는 줄 완성
+            if not self._skipping:
+                if len(self._tail) + end > self._max_line:
+                    self.dropped_lines += 1
+                else:
+                    self._tail += view[:end]
+                    lines.append(bytes(self._tail))
+            self._tail.clear()
+            self._skipping = False
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        while end >= 0:
+            if end > start:
+                lines.append(bytes(view[start:end]))
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        if start < len(chunk):
+            self._append(view[start:])
+        return lines
+
+    def _append(self, data: memoryview) -> None:
+        if self._skipping:
+            return
+        if len(self._tail) + len(data) > self._max_line:
+            self._tail.clear()
+            self._skipping = True
+            self.dropped_lines += 1
+            return
+        self._tail += data
+
+    def flush(self) -> list[bytes]:
+        """EOF: 줄바꿈 없이 끝난 마지막 줄."""
+        if self._skipping or not self._tail:
+            self._tail.clear()
+            self._skipping = False
+            return []
+        line = bytes(self._tail)
+        self._tail.clear()
+        return [line]
+
+
+class LineReader:
+    """read(n) 코루틴 → 줄 묶음. 빈 목록은 EOF."""
+
+    def __init__(
+        self,
+        read: Callable[[int], Awaitable[bytes]],
+        *,
+        chunk_size: int = CHUNK_SIZE,
+        max_line: int = MAX_LINE_BYTES,
+    ):
+        self._read = read
+        self._chunk_size = chunk_size
+        self._splitter = LineSplitter(max_line)
+        self._eof = False
+
+    @property
+    def dropped_lines(self) -> int:
+        return self._splitter.dropped_lines
+
+    async def read_batch(self) -> list[bytes]:
+        """완전한 줄이 하나 이상 모일 때까지 읽어 반환."""
+        while not self._eof:
+            chunk = await self._read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                return self._splitter.flush()
+            lines = self._splitter.feed(chunk)
+            if lines:
+                return lines
+        return []
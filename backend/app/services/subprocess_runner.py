@@ -0,0 +1,256 @@
+"""asyncio 네이티브 서브프로세스 실행기.
+
+`asyncio.to_thread(subprocess.run)`은 실행 중인 명령마다 기본 실행기
+스레드를 점유하여, 동시 git/gh 호출이 많으면 JsonlWatcher·파일 읽기 등
+다른 to_thread 작업까지 대기열에 밀립니다. 이 실행기는 이벤트 루프에서
+직접 자식 프로세스를 관리하며 다음을 보장합니다.
+
+- 전역 동시 실행 수 제한 + 키(저장소)별 동시 실행 수 제한
+- 타임아웃/취소 시 자식 프로세스 kill
+- 대용량 출력은 청크 단위 스트리밍
+"""
+
+import asyncio
+import logging
+import subprocess
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class SubprocessRunError(Exception):
+    """스트리밍 실행 실패 (비정상 종료 코드 또는 시간 초과)."""
+
+    def __init__(self, returncode: int, stderr: str):
+        super().__init__(stderr or f"exit code {returncode}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+class SubprocessRunner:
+    """전역/키별 동시성 제한이 있는 서브프로세스 실행기.
+
+    키별 슬롯을 먼저 얻은 뒤 전역 슬롯을 얻으므로, 한 저장소에 몰린 요청이
+    전역 슬롯을 점유한 채 대기하지 않습니다. 타임아웃은 대기열 시간을
+    제외한 실행 시간 기준입니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrency: int = 16,
+        per_key_concurrency: int = 4,
+    ):
+        self._name = name
+        self._max_concurrency = max_concurrency
+        self._per_key_concurrency = per_key_concurrency
+        self._global = asyncio.Semaphore(max_concurrency)
+        # 키 -> 세마포어 / 대기·실행 중인 사용자 수 (0이 되면 제거)
+        self._key_slots: dict[str, asyncio.Semaphore] = {}
+        self._key_users: dict[str, int] = {}
+        # 메트릭
+        self._running = 0
+        self._waiting = 0
+        self._started_total = 0
+        self._timeouts = 0
+        self._killed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @asynccontextmanager
+    async def _slot(self, key: str | None):
+        enqueued = time.monotonic()
+        key_slot: asyncio.Semaphore | None = None
+        if key is not None:
+            key_slot = self._key_slots.get(key)
+            if key_slot is None:
+                key_slot = self._key_slots[key] = asyncio.Semaphore(
+                    self._per_key_concurrency
+                )
+            self._key_users[key] = self._key_users.get(key, 0) + 1
+        self._waiting += 1
+        acquired_key = acquired_global = False
+        try:
+            if key_slot is not None:
+                await key_slot.acquire()
+                acquired_key = True
+            await self._global.acquire()
+            acquired_global = True
+            self._waiting -= 1
+
+            waited = time.monotonic() - enqueued
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._running += 1
+            self._started_total += 1
+            try:
+                yield
+            finally:
+                self._running -= 1
+        finally:
+            if not acquired_global:
+                self._waiting -= 1
+            else:
+                self._global.release()
+            if key_slot is not None:
+                if acquired_key:
+                    key_slot.release()
+                # 사용자가 없는 키의 세마포어는 정리
+                self._key_users[key] -= 1
+                if not self._key_users[key]:
+                    del self._key_users[key]
+                    del self._key_slots[key]
+
+    async def _spawn(
+        self, cmd: Sequence[str], cwd: str | None, env: dict[str, str] | None
+    ) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    async def _kill(self, proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is None:
+            self._killed += 1
+            proc.kill()
+            await proc.wait()
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: str | None = None,
+        timeout: float = 10.0,
+        key: str | None = None,
+        env: dict[str, str] | None = None,
+    ) -> tuple[int, str, str]:
+        """명령 실행 후 (returncode, stdout, stderr) 반환 (양쪽 공백 제거).
+
+        실행 파일이 없으면 (-1, "", "<name> not found"),
+        시간 초과 시 자식 프로세스를 kill하고 (-1, "", "timeout").
+        """
+        async with self._slot(key):
+            try:
+                proc = await self._spawn(cmd, cwd, env)
+            except FileNotFoundError:
+                return -1, "", f"{self._name} not found"
+            except NotImplementedError:
+                # asyncio subprocess 미지원 루프 (Windows SelectorEventLoop)
+                return await asyncio.to_thread(
+                    self._run_blocking, cmd, cwd, timeout, env
+                )
+            try:
+                out, err = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                self._timeouts += 1
+                logger.warning(
+                    "%s 명령 시간 초과 (%.0f초): %s",
+                    self._name,
+                    timeout,
+                    " ".join(cmd[:3]),
+                )
+                return -1, "", "timeout"
+            finally:
+                # 시간 초과 또는 호출자 취소 시 고아 프로세스 방지
+                await self._kill(proc)
+        return (
+            proc.returncode,
+            out.decode(errors="replace").strip(),
+            err.decode(errors="replace").strip(),
+        )
+
+    def _run_blocking(
+        self,
+        cmd: Sequence[str],
+        cwd: str | None,
+        timeout: float,
+        env: dict[str, str] | None,
+    ) -> tuple[int, str, str]:
+        try:
+            result = subprocess.run(
+                list(cmd),
+                cwd=cwd,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            return result.returncode, result.stdout.strip(), result.stderr.strip()
+        except subprocess.TimeoutExpired:
+            self._timeouts += 1
+            return -1, "", "timeout"
+        except FileNotFoundError:
+            return -1, "", f"{self._name} not found"
+
+    async def stream(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: str | None = None,
+        timeout: float = 30.0,
+        key: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """stdout을 청크 단위로 전달.
+
+        비정상 종료 또는 시간 초과(소비 시간 포함) 시 SubprocessRunError.
+        소비자가 중간에 중단하면 자식 프로세스를 kill합니다.
+        """
+        async with self._slot(key):
+            try:
+                proc = await self._spawn(cmd, cwd, None)
+            except FileNotFoundError:
+                raise SubprocessRunError(-1, f"{self._name} not found")
+            deadline = time.monotonic() + timeout
+            try:
+                assert proc.stdout is not None and proc.stderr is not None
+                # stderr 파이프가 가득 차 자식이 멈추지 않도록 병행 수집
+                stderr_task = asyncio.create_task(proc.stderr.read())
+                try:
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError
+                        chunk = await asyncio.wait_for(
+                            proc.stdout.read(_STREAM_CHUNK_SIZE), remaining
+                        )
+                        if not chunk:
+                            break
+                        yield chunk
+                    err = await stderr_task
+                    rc = await proc.wait()
+                finally:
+                    stderr_task.cancel()
+            except asyncio.TimeoutError:
+                self._timeouts += 1
+                raise SubprocessRunError(-1, f"timeout ({timeout:.0f}초)")
+            finally:
+                await self._kill(proc)
+        if rc != 0:
+            raise SubprocessRunError(rc, err.decode(errors="replace").strip())
+
+    def get_metrics(self) -> dict:
+        """실행/대기 수, 대기 시간, 시간 초과/kill 수."""
+        started = self._started_total
+        return {
+            "running": self._running,
+            "tracked_keys": len(self._key_slots),
+            "waiting": self._waiting,
+            "max_concurrency": self._max_concurrency,
+            "per_key_concurrency": self._per_key_concurrency,
+            "started_total": started,
+            "timeouts": self._timeouts,
+            "killed": self._killed,
+            "wait_ms_avg": (
+                round(self._wait_total / started * 1000, 2) if started else 0.0
+            ),
+            "wait_ms_max": round(self._wait_max * 1000, 2),
+        }
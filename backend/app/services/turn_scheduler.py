@@ -0,0 +1,326 @@
+"""Claude 턴 스케줄러 (우선순위 클래스 + 워크스페이스별 가중 공정 큐잉).
+
+asyncio.Semaphore는 대기자를 임의 순서로 깨우므로, 한 워크스페이스의
+연속 요청이나 워크플로우 자동 체이닝이 사용자 프롬프트를 밀어낼 수
+있습니다. TurnScheduler는 다음 순서로 대기 중인 턴을 실행합니다.
+
+1. 우선순위 클래스: 사용자 프롬프트 > 자동 체이닝 > PR 리뷰/분석.
+   aging_seconds마다 한 단계씩 올려 낮은 클래스의 기아를 방지
+2. 같은 클래스 안에서는 워크스페이스별 start-time fair queuing:
+   도착 시 start = max(가상 시간, 워크스페이스 직전 finish),
+   finish = start + 1/weight 태그를 부여하고 start가 작은 순으로 실행
+
+빈 슬롯이 있어도 admission 콜백이 거절 사유를 반환하면(호스트 과부하)
+실행 중인 턴이 하나 이상인 동안에는 대기시키고 주기적으로 재확인합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+# 대기 순서 변경 콜백: (1부터 시작하는 순서, 전체 대기 수)
+PositionCallback = Callable[[int, int], Awaitable[None]]
+
+
+class TurnPriority(IntEnum):
+    """턴 우선순위 클래스 (값이 작을수록 먼저 실행)."""
+
+    INTERACTIVE = 0  # 사용자 프롬프트
+    AUTO_CHAIN = 1  # 워크플로우 자동 체이닝/수정
+    BACKGROUND = 2  # PR 리뷰, 분석
+
+
+@dataclass(eq=False)
+class _Waiter:
+    key: str
+    workspace: str
+    priority: TurnPriority
+    start_tag: float
+    seq: int
+    enqueued: float
+    future: asyncio.Future
+    on_position: PositionCallback | None = None
+    position: int = 0
+
+
+@dataclass
+class _WaitStats:
+    samples: deque = field(default_factory=lambda: deque(maxlen=512))
+    count: int = 0
+    max: float = 0.0
+
+    def add(self, waited: float) -> None:
+        self.samples.append(waited)
+        self.count += 1
+        self.max = max(self.max, waited)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        p95 = ordered[int(len(ordered) * 0.95)] if ordered else 0.0
+        avg = sum(ordered) / len(ordered) if ordered else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(avg * 1000, 1),
+            "p95_ms": round(p95 * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class HostLoadAdmission:
+    """호스트 CPU 부하/가용 메모리 기반 admission 검사.
+
+    os.getloadavg()와 /proc/meminfo를 check_interval 동안 캐시합니다.
+    지원되지 않는 플랫폼에서는 항상 허용합니다.
+    """
+
+    def __init__(
+        self,
+        max_load_per_cpu: float = 2.0,
+        min_available_mb: int = 512,
+        check_interval: float = 1.0,
+    ):
+        self._max_load = max_load_per_cpu * (os.cpu_count() or 1)
+        self._min_available_kb = min_available_mb * 1024
+        self._interval = check_interval
+        self._checked_at = float("-inf")
+        self._reason: str | None = None
+
+    def __call__(self) -> str | None:
+        now = time.monotonic()
+        if now - self._checked_at >= self._interval:
+            self._checked_at = now
+            self._reason = self._check()
+        return self._reason
+
+    def _check(self) -> str | None:
+        if self._max_load > 0:
+            try:
+                load = os.getloadavg()[0]
+            except (AttributeError, OSError):
+                load = 0.0
+            if load > self._max_load:
+                return f"CPU 부하 {load:.1f} > {self._max_load:.1f}"
+        if self._min_available_kb > 0:
+            available = self._mem_available_kb()
+            if available is not None and available < self._min_available_kb:
+                return f"가용 메모리 {available // 1024}MB"
+        return None
+
+    @staticmethod
+    def _mem_available_kb() -> int | None:
+        try:
+            with open("/proc/meminfo", "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemAvailable:"):
+                        return int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            pass
+        return None
+
+
+class TurnScheduler:
+    """동시 실행 턴 수 제한 + 우선순위/공정 순서 배정."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        *,
+        weights: dict[str, float] | None = None,
+        aging_seconds: float = 60.0,
+        admission: Callable[[], str | None] | None = None,
+        admission_retry: float = 1.0,
+    ):
+        self._limit = max(1, max_concurrent)
+        self._weights = weights or {}
+        self._aging = aging_seconds
+        self._admission = admission
+        self._admission_retry = admission_retry
+        self._retry_handle: asyncio.TimerHandle | None = None
+        self._waiters: list[_Waiter] = []
+        self._running = 0
+        self._seq = 0
+        # start-time fair queuing 상태
+        self._vtime = 0.0
+        self._finish: dict[str, float] = {}
+        self._notify_tasks: set[asyncio.Task] = set()
+        # 메트릭
+        self._dispatched = 0
+        self._admission_blocks = 0
+        self._blocked_reason: str | None = None
+        self._wait_stats = {p: _WaitStats() for p in TurnPriority}
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def set_limit(self, limit: int) -> None:
+        """동시 실행 한도 변경. 줄이면 실행 중인 턴은 유지하고 새 턴만 대기."""
+        self._limit = max(1, limit)
+        self._pump()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        key: str,
+        *,
+        workspace: str | None = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+        on_position: PositionCallback | None = None,
+    ) -> AsyncIterator[float]:
+        """실행 슬롯 획득 → 대기 시간(초) 반환, 종료 시 반납."""
+        waited = await self.acquire(
+            key, workspace=workspace, priority=priority, on_position=on_position
+        )
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    async def acquire(
+        self,
+        key: str,
+        *,
+        workspace: str | None = None,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+        on_position: PositionCallback | None = None,
+    ) -> float:
+        ws = workspace or ""
+        start = max(self._vtime, self._finish.get(ws, 0.0))
+        self._finish[ws] = start + 1.0 / max(self._weights.get(ws, 1.0), 1e-3)
+        self._seq += 1
+        waiter = _Waiter(
+            key=key,
+            workspace=ws,
+            priority=priority,
+            start_tag=start,
+            seq=self._seq,
+            enqueued=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+            on_position=on_position,
+        )
+        self._waiters.append(waiter)
+        self._pump()
+        if not waiter.future.done():
+            logger.info(
+                "턴 대기: %s (priority=%s, 실행 %d/%d, 대기 %d)",
+                key,
+                priority.name,
+                self._running,
+                self._limit,
+                len(self._waiters),
+            )
+            self._notify_positions()
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯 배정 직후 취소됨 → 반납
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._notify_positions()
+            raise
+
+    def release(self) -> None:
+        self._running -= 1
+        self._pump()
+
+    def _order_key(self, waiter: _Waiter, now: float) -> tuple:
+        priority = int(waiter.priority)
+        if self._aging > 0:
+            priority = max(0, priority - int((now - waiter.enqueued) / self._aging))
+        return (priority, waiter.start_tag, waiter.seq)
+
+    def _pump(self) -> None:
+        dispatched = False
+        while self._waiters and self._running < self._limit:
+            if self._admission is not None and self._running > 0:
+                reason = self._admission()
+                if reason is not None:
+                    if self._blocked_reason is None:
+                        self._admission_blocks += 1
+                        logger.warning("턴 admission 보류: %s", reason)
+                    self._blocked_reason = reason
+                    self._schedule_retry()
+                    break
+            self._blocked_reason = None
+            now = time.monotonic()
+            waiter = min(self._waiters, key=lambda w: self._order_key(w, now))
+            self._waiters.remove(waiter)
+            if waiter.future.done():
+                continue
+            self._running += 1
+            self._dispatched += 1
+            self._vtime = waiter.start_tag
+            waited = now - waiter.enqueued
+            self._wait_stats[waiter.priority].add(waited)
+            waiter.future.set_result(waited)
+            dispatched = True
+        if dispatched:
+            self._notify_positions()
+
+    def _schedule_retry(self) -> None:
+        if self._retry_handle is not None:
+            return
+
+        def _retry() -> None:
+            self._retry_handle = None
+            self._pump()
+
+        loop = asyncio.get_running_loop()
+        self._retry_handle = loop.call_later(self._admission_retry, _retry)
+
+    def _notify_positions(self) -> None:
+        """대기 순서가 바뀐 대기자에게만 콜백 호출."""
+        now = time.monotonic()
+        ordered = sorted(self._waiters, key=lambda w: self._order_key(w, now))
+        total = len(ordered)
+        for position, waiter in enumerate(ordered, start=1):
+            if waiter.position == position:
+                continue
+            waiter.position = position
+            if waiter.on_position is None:
+                continue
+            task = asyncio.create_task(waiter.on_position(position, total))
+            self._notify_tasks.add(task)
+            task.add_done_callback(self._on_notify_done)
+
+    def _on_notify_done(self, task: asyncio.Task) -> None:
+        self._notify_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("대기 순서 알림 실패: %s", task.exception())
+
+    def get_metrics(self) -> dict:
+        """실행/대기 수, admission 보류 상태, 우선순위별 스케줄링 지연."""
+        queued_by_priority = {p.name.lower(): 0 for p in TurnPriority}
+        for waiter in self._waiters:
+            queued_by_priority[waiter.priority.name.lower()] += 1
+        return {
+            "max_concurrent": self._limit,
+            "running": self._running,
+            "queued": len(self._waiters),
+            "queued_by_priority": queued_by_priority,
+            "dispatched_total": self._dispatched,
+            "admission_blocks": self._admission_blocks,
+            "admission_blocked": self._blocked_reason,
+            "wait": {
+                p.name.lower(): stats.summary()
+                for p, stats in self._wait_stats.items()
+            },
+        }
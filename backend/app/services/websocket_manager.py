@@ -6,13 +6,16 @@ import asyncio
 import json
 import logging
 import time
-from collections import deque
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 from fastapi import WebSocket
 
+from app.core.tracing import tracer
 from app.core.utils import utc_now
 from app.repositories.event_repo import EventRepository
 from app.services.base import DBService
@@ -20,6 +23,7 @@ from starlette.websockets import WebSocketState
 
 if TYPE_CHECKING:
     from app.core.database import Database
+    from app.services.spill_journal import SpillJournal
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,16 @@ class BufferedEvent:
     timestamp: datetime
 
 
+@dataclass
+class _ActivityState:
+    """세션별 현재 활동 상태 (broadcast_event에서 증분 갱신)."""
+
+    # 결과 미수신 tool_use: tool_use_id → {"tool", "input"} (삽입 순서 = 발생 순서)
+    open_tools: OrderedDict[str, dict] = field(default_factory=OrderedDict)
+    # 마지막 result/user_message 이후 assistant_text 수신 여부
+    thinking: bool = False
+
+
 class WebSocketManager(DBService):
     """세션별 WebSocket 연결 관리, 이벤트 버퍼링 및 메시지 브로드캐스트."""
 
@@ -43,6 +57,7 @@ class WebSocketManager(DBService):
         event_flush_interval: float = 0.2,
         event_batch_max_size: int = 1000,
         heartbeat_interval: int = 15,
+        spill_journal: SpillJournal | None = None,
     ):
         # DBService.__init__ 호출하지 않음: DB는 set_database()로 지연 주입
         self._db: Database | None = None
@@ -51,6 +66,7 @@ class WebSocketManager(DBService):
         self._buffer_last_access: dict[str, float] = {}  # session_id → monotonic time
         self._buffer_ttl: float = 300.0  # 5분 미사용 버퍼 정리
         self._seq_counters: dict[str, int] = {}
+        self._activity: dict[str, _ActivityState] = {}
         self._event_queue: asyncio.Queue[dict] = asyncio.Queue(
             maxsize=event_queue_maxsize
         )
@@ -60,10 +76,17 @@ class WebSocketManager(DBService):
         self._flush_task: asyncio.Task | None = None
         self._heartbeat_task: asyncio.Task | None = None
         self._pending_broadcasts: set[asyncio.Task] = set()
+        # coalesce() 블록 중인 세션 → 전송 대기 payload (블록 종료 시 일괄 전송)
+        self._coalescing: dict[str, list[str]] = {}
+        self._coalesced_batches: int = 0
+        self._coalesced_events: int = 0
         # 이벤트 재시도 버퍼
         self._retry_batch: list[dict] = []
         self._retry_count: int = 0
         self._max_retries: int = 3
+        # DB 장애 시 배치를 흡수하는 spill 저널 (None이면 기존처럼 드롭)
+        self._spill_journal = spill_journal
+        self._spill_replay_failures: int = 0
         # 관측성 카운터
         self._events_dropped: int = 0
         self._broadcast_failures: int = 0
@@ -98,6 +121,12 @@ class WebSocketManager(DBService):
             await asyncio.gather(*self._pending_broadcasts, return_exceptions=True)
             self._pending_broadcasts.clear()
         await self._flush_events()
+        # 종료 시점에도 DB가 불가하면 재시도 배치를 저널로 이관 (재시작 후 replay)
+        if self._retry_batch and self._spill_journal:
+            await self._spill_events(self._retry_batch)
+            self._retry_batch = []
+        if self._spill_journal:
+            await self._spill_journal.close()
 
     async def _batch_writer_loop(self):
         """주기적으로 큐에 쌓인 이벤트를 배치 DB 저장."""
@@ -106,7 +135,11 @@ class WebSocketManager(DBService):
             await self._flush_events()
 
     async def _flush_events(self):
-        """큐의 이벤트를 한번에 배치로 저장 (배치 최대 크기 제한 + 재시도)."""
+        """큐의 이벤트를 한번에 배치로 저장 (배치 최대 크기 제한 + 재시도).
+
+        재시도 한도/배치 상한을 넘긴 이벤트는 드롭 대신 spill 저널에 기록하고,
+        저널에 미전달분이 남아 있으면 순서 보장을 위해 먼저 replay합니다.
+        """
         batch: list[dict] = []
         # 재시도 대기 이벤트 먼저 소비
         if self._retry_batch:
@@ -118,29 +151,50 @@ class WebSocketManager(DBService):
                 batch.append(self._event_queue.get_nowait())
             except asyncio.QueueEmpty:
                 break
-        if not batch or not self._db:
+        if not self._db:
+            return
+        # spill 저널 replay (DB 미복구 시 새 배치도 저널 뒤에 이어 기록)
+        if self._spill_journal and self._spill_journal.pending:
+            if not await self._replay_spilled_events():
+                if batch:
+                    await self._spill_events(batch)
+                return
+        if not batch:
             return
 
         # 재시도 배치 크기 상한: 무한 증가 방지
         max_retry_size = self._event_batch_max_size * 2
         if len(batch) > max_retry_size:
-            dropped = len(batch) - max_retry_size
-            batch = batch[-max_retry_size:]  # 최신 이벤트 유지
-            logger.warning("재시도 배치 크기 초과 — %d건 드롭", dropped)
-            self._events_dropped += dropped
+            if self._spill_journal:
+                # 오래된 쪽만 저널에 넣고 최신분을 DB에 쓰면 DB에 seq가 역전되어
+                # 기록되고, 그 사이 last_seq로 따라잡은 클라이언트는 저널 구간을
+                # 영구히 놓침 → 배치 전체를 저널에 기록 (다음 flush에서 순서대로 replay)
+                logger.warning("재시도 배치 크기 초과 — %d건 전체 spill", len(batch))
+                await self._spill_events(batch)
+                self._retry_count = 0
+                return
+            # 저널 없음: 초과분(오래된 이벤트)을 먼저 기록한 뒤 나머지 진행
+            overflow = batch[:-max_retry_size]
+            batch = batch[-max_retry_size:]
+            try:
+                await self._write_event_batch(overflow)
+            except Exception as e:
+                logger.error(
+                    "재시도 배치 크기 초과분 저장 실패 — %d건 드롭: %s",
+                    len(overflow),
+                    e,
+                )
+                self._events_dropped += len(overflow)
 
         try:
-            # asyncpg COPY 프로토콜 시도 (5~50배 빠름)
-            try:
-                async with self._db.raw_connection() as raw_conn:
-                    await EventRepository.add_batch_copy(raw_conn, batch)
-                self._retry_count = 0
-                return  # COPY 성공 시 즉시 반환 — INSERT fallback 도달 방지
-            except Exception:
-                # COPY 실패 시 기존 INSERT fallback
-                async with self._session_scope(EventRepository) as (session, repo):
-                    await repo.add_batch(batch)
-                    await session.commit()
+            started_ns = time.perf_counter_ns()
+            await self._write_event_batch(batch)
+            tracer.record_batch(
+                "db.flush",
+                started_ns,
+                time.perf_counter_ns(),
+                (evt["session_id"] for evt in batch),
+            )
             self._retry_count = 0
         except Exception as e:
             self._retry_count += 1
@@ -155,14 +209,111 @@ class WebSocketManager(DBService):
                 self._retry_batch = batch
             else:
                 logger.error(
-                    "이벤트 배치 DB 저장 최종 실패 — %d건 드롭 (재시도 %d회 초과): %s",
+                    "이벤트 배치 DB 저장 최종 실패 — %d건 spill (재시도 %d회 초과): %s",
                     len(batch),
                     self._max_retries,
                     e,
                 )
-                self._events_dropped += len(batch)
+                await self._spill_events(batch)
                 self._retry_count = 0
 
+    async def _write_event_batch(self, batch: list[dict]) -> None:
+        """이벤트 배치 DB 저장 (COPY 우선, 실패 시 INSERT). 최종 실패 시 예외 전파."""
+        # asyncpg COPY 프로토콜 시도 (5~50배 빠름)
+        try:
+            async with self._db.raw_connection() as raw_conn:
+                await EventRepository.add_batch_copy(raw_conn, batch)
+            return  # COPY 성공 시 즉시 반환 — INSERT fallback 도달 방지
+        except Exception:
+            # COPY 실패 시 기존 INSERT fallback
+            async with self._session_scope(EventRepository) as (session, repo):
+                await repo.add_batch(batch)
+                await session.commit()
+
+    # --- spill 저널 ---
+
+    @staticmethod
+    def _encode_spill_event(evt: dict) -> bytes:
+        """이벤트 레코드 → 저널 바이트 (메타 JSON + 개행 + 사전 직렬화된 payload)."""
+        payload_json = evt.get("payload_json") or json.dumps(
+            evt["payload"], ensure_ascii=False
+        )
+        meta = json.dumps(
+            {
+                "session_id": evt["session_id"],
+                "seq": evt["seq"],
+                "event_type": evt["event_type"],
+                "timestamp": evt["timestamp"].isoformat(),
+            },
+            ensure_ascii=False,
+        )
+        return f"{meta}\n{payload_json}".encode("utf-8")
+
+    @staticmethod
+    def _decode_spill_event(data: bytes) -> dict:
+        meta_raw, payload_raw = data.split(b"\n", 1)
+        evt = json.loads(meta_raw)
+        payload_json = payload_raw.decode("utf-8")
+        evt["timestamp"] = datetime.fromisoformat(evt["timestamp"])
+        evt["payload_json"] = payload_json
+        evt["payload"] = json.loads(payload_json)
+        return evt
+
+    async def _spill_events(self, batch: list[dict]) -> None:
+        """전달 불가 이벤트를 spill 저널에 기록. 저널이 없거나 거부되면 드롭 집계."""
+        if not batch:
+            return
+        if not self._spill_journal:
+            logger.error("spill 저널 미설정 — 이벤트 %d건 드롭", len(batch))
+            self._events_dropped += len(batch)
+            return
+        try:
+            accepted = await self._spill_journal.append(
+                [self._encode_spill_event(evt) for evt in batch]
+            )
+        except Exception:
+            logger.error("spill 저널 기록 실패 — 이벤트 %d건 드롭", len(batch), exc_info=True)
+            accepted = 0
+        self._events_dropped += len(batch) - accepted
+
+    async def _deliver_spilled_events(self, records: list[bytes]) -> None:
+        """저널 레코드를 DB에 저장 (삭제된 세션 이벤트는 FK 위반 방지를 위해 제외)."""
+        from app.repositories.session_repo import SessionRepository
+
+        events = [self._decode_spill_event(r) for r in records]
+        session_ids = {evt["session_id"] for evt in events}
+        async with self._session_scope(SessionRepository) as (session, repo):
+            existing = await repo.existing_ids(session_ids)
+        events = [evt for evt in events if evt["session_id"] in existing]
+        if events:
+            await self._write_event_batch(events)
+
+    async def _replay_spilled_events(self) -> bool:
+        """spill 저널 replay. 저널이 완전히 비워지면 True."""
+        try:
+            await self._spill_journal.replay(
+                self._deliver_spilled_events, batch_size=self._event_batch_max_size
+            )
+            self._spill_replay_failures = 0
+            return True
+        except Exception as e:
+            self._spill_replay_failures += 1
+            logger.warning(
+                "spill 이벤트 replay 실패 (%d회, 잔여 %d건): %s",
+                self._spill_replay_failures,
+                self._spill_journal.pending,
+                e,
+            )
+            # DB는 정상인데 반복 실패 → head 배치가 불량(poison)이므로 폐기
+            if self._spill_replay_failures > self._max_retries and await self._db.ping():
+                discarded = await self._spill_journal.discard_head(
+                    self._event_batch_max_size
+                )
+                logger.error("spill 이벤트 replay 반복 실패 — head %d건 폐기", discarded)
+                self._events_dropped += discarded
+                self._spill_replay_failures = 0
+            return False
+
     async def flush_events(self):
         """외부에서 호출 가능한 이벤트 flush."""
         await self._flush_events()
@@ -183,6 +334,7 @@ class WebSocketManager(DBService):
             for sid in expired:
                 self._event_buffers.pop(sid, None)
                 self._buffer_last_access.pop(sid, None)
+                self._activity.pop(sid, None)
             if expired:
                 logger.debug("이벤트 버퍼 TTL 정리: %d개 세션", len(expired))
 
@@ -234,6 +386,7 @@ class WebSocketManager(DBService):
         broadcast는 fire-and-forget으로 실행하여 stdout 읽기를 블로킹하지 않음.
         JSON 직렬화는 한 번만 수행하여 broadcast와 DB 저장 모두에 재사용.
         """
+        span = tracer.span("ws.enqueue")
         seq = self._next_seq(session_id)
         event_type = message.get("type", "unknown")
         ts = utc_now()
@@ -252,6 +405,7 @@ class WebSocketManager(DBService):
                 seq=seq, event_type=event_type, payload=message_with_seq, timestamp=ts
             )
         )
+        self._track_activity(session_id, event_type, message)
 
         # DB 저장: 큐에 enqueue (사전 직렬화된 JSON 문자열 포함)
         if self._db:
@@ -283,8 +437,41 @@ class WebSocketManager(DBService):
                     )
                     self._events_dropped += 1
 
+        coalesced = self._coalescing.get(session_id)
+        if coalesced is not None:
+            coalesced.append(payload_json)
+        else:
+            self._schedule_broadcast(session_id, [payload_json])
+        span.end()
+        return seq
+
+    @contextmanager
+    def coalesce(self, session_id: str) -> Iterator[None]:
+        """블록 안의 broadcast_event 전송을 모아 블록 종료 시 한 번에 전송.
+
+        seq 부여/버퍼/DB 큐 적재는 즉시 수행하고 WebSocket 전송만 묶습니다.
+        stdout 청크 하나에서 나온 이벤트들을 태스크 하나로 순서대로 전송합니다.
+        """
+        if session_id in self._coalescing:
+            yield
+            return
+        self._coalescing[session_id] = []
+        try:
+            yield
+        finally:
+            payloads = self._coalescing.pop(session_id)
+            if payloads:
+                self._coalesced_batches += 1
+                self._coalesced_events += len(payloads)
+                self._schedule_broadcast(session_id, payloads)
+
+    def _schedule_broadcast(self, session_id: str, payloads: list[str]) -> None:
         # fire-and-forget: 느린 WS 클라이언트가 stdout 파이프라인을 블로킹하지 않도록
-        task = asyncio.create_task(self._broadcast_text(session_id, payload_json))
+        if len(payloads) == 1:
+            coro = self._broadcast_text(session_id, payloads[0])
+        else:
+            coro = self._broadcast_texts(session_id, payloads)
+        task = asyncio.create_task(coro)
         self._pending_broadcasts.add(task)
 
         def _on_broadcast_done(t: asyncio.Task) -> None:
@@ -296,7 +483,30 @@ class WebSocketManager(DBService):
                     self._broadcast_failures += 1
 
         task.add_done_callback(_on_broadcast_done)
-        return seq
+
+    async def _broadcast_texts(self, session_id: str, payloads: list[str]):
+        """여러 payload를 연결별로 순서대로 전송 (연결 간에는 병렬)."""
+        ws_set = self._connections.get(session_id)
+        if not ws_set:
+            return
+
+        async def _safe_send_all(ws: WebSocket) -> WebSocket | None:
+            try:
+                for payload_json in payloads:
+                    if ws.client_state != WebSocketState.CONNECTED:
+                        return ws
+                    await asyncio.wait_for(ws.send_text(payload_json), timeout=3.0)
+                return None
+            except Exception:
+                return ws
+
+        with tracer.span("ws.send", events=len(payloads), connections=len(ws_set)):
+            results = await asyncio.gather(
+                *[_safe_send_all(ws) for ws in list(ws_set)]
+            )
+        dead = {ws for ws in results if ws is not None}
+        if dead:
+            ws_set -= dead
 
     async def _broadcast_text(self, session_id: str, payload_json: str):
         """사전 직렬화된 JSON 문자열을 세션의 모든 WebSocket에 병렬 전송."""
@@ -313,7 +523,8 @@ class WebSocketManager(DBService):
             except Exception:
                 return ws
 
-        results = await asyncio.gather(*[_safe_send(ws) for ws in list(ws_set)])
+        with tracer.span("ws.send", events=1, connections=len(ws_set)):
+            results = await asyncio.gather(*[_safe_send(ws) for ws in list(ws_set)])
         dead = {ws for ws in results if ws is not None}
         if dead:
             ws_set -= dead
@@ -369,39 +580,66 @@ class WebSocketManager(DBService):
 
         return []
 
+    def _track_activity(self, session_id: str, event_type: str, message: dict) -> None:
+        """이벤트 1건으로 세션 활동 상태 갱신 (O(1))."""
+        if event_type not in (
+            "tool_use",
+            "tool_result",
+            "assistant_text",
+            "result",
+            "user_message",
+        ):
+            return
+        state = self._activity.get(session_id)
+        if state is None:
+            state = self._activity[session_id] = _ActivityState()
+        if event_type == "tool_use":
+            tid = message.get("tool_use_id", "")
+            state.open_tools.pop(tid, None)
+            state.open_tools[tid] = {
+                "tool": message.get("tool", ""),
+                "input": message.get("input", {}),
+            }
+            # 결과 없이 쌓이는 tool_use는 이벤트 버퍼 크기만큼만 유지
+            while len(state.open_tools) > MAX_BUFFER_SIZE:
+                state.open_tools.popitem(last=False)
+        elif event_type == "tool_result":
+            tid = message.get("tool_use_id")
+            if tid:
+                state.open_tools.pop(tid, None)
+        elif event_type == "assistant_text":
+            state.thinking = True
+        else:
+            # 턴 경계: result는 턴 종료이므로 미완료 tool_use도 정리
+            state.thinking = False
+            if event_type == "result":
+                state.open_tools.clear()
+
     def get_current_activity(self, session_id: str) -> dict | None:
-        """세션의 현재 활동 요약 반환."""
-        buffer = self._event_buffers.get(session_id)
-        if not buffer:
+        """세션의 현재 활동 요약 반환 (가장 최근 미완료 도구 > thinking)."""
+        state = self._activity.get(session_id)
+        if state is None:
             return None
-
-        completed_ids: set[str] = set()
-        for evt in buffer:
-            if evt.event_type == "tool_result":
-                tid = evt.payload.get("tool_use_id")
-                if tid:
-                    completed_ids.add(tid)
-
-        for evt in reversed(buffer):
-            if evt.event_type == "tool_use":
-                tid = evt.payload.get("tool_use_id", "")
-                if tid not in completed_ids:
-                    return {
-                        "tool": evt.payload.get("tool", ""),
-                        "input": evt.payload.get("input", {}),
-                    }
-
-        for evt in reversed(buffer):
-            if evt.event_type == "assistant_text":
-                return {"tool": "__thinking__", "input": {}}
-            if evt.event_type in ("result", "user_message"):
-                break
-
+        if state.open_tools:
+            tool = next(reversed(state.open_tools.values()))
+            return {"tool": tool["tool"], "input": tool["input"]}
+        if state.thinking:
+            return {"tool": "__thinking__", "input": {}}
         return None
 
+    def get_activities(self, session_ids: list[str]) -> dict[str, dict]:
+        """여러 세션의 현재 활동을 일괄 조회 (활동 없는 세션은 제외)."""
+        result: dict[str, dict] = {}
+        for sid in session_ids:
+            activity = self.get_current_activity(sid)
+            if activity:
+                result[sid] = activity
+        return result
+
     def clear_buffer(self, session_id: str):
         self._event_buffers.pop(session_id, None)
         self._buffer_last_access.pop(session_id, None)
+        self._activity.pop(session_id, None)
 
     async def restore_seq_counters(self, db: "Database"):
         """서버 재시작 시 DB에서 세션별 최대 seq를 복원."""
@@ -429,9 +667,15 @@ class WebSocketManager(DBService):
             "retry_count": self._retry_count,
             "events_dropped": self._events_dropped,
             "broadcast_failures": self._broadcast_failures,
+            "coalesced_batches": self._coalesced_batches,
+            "coalesced_events": self._coalesced_events,
+            "spill": (
+                self._spill_journal.get_metrics() if self._spill_journal else None
+            ),
         }
 
     def reset_session(self, session_id: str):
         self._event_buffers.pop(session_id, None)
         self._buffer_last_access.pop(session_id, None)
+        self._activity.pop(session_id, None)
         self._seq_counters.pop(session_id, None)
@@ -1,19 +1,22 @@
 """워크스페이스 생명주기 관리 서비스.
 
-Git repo clone, 의존성 설치, pull/push 동기화를 담당합니다.
+Git repo clone, 의존성 설치, pull/push 동기화, 디스크 사용량 갱신을 담당합니다.
 """
 
 import asyncio
 import logging
 import os
 import shutil
+import time
 import uuid
 
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.executors import ExecutorKind, run_in_executor
 from app.core.utils import utc_now
 from app.models.workspace import Workspace
 from app.repositories.workspace_repo import WorkspaceRepository
 from app.services.base import DBService
+from app.services.disk_usage import DiskUsageScanner
 from app.services.git_service import GitService
 
 logger = logging.getLogger(__name__)
@@ -50,12 +53,17 @@ class WorkspaceService(DBService):
         db,
         git_service: GitService,
         workspaces_root: str = "/workspaces",
+        disk_usage: DiskUsageScanner | None = None,
     ) -> None:
         super().__init__(db)
         self._git = git_service
         self._workspaces_root = workspaces_root
         # 진행 중인 clone 태스크 추적
         self._clone_tasks: dict[str, asyncio.Task] = {}
+        # 디스크 사용량: 증분 계산기 + 백그라운드 갱신 요청 (sync 후 등)
+        self._disk_usage = disk_usage or DiskUsageScanner()
+        self._usage_pending: set[str] = set()
+        self._usage_wake = asyncio.Event()
 
     async def create_workspace(
         self,
@@ -231,21 +239,97 @@ class WorkspaceService(DBService):
         except Exception as e:
             logger.warning("의존성 설치 예외 (%s): %s", label, e)
 
-    async def _calc_disk_usage(self, path: str) -> int:
-        """디렉토리 디스크 사용량 계산 (MB)."""
+    async def _calc_disk_usage(self, path: str, *, full: bool = False) -> int:
+        """디렉토리 디스크 사용량 계산 (MB). 변경되지 않은 하위 트리는 캐시 재사용."""
+        return await self._disk_usage.measure(path, full=full) // (1024 * 1024)
 
-        def _calc() -> int:
-            total = 0
-            for dirpath, _dirnames, filenames in os.walk(path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        total += os.path.getsize(fp)
-                    except OSError:
-                        pass
-            return total // (1024 * 1024)
+    def request_disk_usage_refresh(self, workspace_id: str) -> None:
+        """백그라운드 갱신 루프에 즉시 재계산 요청 (호출자는 대기하지 않음)."""
+        self._usage_pending.add(workspace_id)
+        self._usage_wake.set()
 
-        return await asyncio.to_thread(_calc)
+    async def refresh_disk_usage(
+        self, workspace_ids: set[str] | None = None, *, full: bool = False
+    ) -> int:
+        """ready 워크스페이스 디스크 사용량 재계산 후 변경분만 DB 반영.
+
+        Returns:
+            disk_usage_mb가 변경된 워크스페이스 수
+        """
+        async with self._session_scope(WorkspaceRepository) as (db_session, repo):
+            entities = await repo.get_all_ordered(Workspace.created_at.desc())
+            targets = [
+                (e.id, e.local_path, e.disk_usage_mb)
+                for e in entities
+                if e.status == "ready"
+                and (workspace_ids is None or e.id in workspace_ids)
+            ]
+
+        changed: dict[str, int] = {}
+        for wid, local_path, previous in targets:
+            if not os.path.isdir(local_path):
+                continue
+            try:
+                disk_mb = await self._calc_disk_usage(local_path, full=full)
+            except Exception as e:
+                logger.warning("디스크 사용량 계산 실패 (%s): %s", wid, e)
+                continue
+            if disk_mb != previous:
+                changed[wid] = disk_mb
+
+        if changed:
+            async with self._session_scope(WorkspaceRepository) as (db_session, repo):
+                for wid, disk_mb in changed.items():
+                    await repo.update_by_id(wid, disk_usage_mb=disk_mb)
+                await db_session.commit()
+        return len(changed)
+
+    async def run_disk_usage_refresh(
+        self,
+        shutdown_event: asyncio.Event,
+        interval: float,
+        full_every: int = 12,
+    ) -> None:
+        """주기적 디스크 사용량 갱신 루프 (shutdown_event가 set될 때까지).
+
+        interval마다 전체 ready 워크스페이스를 증분 재계산하고, full_every회마다
+        캐시 없이 전체 재계산합니다(제자리 파일 수정 보정). 그 사이
+        request_disk_usage_refresh()로 요청된 워크스페이스는 즉시 처리합니다.
+        """
+        cycles = 0
+        next_due = time.monotonic() + interval
+        while not shutdown_event.is_set():
+            stop = asyncio.ensure_future(shutdown_event.wait())
+            wake = asyncio.ensure_future(self._usage_wake.wait())
+            try:
+                await asyncio.wait(
+                    {stop, wake},
+                    timeout=max(next_due - time.monotonic(), 0.0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                stop.cancel()
+                wake.cancel()
+            if shutdown_event.is_set():
+                break
+
+            self._usage_wake.clear()
+            requested, self._usage_pending = self._usage_pending, set()
+            try:
+                if time.monotonic() >= next_due:
+                    cycles += 1
+                    await self.refresh_disk_usage(full=cycles % full_every == 0)
+                    next_due = time.monotonic() + interval
+                elif requested:
+                    await self.refresh_disk_usage(requested)
+            except Exception as e:
+                logger.warning("디스크 사용량 갱신 실패: %s", e)
+
+    def get_disk_usage_metrics(self) -> dict:
+        return {
+            **self._disk_usage.get_metrics(),
+            "pending_requests": len(self._usage_pending),
+        }
 
     async def _update_status(
         self,
@@ -283,6 +367,12 @@ class WorkspaceService(DBService):
 
         return list(await asyncio.gather(*[_enrich(ws) for ws in results]))
 
+    async def list_ready_paths(self) -> list[str]:
+        """ready 상태 워크스페이스 로컬 경로 목록 (Git 조회 없음)."""
+        async with self._session_scope(WorkspaceRepository) as (db_session, repo):
+            entities = await repo.get_all_ordered(Workspace.created_at.desc())
+            return [e.local_path for e in entities if e.status == "ready"]
+
     async def get(self, workspace_id: str) -> dict:
         """워크스페이스 상세 조회 (ready 시 Git 정보 포함)."""
         async with self._session_scope(WorkspaceRepository) as (db_session, repo):
@@ -350,6 +440,7 @@ class WorkspaceService(DBService):
             if success:
                 now = utc_now()
                 await self._update_status(workspace_id, "ready", last_synced_at=now)
+                self.request_disk_usage_refresh(workspace_id)
             return success, msg, None
 
         elif action == "push":
@@ -395,7 +486,9 @@ class WorkspaceService(DBService):
 
         # 파일 삭제 (블로킹 I/O → thread)
         if os.path.isdir(local_path):
-            await asyncio.to_thread(shutil.rmtree, local_path, True)
+            await run_in_executor(ExecutorKind.FS_SCAN, shutil.rmtree, local_path, True)
+        self._disk_usage.forget(local_path)
+        self._usage_pending.discard(workspace_id)
 
         # DB 삭제
         async with self._session_scope(WorkspaceRepository) as (db_session, repo):
@@ -418,6 +511,8 @@ class WorkspaceService(DBService):
                 elif entity.status == "deleting":
                     # 삭제 중이던 워크스페이스 → 파일 정리 + DB 삭제
                     if os.path.isdir(entity.local_path):
-                        await asyncio.to_thread(shutil.rmtree, entity.local_path, True)
+                        await run_in_executor(
+                            ExecutorKind.FS_SCAN, shutil.rmtree, entity.local_path, True
+                        )
                     await repo.delete_by_id(entity.id)
             await db_session.commit()
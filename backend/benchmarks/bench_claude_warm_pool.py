@@ -0,0 +1,154 @@
+"""Claude CLI 사전 기동 풀 첫 출력 지연(time-to-first-token) 벤치마크.
+
+매 턴 새 프로세스를 실행하는 기존 방식(claude -p <prompt>)과, 직전 턴 이후
+ClaudeProcessPool로 미리 실행해 둔 stream-json 입력 프로세스의 stdin에
+프롬프트를 기록하는 방식을 비교합니다. 프롬프트 전송부터 첫 assistant/
+stream_event 줄 수신까지의 시간을 측정합니다.
+
+기본값은 기동 지연(Node 기동 + MCP 서버 실행)을 --startup-ms로 흉내 내는
+가짜 CLI를 사용합니다. --cli claude를 지정하면 실제 CLI로 측정합니다
+(API 사용량이 발생합니다).
+
+Usage (backend/ 에서):
+    python -m benchmarks.bench_claude_warm_pool [--turns 10] [--startup-ms 1500]
+    python -m benchmarks.bench_claude_warm_pool --cli claude --turns 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from app.services.claude_process_pool import (
+    ClaudeProcessPool,
+    to_stream_input,
+    user_message_line,
+)
+
+_FAKE_CLI = """
+import json, os, sys, time
+time.sleep(int(os.environ["FAKE_STARTUP_MS"]) / 1000)  # Node 기동 + MCP 서버 실행
+if "--input-format" in sys.argv:
+    prompts = (json.loads(l)["message"]["content"][0]["text"] for l in sys.stdin)
+else:
+    prompts = [sys.argv[2]]
+for prompt in prompts:
+    print(json.dumps({"type": "system", "subtype": "init"}), flush=True)
+    delta = {"type": "content_block_delta", "delta": {"type": "text_delta"}}
+    print(json.dumps({"type": "stream_event", "event": delta}), flush=True)
+    print(json.dumps({"type": "result", "result": "ok"}), flush=True)
+"""
+
+_FIRST_TOKEN_TYPES = {"stream_event", "assistant"}
+
+
+async def _spawn(cmd: list[str], work_dir: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=work_dir,
+        limit=10 * 1024 * 1024,
+    )
+
+
+async def _first_token(process: asyncio.subprocess.Process, started: float) -> float:
+    """첫 토큰 줄까지 ms. 나머지 출력은 소진 후 종료 대기."""
+    ttft = None
+    async for line in process.stdout:
+        try:
+            event_type = json.loads(line).get("type")
+        except json.JSONDecodeError:
+            continue
+        if ttft is None and event_type in _FIRST_TOKEN_TYPES:
+            ttft = (time.perf_counter() - started) * 1000
+    await process.wait()
+    if ttft is None:
+        raise RuntimeError(f"첫 토큰 이벤트 없음 (exit code {process.returncode})")
+    return ttft
+
+
+async def _cold(base: list[str], work_dir: str, turns: int) -> list[float]:
+    samples = []
+    for i in range(turns):
+        started = time.perf_counter()
+        process = await _spawn([base[0], "-p", f"턴 {i}", *base[1:]], work_dir)
+        process.stdin.close()
+        samples.append(await _first_token(process, started))
+    return samples
+
+
+async def _warm(
+    base: list[str], work_dir: str, turns: int, think: float
+) -> tuple[list[float], dict]:
+    pool = ClaudeProcessPool(_spawn, max_size=1, idle_ttl=600)
+    stream_cmd, _ = to_stream_input([base[0], "-p", "", *base[1:]])
+    samples = []
+    try:
+        pool.prewarm("bench", stream_cmd, work_dir)
+        for i in range(turns):
+            await asyncio.sleep(think)  # 사용자가 다음 프롬프트를 입력하는 시간
+            started = time.perf_counter()
+            process, _ = await pool.acquire("bench", stream_cmd, work_dir)
+            process.stdin.write(user_message_line(f"턴 {i}"))
+            await process.stdin.drain()
+            process.stdin.close()
+            samples.append(await _first_token(process, started))
+            pool.prewarm("bench", stream_cmd, work_dir)
+        return samples, pool.get_metrics()
+    finally:
+        await pool.close()
+
+
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 1),
+        "mean_ms": round(statistics.fmean(ordered), 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--startup-ms", type=int, default=1500)
+    parser.add_argument(
+        "--think-ms", type=int, default=0, help="턴 사이 대기 (기본: startup-ms x 2)"
+    )
+    parser.add_argument("--cli", default="", help="실제 CLI 경로 (예: claude)")
+    args = parser.parse_args()
+
+    if args.cli:
+        base = [
+            args.cli,
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--include-partial-messages",
+        ]
+    else:
+        os.environ["FAKE_STARTUP_MS"] = str(args.startup_ms)
+    think = (args.think_ms or args.startup_ms * 2) / 1000
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if not args.cli:
+            fake_cli = os.path.join(work_dir, "fake-claude")
+            with open(fake_cli, "w") as f:
+                f.write(f"#!{sys.executable}\n{_FAKE_CLI}")
+            os.chmod(fake_cli, 0o755)
+            base = [fake_cli]
+        cold = await _cold(base, work_dir, args.turns)
+        print(f"  cold (turn마다 새 프로세스): {_summary(cold)}")
+        warm, metrics = await _warm(base, work_dir, args.turns, think)
+        print(f"  warm (사전 기동 풀):        {_summary(warm)}")
+        print(f"  pool: hits={metrics['hits']} misses={metrics['misses']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""파일 변경 패널 diff 조회 벤치마크.
+
+세션 파일 변경 패널이 파일마다 요청하는 diff를 기존 방식(git diff 폴백 체인,
+요청당 1~4회 fork)과 cat-file 워커 + 프로세스 내 diff 방식으로 비교합니다.
+기본값으로 수정 450개 + 신규 50개 = 500개 파일이 변경된 임시 저장소를 생성합니다.
+
+Usage (backend/ 에서):
+    python -m benchmarks.bench_file_diff [--files 500] [--lines 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.git_service import GitService
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _create_repo(root: Path, files: int, lines: int) -> list[str]:
+    repo = root / "repo"
+    (repo / "src").mkdir(parents=True)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "bench")
+    modified = files - files // 10
+    for i in range(modified):
+        body = "".join(f"line {n} of file {i}\n" for n in range(lines))
+        (repo / "src" / f"f{i}.py").write_text(body)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "bench")
+
+    paths: list[str] = []
+    for i in range(modified):
+        target = repo / "src" / f"f{i}.py"
+        body = target.read_text().replace("line 10 ", "changed 10 ")
+        target.write_text(body + "appended\n")
+        paths.append(f"src/f{i}.py")
+    for i in range(files - modified):
+        (repo / "src" / f"new{i}.py").write_text("new file\n" * lines)
+        paths.append(f"src/new{i}.py")
+    return paths
+
+
+def _legacy_diff(cwd: str, rel_path: str) -> tuple[str, int]:
+    """기존 files.py 구현 (blocking subprocess.run 폴백 체인), (diff, fork 수)."""
+    forks = 0
+    for args in (
+        ["diff", "HEAD", "--", rel_path],
+        ["diff", "--", rel_path],
+        ["diff", "--cached", "--", rel_path],
+    ):
+        forks += 1
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, timeout=10.0
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout, forks
+    forks += 1
+    result = subprocess.run(
+        ["git", "diff", "--no-index", "--", "/dev/null", rel_path],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=10.0,
+    )
+    return result.stdout, forks
+
+
+def _summary(samples: list[float], forks: float) -> dict:
+    samples.sort()
+    return {
+        "total_ms": round(sum(samples), 1),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+        "forks": forks,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _create_repo(Path(tmp), args.files, args.lines)
+        cwd = str((Path(tmp) / "repo").resolve())
+
+        legacy: list[float] = []
+        legacy_forks = 0
+        for rel_path in paths:
+            started = time.perf_counter()
+            _, forks = await asyncio.to_thread(_legacy_diff, cwd, rel_path)
+            legacy.append((time.perf_counter() - started) * 1000)
+            legacy_forks += forks
+        print(f"  legacy: {_summary(legacy, legacy_forks)}")
+
+        git = GitService()
+        try:
+            pooled: list[float] = []
+            for rel_path in paths:
+                started = time.perf_counter()
+                await git.diff_worktree_file(cwd, rel_path)
+                pooled.append((time.perf_counter() - started) * 1000)
+            metrics = git.get_metrics()
+            forks = metrics["git_commands_total"] + metrics["cat_file"]["spawns"]
+            print(f"  pooled: {_summary(pooled, forks)}")
+        finally:
+            await git.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
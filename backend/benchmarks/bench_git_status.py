@@ -0,0 +1,112 @@
+"""Git 상태 조회 벤치마크 (fork 수 + wall time).
+
+대시보드 1회 갱신(get_git_info + get_git_status)에 대해 기존 방식
+(정보 7개 + 상태 3개 git 명령 병렬 실행)과 porcelain v2 스냅샷 엔진을 비교합니다.
+기본값으로 파일 100,000개짜리 임시 저장소를 생성합니다.
+
+Usage (backend/ 에서):
+    python -m benchmarks.bench_git_status [--files 100000] [--repo PATH]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.git_service import GitService
+
+_FILES_PER_DIR = 1000
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _create_repo(root: Path, files: int) -> Path:
+    print(f"저장소 생성: files={files:,}")
+    repo = root / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "bench")
+    for i in range(files):
+        directory = repo / f"d{i // _FILES_PER_DIR:04d}"
+        if i % _FILES_PER_DIR == 0:
+            directory.mkdir()
+        (directory / f"f{i}.txt").write_text(f"{i}\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "bench")
+    # 변경/추가 파일 몇 개 (파일 패널이 비어 있지 않은 일반적인 상태)
+    for i in range(0, min(files, 50)):
+        (repo / f"d0000/f{i}.txt").write_text("changed\n")
+    for i in range(10):
+        (repo / f"new{i}.txt").write_text("new\n")
+    return repo
+
+
+async def _legacy_refresh(git: GitService, cwd: str) -> None:
+    """기존 구현의 명령 구성 (get_git_info 7개 + get_git_status 3개)."""
+    opts = (*git._GIT_CROSS_PLATFORM_OPTS, "--no-optional-locks")
+    await git._run_git_command("rev-parse", "--is-inside-work-tree", cwd=cwd)
+    await asyncio.gather(
+        git._run_git_command("branch", "--show-current", cwd=cwd),
+        git._run_git_command(*opts, "status", "--porcelain", cwd=cwd, timeout=60.0),
+        git._run_git_command("log", "-1", "--format=%H%n%s%n%aI", cwd=cwd),
+        git._run_git_command("remote", "get-url", "origin", cwd=cwd),
+        git._run_git_command(
+            "rev-list", "--left-right", "--count", "HEAD...@{upstream}", cwd=cwd
+        ),
+        git._run_git_command("rev-parse", "--git-dir", cwd=cwd),
+        git._run_git_command("rev-parse", "--git-common-dir", cwd=cwd),
+    )
+    await git._run_git_command("rev-parse", "--is-inside-work-tree", cwd=cwd)
+    await asyncio.gather(
+        git._run_git_command("rev-parse", "--show-toplevel", cwd=cwd),
+        git._run_git_command(
+            *opts, "status", "--porcelain=v1", cwd=cwd, timeout=60.0
+        ),
+    )
+
+
+async def _snapshot_refresh(git: GitService, cwd: str) -> None:
+    # get_git_status는 항상 새 스냅샷, get_git_info는 그 스냅샷을 공유
+    await git.get_git_status(cwd)
+    await git.get_git_info(cwd)
+
+
+async def _measure(fn, git: GitService, cwd: str, repeat: int) -> dict:
+    await fn(git, cwd)  # 워밍업 (OS 페이지 캐시, layout 캐시)
+    before = git.get_metrics()["git_commands_total"]
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn(git, cwd)
+        samples.append((time.perf_counter() - started) * 1000)
+    forks = (git.get_metrics()["git_commands_total"] - before) / repeat
+    return {
+        "forks_per_refresh": round(forks, 2),
+        "p50_ms": round(statistics.median(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--repo", help="기존 저장소 경로 (미지정 시 임시 저장소 생성)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(args.repo) if args.repo else _create_repo(Path(tmp), args.files)
+        cwd = str(repo.resolve())
+        for label, fn in (("legacy", _legacy_refresh), ("snapshot", _snapshot_refresh)):
+            result = await _measure(fn, GitService(), cwd, args.repeat)
+            print(f"{label:>9}: {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+"""Permission MCP 전송 방식 지연 벤치마크.
+
+턴마다 permission_mcp_server.py를 실행하는 stdio 방식(인터프리터 기동 +
+요청마다 새 스레드/TCP 연결의 urllib POST)과, 백엔드가 직접 호스팅하는 공유
+HTTP MCP 엔드포인트(keep-alive 연결)를 비교합니다. 턴 시작 시 initialize
+응답까지의 시간과 권한 요청(tools/call) 왕복 시간을 측정합니다.
+
+임시 포트에 permissions 라우터만 띄우며, 권한 요청은 세션 신뢰 도구로
+등록해 사용자 응답 대기 없이 즉시 승인되도록 합니다.
+
+Usage (backend/ 에서):
+    python -m benchmarks.bench_permission_mcp [--turns 20] [--calls 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import permissions
+from app.services import permission_mcp_server
+
+_SESSION_ID = "bench-session"
+_TRUSTED_TOOL = "Read"
+
+
+def _message(msg_id: int, method: str, params: dict | None = None) -> dict:
+    return {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params or {}}
+
+
+def _tool_call(msg_id: int) -> dict:
+    return _message(
+        msg_id,
+        "tools/call",
+        {
+            "name": "handle_request",
+            "arguments": {"tool_name": _TRUSTED_TOOL, "input": {"path": "a.py"}},
+        },
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _stdio_turn(api_base: str, calls: int) -> tuple[float, list[float]]:
+    env = {
+        **os.environ,
+        "PERMISSION_SESSION_ID": _SESSION_ID,
+        "PERMISSION_API_BASE": api_base,
+        "PERMISSION_TIMEOUT": "120",
+    }
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        permission_mcp_server.__file__,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env,
+    )
+
+    async def _rpc(msg: dict) -> dict:
+        process.stdin.write((json.dumps(msg) + "\n").encode())
+        await process.stdin.drain()
+        return json.loads(await process.stdout.readline())
+
+    await _rpc(_message(0, "initialize"))
+    startup = (time.perf_counter() - started) * 1000
+    samples = []
+    for i in range(calls):
+        t0 = time.perf_counter()
+        await _rpc(_tool_call(i + 1))
+        samples.append((time.perf_counter() - t0) * 1000)
+    process.stdin.close()
+    await process.wait()
+    return startup, samples
+
+
+async def _http_turn(api_base: str, calls: int) -> tuple[float, list[float]]:
+    url = f"{api_base}/api/permissions/{_SESSION_ID}/mcp"
+    started = time.perf_counter()
+    # 턴마다 새 CLI 프로세스 = 새 클라이언트 (턴 안에서는 연결 재사용).
+    # 평문 HTTP이므로 인증서 번들 로드(수십 ms)는 제외
+    async with httpx.AsyncClient(verify=False, trust_env=False) as client:
+        await client.post(url, json=_message(0, "initialize"))
+        startup = (time.perf_counter() - started) * 1000
+        samples = []
+        for i in range(calls):
+            t0 = time.perf_counter()
+            await client.post(url, json=_tool_call(i + 1))
+            samples.append((time.perf_counter() - t0) * 1000)
+    return startup, samples
+
+
+async def _bench(turn, api_base: str, turns: int, calls: int):
+    await turn(api_base, 1)  # 지연 import/첫 연결 워밍업
+    startups, samples = [], []
+    for _ in range(turns):
+        startup, call_samples = await turn(api_base, calls)
+        startups.append(startup)
+        samples.extend(call_samples)
+    return startups, samples
+
+
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 2),
+        "mean_ms": round(statistics.fmean(ordered), 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=10, help="턴당 권한 요청 수")
+    args = parser.parse_args()
+
+    # 세션 신뢰 도구 → 사용자 응답 대기 없이 즉시 승인
+    permissions.engine.trust_session(_SESSION_ID, _TRUSTED_TOOL)
+    app = FastAPI()
+    app.include_router(permissions.router, prefix="/api")
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    api_base = f"http://127.0.0.1:{port}"
+
+    try:
+        for name, turn in (("stdio", _stdio_turn), ("http", _http_turn)):
+            startups, samples = await _bench(turn, api_base, args.turns, args.calls)
+            print(f"{name}:")
+            print(f"  turn startup (initialize): {_summary(startups)}")
+            print(f"  permission round trip:     {_summary(samples)}")
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""프롬프트 디스패치 DB 경로 벤치마크.
+
+ws._handle_prompt가 runner task 생성 전까지 수행하는 DB 접근
+(세션 행 조회, 글로벌 설정 조회, 사용자 메시지 저장)을 반복 실행하여
+핫패스 캐시 on/off의 지연 시간과 DB 왕복 횟수를 비교합니다.
+
+Usage (backend/ 에서):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_prompt_dispatch
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from app.core.database import Database, track_round_trips
+from app.core.utils import utc_now
+from app.services.session_manager import SessionManager
+from app.services.settings_service import SettingsService
+
+
+async def _dispatch_once(
+    manager: SessionManager, settings_service: SettingsService, session_id: str
+) -> int:
+    counter = track_round_trips()
+    session = await manager.get(session_id)
+    global_settings = await settings_service.get()
+    settings_service.merge_session_with_globals(session, global_settings)
+    await manager.add_message(
+        session_id=session_id,
+        role="user",
+        content="bench",
+        timestamp=utc_now(),
+    )
+    return counter.count
+
+
+async def _run(db: Database, iterations: int, cache_ttl: float) -> dict:
+    manager = SessionManager(db, cache_ttl=cache_ttl)
+    settings_service = SettingsService(db, cache_ttl=cache_ttl)
+    session = await manager.create(work_dir=tempfile.gettempdir())
+    session_id = session["id"]
+    try:
+        # 커넥션 풀/prepared statement 워밍업
+        for _ in range(10):
+            await _dispatch_once(manager, settings_service, session_id)
+
+        latencies: list[float] = []
+        round_trips: list[int] = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            round_trips.append(
+                await _dispatch_once(manager, settings_service, session_id)
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        await manager.delete(session_id)
+
+    latencies.sort()
+    return {
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "round_trips": round(statistics.fmean(round_trips), 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url 또는 DATABASE_URL 환경 변수가 필요합니다")
+
+    db = Database(args.database_url)
+    await db.initialize()
+    try:
+        for label, ttl in (("cache off", 0.0), ("cache on", 60.0)):
+            result = await _run(db, args.iterations, ttl)
+            print(f"{label:>10}: {result}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""세션 목록/검색 페이지네이션 벤치마크.
+
+기존 방식(행별 correlated count() 서브쿼리 + COUNT(*) OVER() + OFFSET)과
+keyset 커서 + 비정규화 카운터(+ 추정 total) 방식을 페이지 깊이별로 비교합니다.
+
+전용(폐기 가능한) 데이터베이스에서 실행하세요. 기본 시드는
+세션 100,000개 + 메시지 10,000,000개입니다 (--sessions / --messages로 조정).
+
+Usage (backend/ 에서):
+    DATABASE_URL=postgresql+asyncpg://.../rocket_bench \\
+        python -m benchmarks.bench_session_list [--reseed]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.core.database import Database
+from app.repositories.search_repo import SearchRepository
+
+_PAGE_SIZE = 50
+
+_LEGACY_QUERY = """
+SELECT s.*,
+       (SELECT count(*) FROM messages m WHERE m.session_id = s.id) AS message_count,
+       (SELECT count(*) FROM file_changes f WHERE f.session_id = s.id)
+           AS file_changes_count,
+       count(*) OVER () AS total_count
+FROM sessions s
+ORDER BY s.created_at DESC
+LIMIT :limit OFFSET :offset
+"""
+
+
+async def _execute(db: Database, sql: str, params: dict | None = None) -> None:
+    async with db.session() as session:
+        await session.execute(text(sql), params or {})
+        await session.commit()
+
+
+async def _analyze(db: Database, *tables: str) -> None:
+    async with db.engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in tables:
+            await conn.execute(text(f"VACUUM ANALYZE {table}"))
+
+
+async def _seed(db: Database, sessions: int, messages: int) -> None:
+    print(f"시드 생성: sessions={sessions:,} messages={messages:,}")
+    await _execute(db, "DELETE FROM sessions WHERE id LIKE 'bench-%'")
+    await _execute(
+        db,
+        """
+        INSERT INTO sessions (id, work_dir, status, created_at,
+            workflow_enabled, permission_mode, system_prompt_mode)
+        SELECT 'bench-' || g, '/bench', 'idle',
+               now() - g * interval '1 second', false, false, 'replace'
+        FROM generate_series(1, CAST(:n AS int)) g
+        """,
+        {"n": sessions},
+    )
+    # FK 검사가 sessions PK 인덱스를 타도록 통계 갱신
+    await _analyze(db, "sessions")
+
+    # 시드 중 FTS 트리거 비활성화 (행마다 세션 search_vector 재집계)
+    await _execute(db, "ALTER TABLE messages DISABLE TRIGGER trg_messages_search_vector")
+    try:
+        chunk = 200_000  # asyncpg command_timeout(60s) 이내로 분할
+        for start in range(0, messages, chunk):
+            await _execute(
+                db,
+                """
+                INSERT INTO messages (session_id, role, content, timestamp, is_error)
+                SELECT 'bench-' || (g % CAST(:n AS int) + 1), 'user', 'bench',
+                       now(), false
+                FROM generate_series(CAST(:start AS int), CAST(:stop AS int)) g
+                """,
+                {"n": sessions, "start": start + 1, "stop": min(start + chunk, messages)},
+            )
+    finally:
+        await _execute(
+            db, "ALTER TABLE messages ENABLE TRIGGER trg_messages_search_vector"
+        )
+    await _execute(
+        db,
+        """
+        UPDATE sessions s SET message_count = m.cnt
+        FROM (SELECT session_id, count(*) AS cnt FROM messages
+              GROUP BY session_id) m
+        WHERE m.session_id = s.id
+        """,
+    )
+    await _analyze(db, "sessions", "messages")
+
+
+async def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+async def _bench_depth(db: Database, offset: int, repeat: int) -> dict:
+    async with db.session() as session:
+        # 같은 깊이의 keyset 커서 = offset 직전 행의 (created_at, id)
+        row = (
+            await session.execute(
+                text(
+                    "SELECT created_at, id FROM sessions "
+                    "ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET :o"
+                ),
+                {"o": max(offset - 1, 0)},
+            )
+        ).one()
+        after = (row[0], row[1]) if offset else None
+        repo = SearchRepository(session)
+
+        async def legacy():
+            await session.execute(
+                text(_LEGACY_QUERY), {"limit": _PAGE_SIZE, "offset": offset}
+            )
+
+        async def keyset_exact():
+            await repo.search_sessions(limit=_PAGE_SIZE, after=after)
+
+        async def keyset_estimated():
+            await repo.search_sessions(
+                limit=_PAGE_SIZE, after=after, estimate_total=True
+            )
+
+        return {
+            "legacy_offset_ms": await _time(legacy, repeat),
+            "keyset_exact_ms": await _time(keyset_exact, repeat),
+            "keyset_estimated_ms": await _time(keyset_estimated, repeat),
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--messages", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reseed", action="store_true", help="기존 bench 시드 재생성")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url 또는 DATABASE_URL 환경 변수가 필요합니다")
+
+    db = Database(args.database_url)
+    await db.initialize()
+    try:
+        async with db.session() as session:
+            seeded = (
+                await session.execute(
+                    text("SELECT count(*) FROM sessions WHERE id LIKE 'bench-%'")
+                )
+            ).scalar_one()
+        if args.reseed or seeded != args.sessions:
+            await _seed(db, args.sessions, args.messages)
+
+        for offset in (0, 1_000, args.sessions // 2, args.sessions - _PAGE_SIZE):
+            result = await _bench_depth(db, offset, args.repeat)
+            print(f"offset={offset:>9,}: {result}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
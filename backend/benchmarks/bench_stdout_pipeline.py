@@ -0,0 +1,226 @@
+"""Claude CLI stdout 파이프라인 처리량 벤치마크.
+
+합성 stream-json 대화 기록(기본 50MB: 텍스트 델타, tool_use, 128KB~2MB의
+tool_result 줄 혼합)을 파일로 만들고, cat 서브프로세스의 stdout을 다음 방식으로
+읽어 JSON 파싱 + WebSocketManager.broadcast_event(연결 1개)까지 처리합니다.
+
+- readline:  줄마다 readline() → decode/strip → 이벤트마다 broadcast 태스크 (기존)
+- chunked:   LineReader 청크 읽기 → 줄 묶음 파싱 → coalesce로 묶음 전송 (신규)
+
+Windows 래퍼의 줄 분할(`buffer += chunk` 후 슬라이스)과 LineSplitter는
+64KB 청크를 메모리에서 분할하는 시간만 따로 비교합니다.
+
+Usage (backend/ 에서):
+    python -m benchmarks.bench_stdout_pipeline [--size-mb 50] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from starlette.websockets import WebSocketState
+
+from app.services.stream_lines import LineReader, LineSplitter
+from app.services.websocket_manager import WebSocketManager
+
+_SESSION_ID = "bench-session"
+_LEGACY_CHUNK = 65536
+_READLINE_LIMIT = 10 * 1024 * 1024
+
+
+class _NullWebSocket:
+    client_state = WebSocketState.CONNECTED
+
+    async def send_text(self, text: str) -> None:
+        return None
+
+
+def _synthetic_lines(size: int, seed: int = 7) -> list[bytes]:
+    rng = random.Random(seed)
+    lines: list[bytes] = []
+    total = 0
+    n = 0
+    while total < size:
+        n += 1
+        roll = rng.random()
+        if roll < 0.001:
+            # 대용량 tool_result (128KB ~ 2MB)
+            content = "r" * rng.randint(128 * 1024, 2 * 1024 * 1024)
+            event = {
+                "type": "user",
+                "message": {
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": f"tu{n}",
+                            "content": content,
+                        }
+                    ]
+                },
+            }
+        elif roll < 0.1:
+            event = {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "id": f"tu{n}",
+                            "name": "Read",
+                            "input": {"file_path": f"src/module_{n}.py"},
+                        }
+                    ]
+                },
+            }
+        else:
+            text = "토큰 " * rng.randint(1, 40)
+            event = {
+                "type": "stream_event",
+                "event": {
+                    "type": "content_block_delta",
+                    "delta": {"type": "text_delta", "text": text},
+                },
+            }
+        line = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        lines.append(line)
+        total += len(line)
+    return lines
+
+
+async def _spawn_cat(path: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        "cat", path, stdout=asyncio.subprocess.PIPE, limit=_READLINE_LIMIT
+    )
+
+
+def _manager() -> WebSocketManager:
+    manager = WebSocketManager()
+    manager.register(_SESSION_ID, _NullWebSocket())
+    return manager
+
+
+async def _drain(manager: WebSocketManager) -> None:
+    while manager._pending_broadcasts:
+        await asyncio.gather(*manager._pending_broadcasts, return_exceptions=True)
+
+
+async def _run_readline(path: str) -> tuple[float, int]:
+    manager = _manager()
+    process = await _spawn_cat(path)
+    events = 0
+    started = time.perf_counter()
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            break
+        line_str = line.decode("utf-8").strip()
+        if not line_str:
+            continue
+        event = json.loads(line_str)
+        await manager.broadcast_event(_SESSION_ID, {"type": event["type"]})
+        events += 1
+    await _drain(manager)
+    elapsed = time.perf_counter() - started
+    await process.wait()
+    return elapsed, events
+
+
+async def _run_chunked(path: str) -> tuple[float, int]:
+    manager = _manager()
+    process = await _spawn_cat(path)
+    reader = LineReader(process.stdout.read)
+    events = 0
+    started = time.perf_counter()
+    while batch := await reader.read_batch():
+        with manager.coalesce(_SESSION_ID):
+            for line in batch:
+                event = json.loads(line)
+                await manager.broadcast_event(_SESSION_ID, {"type": event["type"]})
+                events += 1
+    await _drain(manager)
+    elapsed = time.perf_counter() - started
+    await process.wait()
+    return elapsed, events
+
+
+def _split_legacy(chunks: list[bytes]) -> int:
+    buffer = b""
+    count = 0
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            pos = buffer.find(b"\n")
+            if pos < 0:
+                break
+            _line = buffer[: pos + 1]
+            buffer = buffer[pos + 1 :]
+            count += 1
+    return count
+
+
+def _split_new(chunks: list[bytes]) -> int:
+    splitter = LineSplitter()
+    return sum(len(splitter.feed(chunk)) for chunk in chunks)
+
+
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "p95_ms": round(
+            ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 1
+        ),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 1),
+    }
+
+
+def _throughput(size: int, samples: list[float]) -> str:
+    return f"{size / (1024 * 1024) / statistics.median(samples):.1f} MB/s"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = _synthetic_lines(int(args.size_mb * 1024 * 1024))
+    data = b"".join(lines)
+    size = len(data)
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        print(f"transcript: {size / (1024 * 1024):.1f}MB, {len(lines)} lines")
+
+        for name, run in (("readline", _run_readline), ("chunked", _run_chunked)):
+            samples = []
+            for _ in range(args.runs):
+                elapsed, events = await run(path)
+                assert events == len(lines), (name, events)
+                samples.append(elapsed)
+            print(f"{name:9} {_throughput(size, samples):>12}  {_summary(samples)}")
+
+        chunks = [data[i : i + _LEGACY_CHUNK] for i in range(0, size, _LEGACY_CHUNK)]
+        print("split only (64KB chunks):")
+        for name, split in (("legacy", _split_legacy), ("splitter", _split_new)):
+            samples = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                assert split(chunks) == len(lines)
+                samples.append(time.perf_counter() - started)
+            print(f"  {name:9} {_throughput(size, samples):>12}  {_summary(samples)}")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        sys.exit("cat 서브프로세스가 필요합니다 (POSIX 전용)")
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""sessions에 message_count/file_changes_count 비정규화 카운터 + keyset 인덱스 추가
+
+세션 목록/검색에서 행마다 실행되던 messages/file_changes correlated count()
+서브쿼리를 제거하기 위해 카운터를 sessions 행에 유지합니다.
+(created_at, id) 복합 인덱스로 keyset(cursor) 페이지네이션을 지원합니다.
+
+Revision ID: 0033
+Revises: 0032
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0033"
+down_revision: Union[str, None] = "0032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "message_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "file_changes_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+    # 기존 데이터 백필 (세션별 1회 집계)
+    op.execute(
+        """
+        UPDATE sessions s SET message_count = m.cnt
+        FROM (SELECT session_id, count(*) AS cnt FROM messages GROUP BY session_id) m
+        WHERE m.session_id = s.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE sessions s SET file_changes_count = f.cnt
+        FROM (SELECT session_id, count(*) AS cnt FROM file_changes GROUP BY session_id) f
+        WHERE f.session_id = s.id
+        """
+    )
+
+    # keyset 페이지네이션: ORDER BY created_at, id 를 인덱스 순서로 처리
+    op.drop_index("idx_sessions_created_at", table_name="sessions")
+    op.create_index("idx_sessions_created_at_id", "sessions", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sessions_created_at_id", table_name="sessions")
+    op.create_index("idx_sessions_created_at", "sessions", ["created_at"])
+    op.drop_column("sessions", "file_changes_count")
+    op.drop_column("sessions", "message_count")
@@ -0,0 +1,48 @@
+"""pr_review_jobs 테이블 추가 — PR 리뷰 작업/결과 영속화
+
+Revision ID: 0034
+Revises: 0033
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0034"
+down_revision: Union[str, None] = "0033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pr_review_jobs",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("repo_path", sa.Text(), nullable=False),
+        sa.Column("pr_number", sa.Integer(), nullable=False),
+        sa.Column("head_sha", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
+        sa.Column("review_text", sa.Text(), nullable=False, server_default=""),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("chunks_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("chunks_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("idx_pr_review_jobs_status", "pr_review_jobs", ["status"])
+    op.create_index(
+        "idx_pr_review_jobs_repo_pr", "pr_review_jobs", ["repo_path", "pr_number"]
+    )
+    op.create_index("idx_pr_review_jobs_created_at", "pr_review_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("pr_review_jobs")
@@ -0,0 +1,52 @@
+"""permission_requests 테이블 + workspaces.trusted_tools 추가 — 권한 요청 영속화
+
+Revision ID: 0035
+Revises: 0034
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0035"
+down_revision: Union[str, None] = "0034"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "permission_requests",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column(
+            "session_id",
+            sa.String(),
+            sa.ForeignKey("sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("tool_name", sa.String(), nullable=False),
+        sa.Column("tool_input", JSONB(), nullable=False, server_default="{}"),
+        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("decided_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "idx_permission_requests_status", "permission_requests", ["status"]
+    )
+    op.create_index(
+        "idx_permission_requests_session_id", "permission_requests", ["session_id"]
+    )
+    op.add_column("workspaces", sa.Column("trusted_tools", JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "trusted_tools")
+    op.drop_table("permission_requests")
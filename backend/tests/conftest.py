@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+import subprocess
 import tempfile
 from unittest.mock import AsyncMock, MagicMock
 from urllib.parse import urlparse
@@ -101,6 +102,8 @@ _TRUNCATE_TABLES = [
     "global_settings",
     "token_snapshots",
     "workflow_definitions",
+    "pr_review_jobs",
+    "permission_requests",
 ]
 
 
@@ -161,10 +164,38 @@ def filesystem_service():
     return FilesystemService()
 
 
+@pytest_asyncio.fixture
+async def git_service():
+    """GitService fixture (cat-file 워커 정리 포함)."""
+    service = GitService()
+    yield service
+    await service.close()
+
+
+def run_git(cwd, *args: str) -> str:
+    """테스트용 git 명령 실행 (실패 시 예외)."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+
+
 @pytest.fixture
-def git_service():
-    """GitService fixture."""
-    return GitService()
+def git_repo(tmp_path):
+    """커밋 1개 + upstream(bare origin)이 설정된 실제 git 저장소."""
+    origin = tmp_path / "origin.git"
+    run_git(tmp_path, "init", "--bare", "-q", str(origin))
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    run_git(repo, "init", "-q", "-b", "main")
+    run_git(repo, "config", "user.email", "test@example.com")
+    run_git(repo, "config", "user.name", "Test")
+    run_git(repo, "remote", "add", "origin", str(origin))
+    (repo / "a.txt").write_text("a\n")
+    (repo / "b.txt").write_text("b\n")
+    run_git(repo, "add", ".")
+    run_git(repo, "commit", "-q", "-m", "initial commit")
+    run_git(repo, "push", "-q", "-u", "origin", "main")
+    return repo
 
 
 @pytest.fixture
@@ -393,6 +393,51 @@ class TestSessionExport:
         assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+class TestSessionTraces:
+    """Tests for per-session turn traces and flamegraph summary."""
+
+    async def test_traces_and_flamegraph(self, test_client: AsyncClient):
+        """Should list finished turn traces and aggregate them by span path."""
+        from app.core.tracing import tracer
+
+        created = await create_test_session(test_client)
+        session_id = created["id"]
+        trace = tracer.start_turn(session_id, "turn00000001")
+        with tracer.span("runner.run"):
+            with tracer.span("process.spawn"):
+                pass
+        tracer.end_turn(trace)
+
+        response = await test_client.get(f"/api/sessions/{session_id}/traces")
+        assert response.status_code == 200
+        (summary,) = response.json()
+        assert summary["turn_id"] == "turn00000001"
+
+        response = await test_client.get(
+            f"/api/sessions/{session_id}/traces/flamegraph"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["turns"] == 1
+        assert data["tree"]["children"][0]["name"] == "runner.run"
+
+        response = await test_client.get(
+            f"/api/sessions/{session_id}/traces/flamegraph?format=folded"
+        )
+        assert response.status_code == 200
+        assert response.text.startswith("turn")
+
+        await test_client.delete(f"/api/sessions/{session_id}")
+        assert tracer.traces(session_id) == []
+
+    async def test_traces_session_not_found(self, test_client: AsyncClient):
+        """Should return 404 for unknown session."""
+        response = await test_client.get("/api/sessions/non-existent-id/traces")
+
+        assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 class TestSessionWorkflow:
     """Tests for session workflow and permission functionality."""
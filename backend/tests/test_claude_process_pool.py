@@ -0,0 +1,261 @@
+"""ClaudeProcessPool 테스트 (사전 기동, 설정 불일치 폐기, 만료/축출, config 참조)."""
+
+import asyncio
+import json
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from app.core.config import Settings
+from app.services.claude_process_pool import (
+    ClaudeProcessPool,
+    to_stream_input,
+    user_message_line,
+)
+from app.services.claude_runner import ClaudeRunner
+from app.services.mcp_config_store import McpConfigStore
+from app.services.process_monitor import ProcessMonitor
+
+# stream-json 사용자 메시지를 읽어 result 이벤트로 응답하는 가짜 CLI
+_FAKE_CLI = """
+import json, sys
+for line in sys.stdin:
+    text = json.loads(line)["message"]["content"][0]["text"]
+    print(json.dumps({"type": "result", "result": text}), flush=True)
+"""
+
+
+async def _spawn(cmd, work_dir):
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=work_dir,
+    )
+
+
+async def _ask(process, prompt: str) -> str:
+    process.stdin.write(user_message_line(prompt))
+    await process.stdin.drain()
+    process.stdin.close()
+    line = await asyncio.wait_for(process.stdout.readline(), timeout=5)
+    await process.wait()
+    return json.loads(line)["result"]
+
+
+def _cmd(*extra: str) -> list[str]:
+    return [sys.executable, "-c", _FAKE_CLI, *extra]
+
+
+async def _settled(pool: ClaudeProcessPool) -> None:
+    for _ in range(100):
+        if not pool.get_metrics()["prewarming"]:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def pool():
+    p = ClaudeProcessPool(_spawn, max_size=2, idle_ttl=60)
+    yield p
+    await p.close()
+
+
+def test_to_stream_input():
+    cmd, prompt = to_stream_input(["claude", "-p", "안녕", "--resume", "abc"])
+
+    assert prompt == "안녕"
+    assert cmd == [
+        "claude",
+        "-p",
+        "--input-format",
+        "stream-json",
+        "--resume",
+        "abc",
+    ]
+
+
+class TestClaudeProcessPool:
+    @pytest.mark.asyncio
+    async def test_prewarmed_process_reused(self, pool, tmp_path):
+        pool.prewarm("s1", _cmd(), str(tmp_path))
+        await _settled(pool)
+        warm_pid = pool._warm["s1"].process.pid
+
+        process, warm = await pool.acquire("s1", _cmd(), str(tmp_path))
+
+        assert warm is True
+        assert process.pid == warm_pid
+        assert await _ask(process, "다음 질문") == "다음 질문"
+        assert pool.get_metrics()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_pending_prewarm(self, pool, tmp_path):
+        pool.prewarm("s1", _cmd(), str(tmp_path))
+
+        process, warm = await pool.acquire("s1", _cmd(), str(tmp_path))
+
+        assert warm is True
+        assert await _ask(process, "x") == "x"
+
+    @pytest.mark.asyncio
+    async def test_changed_arguments_discard_warm(self, pool, tmp_path):
+        pool.prewarm("s1", _cmd("--model", "a"), str(tmp_path))
+        await _settled(pool)
+        stale = pool._warm["s1"].process
+
+        process, warm = await pool.acquire("s1", _cmd("--model", "b"), str(tmp_path))
+
+        assert warm is False
+        assert process.pid != stale.pid
+        assert await asyncio.wait_for(stale.wait(), timeout=5) is not None
+        assert await _ask(process, "y") == "y"
+        assert pool.get_metrics()["mismatches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mcp_config_content_part_of_signature(self, tmp_path):
+        store = McpConfigStore(tmp_path / "mcp", max_idle=0)
+        pool = ClaudeProcessPool(
+            _spawn, max_size=2, idle_ttl=60, release_config=store.release
+        )
+        try:
+            old = store.acquire({"mcpServers": {"a": {}}})
+            pool.prewarm(
+                "s1", _cmd("--mcp-config", str(old)), str(tmp_path), mcp_config=old
+            )
+            await _settled(pool)
+            # warm 항목이 참조를 유지 → 다른 턴이 반납해도 파일 유지
+            store.release(store.acquire({"mcpServers": {"a": {}}}))
+            assert old.exists()
+
+            new = store.acquire({"mcpServers": {"b": {}}})
+            process, warm = await pool.acquire(
+                "s1", _cmd("--mcp-config", str(new)), str(tmp_path)
+            )
+
+            assert warm is False
+            assert not old.exists()  # 불일치 폐기 시 참조 반납
+            await _ask(process, "z")
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_warm_entry_tracked_and_config_released_on_take(self, tmp_path):
+        store = McpConfigStore(tmp_path / "mcp")
+        monitor = ProcessMonitor()
+        pool = ClaudeProcessPool(
+            _spawn,
+            max_size=2,
+            idle_ttl=60,
+            release_config=store.release,
+            monitor=monitor,
+        )
+        try:
+            config = store.acquire({"mcpServers": {"a": {}}})
+            cmd = _cmd("--mcp-config", str(config))
+            pool.prewarm("s1", cmd, str(tmp_path), mcp_config=config)
+            await _settled(pool)
+            assert monitor.get_metrics()["idle_tracked"] == 1
+            assert store.get_metrics()["references"] == 1
+
+            process, warm = await pool.acquire("s1", cmd, str(tmp_path))
+
+            assert warm is True
+            assert monitor.get_metrics()["idle_tracked"] == 0
+            assert store.get_metrics()["references"] == 0
+            await _ask(process, "t")
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_prewarm_releases_config(self, tmp_path):
+        store = McpConfigStore(tmp_path / "mcp")
+        pool = ClaudeProcessPool(
+            _spawn, max_size=2, idle_ttl=60, release_config=store.release
+        )
+        first = store.acquire({"mcpServers": {"a": {}}})
+        pool.prewarm(
+            "s1", _cmd("--mcp-config", str(first)), str(tmp_path), mcp_config=first
+        )
+        second = store.acquire({"mcpServers": {"a": {}}})
+        pool.prewarm(
+            "s1", _cmd("--mcp-config", str(second)), str(tmp_path), mcp_config=second
+        )
+        await _settled(pool)
+        assert store.get_metrics()["references"] == 1
+
+        await pool.close()
+        assert store.get_metrics()["references"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_expiry_and_eviction(self, tmp_path):
+        pool = ClaudeProcessPool(_spawn, max_size=1, idle_ttl=0.1)
+        try:
+            pool.prewarm("s1", _cmd(), str(tmp_path))
+            await _settled(pool)
+            pool.prewarm("s2", _cmd(), str(tmp_path))
+            await _settled(pool)
+            assert list(pool._warm) == ["s2"]  # max_size 초과 → 오래된 항목 축출
+
+            await asyncio.sleep(0.2)
+            metrics = pool.get_metrics()
+            assert metrics["warm"] == 0
+            assert (metrics["evicted"], metrics["expired"]) == (1, 1)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_disabled_pool_never_prewarms(self, tmp_path):
+        pool = ClaudeProcessPool(_spawn, max_size=0)
+        pool.prewarm("s1", _cmd(), str(tmp_path))
+
+        process, warm = await pool.acquire("s1", _cmd(), str(tmp_path))
+
+        assert warm is False
+        await _ask(process, "w")
+        await pool.close()
+
+
+class TestRunnerPrewarm:
+    @pytest.mark.asyncio
+    async def test_prewarm_matches_merged_session(self, tmp_path):
+        runner = ClaudeRunner(Settings(mcp_config_dir=str(tmp_path / "mcp")))
+
+        async def _fake_spawn(cmd, work_dir):
+            return await _spawn(_cmd(), work_dir)
+
+        pool = ClaudeProcessPool(_fake_spawn, max_size=1, idle_ttl=60)
+        runner._process_pool = pool
+        # ws.py가 턴에 넘기는 세션: 글로벌 기본값 + KB 컨텍스트가 병합된 상태
+        merged = {
+            "work_dir": str(tmp_path),
+            "claude_session_id": "conv-1",
+            "model": "global-default-model",
+            "system_prompt": "\n\n<knowledge_base>\nKB\n</knowledge_base>",
+        }
+        # DB 원본: 병합 전 + 턴 결과로 갱신된 대화 id
+        session_manager = AsyncMock()
+        session_manager.get = AsyncMock(
+            return_value={"work_dir": str(tmp_path), "claude_session_id": "conv-2"}
+        )
+        try:
+            runner._schedule_prewarm("s1", merged, session_manager, "Read")
+            for _ in range(200):
+                if "s1" in pool._warm:
+                    break
+                await asyncio.sleep(0.01)
+
+            cmd, _, _ = runner._build_command(
+                {**merged, "claude_session_id": "conv-2"}, "다음", "Read", "s1"
+            )
+            stream_cmd, prompt = to_stream_input(cmd)
+            process, warm = await pool.acquire("s1", stream_cmd, str(tmp_path))
+
+            assert warm is True
+            assert await _ask(process, prompt) == "다음"
+        finally:
+            await pool.close()
+            await runner.close()
@@ -0,0 +1,175 @@
+"""ResidentProcessRegistry 테스트 (턴 경계, 긴 줄, 재사용 조건, 재활용)."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+import pytest_asyncio
+
+from app.services.claude_resident_process import ResidentProcessRegistry
+
+# 사용자 메시지마다 stream_event + result를 한 번에 출력하고 다음 메시지를 기다리는
+# 가짜 CLI. result의 session_id는 --resume 값 (없으면 "conv-new").
+# "big"이면 1MB stream_event, "tail"이면 result 뒤에 system 이벤트를 이어서 출력
+_FAKE_CLI = """
+import json, sys
+sid = sys.argv[sys.argv.index("--resume") + 1] if "--resume" in sys.argv else "conv-new"
+for line in sys.stdin:
+    text = json.loads(line)["message"]["content"][0]["text"]
+    event = {"type": "stream_event", "text": text}
+    if text == "big":
+        event["pad"] = "x" * (1024 * 1024)
+    out = [event, {"type": "result", "result": text, "session_id": sid}]
+    if text == "tail":
+        out.append({"type": "system", "text": "trailing"})
+    sys.stdout.write("".join(json.dumps(e) + "\\n" for e in out))
+    sys.stdout.flush()
+"""
+
+
+async def _spawn(cmd, work_dir):
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=work_dir,
+    )
+
+
+def _cmd(*extra: str) -> list[str]:
+    return [sys.executable, "-c", _FAKE_CLI, *extra]
+
+
+async def _read_turn(turn) -> list[dict]:
+    events = []
+    while True:
+        batch = await asyncio.wait_for(turn.stdout.read_batch(), timeout=5)
+        if not batch:
+            return events
+        events.extend(json.loads(line) for line in batch)
+
+
+@pytest_asyncio.fixture
+async def registry():
+    r = ResidentProcessRegistry(_spawn, max_size=2, idle_ttl=60, max_rss_mb=100)
+    yield r
+    await r.close()
+
+
+class TestResidentProcessRegistry:
+    @pytest.mark.asyncio
+    async def test_process_kept_across_turns(self, registry, tmp_path):
+        first = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+        events = await _read_turn(first)
+        registry.finish_turn(first)
+
+        second = await registry.start_turn(
+            "s1", _cmd("--resume", "conv-new"), str(tmp_path), "둘"
+        )
+        assert second.reused is True
+        assert second.pid == first.pid
+        assert [e["type"] for e in events] == ["stream_event", "result"]
+        assert (await _read_turn(second))[-1]["result"] == "둘"
+        assert await second.wait() == 0
+        registry.finish_turn(second)
+        assert registry.holds("s1")
+        assert registry.get_metrics()["reused_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_long_line_read_in_chunks(self, registry, tmp_path):
+        # StreamReader 줄 한도(기본 64KB)를 넘는 줄도 턴을 깨뜨리지 않음
+        turn = await registry.start_turn("s1", _cmd(), str(tmp_path), "big")
+        events = await _read_turn(turn)
+
+        assert len(events[0]["pad"]) == 1024 * 1024
+        assert events[-1]["type"] == "result"
+        assert turn.stdout.dropped_lines == 0
+        registry.finish_turn(turn)
+        assert registry.holds("s1")
+
+    @pytest.mark.asyncio
+    async def test_lines_after_result_kept_for_next_turn(self, registry, tmp_path):
+        first = await registry.start_turn("s1", _cmd(), str(tmp_path), "tail")
+        events = await _read_turn(first)
+        registry.finish_turn(first)
+        assert [e["type"] for e in events] == ["stream_event", "result"]
+
+        second = await registry.start_turn(
+            "s1", _cmd("--resume", "conv-new"), str(tmp_path), "둘"
+        )
+        events = await _read_turn(second)
+
+        assert second.reused is True
+        assert [e["type"] for e in events] == ["system", "stream_event", "result"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_resume_target_respawns(self, registry, tmp_path):
+        first = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+        await _read_turn(first)
+        registry.finish_turn(first)
+
+        second = await registry.start_turn(
+            "s1", _cmd("--resume", "other"), str(tmp_path), "둘"
+        )
+        assert second.reused is False
+        assert second.pid != first.pid
+        assert (await _read_turn(second))[-1]["session_id"] == "other"
+        registry.finish_turn(second)
+        assert registry.get_metrics()["mismatches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stopped_turn_recycles_process(self, registry, tmp_path):
+        turn = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+        turn.terminate()
+        await turn.wait()
+        registry.finish_turn(turn)
+
+        assert not registry.holds("s1")
+        assert registry.get_metrics()["incomplete"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cap_recycles_process(self, registry, tmp_path):
+        turn = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+        await _read_turn(turn)
+        registry.finish_turn(turn, rss_bytes=200 * 1024 * 1024)
+
+        assert not registry.holds("s1")
+        assert registry.get_metrics()["recycled_memory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_process_expires(self, tmp_path):
+        registry = ResidentProcessRegistry(_spawn, max_size=1, idle_ttl=0.05)
+        try:
+            turn = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+            await _read_turn(turn)
+            registry.finish_turn(turn)
+            await asyncio.sleep(0.2)
+
+            assert not registry.holds("s1")
+            assert registry.get_metrics()["expired"] == 1
+        finally:
+            await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_full_registry_evicts_idle_or_falls_back(self, tmp_path):
+        registry = ResidentProcessRegistry(_spawn, max_size=1, idle_ttl=60)
+        try:
+            idle = await registry.start_turn("s1", _cmd(), str(tmp_path), "하나")
+            await _read_turn(idle)
+            registry.finish_turn(idle)
+
+            busy = await registry.start_turn("s2", _cmd(), str(tmp_path), "둘")
+            assert not registry.holds("s1")
+            # s2 턴 진행 중 → 자리 없음 / 같은 세션 동시 턴 → 일회성 프로세스 사용
+            assert await registry.start_turn("s3", _cmd(), str(tmp_path), "셋") is None
+            assert await registry.start_turn("s2", _cmd(), str(tmp_path), "넷") is None
+            await _read_turn(busy)
+            registry.finish_turn(busy)
+
+            metrics = registry.get_metrics()
+            assert metrics["evicted"] == 1
+            assert metrics["fallbacks"] == 2
+        finally:
+            await registry.close()
@@ -4,17 +4,19 @@ PostgreSQL + SQLAlchemy ORM + Repository 패턴 기반.
 """
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import track_round_trips
 from app.models.file_change import FileChange
 from app.models.session import Session
 from app.repositories.event_repo import EventRepository
 from app.repositories.file_change_repo import FileChangeRepository
 from app.repositories.message_repo import MessageRepository
+from app.repositories.search_repo import SearchRepository
 from app.repositories.session_repo import SessionRepository
 
 
@@ -53,6 +55,17 @@ class TestDatabaseLifecycle:
         engine = db.engine
         assert engine is not None
 
+    async def test_track_round_trips_counts_executes(self, db):
+        """track_round_trips()가 현재 컨텍스트의 SQL 실행 횟수를 집계."""
+        counter = track_round_trips()
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+            await session.execute(text("SELECT 2"))
+        assert counter.count == 2
+
+        # 새 카운터 바인딩 시 0부터 다시 집계
+        assert track_round_trips().count == 0
+
 
 # ---------------------------------------------------------------------------
 # Session Repository 테스트
@@ -227,6 +240,33 @@ class TestMessageRepository:
             assert count == 5
 
 
+    async def test_session_counters_maintained(self, db):
+        """add_batch/copy/delete가 sessions.message_count를 같은 트랜잭션에서 갱신."""
+        await self._create_session(db, "cnt-a")
+        await self._create_session(db, "cnt-b")
+        now = datetime.now(timezone.utc)
+
+        async with db.session() as session:
+            repo = MessageRepository(session)
+            await repo.add_batch(
+                [
+                    {"session_id": sid, "role": "user", "content": "m", "timestamp": now}
+                    for sid in ("cnt-a", "cnt-a", "cnt-b")
+                ]
+            )
+            await repo.copy_messages_to_session("cnt-a", "cnt-b")
+            await session.commit()
+
+        async with db.session() as session:
+            repo = SessionRepository(session)
+            assert (await repo.get_with_counts("cnt-a"))["message_count"] == 2
+            assert (await repo.get_with_counts("cnt-b"))["message_count"] == 3
+
+            await MessageRepository(session).delete_by_session("cnt-a")
+            await session.commit()
+            assert (await repo.get_with_counts("cnt-a"))["message_count"] == 0
+
+
 # ---------------------------------------------------------------------------
 # FileChange Repository 테스트
 # ---------------------------------------------------------------------------
@@ -267,6 +307,36 @@ class TestFileChangeRepository:
             changes = await repo.get_by_session("fc-test")
             assert len(changes) == 2
 
+    async def test_add_batch_updates_counter(self, db):
+        """add_batch가 sessions.file_changes_count를 갱신."""
+        async with db.session() as session:
+            await SessionRepository(session).add(
+                Session(
+                    id="fc-count",
+                    work_dir="/test",
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            await session.commit()
+
+        async with db.session() as session:
+            await FileChangeRepository(session).add_batch(
+                [
+                    {
+                        "session_id": "fc-count",
+                        "tool": "Write",
+                        "file": f"/test/{i}.txt",
+                        "timestamp": datetime.now(timezone.utc),
+                    }
+                    for i in range(3)
+                ]
+            )
+            await session.commit()
+
+        async with db.session() as session:
+            row = await SessionRepository(session).get_with_counts("fc-count")
+            assert row["file_changes_count"] == 3
+
 
 # ---------------------------------------------------------------------------
 # Event Repository 테스트
@@ -422,3 +492,57 @@ class TestEventRepository:
             evt_repo = EventRepository(session)
             events = await evt_repo.get_all_events("cascade-test")
             assert len(events) == 0
+
+
+# ---------------------------------------------------------------------------
+# Search Repository 테스트
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+class TestSearchRepository:
+    """SearchRepository keyset 페이지네이션 테스트."""
+
+    async def _seed(self, db, count: int) -> list[str]:
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ids = []
+        async with db.session() as session:
+            repo = SessionRepository(session)
+            for i in range(count):
+                sid = f"search-{i:02d}"
+                # 동일 created_at 쌍을 섞어 id 보조 정렬 검증
+                await repo.add(
+                    Session(
+                        id=sid,
+                        work_dir="/test",
+                        created_at=base + timedelta(minutes=i // 2),
+                    )
+                )
+                ids.append(sid)
+            await session.commit()
+        return ids
+
+    async def test_keyset_pages_cover_all_rows(self, db):
+        """next_key를 따라가면 중복/누락 없이 전체 행을 순회."""
+        ids = await self._seed(db, 7)
+
+        seen: list[str] = []
+        after = None
+        async with db.session() as session:
+            repo = SearchRepository(session)
+            while True:
+                items, total, after = await repo.search_sessions(limit=3, after=after)
+                seen.extend(item["id"] for item in items)
+                assert total == 7
+                if after is None:
+                    break
+
+        assert seen == sorted(ids, reverse=True)
+
+    async def test_estimated_total(self, db):
+        """estimate_total=True면 플래너 추정치(음수가 아닌 정수)를 반환."""
+        await self._seed(db, 3)
+        async with db.session() as session:
+            items, total, _ = await SearchRepository(session).search_sessions(
+                limit=10, estimate_total=True, q="search-"
+            )
+        assert len(items) == 3
+        assert isinstance(total, int) and total >= 0
@@ -0,0 +1,112 @@
+"""DiffCache 테스트 (메모리/디스크 단계, LRU 퇴거, 스트리밍 기록)."""
+
+import os
+
+import pytest
+
+from app.services.diff_cache import DiffCache
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestDiffCache:
+    @pytest.mark.asyncio
+    async def test_memory_only_get_put(self):
+        """디렉토리 없이 메모리 단계만 사용."""
+        cache = DiffCache()
+
+        assert await cache.get("k") is None
+        await cache.put("k", "diff --git a/x b/x\n")
+
+        assert await cache.get("k") == "diff --git a/x b/x\n"
+        metrics = cache.get_metrics()
+        assert metrics["memory_hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_memory_lru_eviction_by_size(self):
+        """메모리 크기 한도 초과 시 가장 오래된 항목부터 퇴거."""
+        cache = DiffCache(memory_max_bytes=10, memory_entry_max_bytes=10)
+        await cache.put("a", "12345")
+        await cache.put("b", "12345")
+        await cache.get("a")  # a를 최근 사용으로
+        await cache.put("c", "12345")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "12345"
+        assert cache.get_metrics()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """디스크 항목은 새 인스턴스에서 색인되어 재사용."""
+        cache = DiffCache(tmp_path)
+        await cache.open()
+        await cache.put("k", "persisted")
+
+        reopened = DiffCache(tmp_path)
+        await reopened.open()
+
+        assert reopened.get_metrics()["disk_entries"] == 1
+        assert await reopened.get("k") == "persisted"
+        assert reopened.get_metrics()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_eviction_and_tmp_cleanup(self, tmp_path):
+        """디스크 크기 한도 초과 시 파일 삭제, 미완료 임시 파일 정리."""
+        (tmp_path / "leftover.diff.1.2.tmp").write_bytes(b"partial")
+        cache = DiffCache(tmp_path, disk_max_bytes=10, memory_entry_max_bytes=0)
+        await cache.open()
+
+        await cache.put("a", "123456")
+        await cache.put("b", "123456")
+
+        files = sorted(os.listdir(tmp_path))
+        assert files == [DiffCache._filename("b")]
+        assert await cache.get("a") is None
+        assert cache.get_metrics()["disk_bytes"] == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_records_and_replays(self, tmp_path):
+        """miss 시 produce 출력을 전달하며 기록, 이후에는 캐시에서 전달."""
+        cache = DiffCache(tmp_path, memory_entry_max_bytes=4)
+        await cache.open()
+        calls = 0
+
+        def produce():
+            nonlocal calls
+            calls += 1
+            return _chunks(b"large ", b"diff")
+
+        first = await _collect(cache.stream("k", produce))
+        second = await _collect(cache.stream("k", produce))
+
+        assert first == second == b"large diff"
+        assert calls == 1
+        # 메모리 단계 한도(4바이트) 초과 → 디스크에서 전달
+        metrics = cache.get_metrics()
+        assert metrics["memory_entries"] == 0
+        assert metrics["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_not_cached(self, tmp_path):
+        """produce 실패 시 부분 결과를 기록하지 않음."""
+        cache = DiffCache(tmp_path)
+        await cache.open()
+
+        async def failing():
+            yield b"partial"
+            raise RuntimeError("git 실패")
+
+        with pytest.raises(RuntimeError):
+            await _collect(cache.stream("k", failing))
+
+        assert os.listdir(tmp_path) == []
+        assert await cache.get("k") is None
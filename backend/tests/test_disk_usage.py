@@ -0,0 +1,89 @@
+"""DiskUsageScanner 테스트 (st_blocks 합산, mtime 캐시 재사용, 증분 재계산)."""
+
+import os
+import shutil
+
+import pytest
+
+from app.services.disk_usage import DiskUsageScanner
+
+
+def _du(root) -> int:
+    """기준값: os.walk + lstat st_blocks 합 (디렉토리 자체 포함)."""
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        total += os.lstat(dirpath).st_blocks * 512
+        for name in filenames:
+            total += os.lstat(os.path.join(dirpath, name)).st_blocks * 512
+    return total
+
+
+def _write(path, size: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(os.urandom(size))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "repo"
+    for pkg in range(5):
+        for mod in range(3):
+            _write(root / "node_modules" / f"pkg{pkg}" / "lib" / f"m{mod}.js", 5000)
+    _write(root / "src" / "main.py", 12000)
+    _write(root / "README.md", 100)
+    # 스캔 직후 변경(racy) 판정을 피하도록 디렉토리 mtime을 과거로
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (1_000_000_000, 1_000_000_000))
+    return root
+
+
+class TestDiskUsageScanner:
+    @pytest.mark.asyncio
+    async def test_matches_allocated_blocks(self, tree):
+        scanner = DiskUsageScanner(parallelism=3)
+        assert await scanner.measure(str(tree)) == _du(tree)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_reuses_every_directory(self, tree):
+        scanner = DiskUsageScanner()
+        first = await scanner.measure(str(tree))
+        scanned = scanner.get_metrics()["dirs_scanned"]
+
+        assert await scanner.measure(str(tree)) == first
+        metrics = scanner.get_metrics()
+        assert metrics["dirs_scanned"] == scanned  # scandir 추가 호출 없음
+        assert metrics["dirs_reused"] == scanned
+
+    @pytest.mark.asyncio
+    async def test_only_changed_directories_rescanned(self, tree):
+        scanner = DiskUsageScanner()
+        await scanner.measure(str(tree))
+        before = scanner.get_metrics()["dirs_scanned"]
+
+        _write(tree / "src" / "extra.py", 40000)
+        os.utime(tree / "src", (1_000_000_100, 1_000_000_100))
+        total = await scanner.measure(str(tree))
+
+        assert total == _du(tree)
+        assert scanner.get_metrics()["dirs_scanned"] == before + 1
+
+    @pytest.mark.asyncio
+    async def test_removed_subtree_dropped(self, tree):
+        scanner = DiskUsageScanner()
+        await scanner.measure(str(tree))
+        shutil.rmtree(tree / "node_modules")
+
+        assert await scanner.measure(str(tree)) == _du(tree)
+        assert scanner.get_metrics()["cached_dirs"] == 2  # repo, src
+
+    @pytest.mark.asyncio
+    async def test_full_scan_catches_in_place_rewrite(self, tree):
+        """파일 내용만 바뀌면 디렉토리 mtime이 그대로 → full=True로 보정."""
+        scanner = DiskUsageScanner()
+        await scanner.measure(str(tree))
+        readme = tree / "README.md"
+        readme.write_bytes(os.urandom(200000))
+        os.utime(tree, (1_000_000_000, 1_000_000_000))
+
+        assert await scanner.measure(str(tree)) < _du(tree)
+        assert await scanner.measure(str(tree), full=True) == _du(tree)
@@ -0,0 +1,80 @@
+"""계측 스레드 풀 실행기 테스트."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from app.core.executors import (
+    ExecutorKind,
+    InstrumentedThreadPoolExecutor,
+    get_executor_metrics,
+    run_cpu_bound,
+    run_in_executor,
+)
+
+
+class TestInstrumentedThreadPoolExecutor:
+    @pytest.mark.asyncio
+    async def test_reports_queue_depth_and_saturation(self):
+        """스레드가 모두 사용 중이면 대기열 깊이와 포화 상태 보고."""
+        executor = InstrumentedThreadPoolExecutor(1, "test")
+        release = threading.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            first = loop.run_in_executor(executor, release.wait)
+            second = loop.run_in_executor(executor, lambda: None)
+            await asyncio.sleep(0.05)
+
+            metrics = executor.get_metrics()
+            assert metrics["active"] == 1
+            assert metrics["queued"] == 1
+            assert metrics["saturated"] is True
+
+            release.set()
+            await asyncio.gather(first, second)
+
+            metrics = executor.get_metrics()
+            assert metrics["active"] == 0
+            assert metrics["queued"] == 0
+            assert metrics["submitted_total"] == 2
+            assert metrics["wait_ms_max"] >= 40
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+
+class TestWorkloadExecutors:
+    @pytest.mark.asyncio
+    async def test_pipe_reads_not_queued_behind_scans(self):
+        """FS_SCAN 실행기가 포화되어도 PIPE 작업은 즉시 실행."""
+        release = threading.Event()
+        scans = [
+            asyncio.ensure_future(run_in_executor(ExecutorKind.FS_SCAN, release.wait))
+            for _ in range(8)
+        ]
+        try:
+            await asyncio.sleep(0.05)
+            started = time.monotonic()
+            name = await run_in_executor(
+                ExecutorKind.PIPE, lambda: threading.current_thread().name
+            )
+
+            assert time.monotonic() - started < 0.5
+            assert name.startswith(ExecutorKind.PIPE)
+            metrics = get_executor_metrics()
+            assert metrics[ExecutorKind.FS_SCAN]["saturated"] is True
+            assert metrics[ExecutorKind.FS_SCAN]["queued"] > 0
+        finally:
+            release.set()
+            await asyncio.gather(*scans)
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_runs_in_process_pool(self):
+        """CPU 작업은 별도 프로세스에서 실행."""
+        pid = await run_cpu_bound(os.getpid)
+
+        assert pid != os.getpid()
+        assert get_executor_metrics()[ExecutorKind.CPU]["submitted_total"] >= 1
@@ -1,5 +1,6 @@
 """Tests for FilesystemService, GitService, and SkillsService."""
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -10,8 +11,12 @@ from app.core.exceptions import ValidationError
 from app.schemas.filesystem import (
     DirectoryListResponse,
     GitInfo,
+    GitStatusResponse,
     SkillListResponse,
 )
+from app.services.git_cat_file import CatFilePool
+from app.services.git_service import GitService, _GitSnapshot
+from tests.conftest import run_git
 
 
 class TestValidatePath:
@@ -298,17 +303,335 @@ class TestGetGitInfo:
         with tempfile.TemporaryDirectory() as tmpdir:
             call_count = 0
 
-            async def mock_fetch(*args, **kwargs):
+            async def mock_snapshot(*args, **kwargs):
                 nonlocal call_count
                 call_count += 1
-                return GitInfo(is_git_repo=True, branch="main")
+                return _GitSnapshot(
+                    info=GitInfo(is_git_repo=True, branch="main"),
+                    status=GitStatusResponse(is_git_repo=True),
+                )
 
-            with patch.object(git_service, "_fetch_git_info", side_effect=mock_fetch):
+            with patch.object(
+                git_service, "_take_snapshot", side_effect=mock_snapshot
+            ):
                 # First call
                 result1 = await git_service.get_git_info(tmpdir)
                 # Second call (should use cache)
                 result2 = await git_service.get_git_info(tmpdir)
 
-                assert call_count == 1  # Should only call _fetch_git_info once
+                assert call_count == 1  # Should only take one snapshot
                 assert result1 == result2
                 assert result1.branch == "main"
+
+
+class TestParsePorcelainV2:
+    """Tests for GitService._parse_porcelain_v2 (v2 -z 출력 → v1 상태 표기)."""
+
+    def test_parse_headers_and_entries(self):
+        output = "\x00".join(
+            [
+                "# branch.oid 1234abcd",
+                "# branch.head main",
+                "# branch.upstream origin/main",
+                "# branch.ab +2 -1",
+                "1 .M N... 100644 100644 100644 aaa bbb modified file.txt",
+                "1 A. N... 000000 100644 100644 000 ccc added.txt",
+                "2 R. N... 100644 100644 100644 ddd ddd R100 new name.txt",
+                "old name.txt",
+                "u UU N... 100644 100644 100644 100644 e1 e2 e3 conflict.txt",
+                "? untracked dir/",
+                "",
+            ]
+        )
+
+        headers, files = GitService._parse_porcelain_v2(output)
+
+        assert headers["branch.head"] == "main"
+        assert headers["branch.ab"] == "+2 -1"
+        assert [(f.path, f.status) for f in files] == [
+            ("modified file.txt", "M"),
+            ("added.txt", "A"),
+            ("new name.txt", "R"),
+            ("conflict.txt", "UU"),
+            ("untracked dir/", "??"),
+        ]
+        assert files[0].is_unstaged and not files[0].is_staged
+        assert files[1].is_staged and not files[1].is_unstaged
+        assert files[4].is_untracked
+
+
+class TestGitSnapshot:
+    """get_git_info / get_git_status 스냅샷 공유 (실제 git 저장소)."""
+
+    @pytest.mark.asyncio
+    async def test_info_and_status_from_single_snapshot(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("changed\n")
+        (git_repo / "c.txt").write_text("new\n")
+        run_git(git_repo, "add", "c.txt")
+        (git_repo / "d.txt").write_text("untracked\n")
+
+        status = await git_service.get_git_status(str(git_repo))
+        commands_after_status = git_service.get_metrics()["git_commands_total"]
+        info = await git_service.get_git_info(str(git_repo))
+
+        # get_git_info는 get_git_status가 만든 스냅샷을 재사용 (추가 fork 없음)
+        assert git_service.get_metrics()["git_commands_total"] == commands_after_status
+        assert status.repo_root == str(git_repo)
+        assert {f.path: f.status for f in status.files} == {
+            "a.txt": "M",
+            "c.txt": "A",
+            "d.txt": "??",
+        }
+        assert status.total_count == 3
+        assert info.branch == "main"
+        assert info.is_dirty and info.has_untracked
+        assert info.last_commit_message == "initial commit"
+        assert info.remote_url and info.remote_url.endswith("origin.git")
+        assert info.is_worktree is False
+
+    @pytest.mark.asyncio
+    async def test_fork_count_and_commit_reuse(self, git_service, git_repo):
+        await git_service.get_git_status(str(git_repo))
+        # 최초: rev-parse + remote get-url + status + log
+        assert git_service.get_metrics()["git_commands_total"] == 4
+
+        await git_service.get_git_status(str(git_repo))
+        # HEAD 불변: status 1회만 (layout/커밋 정보 재사용)
+        assert git_service.get_metrics()["git_commands_total"] == 5
+
+        (git_repo / "a.txt").write_text("changed\n")
+        run_git(git_repo, "commit", "-q", "-am", "second commit")
+        await git_service.get_git_status(str(git_repo))
+        info = await git_service.get_git_info(str(git_repo))
+        assert git_service.get_metrics()["git_commands_total"] == 7
+        assert info.last_commit_message == "second commit"
+        assert info.ahead == 1 and info.behind == 0
+        assert info.is_dirty is False
+
+    @pytest.mark.asyncio
+    async def test_detached_head_and_invalidate(self, git_service, git_repo):
+        info = await git_service.get_git_info(str(git_repo))
+        assert info.branch == "main"
+
+        run_git(git_repo, "checkout", "-q", "--detach")
+        # TTL 내에서는 캐시, 무효화 후 재조회
+        assert (await git_service.get_git_info(str(git_repo))).branch == "main"
+        git_service._invalidate_cache(str(git_repo))
+        assert (await git_service.get_git_info(str(git_repo))).branch is None
+
+
+class TestFileDiff:
+    """cat-file 워커 + 프로세스 내 diff (실제 git 저장소)."""
+
+    @staticmethod
+    def _body(diff: str) -> list[str]:
+        """hunk 이후 본문만 비교 (index 헤더 형식 차이 무시)."""
+        lines = diff.splitlines()
+        start = next(i for i, line in enumerate(lines) if line.startswith("@@"))
+        return lines[start:]
+
+    @pytest.mark.asyncio
+    async def test_matches_git_diff_output(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("a\nadded\n")
+        (git_repo / "b.txt").write_text("no newline")
+
+        for name in ("a.txt", "b.txt"):
+            diff = await git_service.get_file_diff(str(git_repo), name)
+            expected = run_git(git_repo, "diff", "HEAD", "--", name)
+            assert diff.splitlines()[0] == f"diff --git a/{name} b/{name}"
+            assert f"--- a/{name}" in diff and f"+++ b/{name}" in diff
+            assert self._body(diff) == self._body(expected)
+
+    @pytest.mark.asyncio
+    async def test_untracked_deleted_and_binary(self, git_service, git_repo):
+        (git_repo / "new.txt").write_text("hello\n")
+        (git_repo / "b.txt").unlink()
+        (git_repo / "bin.dat").write_bytes(b"\x00\x01\x02")
+
+        new_diff = await git_service.get_file_diff(str(git_repo), "new.txt")
+        deleted_diff = await git_service.get_file_diff(str(git_repo), "b.txt")
+        binary_diff = await git_service.get_file_diff(str(git_repo), "bin.dat")
+
+        assert "new file mode 100644" in new_diff
+        assert "--- /dev/null" in new_diff and "+hello" in new_diff
+        assert "deleted file mode 100644" in deleted_diff
+        assert "+++ /dev/null" in deleted_diff and "-b" in deleted_diff
+        assert "Binary files /dev/null and b/bin.dat differ" in binary_diff
+        assert await git_service.get_file_diff(str(git_repo), "a.txt") == ""
+
+    @pytest.mark.asyncio
+    async def test_index_only_change_and_worker_refresh(self, git_service, git_repo):
+        assert await git_service.get_file_diff(str(git_repo), "a.txt") == ""
+
+        # stage 후 작업 트리를 HEAD로 되돌림 → index -> worktree diff
+        (git_repo / "a.txt").write_text("staged\n")
+        run_git(git_repo, "add", "a.txt")
+        (git_repo / "a.txt").write_text("a\n")
+
+        diff = await git_service.get_file_diff(str(git_repo), "a.txt")
+
+        assert "-staged" in diff and "+a" in diff
+        # index 변경 감지 → cat-file 워커 재시작
+        assert git_service.get_metrics()["cat_file"]["spawns"] == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_diffs_do_not_fork(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("changed\n")
+        await git_service.get_file_diff(str(git_repo), "a.txt")
+        commands = git_service.get_metrics()["git_commands_total"]
+
+        for _ in range(5):
+            await git_service.get_file_diff(str(git_repo), "a.txt")
+            await git_service.get_file_diff(str(git_repo), "b.txt")
+
+        metrics = git_service.get_metrics()
+        assert metrics["git_commands_total"] == commands
+        assert metrics["subprocess_diffs"] == 0
+        assert metrics["cat_file"]["spawns"] == 1
+
+    @pytest.mark.asyncio
+    async def test_files_outside_repo_shown_as_new(self, git_service, tmp_path):
+        (tmp_path / "plain.txt").write_text("x\n")
+
+        diff = await git_service.get_file_diff(str(tmp_path), "plain.txt")
+
+        assert "--- /dev/null" in diff and "+x" in diff
+
+    @pytest.mark.asyncio
+    async def test_cached_by_blob_oids(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("first\n")
+        first = await git_service.get_file_diff(str(git_repo), "a.txt")
+        again = await git_service.get_file_diff(str(git_repo), "a.txt")
+
+        assert again == first
+        assert git_service.get_metrics()["inprocess_diffs"] == 1
+        assert git_service.get_metrics()["diff_cache"]["memory_hits"] == 1
+
+        # 내용이 바뀌면 키도 바뀜 → 재계산
+        (git_repo / "a.txt").write_text("second\n")
+        changed = await git_service.get_file_diff(str(git_repo), "a.txt")
+
+        assert "+second" in changed
+        assert git_service.get_metrics()["inprocess_diffs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gitattributes_conversion_uses_git_diff(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("changed\n")
+        await git_service.get_file_diff(str(git_repo), "a.txt")
+        assert git_service.get_metrics()["subprocess_diffs"] == 0
+
+        # eol=crlf 체크아웃: 작업 트리는 CRLF, blob은 LF → 변경 없음
+        (git_repo / ".gitattributes").write_text("* text eol=crlf\n")
+        run_git(git_repo, "add", ".gitattributes")
+        run_git(git_repo, "commit", "-q", "-m", "attrs")
+        run_git(git_repo, "rm", "-q", "--cached", "-r", ".")
+        run_git(git_repo, "reset", "-q", "--hard")
+        assert (git_repo / "a.txt").read_bytes() == b"a\r\n"
+
+        assert await git_service.get_file_diff(str(git_repo), "a.txt") == ""
+        assert run_git(git_repo, "diff", "HEAD", "--", "a.txt") == ""
+        (git_repo / "b.txt").write_bytes(b"b\r\nmore\r\n")
+        diff = await git_service.get_file_diff(str(git_repo), "b.txt")
+        assert diff.strip() == run_git(git_repo, "diff", "HEAD", "--", "b.txt").strip()
+        metrics = git_service.get_metrics()
+        # .gitattributes 생성 감지 → check-attr 워커 재시작
+        assert metrics["cat_file"]["attr_spawns"] == 2
+        assert metrics["subprocess_diffs"] >= 2
+
+
+class TestCatFilePool:
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_replace_worker_once(self, git_repo):
+        pool = CatFilePool()
+        index_path = str(git_repo / ".git" / "index")
+        try:
+            await pool.read(str(git_repo), index_path, ["HEAD:a.txt"])
+            (git_repo / "a.txt").write_text("staged\n")
+            run_git(git_repo, "add", "a.txt")
+
+            results = await asyncio.gather(
+                *(
+                    pool.read(str(git_repo), index_path, [":a.txt"])
+                    for _ in range(8)
+                )
+            )
+
+            assert all(r[0][1] == b"staged\n" for r in results)
+            # index 변경 후 동시 요청이 와도 워커 교체는 1회 (버려지는 프로세스 없음)
+            assert pool.get_metrics()["spawns"] == 2
+        finally:
+            await pool.close_all()
+
+
+class TestCommitDiff:
+    """커밋 diff 스트리밍 + 커밋 OID 키 캐시."""
+
+    @pytest.mark.asyncio
+    async def test_short_hash_resolved_and_cached(self, git_service, git_repo):
+        (git_repo / "a.txt").write_text("a\nmore\n")
+        run_git(git_repo, "commit", "-q", "-am", "second")
+        full = run_git(git_repo, "rev-parse", "HEAD").strip()
+        expected = run_git(git_repo, "show", "--format=", "--patch", full)
+
+        first = await git_service.get_commit_diff(str(git_repo), full[:7])
+        commands = git_service.get_metrics()["git_commands_total"]
+        second = await git_service.get_commit_diff(str(git_repo), full)
+
+        assert first.strip() == second.strip() == expected.strip()
+        assert git_service.get_metrics()["git_commands_total"] == commands
+        assert git_service.get_metrics()["diff_cache"]["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_or_unknown_commit(self, git_service, git_repo):
+        with pytest.raises(ValidationError):
+            await git_service.stream_commit_diff(str(git_repo), "--output=/tmp/x")
+        with pytest.raises(ValidationError):
+            await git_service.stream_commit_diff(str(git_repo), "deadbeef" * 5)
+
+
+class TestGitLogCommitCount:
+    """rev-list --count HEAD별 캐시."""
+
+    @pytest.mark.asyncio
+    async def test_count_cached_per_head(self, git_service, git_repo):
+        first = await git_service.get_git_log(str(git_repo))
+        second = await git_service.get_git_log(str(git_repo), offset=1)
+
+        assert first.total_count == second.total_count == 1
+        assert git_service.get_metrics()["commit_count_hits"] == 1
+
+        (git_repo / "a.txt").write_text("changed\n")
+        run_git(git_repo, "commit", "-q", "-am", "second")
+        third = await git_service.get_git_log(str(git_repo))
+
+        assert third.total_count == 2
+        assert third.commits[0].message == "second"
+
+
+class TestListBranches:
+    """for-each-ref 단일 조회 + refs stat 키 캐시."""
+
+    @pytest.mark.asyncio
+    async def test_cached_until_refs_change(self, git_service, git_repo):
+        run_git(git_repo, "remote", "set-head", "origin", "main")
+        run_git(git_repo, "push", "-q", "origin", "main:remote-only")
+        run_git(git_repo, "fetch", "-q", "origin")
+
+        first = await git_service.list_branches(str(git_repo))
+        commands = git_service.get_metrics()["git_commands_total"]
+        second = await git_service.list_branches(str(git_repo))
+
+        assert first == second == (["main", "remote-only"], "main", "main")
+        assert git_service.get_metrics()["git_commands_total"] == commands
+        assert git_service.get_metrics()["branch_cache_hits"] == 1
+
+        run_git(git_repo, "checkout", "-q", "-b", "feature")
+        branches, current, _ = await git_service.list_branches(str(git_repo))
+
+        assert set(branches) == {"main", "feature", "remote-only"}
+        assert current == "feature"
+
+    @pytest.mark.asyncio
+    async def test_not_git_repo(self, git_service, tmp_path):
+        assert await git_service.list_branches(str(tmp_path)) == ([], None, None)
+
@@ -0,0 +1,100 @@
+"""RefSyncScheduler 테스트 (백그라운드 fetch, 백오프, 저장소 해제)."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.git_ref_sync import RefSyncScheduler
+from app.services.git_service import GitService
+from tests.conftest import run_git
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건 대기 시간 초과")
+        await asyncio.sleep(0.05)
+
+
+@pytest.fixture
+def pushed_elsewhere(git_repo, tmp_path):
+    """다른 클론에서 origin에 새 브랜치를 push하는 함수."""
+
+    def _push(branch: str) -> None:
+        other = tmp_path / "other"
+        if not other.exists():
+            run_git(tmp_path, "clone", "-q", str(tmp_path / "origin.git"), str(other))
+        run_git(other, "push", "-q", "origin", f"origin/main:refs/heads/{branch}")
+
+    return _push
+
+
+class TestRefSyncScheduler:
+    @pytest.mark.asyncio
+    async def test_request_sync_fetches_new_remote_branch(
+        self, git_repo, pushed_elsewhere
+    ):
+        """브랜치 조회는 fetch하지 않고, 동기화 후 새 원격 브랜치가 보임."""
+        git = GitService()
+        scheduler = RefSyncScheduler(git, interval=60)
+        shutdown = asyncio.Event()
+        loop_task = asyncio.create_task(scheduler.run(shutdown))
+        try:
+            pushed_elsewhere("from-elsewhere")
+            branches, _, _ = await git.list_branches(str(git_repo))
+            assert "from-elsewhere" not in branches
+
+            scheduler.request_sync(str(git_repo))
+            await _wait_for(lambda: scheduler.get_metrics()["syncs_total"] == 1)
+
+            branches, _, _ = await git.list_branches(str(git_repo))
+            assert "from-elsewhere" in branches
+            assert scheduler.last_synced(str(git_repo)) is not None
+        finally:
+            shutdown.set()
+            await loop_task
+            await git.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_backs_off_and_missing_repo_dropped(self, tmp_path):
+        git = GitService()
+        scheduler = RefSyncScheduler(git, interval=60)
+        shutdown = asyncio.Event()
+        not_repo = tmp_path / "plain"
+        not_repo.mkdir()
+        loop_task = asyncio.create_task(scheduler.run(shutdown))
+        try:
+            scheduler.request_sync(str(not_repo))
+            scheduler.request_sync(str(tmp_path / "deleted"))
+            await _wait_for(lambda: scheduler.get_metrics()["sync_failures"] == 1)
+
+            assert scheduler.get_metrics()["repos"] == 1  # 삭제된 경로는 해제
+            state = scheduler._repos[str(not_repo)]
+            assert state.failures == 1
+            # 실패 1회 → 약 2배 주기 (지터 ±20%)
+            remaining = state.next_due - time.monotonic()
+            assert remaining > 60
+        finally:
+            shutdown.set()
+            await loop_task
+            await git.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_repos_released_unless_pinned(self, tmp_path):
+        git = GitService()
+        scheduler = RefSyncScheduler(git, interval=60, idle_ttl=0)
+        scheduler.register(str(tmp_path / "a"))
+        scheduler.register(str(tmp_path / "b"), pinned=True)
+        for state in scheduler._repos.values():
+            state.next_due += 3600  # 동기화 대상이 되지 않도록
+        shutdown = asyncio.Event()
+        loop_task = asyncio.create_task(scheduler.run(shutdown))
+        try:
+            await _wait_for(lambda: scheduler.get_metrics()["repos"] == 1)
+            assert str(tmp_path / "b") in scheduler._repos
+        finally:
+            shutdown.set()
+            await loop_task
+            await git.close()
@@ -0,0 +1,119 @@
+"""Tests for GitChangeWatcher (파일시스템 변경 기반 Git 스냅샷 무효화)."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from app.models.event_types import WsEventType
+from app.services.git_service import GitService
+from app.services.git_watcher import GitChangeWatcher, _RepoChangeFilter
+from tests.conftest import run_git
+
+pytestmark = pytest.mark.skipif(
+    not GitChangeWatcher.is_available(), reason="watchfiles 미설치"
+)
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건 대기 시간 초과")
+        await asyncio.sleep(0.05)
+
+
+@pytest_asyncio.fixture
+async def watched():
+    git = GitService()
+    ws_manager = MagicMock()
+    ws_manager.broadcast = AsyncMock()
+    watcher = GitChangeWatcher(git, ws_manager, debounce_ms=50)
+    yield git, watcher, ws_manager
+    await watcher.stop_all()
+
+
+class TestRepoChangeFilter:
+    """git 상태와 무관한 변경 필터링."""
+
+    def test_filters_git_internals_and_ignored_dirs(self, tmp_path):
+        root = str(tmp_path)
+        git_dir = os.path.join(root, ".git")
+        f = _RepoChangeFilter(root, (git_dir, git_dir))
+
+        assert f(None, os.path.join(git_dir, "index"))
+        assert f(None, os.path.join(git_dir, "HEAD"))
+        assert f(None, os.path.join(git_dir, "refs", "heads", "main"))
+        assert not f(None, os.path.join(git_dir, "index.lock"))
+        assert not f(None, os.path.join(git_dir, "objects", "ab", "cdef"))
+        assert f(None, os.path.join(root, "src", "app.py"))
+        assert not f(None, os.path.join(root, "node_modules", "x", "index.js"))
+
+
+class TestWatchedSnapshotCache:
+    """감시 중 저장소: 변경 전까지 캐시, 변경 시 무효화 + 통지."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repo_served_from_cache(self, watched, git_repo):
+        git, watcher, _ = watched
+        await git.get_git_status(str(git_repo))  # 감시 시작
+        await asyncio.sleep(0.6)  # 감시 시작 유예 구간 경과
+        await git.get_git_status(str(git_repo))  # 감시 이후 스냅샷
+        commands = git.get_metrics()["git_commands_total"]
+
+        # TTL과 무관하게 캐시 사용 (get_git_status는 TTL 0)
+        git._git_cache_ttl = 0.0
+        for _ in range(3):
+            await git.get_git_status(str(git_repo))
+            await git.get_git_info(str(git_repo))
+
+        assert git.get_metrics()["git_commands_total"] == commands
+        assert watcher.get_metrics()["watched_repos"] == 1
+
+    @pytest.mark.asyncio
+    async def test_change_invalidates_and_notifies(self, watched, git_repo):
+        git, watcher, ws_manager = watched
+        await watcher.subscribe("session-1", str(git_repo))
+        await asyncio.sleep(0.6)
+        status = await git.get_git_status(str(git_repo))
+        assert status.files == []
+
+        (git_repo / "a.txt").write_text("edited by claude\n")
+        await _wait_for(lambda: ws_manager.broadcast.await_count > 0)
+
+        session_id, message = ws_manager.broadcast.await_args.args
+        assert session_id == "session-1"
+        assert message["type"] == WsEventType.GIT_STATUS_CHANGED
+        assert message["repo_root"] == str(git_repo)
+        status = await git.get_git_status(str(git_repo))
+        assert [f.path for f in status.files] == ["a.txt"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_session_not_notified(self, watched, git_repo):
+        git, watcher, ws_manager = watched
+        await watcher.subscribe("session-1", str(git_repo))
+        watcher.unsubscribe("session-1")
+        await asyncio.sleep(0.6)
+
+        (git_repo / "b.txt").write_text("changed\n")
+        await _wait_for(lambda: watcher.get_metrics()["changes_total"] > 0)
+
+        ws_manager.broadcast.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_evicted_repo_falls_back_to_ttl(self, git_repo, tmp_path):
+        git = GitService()
+        watcher = GitChangeWatcher(git, MagicMock(), max_repos=1)
+        other = tmp_path / "other"
+        other.mkdir()
+        run_git(other, "init", "-q")
+        try:
+            await git.get_git_status(str(git_repo))
+            await git.get_git_status(str(other))
+
+            assert watcher.watching_since(str(git_repo)) is None
+            assert watcher.watching_since(str(other)) is not None
+        finally:
+            await watcher.stop_all()
@@ -0,0 +1,149 @@
+"""GitHub PR 캐시 테스트 (stale-while-revalidate, 동시 요청 통합, head SHA diff 캐시)."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.git_service import GitService
+from app.services.github_pr_cache import StaleWhileRevalidateCache
+from app.services.github_service import GitHubService
+
+
+class _Counter:
+    """호출 횟수를 세는 fetch 함수 (delay만큼 대기)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+class TestStaleWhileRevalidateCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        cache = StaleWhileRevalidateCache("test")
+        fetch = _Counter(delay=0.05)
+
+        results = await asyncio.gather(*[cache.get("k", fetch) for _ in range(5)])
+
+        assert results == [1] * 5
+        assert fetch.calls == 1
+        assert cache.get_metrics()["deduped"] == 4
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_refreshing(self):
+        """fresh_ttl 경과 후에는 이전 값을 즉시 반환하고 백그라운드 갱신."""
+        cache = StaleWhileRevalidateCache("test", fresh_ttl=0.0, stale_ttl=60.0)
+        fetch = _Counter(delay=0.05)
+        assert await cache.get("k", fetch) == 1
+
+        assert await cache.get("k", fetch) == 1  # stale 반환
+        await asyncio.sleep(0.1)
+        assert cache.peek("k") == 2  # 백그라운드 갱신 완료
+
+        metrics = cache.get_metrics()
+        assert metrics["stale_hits"] == 1
+        assert metrics["background_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_result_not_stored(self):
+        cache = StaleWhileRevalidateCache("test", cacheable=lambda v: v > 1)
+        fetch = _Counter()
+
+        assert await cache.get("k", fetch) == 1
+        assert await cache.get("k", fetch) == 2
+        assert await cache.get("k", fetch) == 2
+        assert fetch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_revalidate_extends_or_drops(self):
+        cache = StaleWhileRevalidateCache(
+            "test", fresh_ttl=0.0, validator=lambda v: f"v{v}"
+        )
+        fetch = _Counter()
+        await cache.get("k", fetch)
+
+        assert cache.revalidate("k", "v1") is True
+        assert cache.revalidate("k", "v2") is False
+        assert cache.peek("k") is None
+
+
+def _gh_outputs(head_sha: str = "abc123", updated_at: str = "2026-01-01T00:00:00Z"):
+    """gh pr list/view/diff 명령별 응답."""
+    pr = {
+        "number": 7,
+        "title": "Add feature",
+        "state": "OPEN",
+        "author": {"login": "dev"},
+        "headRefName": "feature",
+        "baseRefName": "main",
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+        "url": "https://example.com/pr/7",
+        "headRefOid": head_sha,
+    }
+
+    async def _run(*args, cwd, timeout=30.0):
+        if args[:2] == ("pr", "list"):
+            return 0, json.dumps([pr]), ""
+        if args[:2] == ("pr", "view"):
+            return 0, json.dumps(pr), ""
+        if args[:2] == ("pr", "diff"):
+            return 0, f"diff for {head_sha}", ""
+        return 0, "", ""
+
+    return _run
+
+
+class TestGitHubServiceCache:
+    @pytest.fixture
+    def gh(self, tmp_path):
+        service = GitHubService(GitService(root_dir=str(tmp_path)))
+        service._run_gh_command = AsyncMock(side_effect=_gh_outputs())
+        return service
+
+    @pytest.mark.asyncio
+    async def test_detail_and_diff_cached_by_head_sha(self, gh, tmp_path):
+        """재리뷰/재조회 시 같은 head SHA면 gh 호출 없음."""
+        first = await gh.get_github_pr_diff(str(tmp_path), 7)
+        calls = gh._run_gh_command.await_count
+        detail = await gh.get_github_pr_detail(str(tmp_path), 7)
+        second = await gh.get_github_pr_diff(str(tmp_path), 7)
+
+        assert first == second == "diff for abc123"
+        assert detail.head_sha == "abc123"
+        assert calls == 2  # pr view + pr diff
+        assert gh._run_gh_command.await_count == calls
+        assert gh.get_metrics()["pr_diffs"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pr_list_revalidates_details(self, gh, tmp_path):
+        """목록의 updatedAt/headRefOid가 바뀐 PR만 상세 캐시 폐기."""
+        await gh.get_github_pr_detail(str(tmp_path), 7)
+
+        await gh.get_github_prs(str(tmp_path))
+        assert gh.get_metrics()["pr_details"]["revalidated"] == 1
+
+        gh._run_gh_command.side_effect = _gh_outputs(head_sha="def456")
+        gh._pr_lists.invalidate((str(tmp_path), "open", 20))
+        await gh.get_github_prs(str(tmp_path))
+        diff = await gh.get_github_pr_diff(str(tmp_path), 7)
+
+        assert diff == "diff for def456"
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, gh, tmp_path):
+        gh._run_gh_command.side_effect = None
+        gh._run_gh_command.return_value = (1, "", "not authenticated")
+
+        first = await gh.get_github_pr_detail(str(tmp_path), 7)
+        await gh.get_github_pr_detail(str(tmp_path), 7)
+
+        assert first.error == "not authenticated"
+        assert gh._run_gh_command.await_count == 2
@@ -0,0 +1,73 @@
+"""McpConfigStore 테스트 (내용 주소 경로, 참조 수, 유휴 파일 정리)."""
+
+import json
+import os
+import sys
+
+import pytest
+
+from app.services.mcp_config_store import McpConfigStore
+
+_CONFIG = {"mcpServers": {"fs": {"command": "npx", "env": {"TOKEN": "t"}}}}
+
+
+class TestMcpConfigStore:
+    def test_same_content_reuses_file(self, tmp_path):
+        store = McpConfigStore(tmp_path)
+        first = store.acquire(_CONFIG)
+        # 키 순서가 달라도 같은 내용이면 같은 파일
+        second = store.acquire(
+            {"mcpServers": {"fs": {"env": {"TOKEN": "t"}, "command": "npx"}}}
+        )
+
+        assert first == second
+        assert json.loads(first.read_text()) == _CONFIG
+        metrics = store.get_metrics()
+        assert (metrics["writes"], metrics["reuses"]) == (1, 1)
+        assert metrics["references"] == 2
+
+    def test_different_content_different_path(self, tmp_path):
+        store = McpConfigStore(tmp_path)
+        other = {"mcpServers": {"permission": {"type": "http", "url": "http://x"}}}
+        assert store.acquire(_CONFIG) != store.acquire(other)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX 권한")
+    def test_file_readable_by_owner_only(self, tmp_path):
+        path = McpConfigStore(tmp_path).acquire(_CONFIG)
+        assert os.stat(path).st_mode & 0o077 == 0
+
+    def test_release_keeps_file_until_idle_limit(self, tmp_path):
+        store = McpConfigStore(tmp_path, max_idle=1)
+        first = store.acquire(_CONFIG)
+        store.acquire(_CONFIG)
+        store.release(first)
+        store.release(first)
+        assert first.exists()  # 유휴 보관 → 다음 턴 재사용
+
+        second = store.acquire({"mcpServers": {}})
+        store.release(second)
+        assert not first.exists()  # 유휴 한도 초과 → 오래된 것부터 삭제
+        assert second.exists()
+
+    def test_in_use_file_not_removed(self, tmp_path):
+        store = McpConfigStore(tmp_path, max_idle=0)
+        held = store.acquire(_CONFIG)
+        other = store.acquire({"mcpServers": {}})
+        store.release(other)
+
+        assert held.exists()
+        assert not other.exists()
+
+    def test_recreates_externally_deleted_file(self, tmp_path):
+        store = McpConfigStore(tmp_path)
+        path = store.acquire(_CONFIG)
+        path.unlink()
+
+        assert store.acquire(_CONFIG).exists()
+        assert store.get_metrics()["writes"] == 2
+
+    def test_close_removes_files(self, tmp_path):
+        store = McpConfigStore(tmp_path)
+        path = store.acquire(_CONFIG)
+        store.close()
+        assert not path.exists()
@@ -5,6 +5,8 @@ McpService의 주요 public 메서드를 PostgreSQL DB를 사용하여 검증합
 - MCP config 빌드 (build_mcp_config)
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from app.core.exceptions import NotFoundError
@@ -357,3 +359,33 @@ class TestBuildMcpConfig:
 
         assert "permission" in config["mcpServers"]
         assert config["mcpServers"]["permission"]["command"] == "perm-tool"
+
+    async def test_build_config_cached_until_server_changes(self, mcp_service):
+        """같은 server_ids는 캐시를 사용하고, 서버 수정/삭제 시 무효화된다."""
+        server = await mcp_service.create_server(
+            name="cached", transport_type="stdio", command="v1"
+        )
+        await mcp_service.build_mcp_config([server.id])
+
+        with patch.object(
+            mcp_service,
+            "_load_server_entries",
+            wraps=mcp_service._load_server_entries,
+        ) as load:
+            config = await mcp_service.build_mcp_config(
+                [server.id], permission_mcp_dict={"permission": {"command": "p"}}
+            )
+            assert load.await_count == 0
+            assert set(config["mcpServers"]) == {"cached", "permission"}
+
+            await mcp_service.update_server(server.id, command="v2")
+            config = await mcp_service.build_mcp_config([server.id])
+            assert config["mcpServers"]["cached"]["command"] == "v2"
+            # permission 병합이 캐시 항목을 바꾸지 않음
+            assert "permission" not in config["mcpServers"]
+
+            await mcp_service.delete_server(server.id)
+            assert await mcp_service.build_mcp_config([server.id]) == {
+                "mcpServers": {}
+            }
+            assert load.await_count == 2
@@ -0,0 +1,197 @@
+"""PermissionEngine 테스트 (신뢰 규칙 컴파일/판정, 설정 무효화, 재시작 복원)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+from app.api.v1.endpoints import permissions
+from app.api.v1.endpoints.permissions import (
+    PermissionRequest,
+    request_permission,
+    respond_permission,
+)
+from app.services.permission_engine import PermissionEngine, RuleSet, TrustRule
+from app.services.settings_service import SettingsService
+
+
+class TestTrustRule:
+    def test_tool_name_only(self):
+        rule = TrustRule.parse("Read")
+        assert rule.matches("Read", {"file_path": "/etc/passwd"})
+        assert not rule.matches("Write", {})
+
+    def test_input_glob_on_primary_field(self):
+        rule = TrustRule.parse("Bash(git status*)")
+        assert rule.matches("Bash", {"command": "git status --short"})
+        assert not rule.matches("Bash", {"command": "rm -rf /; git status"})
+
+    def test_input_regex(self):
+        rule = TrustRule.parse(r"Edit(re:^src/.*\.py$)")
+        assert rule.matches("Edit", {"file_path": "src/app/main.py"})
+        assert not rule.matches("Edit", {"file_path": "src/app/main.ts"})
+
+    def test_tool_name_glob(self):
+        rule = TrustRule.parse("mcp__github__*")
+        assert rule.matches("mcp__github__create_pr", {})
+        assert not rule.matches("mcp__slack__post", {})
+
+    def test_invalid_rules(self):
+        for spec in ("", "Bash(re:[)", "Bash(unclosed"):
+            with pytest.raises(ValueError):
+                TrustRule.parse(spec)
+
+    def test_rule_set_skips_invalid_and_duplicates(self):
+        rules = RuleSet(["Read", "Read", "Bash(re:[)", "Bash(npm test*)"])
+        assert rules.specs == ["Read", "Bash(npm test*)"]
+        assert rules.match("Bash", {"command": "npm test -- -u"}) == "Bash(npm test*)"
+        assert rules.match("Bash", {"command": "npm publish"}) is None
+
+
+@pytest_asyncio.fixture
+async def settings_service(db):
+    return SettingsService(db, cache_ttl=60)
+
+
+@pytest_asyncio.fixture
+async def engine(db, settings_service):
+    engine = PermissionEngine(max_sessions=2)
+    engine.attach(db, settings_service, AsyncMock(return_value=None))
+    return engine
+
+
+class TestPermissionEngine:
+    @pytest.mark.asyncio
+    async def test_session_rules_lru(self):
+        engine = PermissionEngine(max_sessions=2)
+        for sid in ("s1", "s2", "s3"):
+            engine.trust_session(sid, "Read")
+
+        assert await engine.evaluate("s1", "Read", {}) is None
+        assert await engine.evaluate("s3", "Read", {}) == ("session", "Read")
+
+    @pytest.mark.asyncio
+    async def test_global_rules_loaded_once(self, engine, settings_service):
+        await settings_service.update(globally_trusted_tools=["Bash(ls*)"])
+        get = AsyncMock(wraps=settings_service.get)
+        with patch.object(settings_service, "get", get):
+            for _ in range(5):
+                decision = await engine.evaluate("s1", "Bash", {"command": "ls -la"})
+                assert decision == ("global", "Bash(ls*)")
+
+        assert get.await_count == 1
+        assert engine.get_metrics()["global_rules"] == 1
+
+    @pytest.mark.asyncio
+    async def test_settings_update_invalidates_global_rules(
+        self, engine, settings_service
+    ):
+        assert await engine.evaluate("s1", "Write", {}) is None
+
+        await settings_service.update(globally_trusted_tools=["Write"])
+
+        assert await engine.evaluate("s1", "Write", {}) == ("global", "Write")
+
+    @pytest.mark.asyncio
+    async def test_workspace_rules(self, db, settings_service):
+        from app.core.utils import utc_now
+        from app.models.workspace import Workspace
+
+        async with db.session() as session:
+            session.add(
+                Workspace(
+                    id="ws-perm",
+                    name="perm",
+                    repo_url="https://example.com/repo.git",
+                    local_path="/tmp/perm",
+                    status="ready",
+                    created_at=utc_now(),
+                )
+            )
+            await session.commit()
+        engine = PermissionEngine()
+        engine.attach(db, settings_service, AsyncMock(return_value="ws-perm"))
+
+        assert await engine.evaluate("s1", "Bash", {"command": "make"}) is None
+        assert await engine.trust_workspace("ws-perm", "Bash(make*)")
+
+        fresh = PermissionEngine()
+        fresh.attach(db, settings_service, AsyncMock(return_value="ws-perm"))
+        decision = await fresh.evaluate("s2", "Bash", {"command": "make test"})
+        assert decision == ("workspace", "Bash(make*)")
+
+
+@pytest_asyncio.fixture
+async def app_engine(db, settings_service, session_manager):
+    """permissions 모듈 엔진을 테스트 DB에 연결 (테스트 후 원복)."""
+    original = permissions.engine
+    permissions.engine = PermissionEngine()
+    session = await session_manager.create(work_dir="/tmp")
+    pending = permissions.get_pending()
+    pending.clear()
+    permissions._recovered_answers.clear()
+    yield session["id"]
+    permissions.clear_pending()
+    permissions._recovered_answers.clear()
+    permissions.engine = original
+
+
+class TestPermissionRecovery:
+    @pytest.mark.asyncio
+    async def test_pending_request_survives_restart(
+        self, db, settings_service, app_engine
+    ):
+        session_id = app_engine
+        ws_manager = AsyncMock()
+        body = PermissionRequest(tool_name="Bash", tool_input={"command": "make"})
+        await permissions.init(db, settings_service)
+
+        with patch(
+            "app.api.v1.endpoints.permissions.get_ws_manager",
+            return_value=ws_manager,
+        ):
+            waiter = asyncio.create_task(request_permission(session_id, body))
+            await asyncio.sleep(0.2)
+            assert len(permissions.get_pending()) == 1
+
+            # 재시작: 메모리 상태 소실 후 DB에서 복원
+            permissions.clear_pending()
+            assert await waiter == {"behavior": "deny"}
+            await permissions.init(db, settings_service)
+            (perm_id, entry), = permissions.get_pending().items()
+            assert entry["orphan"] is True
+            assert entry["tool_input"] == {"command": "make"}
+
+            # 재시작 후 받은 응답은 CLI의 같은 재요청에 적용
+            assert await respond_permission(perm_id, "allow")
+            assert await request_permission(session_id, body) == {"behavior": "allow"}
+
+        assert permissions.get_pending() == {}
+        decisions = permissions.engine.get_metrics()["decisions"]
+        assert decisions["recovered"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_adopts_restored_prompt(self, db, settings_service, app_engine):
+        session_id = app_engine
+        ws_manager = AsyncMock()
+        body = PermissionRequest(tool_name="Read", tool_input={"file_path": "a.py"})
+        permissions.engine.attach(db, settings_service)
+        await permissions.engine.persist_pending("old-id", session_id, "Read", {})
+        await permissions.engine.persist_pending(
+            "orphan-id", session_id, "Read", {"file_path": "a.py"}
+        )
+        await permissions.init(db, settings_service)
+        assert set(permissions.get_pending()) == {"old-id", "orphan-id"}
+
+        with patch(
+            "app.api.v1.endpoints.permissions.get_ws_manager",
+            return_value=ws_manager,
+        ):
+            waiter = asyncio.create_task(request_permission(session_id, body))
+            await asyncio.sleep(0.05)
+            # 프론트엔드에 이미 표시된 프롬프트를 그대로 사용 (새 요청 없음)
+            ws_manager.broadcast_event.assert_not_called()
+            assert permissions.get_pending()["orphan-id"]["orphan"] is False
+            await respond_permission("orphan-id", "deny")
+            assert await waiter == {"behavior": "deny"}
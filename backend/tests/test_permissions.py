@@ -4,6 +4,9 @@ import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
 from app.api.v1.endpoints.permissions import (
     MAX_PENDING,
@@ -12,6 +15,7 @@ from app.api.v1.endpoints.permissions import (
     get_pending,
     request_permission,
     respond_permission,
+    router,
 )
 
 
@@ -276,3 +280,95 @@ class TestRequestPermission:
             permission_id = list(pending.keys())[0]
             await respond_permission(permission_id, "deny")
             await request_task
+
+
+@pytest_asyncio.fixture
+async def mcp_client(mock_ws_manager):
+    """permissions 라우터만 포함한 앱의 HTTP 클라이언트."""
+    app = FastAPI()
+    app.include_router(router)
+    transport = ASGITransport(app=app)
+    with patch(
+        "app.api.v1.endpoints.permissions.get_ws_manager",
+        return_value=mock_ws_manager,
+    ):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+@pytest.mark.asyncio
+class TestPermissionMcpEndpoint:
+    """Test shared Streamable HTTP permission MCP endpoint."""
+
+    async def test_initialize_negotiates_version(self, mcp_client):
+        """요청한 프로토콜 버전을 지원하면 그대로 응답."""
+        response = await mcp_client.post(
+            "/permissions/sess1/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"protocolVersion": "2025-03-26"},
+            },
+        )
+
+        result = response.json()["result"]
+        assert result["protocolVersion"] == "2025-03-26"
+        assert result["serverInfo"]["name"] == "permission-prompt"
+
+    async def test_notification_accepted_without_body(self, mcp_client):
+        """알림은 202 + 본문 없음."""
+        response = await mcp_client.post(
+            "/permissions/sess1/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+        )
+
+        assert response.status_code == 202
+        assert response.content == b""
+
+    async def test_tools_list(self, mcp_client):
+        response = await mcp_client.post(
+            "/permissions/sess1/mcp",
+            json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        )
+
+        tools = response.json()["result"]["tools"]
+        assert [t["name"] for t in tools] == ["handle_request"]
+
+    async def test_tool_call_waits_for_user_response(self, mcp_client):
+        """tools/call → 프론트엔드 응답이 MCP 결과로 반환."""
+        call = asyncio.create_task(
+            mcp_client.post(
+                "/permissions/sess1/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 3,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "handle_request",
+                        "arguments": {"tool_name": "Bash", "input": {"command": "ls"}},
+                    },
+                },
+            )
+        )
+        for _ in range(100):
+            if get_pending():
+                break
+            await asyncio.sleep(0.01)
+        permission_id = next(iter(get_pending()))
+        await respond_permission(permission_id, "allow")
+        response = await call
+
+        body = response.json()
+        assert body["id"] == 3
+        assert body["result"]["content"][0]["text"] == '{"behavior": "allow"}'
+
+    async def test_unknown_method_and_stream_unsupported(self, mcp_client):
+        response = await mcp_client.post(
+            "/permissions/sess1/mcp",
+            json={"jsonrpc": "2.0", "id": 4, "method": "resources/list"},
+        )
+        assert response.json()["error"]["code"] == -32601
+
+        response = await mcp_client.get("/permissions/sess1/mcp")
+        assert response.status_code == 405
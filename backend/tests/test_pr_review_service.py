@@ -0,0 +1,222 @@
+"""PRReviewService 테스트 (작업 큐, DB 영속화, stream-json 스트리밍, 분할 리뷰)."""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from starlette.websockets import WebSocketState
+
+from app.core.exceptions import ConflictError, NotFoundError
+from app.models.event_types import WsEventType
+from app.schemas.filesystem import GitHubPRDetail
+from app.services.git_service import GitService
+from app.services.pr_review_service import PRReviewService, pr_review_channel
+
+# stream-json 델타 3개 + result를 출력하는 가짜 claude CLI
+_FAKE_CLAUDE = f"""#!{sys.executable}
+import json, os, sys
+prompt = sys.argv[2]
+if "부분 리뷰를" in prompt:
+    kind = "merge"
+elif "diff의 일부" in prompt:
+    kind = "chunk"
+else:
+    kind = "review"
+with open(os.environ["FAKE_CLAUDE_LOG"], "a") as f:
+    f.write(kind + "\\n")
+for text in ["리뷰 ", "결과 ", kind]:
+    delta = {{"type": "text_delta", "text": text}}
+    event = {{"type": "content_block_delta", "delta": delta}}
+    print(json.dumps({{"type": "stream_event", "event": event}}), flush=True)
+print(json.dumps({{"type": "result", "result": "리뷰 결과 " + kind}}), flush=True)
+"""
+
+
+def _file_diff(name: str, lines: int = 5) -> str:
+    body = "".join(f"+line {i}\n" for i in range(lines))
+    return (
+        f"diff --git a/{name} b/{name}\n--- a/{name}\n+++ b/{name}\n"
+        f"@@ -0,0 +1,{lines} @@\n{body}"
+    )
+
+
+class _FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.messages: list[dict] = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(json.loads(text))
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """PATH에 가짜 claude 설치. 호출 종류(review/chunk/merge) 로그 경로 반환."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "claude"
+    script.write_text(_FAKE_CLAUDE)
+    script.chmod(0o755)
+    log = tmp_path / "claude.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_CLAUDE_LOG", str(log))
+    return log
+
+
+@pytest.fixture
+def github(tmp_path):
+    gh = MagicMock()
+    gh._git = GitService(root_dir=str(tmp_path))
+    gh.get_github_pr_detail = AsyncMock(
+        return_value=GitHubPRDetail(
+            number=7,
+            title="Add feature",
+            body="",
+            state="OPEN",
+            author="dev",
+            branch="feature",
+            base="main",
+            created_at="",
+            updated_at="",
+            url="",
+            head_sha="abc123",
+        )
+    )
+    gh.get_github_pr_diff = AsyncMock(return_value=_file_diff("a.py"))
+    return gh
+
+
+@pytest_asyncio.fixture
+async def make_service(db, github, ws_manager):
+    services: list[PRReviewService] = []
+
+    def _make(**kwargs) -> PRReviewService:
+        service = PRReviewService(db, github, ws_manager, **kwargs)
+        services.append(service)
+        return service
+
+    yield _make
+    for service in services:
+        await service.stop()
+
+
+async def _wait_done(service: PRReviewService, job_id: str, timeout: float = 10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        status = await service.get_status(job_id)
+        if status.status != "pending":
+            return status
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError(f"리뷰 작업 대기 시간 초과: {status}")
+        await asyncio.sleep(0.05)
+
+
+class TestPRReviewService:
+    @pytest.mark.asyncio
+    async def test_streams_deltas_and_persists_result(
+        self, make_service, fake_claude, ws_manager, tmp_path
+    ):
+        service = make_service()
+        await service.start()
+
+        job = await service.submit(str(tmp_path), 7)
+        subscriber = _FakeWebSocket()
+        ws_manager.register(pr_review_channel(job.job_id), subscriber)
+        status = await _wait_done(service, job.job_id)
+
+        assert status.status == "completed"
+        assert status.review_text == "리뷰 결과 review"
+        assert status.head_sha == "abc123"
+        deltas = [
+            m for m in subscriber.messages if m["type"] == WsEventType.PR_REVIEW_DELTA
+        ]
+        assert "".join(d["text"] for d in deltas) == "리뷰 결과 review"
+        assert [d["offset"] for d in deltas] == [0, 3, 6]
+        assert subscriber.messages[-1]["status"] == "completed"
+
+        # 메모리 상태가 아닌 DB에서 조회
+        assert (await make_service().get_status(job.job_id)).review_text == (
+            "리뷰 결과 review"
+        )
+
+    @pytest.mark.asyncio
+    async def test_large_diff_map_reduce(
+        self, make_service, fake_claude, github, tmp_path
+    ):
+        """chunk_chars 초과 diff → 파일별 부분 리뷰 후 통합 리뷰."""
+        github.get_github_pr_diff.return_value = "".join(
+            _file_diff(name) for name in ("a.py", "b.py", "c.py")
+        )
+        service = make_service(chunk_chars=200)
+        await service.start()
+
+        job = await service.submit(str(tmp_path), 7)
+        status = await _wait_done(service, job.job_id)
+
+        assert status.status == "completed"
+        assert status.review_text == "리뷰 결과 merge"
+        assert (status.chunks_total, status.chunks_done) == (3, 3)
+        assert sorted(fake_claude.read_text().split()) == [
+            "chunk",
+            "chunk",
+            "chunk",
+            "merge",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_claude_failure_recorded(self, make_service, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+        service = make_service()
+        await service.start()
+
+        job = await service.submit(str(tmp_path), 7)
+        status = await _wait_done(service, job.job_id)
+
+        assert status.status == "error"
+        assert status.error == "Claude Code CLI를 찾을 수 없습니다"
+        assert service.get_metrics()["failed_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejected_and_pending_recovered(
+        self, make_service, fake_claude, tmp_path
+    ):
+        """대기열 초과 시 거부, 재시작 후 미완료 작업 재실행."""
+        stopped = make_service(queue_size=1)  # 워커 미시작 (종료된 서버 역할)
+        job = await stopped.submit(str(tmp_path), 7)
+        with pytest.raises(ConflictError):
+            await stopped.submit(str(tmp_path), 8)
+
+        restarted = make_service()
+        await restarted.start()
+        status = await _wait_done(restarted, job.job_id)
+
+        assert status.status == "completed"
+        assert restarted.get_metrics()["recovered_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, make_service):
+        with pytest.raises(NotFoundError):
+            await make_service().get_status("missing")
+
+
+class TestSplitDiff:
+    def test_files_packed_and_large_file_split_by_hunk(self):
+        big = _file_diff("big.py", lines=40) + "@@ -50,0 +50,40 @@\n" + "+x\n" * 40
+        diff_text = _file_diff("a.py") + _file_diff("b.py") + big
+
+        chunks = PRReviewService._split_diff(diff_text, 300)
+
+        assert all(len(c) <= 300 for c in chunks)
+        assert chunks[0].startswith("diff --git a/a.py") and "b/b.py" in chunks[0]
+        # 분할된 hunk에도 파일 헤더가 붙음
+        assert sum(c.count("diff --git a/big.py") for c in chunks) > 1
+        assert "".join(chunks).count("+line") == 50
+
+    def test_small_diff_single_chunk(self):
+        diff_text = _file_diff("a.py")
+        assert PRReviewService._split_diff(diff_text, 50000) == [diff_text]
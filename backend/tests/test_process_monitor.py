@@ -0,0 +1,176 @@
+"""ProcessMonitor 테스트 (프로세스 트리 RSS/CPU, stall 판정, PSI 기반 한도 조정)."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from app.services.process_monitor import ProcessMonitor
+from app.services.turn_scheduler import TurnScheduler
+
+_SPAWN_CHILD = (
+    "import subprocess, sys, time;"
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']);"
+    "time.sleep(30)"
+)
+
+_BUSY = "while True: pass"
+_IDLE = "import time; time.sleep(30)"
+
+
+def _fake_proc(root, *, pressure: float, available_mb: int) -> None:
+    (root / "pressure").mkdir(parents=True, exist_ok=True)
+    (root / "pressure" / "memory").write_text(
+        f"some avg10={pressure:.2f} avg60=0.00 avg300=0.00 total=0\n"
+        "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+    )
+    (root / "meminfo").write_text(
+        f"MemTotal: 16000000 kB\nMemAvailable: {available_mb * 1024} kB\n"
+    )
+
+
+async def _busy_scheduler(limit: int, running: int) -> TurnScheduler:
+    scheduler = TurnScheduler(limit)
+    for i in range(running):
+        await scheduler.acquire(f"s{i}")
+    return scheduler
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="/proc 필요")
+class TestProcessTreeSampling:
+    @pytest.mark.asyncio
+    async def test_tree_includes_children(self):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", _SPAWN_CHILD
+        )
+        monitor = ProcessMonitor()
+        try:
+            monitor.track("s1", process.pid)
+            for _ in range(50):
+                await monitor.sample()
+                usage = monitor.usage("s1")
+                if usage is not None and usage.processes == 2:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert usage.processes == 2
+            assert usage.rss_bytes > 1024 * 1024
+            assert monitor.get_metrics()["sessions"]["s1"]["pid"] == process.pid
+        finally:
+            process.kill()
+            await process.wait()
+
+        await monitor.sample()
+        assert monitor.usage("s1") is None  # 종료된 프로세스는 제외
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="/proc 필요")
+class TestStallDetection:
+    async def _watch(self, code: str, timeout: float) -> tuple[list, ProcessMonitor]:
+        process = await asyncio.create_subprocess_exec(sys.executable, "-c", code)
+        monitor = ProcessMonitor(interval=0.05)
+        stalls: list[bool] = []
+
+        async def _on_stall(elapsed, hard):
+            stalls.append(hard)
+
+        last_output = time.monotonic()
+        monitor.track("s1", process.pid)
+        monitor.watch_stall(
+            "s1", last_output=lambda: last_output, timeout=timeout, on_stall=_on_stall
+        )
+        try:
+            deadline = time.monotonic() + 5
+            while not stalls and time.monotonic() < deadline:
+                await monitor.sample()
+                await asyncio.sleep(0.05)
+            await monitor.sample()  # 감시당 1회만 호출되는지 확인
+            await asyncio.sleep(0)
+        finally:
+            process.kill()
+            await process.wait()
+        return stalls, monitor
+
+    @pytest.mark.asyncio
+    async def test_idle_process_soft_stall(self):
+        stalls, monitor = await self._watch(_IDLE, timeout=1.0)
+
+        assert stalls == [False]
+        assert monitor.get_metrics()["stalls_soft"] == 1
+
+    @pytest.mark.asyncio
+    async def test_busy_process_graced_until_hard_limit(self):
+        stalls, monitor = await self._watch(_BUSY, timeout=0.3)
+
+        assert stalls == [True]
+        metrics = monitor.get_metrics()
+        assert metrics["stalls_graced"] == 1
+        assert metrics["sessions"]["s1"]["cpu_percent"] > 50
+
+
+class TestMemoryPressureLimit:
+    @pytest.mark.asyncio
+    async def test_pressure_shrinks_limit_with_cooldown(self, tmp_path):
+        _fake_proc(tmp_path, pressure=25.0, available_mb=8000)
+        scheduler = await _busy_scheduler(limit=10, running=8)
+        monitor = ProcessMonitor(
+            scheduler=scheduler, max_limit=10, proc_root=str(tmp_path)
+        )
+
+        await monitor.sample()
+        assert scheduler.limit == 6  # 실행 중 8개의 3/4
+
+        await monitor.sample()
+        assert scheduler.limit == 6  # PSI 창 동안 추가 감소 없음
+        assert monitor.get_metrics()["memory_pressure_avg10"] == 25.0
+
+    @pytest.mark.asyncio
+    async def test_low_memory_queues_new_turns(self, tmp_path):
+        _fake_proc(tmp_path, pressure=0.0, available_mb=200)
+        scheduler = await _busy_scheduler(limit=4, running=4)
+        monitor = ProcessMonitor(
+            scheduler=scheduler, max_limit=4, min_limit=2, proc_root=str(tmp_path)
+        )
+
+        await monitor.sample()
+        waiter = asyncio.create_task(scheduler.acquire("new"))
+        scheduler.release()
+        await asyncio.sleep(0)
+
+        assert scheduler.limit == 3
+        assert not waiter.done()  # 실행 중 3개 = 한도 → 대기
+        scheduler.release()
+        await asyncio.wait_for(waiter, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_recovers_one_step_at_a_time(self, tmp_path):
+        _fake_proc(tmp_path, pressure=0.0, available_mb=8000)
+        scheduler = await _busy_scheduler(limit=3, running=3)
+        monitor = ProcessMonitor(
+            scheduler=scheduler, max_limit=5, proc_root=str(tmp_path)
+        )
+
+        await monitor.sample()
+        assert scheduler.limit == 4
+        await monitor.sample()
+        await monitor.sample()
+        assert scheduler.limit == 5
+        assert monitor.get_metrics()["limit_increases"] == 2
+
+    @pytest.mark.asyncio
+    async def test_pressure_reclaims_idle_processes_first(self, tmp_path):
+        _fake_proc(tmp_path, pressure=25.0, available_mb=8000)
+        scheduler = await _busy_scheduler(limit=10, running=8)
+        monitor = ProcessMonitor(
+            scheduler=scheduler, max_limit=10, proc_root=str(tmp_path)
+        )
+        reclaimed = []
+        monitor.track_idle("warm:s1", 12345, lambda: reclaimed.append("s1"))
+
+        await monitor.sample()
+
+        assert reclaimed == ["s1"]
+        assert scheduler.limit == 10  # 유휴 프로세스 회수로 대체
+        metrics = monitor.get_metrics()
+        assert (metrics["idle_reclaimed"], metrics["idle_tracked"]) == (1, 0)
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.core.database import track_round_trips
 from app.core.exceptions import NotFoundError
 from app.models.session import SessionStatus
 from app.schemas.session import SessionInfo
@@ -442,3 +443,124 @@ class TestSessionManager:
         assert info_dict["work_dir"] == work_dir
         assert info_dict["status"] == SessionStatus.IDLE
         assert info_dict["permission_mode"] is False
+
+
+@pytest.mark.asyncio
+class TestSessionRowCache:
+    """세션 상태 캐시 (write-through LRU) 테스트."""
+
+    async def test_get_served_from_cache(self, session_manager):
+        """create() 직후 get()은 DB 왕복 없이 캐시에서 응답."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+
+        counter = track_round_trips()
+        session = await session_manager.get(created["id"])
+
+        assert counter.count == 0
+        assert session["id"] == created["id"]
+        metrics = session_manager.get_cache_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 0
+
+    async def test_write_through_avoids_reload(self, session_manager):
+        """update_status/update_claude_session_id가 캐시에 반영되어 재조회 불필요."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        await session_manager.update_status(created["id"], SessionStatus.RUNNING)
+        await session_manager.update_claude_session_id(created["id"], "claude-xyz")
+
+        counter = track_round_trips()
+        session = await session_manager.get(created["id"])
+
+        assert counter.count == 0
+        assert session["status"] == "running"
+        assert session["claude_session_id"] == "claude-xyz"
+
+    async def test_miss_loads_from_db(self, session_manager):
+        """캐시에 없는 세션은 DB에서 로드 후 캐시."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        session_manager.invalidate_cache(created["id"])
+
+        await session_manager.get(created["id"])
+        await session_manager.get(created["id"])
+
+        metrics = session_manager.get_cache_metrics()
+        assert metrics["misses"] == 1
+        assert metrics["hits"] == 1
+
+    async def test_lru_eviction(self, db):
+        """max_entries 초과 시 가장 오래된 세션부터 제거."""
+        from app.services.session_manager import SessionManager
+
+        manager = SessionManager(db, cache_max_entries=2)
+        first = await manager.create(work_dir=tempfile.gettempdir())
+        await manager.create(work_dir=tempfile.gettempdir())
+        await manager.create(work_dir=tempfile.gettempdir())
+
+        assert manager.get_cache_metrics()["size"] == 2
+        await manager.get(first["id"])
+        assert manager.get_cache_metrics()["misses"] == 1
+
+    async def test_get_returns_copy(self, session_manager):
+        """반환된 dict를 수정해도 캐시가 오염되지 않음."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        first = await session_manager.get(created["id"])
+        first["workflow_phase"] = "mutated"
+
+        second = await session_manager.get(created["id"])
+        assert second["workflow_phase"] != "mutated"
+
+    async def test_get_copies_nested_values(self, session_manager):
+        """JSONB list 값을 수정해도 캐시가 오염되지 않음."""
+        created = await session_manager.create(
+            work_dir=tempfile.gettempdir(), mcp_server_ids=["a"]
+        )
+        first = await session_manager.get(created["id"])
+        first["mcp_server_ids"].append("b")
+
+        second = await session_manager.get(created["id"])
+        assert second["mcp_server_ids"] == ["a"]
+
+    async def test_externally_updated_columns_not_cached(self, session_manager):
+        """매니저 밖에서 갱신되는 개수/대기 질문 컬럼은 캐시 행에 두지 않음."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        await session_manager.add_message(
+            session_id=created["id"],
+            role="user",
+            content="hi",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        session = await session_manager.get(created["id"])
+        assert "message_count" not in session
+        assert "pending_question" not in session
+        counted = await session_manager.get_with_counts(created["id"])
+        assert counted["message_count"] == 1
+
+    async def test_update_settings_invalidates(self, session_manager):
+        """update_settings 후 get()은 최신 값을 반환."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        await session_manager.get(created["id"])
+
+        await session_manager.update_settings(created["id"], name="renamed")
+
+        assert (await session_manager.get(created["id"]))["name"] == "renamed"
+
+    async def test_update_status_invalidates(self, session_manager):
+        """update_status 후 get()은 최신 상태를 반환."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        await session_manager.get(created["id"])
+
+        await session_manager.update_status(created["id"], SessionStatus.RUNNING)
+
+        session = await session_manager.get(created["id"])
+        assert session["status"] == SessionStatus.RUNNING
+
+    async def test_delete_invalidates(self, session_manager):
+        """삭제된 세션은 캐시에 남지 않음."""
+        created = await session_manager.create(work_dir=tempfile.gettempdir())
+        await session_manager.get(created["id"])
+
+        await session_manager.delete(created["id"])
+
+        with pytest.raises(NotFoundError):
+            await session_manager.get(created["id"])
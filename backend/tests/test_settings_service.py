@@ -0,0 +1,24 @@
+"""SettingsService 테스트 (read-through 캐시 격리)."""
+
+import pytest
+
+from app.services.settings_service import SettingsService
+
+
+class TestSettingsCache:
+    @pytest.mark.asyncio
+    async def test_cached_settings_not_shared_with_callers(self, db):
+        service = SettingsService(db, cache_ttl=60)
+        await service.update(
+            globally_trusted_tools=["Read"], mcp_server_ids=["m1"]
+        )
+
+        first = await service.get()
+        first["globally_trusted_tools"].append("Bash")
+        first["mcp_server_ids"].clear()
+        second = await service.get()
+        second["globally_trusted_tools"].append("Write")
+
+        third = await service.get()
+        assert third["globally_trusted_tools"] == ["Read"]
+        assert third["mcp_server_ids"] == ["m1"]
@@ -0,0 +1,141 @@
+"""Tests for SpillJournal (DB 장애 시 배치 보존용 append-only 저널)."""
+
+import pytest
+import pytest_asyncio
+
+from app.services.spill_journal import SpillJournal
+
+
+@pytest_asyncio.fixture
+async def journal(tmp_path):
+    j = SpillJournal(tmp_path / "spill", segment_max_bytes=64, name="test")
+    await j.open()
+    yield j
+    await j.close()
+
+
+class TestAppendReplay:
+    """append → replay 순서 보장 및 세그먼트 정리."""
+
+    @pytest.mark.asyncio
+    async def test_replay_in_order_across_segments(self, journal, tmp_path):
+        records = [f"record-{i}".encode() for i in range(20)]
+        assert await journal.append(records) == 20
+        assert journal.pending == 20
+        # 64바이트 세그먼트 → 여러 세그먼트로 롤오버
+        assert len(list((tmp_path / "spill").glob("*.seg"))) > 1
+
+        delivered: list[bytes] = []
+
+        async def deliver(batch):
+            delivered.extend(batch)
+
+        replayed = await journal.replay(deliver, batch_size=3)
+
+        assert replayed == 20
+        assert delivered == records
+        assert journal.pending == 0
+        assert journal.pending_bytes == 0
+        assert not list((tmp_path / "spill").glob("*.seg"))
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_keeps_cursor(self, journal):
+        await journal.append([b"a", b"b", b"c"])
+
+        async def failing(batch):
+            raise ConnectionError("db down")
+
+        with pytest.raises(ConnectionError):
+            await journal.replay(failing)
+        assert journal.pending == 3
+
+        delivered: list[bytes] = []
+
+        async def deliver(batch):
+            delivered.extend(batch)
+
+        await journal.replay(deliver)
+        assert delivered == [b"a", b"b", b"c"]
+
+    @pytest.mark.asyncio
+    async def test_quota_rejects_overflow(self, tmp_path):
+        j = SpillJournal(tmp_path / "quota", max_bytes=20)
+        await j.open()
+        # 레코드당 4바이트 길이 헤더 + 6바이트 → 2건만 수용
+        accepted = await j.append([b"xxxxxx", b"yyyyyy", b"zzzzzz"])
+        await j.close()
+
+        assert accepted == 2
+        metrics = j.get_metrics()
+        assert metrics["pending_records"] == 2
+        assert metrics["rejected_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_discard_head(self, journal):
+        await journal.append([b"poison", b"ok"])
+
+        discarded = await journal.discard_head(1)
+
+        assert discarded == 1
+        assert journal.pending == 1
+        assert journal.get_metrics()["discarded_total"] == 1
+
+
+class TestRecovery:
+    """프로세스 재시작 후 잔여 레코드 복원."""
+
+    @pytest.mark.asyncio
+    async def test_reopen_resumes_from_cursor(self, tmp_path):
+        path = tmp_path / "spill"
+        first = SpillJournal(path, segment_max_bytes=1024)
+        await first.open()
+        await first.append([b"one", b"two", b"three"])
+        delivered: list[bytes] = []
+
+        async def deliver_one(batch):
+            delivered.extend(batch)
+
+        # 1건만 replay 후 종료 (batch_size=1, 두 번째 배치에서 실패)
+        calls = 0
+
+        async def deliver_then_fail(batch):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise ConnectionError("db down")
+            delivered.extend(batch)
+
+        with pytest.raises(ConnectionError):
+            await first.replay(deliver_then_fail, batch_size=1)
+        await first.close()
+
+        second = SpillJournal(path, segment_max_bytes=1024)
+        await second.open()
+        assert second.pending == 2
+        await second.replay(deliver_one)
+        await second.close()
+
+        assert delivered == [b"one", b"two", b"three"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_tail_is_dropped(self, tmp_path):
+        path = tmp_path / "spill"
+        j = SpillJournal(path)
+        await j.open()
+        await j.append([b"complete"])
+        await j.close()
+        # 크래시로 인한 부분 기록 시뮬레이션
+        segment = next(path.glob("*.seg"))
+        with segment.open("ab") as f:
+            f.write(b"\x00\x00\x00\x10part")
+
+        reopened = SpillJournal(path)
+        await reopened.open()
+        delivered: list[bytes] = []
+
+        async def deliver(batch):
+            delivered.extend(batch)
+
+        await reopened.replay(deliver)
+        await reopened.close()
+        assert delivered == [b"complete"]
@@ -0,0 +1,72 @@
+"""LineSplitter / LineReader 테스트 (청크 경계, 긴 줄, 크기 한도)."""
+
+import asyncio
+import sys
+
+import pytest
+
+from app.services.stream_lines import LineReader, LineSplitter
+
+
+def _reader_from(chunks: list[bytes], **kwargs) -> LineReader:
+    queue = list(chunks)
+
+    async def _read(size: int) -> bytes:
+        return queue.pop(0) if queue else b""
+
+    return LineReader(_read, **kwargs)
+
+
+class TestLineSplitter:
+    def test_multiple_lines_in_chunk(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b'{"a":1}\n{"b":2}\n\n{"c"') == [b'{"a":1}', b'{"b":2}']
+        assert splitter.feed(b":3}\n") == [b'{"c":3}']
+        assert splitter.flush() == []
+
+    def test_long_line_across_chunks(self):
+        splitter = LineSplitter()
+        payload = b"x" * 100_000
+        for i in range(0, len(payload), 4096):
+            assert splitter.feed(payload[i : i + 4096]) == []
+        assert splitter.feed(b"\nnext") == [payload]
+        assert splitter.flush() == [b"next"]
+
+    def test_oversized_line_dropped(self):
+        splitter = LineSplitter(max_line=10)
+        assert splitter.feed(b"short\n0123456789") == [b"short"]
+        assert splitter.feed(b"abc") == []
+        assert splitter.feed(b"def\nok\n") == [b"ok"]
+        assert splitter.dropped_lines == 1
+
+    def test_oversized_tail_completion_dropped(self):
+        splitter = LineSplitter(max_line=10)
+        assert splitter.feed(b"01234567") == []
+        assert splitter.feed(b"89ab\nok\n") == [b"ok"]
+        assert splitter.dropped_lines == 1
+
+
+class TestLineReader:
+    @pytest.mark.asyncio
+    async def test_batches_until_eof(self):
+        reader = _reader_from([b"a\nb", b"c\n", b"tail"])
+        assert await reader.read_batch() == [b"a"]
+        assert await reader.read_batch() == [b"bc"]
+        assert await reader.read_batch() == [b"tail"]
+        assert await reader.read_batch() == []
+        assert await reader.read_batch() == []
+
+    @pytest.mark.asyncio
+    async def test_reads_subprocess_stream(self):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import sys\nfor i in range(1000): print(i)",
+            stdout=asyncio.subprocess.PIPE,
+        )
+        reader = LineReader(process.stdout.read, chunk_size=256)
+        lines = []
+        while batch := await reader.read_batch():
+            lines.extend(batch)
+        await process.wait()
+        assert lines == [str(i).encode() for i in range(1000)]
@@ -0,0 +1,128 @@
+"""SubprocessRunner 테스트 (동시성 제한, 타임아웃 kill, 스트리밍)."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from app.services.subprocess_runner import SubprocessRunError, SubprocessRunner
+
+PY = sys.executable
+
+
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_returns_stripped_output(self):
+        runner = SubprocessRunner("python")
+
+        rc, out, err = await runner.run(
+            [PY, "-c", "import sys; print(' hi '); print('oops', file=sys.stderr)"]
+        )
+
+        assert (rc, out, err) == (0, "hi", "oops")
+        assert runner.get_metrics()["started_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_executable(self):
+        runner = SubprocessRunner("nope")
+
+        assert await runner.run(["/nonexistent/nope"]) == (-1, "", "nope not found")
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_child(self):
+        """시간 초과 시 자식 프로세스를 kill하고 'timeout' 반환."""
+        runner = SubprocessRunner("python")
+        started = time.monotonic()
+
+        result = await runner.run(
+            [PY, "-c", "import time; time.sleep(30)"], timeout=0.3
+        )
+
+        assert result == (-1, "", "timeout")
+        assert time.monotonic() - started < 5
+        metrics = runner.get_metrics()
+        assert metrics["timeouts"] == 1
+        assert metrics["killed"] == 1
+        assert metrics["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_per_key_limit_queues_same_repo(self):
+        """같은 키는 per_key_concurrency만큼만 동시 실행, 다른 키는 병행."""
+        runner = SubprocessRunner("python", per_key_concurrency=1)
+        cmd = [PY, "-c", "import time; time.sleep(0.3)"]
+
+        started = time.monotonic()
+        await asyncio.gather(
+            runner.run(cmd, key="repo-a"),
+            runner.run(cmd, key="repo-a"),
+            runner.run(cmd, key="repo-b"),
+        )
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.6  # repo-a 두 번은 순차 실행
+        metrics = runner.get_metrics()
+        assert metrics["wait_ms_max"] >= 250
+        assert metrics["tracked_keys"] == 0  # 사용 종료된 키 정리
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_slots(self):
+        """호출자 취소 시 자식 kill + 슬롯 반환."""
+        runner = SubprocessRunner("python", max_concurrency=1)
+        task = asyncio.create_task(
+            runner.run([PY, "-c", "import time; time.sleep(30)"], timeout=60)
+        )
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        rc, out, _ = await runner.run([PY, "-c", "print('next')"])
+
+        assert (rc, out) == (0, "next")
+        assert runner.get_metrics()["killed"] == 1
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_streams_large_output(self):
+        runner = SubprocessRunner("python")
+        size = 1024 * 1024
+
+        chunks = [
+            chunk
+            async for chunk in runner.stream(
+                [PY, "-c", f"import sys; sys.stdout.write('x' * {size})"]
+            )
+        ]
+
+        assert len(chunks) > 1
+        assert sum(len(c) for c in chunks) == size
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_raises(self):
+        runner = SubprocessRunner("python")
+
+        with pytest.raises(SubprocessRunError) as exc_info:
+            async for _ in runner.stream(
+                [PY, "-c", "import sys; print('bad', file=sys.stderr); sys.exit(3)"]
+            ):
+                pass
+
+        assert exc_info.value.returncode == 3
+        assert exc_info.value.stderr == "bad"
+
+    @pytest.mark.asyncio
+    async def test_early_close_kills_child(self):
+        """소비자가 중간에 중단하면 자식 프로세스 kill."""
+        runner = SubprocessRunner("python")
+        stream = runner.stream(
+            [PY, "-c", "import sys, time\nwhile True: sys.stdout.write('x' * 65536)"]
+        )
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        metrics = runner.get_metrics()
+        assert metrics["killed"] == 1
+        assert metrics["running"] == 0
@@ -0,0 +1,188 @@
+"""턴 트레이싱 테스트 (span 트리/집계, 러너 인계, 배치 기록, OTLP export)."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1.endpoints.ws import _handle_prompt
+from app.core.tracing import Tracer, tracer as global_tracer
+
+
+class TestTracer:
+    @pytest.mark.asyncio
+    async def test_span_tree_and_child_task_propagation(self):
+        tracer = Tracer()
+        trace = tracer.start_turn("s1", "abc123")
+
+        async def _send():
+            with tracer.span("ws.send"):
+                await asyncio.sleep(0)
+
+        with tracer.span("runner.run"):
+            with tracer.span("stream.batch"):
+                await asyncio.create_task(_send())
+        tracer.end_turn(trace, status="idle")
+
+        (summary,) = tracer.traces("s1")
+        assert summary["trace_id"] == "0" * 26 + "abc123"
+        assert summary["span_count"] == 4
+        assert summary["attrs"] == {"status": "idle"}
+        assert set(summary["breakdown_ms"]) == {"runner.run"}
+        folded = tracer.flamegraph("s1")["folded"]
+        assert "turn;runner.run;stream.batch;ws.send" in folded
+
+    def test_no_active_trace_is_noop(self):
+        tracer = Tracer()
+        with tracer.span("orphan") as span:
+            span.set(a=1)
+        assert not span.recording
+        assert tracer.get_metrics()["traces_started"] == 0
+
+    def test_disabled(self):
+        tracer = Tracer(enabled=False)
+        assert tracer.start_turn("s1") is None
+        assert tracer.claim_turn("s1") is None
+        tracer.end_turn(None)
+
+    @pytest.mark.asyncio
+    async def test_claim_turn_hands_off_once(self):
+        tracer = Tracer()
+        prompt_trace = tracer.start_turn("s1", "t1")
+
+        async def _runner():
+            first = tracer.claim_turn("s1")
+            # 같은 컨텍스트에서 시작된 자동 체이닝 턴은 새 트레이스
+            chained = tracer.claim_turn("s1")
+            return first, chained
+
+        first, chained = await asyncio.create_task(_runner())
+        assert first is prompt_trace
+        assert chained is not prompt_trace
+        assert chained.claimed
+
+    @pytest.mark.asyncio
+    async def test_detach_keeps_task_context(self):
+        tracer = Tracer()
+        trace = tracer.start_turn("s1")
+
+        async def _runner():
+            await asyncio.sleep(0)
+            return tracer.current_trace()
+
+        task = asyncio.create_task(_runner())
+        tracer.detach(trace)
+
+        assert tracer.current_trace() is None
+        assert await task is trace  # Task 생성 시 복사된 컨텍스트는 유지
+        tracer.detach(trace)  # 중복 호출 무시
+
+    def test_span_limit_counts_dropped(self):
+        tracer = Tracer(max_spans=3)
+        trace = tracer.start_turn("s1")
+        for _ in range(5):
+            with tracer.span("stream.event.assistant"):
+                pass
+        tracer.end_turn(trace)
+
+        (summary,) = tracer.traces("s1")
+        assert summary["span_count"] == 3
+        assert summary["dropped_spans"] == 3
+        assert tracer.get_metrics()["spans_dropped"] == 3
+
+    def test_ended_trace_records_nothing(self):
+        tracer = Tracer()
+        trace = tracer.start_turn("s1")
+        tracer.end_turn(trace)
+        with tracer.span("late") as span:
+            pass
+        assert not span.recording
+        assert tracer.current_trace() is None
+
+    def test_record_batch_attributes_to_active_sessions(self):
+        tracer = Tracer()
+        trace = tracer.start_turn("s1")
+        started = time.perf_counter_ns()
+        tracer.record_batch(
+            "db.flush", started, started + 2_000_000, ["s1", "s2", "s1"]
+        )
+        tracer.end_turn(trace)
+
+        flush = next(s for s in trace.spans if s.name == "db.flush")
+        assert flush.attrs == {"events": 2, "batch": 3}
+        assert flush.parent_id == trace.root.span_id
+        assert tracer.traces("s2") == []
+
+    def test_flamegraph_merges_turns(self):
+        tracer = Tracer(retained_turns=2)
+        for _ in range(3):
+            trace = tracer.start_turn("s1")
+            with tracer.span("process.spawn"):
+                pass
+            tracer.end_turn(trace)
+
+        graph = tracer.flamegraph("s1")
+        assert graph["turns"] == 2
+        (spawn,) = graph["tree"]["children"]
+        assert spawn["name"] == "process.spawn"
+        assert spawn["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_file_exporter_writes_otlp_json(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer()
+        tracer.configure(export_path=str(path))
+        tracer.start()
+        trace = tracer.start_turn("s1", "t1")
+        with tracer.span("process.spawn", resident=True):
+            pass
+        tracer.end_turn(trace)
+        await tracer.close()
+
+        (line,) = path.read_text(encoding="utf-8").splitlines()
+        spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, spawn = spans
+        assert root["traceId"] == spawn["traceId"] == trace.trace_id
+        assert spawn["parentSpanId"] == root["spanId"]
+        assert spawn["attributes"] == [
+            {"key": "resident", "value": {"boolValue": True}}
+        ]
+        assert int(spawn["endTimeUnixNano"]) >= int(spawn["startTimeUnixNano"])
+        assert tracer.get_metrics()["exported"] == 1
+
+
+class TestPromptTrace:
+    @pytest.mark.asyncio
+    async def test_failure_before_runner_ends_trace(self):
+        manager = AsyncMock()
+        manager.get = AsyncMock(return_value={"name": "test"})
+        manager.get_runner_task = MagicMock(return_value=None)
+        manager.add_message = AsyncMock(side_effect=RuntimeError("db down"))
+        settings_svc = AsyncMock()
+        settings_svc.get = AsyncMock(return_value={})
+
+        async def _prompt():
+            with (
+                patch(
+                    "app.api.v1.endpoints.ws.get_settings_service",
+                    return_value=settings_svc,
+                ),
+                pytest.raises(RuntimeError),
+            ):
+                await _handle_prompt(
+                    data={"prompt": "hello"},
+                    session_id="trace-fail",
+                    manager=manager,
+                    ws_manager=AsyncMock(),
+                    ws=AsyncMock(),
+                    settings=MagicMock(),
+                    runner=AsyncMock(),
+                )
+            return global_tracer.current_trace()
+
+        # WS 루프처럼 별도 컨텍스트에서 실행 → 현재 span 복원 여부 확인
+        assert await asyncio.create_task(_prompt()) is None
+        (summary,) = global_tracer.traces("trace-fail")
+        assert summary["attrs"]["status"] == "error"
@@ -0,0 +1,130 @@
+"""TurnScheduler 테스트 (우선순위, 워크스페이스 공정 큐잉, admission, 대기 순서 알림)."""
+
+import asyncio
+
+import pytest
+
+from app.services.turn_scheduler import TurnPriority, TurnScheduler
+
+
+async def _drain_order(scheduler: TurnScheduler, requests) -> list[str]:
+    """슬롯 1개를 점유한 상태에서 requests를 대기시킨 뒤 실행 순서 반환."""
+    order: list[str] = []
+    await scheduler.acquire("holder")
+
+    async def _turn(key, workspace, priority):
+        async with scheduler.slot(key, workspace=workspace, priority=priority):
+            order.append(key)
+            await asyncio.sleep(0)
+
+    tasks = []
+    for key, workspace, priority in requests:
+        tasks.append(asyncio.create_task(_turn(key, workspace, priority)))
+        await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestTurnScheduler:
+    @pytest.mark.asyncio
+    async def test_priority_classes(self):
+        scheduler = TurnScheduler(1)
+        order = await _drain_order(
+            scheduler,
+            [
+                ("review", "w", TurnPriority.BACKGROUND),
+                ("chain", "w", TurnPriority.AUTO_CHAIN),
+                ("prompt", "w", TurnPriority.INTERACTIVE),
+            ],
+        )
+        assert order == ["prompt", "chain", "review"]
+
+    @pytest.mark.asyncio
+    async def test_workspaces_interleaved(self):
+        """한 워크스페이스의 연속 요청이 다른 워크스페이스를 밀어내지 않음."""
+        scheduler = TurnScheduler(1)
+        requests = [(f"a{i}", "A", TurnPriority.INTERACTIVE) for i in range(4)]
+        requests += [(f"b{i}", "B", TurnPriority.INTERACTIVE) for i in range(2)]
+
+        order = await _drain_order(scheduler, requests)
+
+        assert order == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_workspace_weights(self):
+        scheduler = TurnScheduler(1, weights={"A": 2.0})
+        requests = [(f"a{i}", "A", TurnPriority.INTERACTIVE) for i in range(4)]
+        requests += [(f"b{i}", "B", TurnPriority.INTERACTIVE) for i in range(2)]
+
+        order = await _drain_order(scheduler, requests)
+
+        assert order == ["a0", "b0", "a1", "a2", "b1", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        scheduler = TurnScheduler(1, aging_seconds=0.05)
+        await scheduler.acquire("holder")
+        background = asyncio.create_task(
+            scheduler.acquire("review", priority=TurnPriority.BACKGROUND)
+        )
+        await asyncio.sleep(0.12)  # 2단계 상승 → INTERACTIVE와 동급, 먼저 도착
+        prompt = asyncio.create_task(scheduler.acquire("prompt"))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await asyncio.sleep(0)
+
+        assert background.done() and not prompt.done()
+        scheduler.release()
+        await prompt
+
+    @pytest.mark.asyncio
+    async def test_position_updates_and_cancel(self):
+        scheduler = TurnScheduler(1)
+        await scheduler.acquire("holder")
+        positions: dict[str, list[tuple[int, int]]] = {"a": [], "b": []}
+
+        def _recorder(key):
+            async def _on_position(position, total):
+                positions[key].append((position, total))
+
+            return _on_position
+
+        a = asyncio.create_task(scheduler.acquire("a", on_position=_recorder("a")))
+        await asyncio.sleep(0)
+        b = asyncio.create_task(scheduler.acquire("b", on_position=_recorder("b")))
+        await asyncio.sleep(0)
+
+        a.cancel()
+        await asyncio.gather(a, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert positions["a"] == [(1, 1)]
+        assert positions["b"] == [(2, 2), (1, 1)]
+        assert scheduler.queued == 1
+        scheduler.release()
+        await b
+        assert scheduler.running == 1
+
+    @pytest.mark.asyncio
+    async def test_admission_holds_until_host_recovers(self):
+        overloaded = ["메모리 부족"]
+        scheduler = TurnScheduler(
+            4,
+            admission=lambda: overloaded[0] if overloaded else None,
+            admission_retry=0.02,
+        )
+        await scheduler.acquire("first")  # 실행 중인 턴이 없으면 항상 허용
+        second = asyncio.create_task(scheduler.acquire("second"))
+        await asyncio.sleep(0.05)
+
+        assert not second.done()
+        assert scheduler.get_metrics()["admission_blocked"] == "메모리 부족"
+
+        overloaded.clear()
+        await asyncio.wait_for(second, timeout=1)
+        metrics = scheduler.get_metrics()
+        assert metrics["running"] == 2
+        assert metrics["admission_blocks"] == 1
+        assert metrics["wait"]["interactive"]["count"] == 2
@@ -497,3 +497,182 @@ async def test_set_database(ws_manager, db):
     """set_database가 DB 참조를 설정하는지 확인."""
     ws_manager.set_database(db)
     assert ws_manager._db is db
+
+
+@pytest.mark.asyncio
+async def test_flush_events_spills_and_replays_after_db_outage(
+    ws_manager_with_db, db, tmp_path
+):
+    """DB 장애로 재시도 소진 시 spill 저널에 보존 후 복구 시 순서대로 재생."""
+    from app.services.spill_journal import SpillJournal
+
+    session_id = "test-session-spill"
+    async with db.session() as session:
+        await SessionRepository(session).add(
+            Session(
+                id=session_id,
+                work_dir="/tmp",
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        await session.commit()
+
+    journal = SpillJournal(tmp_path / "events")
+    await journal.open()
+    ws_manager_with_db._spill_journal = journal
+
+    original_write = ws_manager_with_db._write_event_batch
+    ws_manager_with_db._write_event_batch = AsyncMock(
+        side_effect=ConnectionError("db down")
+    )
+    for i in range(3):
+        await ws_manager_with_db.broadcast_event(
+            session_id, {"type": "assistant", "text": f"m{i}"}
+        )
+    # 최초 시도 + 재시도 소진 → spill
+    for _ in range(ws_manager_with_db._max_retries + 1):
+        await ws_manager_with_db._flush_events()
+    assert journal.pending == 3
+    assert ws_manager_with_db._retry_batch == []
+
+    # DB 복구 후 다음 flush에서 저널 재생
+    ws_manager_with_db._write_event_batch = original_write
+    await ws_manager_with_db.broadcast_event(
+        session_id, {"type": "assistant", "text": "m3"}
+    )
+    await ws_manager_with_db._flush_events()
+    await journal.close()
+
+    assert journal.pending == 0
+    async with db.session() as session:
+        rows = await EventRepository(session).get_after(session_id, 0)
+    assert [r["seq"] for r in rows] == [1, 2, 3, 4]
+    assert ws_manager_with_db.get_metrics()["spill"]["replayed_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_overflow_spills_whole_batch_in_order(
+    ws_manager_with_db, db, tmp_path
+):
+    """재시도 배치 상한 초과 시 배치 전체를 저널로 보내 DB에 seq 역전이 없어야 함."""
+    from app.services.spill_journal import SpillJournal
+
+    session_id = "test-session-overflow"
+    async with db.session() as session:
+        await SessionRepository(session).add(
+            Session(
+                id=session_id,
+                work_dir="/tmp",
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        await session.commit()
+
+    journal = SpillJournal(tmp_path / "events")
+    await journal.open()
+    ws_manager_with_db._spill_journal = journal
+    ws_manager_with_db._event_batch_max_size = 2
+
+    original_write = ws_manager_with_db._write_event_batch
+    ws_manager_with_db._write_event_batch = AsyncMock(
+        side_effect=ConnectionError("db down")
+    )
+    for i in range(3):
+        await ws_manager_with_db.broadcast_event(
+            session_id, {"type": "assistant", "text": f"m{i}"}
+        )
+    await ws_manager_with_db._flush_events()  # 2건 재시도 대기
+    for i in range(3, 6):
+        await ws_manager_with_db.broadcast_event(
+            session_id, {"type": "assistant", "text": f"m{i}"}
+        )
+    ws_manager_with_db._write_event_batch = original_write
+    # 장애 동안 쌓인 재시도 대기분이 상한(batch_max * 2 = 4)을 넘은 상태
+    ws_manager_with_db._retry_batch.extend(
+        [ws_manager_with_db._event_queue.get_nowait() for _ in range(4)]
+    )
+    await ws_manager_with_db._flush_events()
+
+    assert journal.pending == 6
+    async with db.session() as session:
+        rows = await EventRepository(session).get_after(session_id, 0)
+    assert rows == []
+
+    await ws_manager_with_db._flush_events()
+    await journal.close()
+    async with db.session() as session:
+        rows = await EventRepository(session).get_after(session_id, 0)
+    assert [r["seq"] for r in rows] == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_current_activity_tracks_open_tool(ws_manager):
+    """가장 최근 미완료 tool_use가 현재 활동으로 반환."""
+    sid = "activity-session"
+    await ws_manager.broadcast_event(sid, {"type": "user_message"})
+    await ws_manager.broadcast_event(
+        sid, {"type": "tool_use", "tool_use_id": "t1", "tool": "Read", "input": {"a": 1}}
+    )
+    await ws_manager.broadcast_event(
+        sid, {"type": "tool_use", "tool_use_id": "t2", "tool": "Bash", "input": {}}
+    )
+    assert ws_manager.get_current_activity(sid) == {"tool": "Bash", "input": {}}
+
+    await ws_manager.broadcast_event(sid, {"type": "tool_result", "tool_use_id": "t2"})
+    assert ws_manager.get_current_activity(sid) == {"tool": "Read", "input": {"a": 1}}
+
+    await ws_manager.broadcast_event(sid, {"type": "tool_result", "tool_use_id": "t1"})
+    assert ws_manager.get_current_activity(sid) is None
+    await _drain_broadcasts(ws_manager)
+
+
+@pytest.mark.asyncio
+async def test_current_activity_thinking_until_turn_end(ws_manager):
+    """assistant_text 이후 result 전까지 __thinking__, result 후 미완료 도구 정리."""
+    sid = "thinking-session"
+    await ws_manager.broadcast_event(sid, {"type": "assistant_text", "text": "..."})
+    assert ws_manager.get_current_activity(sid) == {"tool": "__thinking__", "input": {}}
+
+    await ws_manager.broadcast_event(
+        sid, {"type": "tool_use", "tool_use_id": "t1", "tool": "Edit", "input": {}}
+    )
+    await ws_manager.broadcast_event(sid, {"type": "result"})
+    assert ws_manager.get_current_activity(sid) is None
+    await _drain_broadcasts(ws_manager)
+
+
+@pytest.mark.asyncio
+async def test_get_activities_bulk(ws_manager):
+    """get_activities는 활동 중인 세션만 반환하고 clear_buffer 후 제외."""
+    await ws_manager.broadcast_event(
+        "s1", {"type": "tool_use", "tool_use_id": "t1", "tool": "Grep", "input": {}}
+    )
+    await ws_manager.broadcast_event("s2", {"type": "status", "status": "running"})
+
+    activities = ws_manager.get_activities(["s1", "s2", "s3"])
+    assert activities == {"s1": {"tool": "Grep", "input": {}}}
+
+    ws_manager.clear_buffer("s1")
+    assert ws_manager.get_activities(["s1"]) == {}
+    await _drain_broadcasts(ws_manager)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_sends_batch_in_order(ws_manager, mock_websocket):
+    """coalesce 블록 안의 이벤트는 블록 종료 시 태스크 하나로 순서대로 전송."""
+    session_id = "test-session"
+    ws_manager.register(session_id, mock_websocket)
+
+    with ws_manager.coalesce(session_id):
+        for i in range(3):
+            await ws_manager.broadcast_event(session_id, {"type": "raw", "text": i})
+        assert not ws_manager._pending_broadcasts
+        mock_websocket.send_text.assert_not_called()
+    assert len(ws_manager._pending_broadcasts) == 1
+    await _drain_broadcasts(ws_manager)
+
+    sent = [json.loads(c.args[0]) for c in mock_websocket.send_text.call_args_list]
+    assert [m["text"] for m in sent] == [0, 1, 2]
+    assert [m["seq"] for m in sent] == [1, 2, 3]
+    metrics = ws_manager.get_metrics()
+    assert (metrics["coalesced_batches"], metrics["coalesced_events"]) == (1, 3)
@@ -3,10 +3,12 @@
 WorkspaceService의 public 메서드를 PostgreSQL DB를 사용하여 검증합니다:
 - 워크스페이스 CRUD (list_all, get, update, delete_workspace)
 - stale 워크스페이스 정리 (cleanup_stale)
+- 디스크 사용량 갱신 (refresh_disk_usage, run_disk_usage_refresh)
 
 GitService의 실제 git 명령은 mock 처리하고, DB 연동은 실제 PostgreSQL을 사용합니다.
 """
 
+import asyncio
 import os
 import tempfile
 from datetime import datetime, timezone
@@ -275,3 +277,59 @@ class TestCleanupStale:
         # deleting → 삭제됨
         with pytest.raises(NotFoundError):
             await workspace_service.get("ws-mix-003")
+
+
+# ---------------------------------------------------------------------------
+# 디스크 사용량 갱신 테스트
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+class TestDiskUsageRefresh:
+
+    async def test_refresh_updates_changed_workspaces(self, workspace_service, db):
+        """ready 워크스페이스만 재계산하고 변경된 값만 DB에 반영한다."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "blob.bin"), "wb") as f:
+                f.write(os.urandom(3 * 1024 * 1024))
+            await _insert_workspace(db, wid="ws-du-001", local_path=tmpdir)
+            await _insert_workspace(
+                db,
+                wid="ws-du-002",
+                name="cloning",
+                status="cloning",
+                local_path=tmpdir,
+            )
+
+            assert await workspace_service.refresh_disk_usage() == 1
+            assert await workspace_service.refresh_disk_usage() == 0
+
+            ready = await workspace_service.get("ws-du-001")
+            cloning = await workspace_service.get("ws-du-002")
+            assert ready["disk_usage_mb"] == 3
+            assert cloning["disk_usage_mb"] is None
+
+    async def test_requested_refresh_runs_without_waiting_interval(
+        self, workspace_service, db
+    ):
+        """sync 후 요청된 워크스페이스는 주기와 무관하게 즉시 갱신된다."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "blob.bin"), "wb") as f:
+                f.write(os.urandom(2 * 1024 * 1024))
+            await _insert_workspace(db, wid="ws-du-003", local_path=tmpdir)
+
+            shutdown = asyncio.Event()
+            loop = asyncio.create_task(
+                workspace_service.run_disk_usage_refresh(shutdown, interval=3600)
+            )
+            try:
+                workspace_service.request_disk_usage_refresh("ws-du-003")
+                for _ in range(100):
+                    ws = await workspace_service.get("ws-du-003")
+                    if ws["disk_usage_mb"] is not None:
+                        break
+                    await asyncio.sleep(0.02)
+                assert ws["disk_usage_mb"] == 2
+            finally:
+                shutdown.set()
+                await asyncio.wait_for(loop, timeout=5)
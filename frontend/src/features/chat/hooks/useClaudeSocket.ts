@@ -1,4 +1,5 @@
 import { useEffect, useRef, useReducer, useCallback } from "react";
+import { useQueryClient } from "@tanstack/react-query";
 import { toast } from "sonner";
 import { isMobileDevice } from "@/lib/platform";
 import type {
@@ -40,6 +41,7 @@ export function useClaudeSocket(sessionId: string) {
   const reconnectAttempt = useRef(0);
 
   const [state, dispatch] = useReducer(claudeSocketReducer, initialState);
+  const queryClient = useQueryClient();
 
   // sessionId 변경 시 모든 상태 초기화
   useEffect(() => {
@@ -420,10 +422,16 @@ export function useClaudeSocket(sessionId: string) {
         break;
       }
 
+      case "git_status_changed":
+        // 서버 파일시스템 감시가 저장소 변경을 감지 → Git 패널 즉시 갱신
+        queryClient.invalidateQueries({ queryKey: ["git-status"] });
+        queryClient.invalidateQueries({ queryKey: ["git-info"] });
+        break;
+
       default:
         break;
     }
-  }, []);
+  }, [queryClient]);
 
   const connect = useCallback(() => {
     if (!sessionId) return;
@@ -24,6 +24,8 @@ export interface SearchSessionsParams {
   order?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  total_mode?: "exact" | "estimated";
   include_tags?: boolean;
 }
 
@@ -32,6 +34,8 @@ export interface PaginatedSessions {
   total: number;
   limit: number;
   offset: number;
+  next_cursor: string | null;
+  total_estimated: boolean;
 }
 
 export const sessionsApi = {
@@ -128,6 +132,8 @@ export const sessionsApi = {
     if (params.order) searchParams.set("order", params.order);
     if (params.limit != null) searchParams.set("limit", String(params.limit));
     if (params.offset != null) searchParams.set("offset", String(params.offset));
+    if (params.cursor) searchParams.set("cursor", params.cursor);
+    if (params.total_mode) searchParams.set("total_mode", params.total_mode);
     if (params.include_tags) searchParams.set("include_tags", "true");
     return api.get<PaginatedSessions>(`/api/sessions/search?${searchParams.toString()}`);
   },
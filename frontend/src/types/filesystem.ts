@@ -117,6 +117,7 @@ export interface GitHubPREntry {
   draft: boolean;
   additions: number;
   deletions: number;
+  head_sha?: string;
 }
 
 export interface GitHubPRListResponse {
@@ -159,6 +160,7 @@ export interface GitHubPRDetail {
   reviews: GitHubPRReview[];
   comments: GitHubPRComment[];
   mergeable?: string | null;
+  head_sha?: string;
   error?: string | null;
 }
 
@@ -269,6 +269,16 @@ export interface WsRetryAttemptEvent extends WsBaseEvent {
   backoff_seconds: number;
 }
 
+// ---------------------------------------------------------------------------
+// Git 이벤트
+// ---------------------------------------------------------------------------
+
+/** 세션 작업 디렉토리 저장소의 파일/인덱스/ref 변경 (서버 파일시스템 감시) */
+export interface WsGitStatusChangedEvent extends WsBaseEvent {
+  type: "git_status_changed";
+  repo_root: string;
+}
+
 // ---------------------------------------------------------------------------
 // Discriminated union: 모든 WS 이벤트
 // ---------------------------------------------------------------------------
@@ -304,7 +314,8 @@ export type WsEvent =
   | WsWorkflowAnnotationAddedEvent
   | WsWorkflowQAFailedEvent
   | WsStallDetectedEvent
-  | WsRetryAttemptEvent;
+  | WsRetryAttemptEvent
+  | WsGitStatusChangedEvent;
 
 /** WS 이벤트 type 필드 값의 union (편의 타입) */
 export type WsEventType = WsEvent["type"];